@@ -139,11 +139,71 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'common.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
 }
 
+# Caches
+# The search result cache (SVE-MDE-03-15) keeps its shared layer in its own
+# alias. It must be visible to every worker process, or a write in one worker
+# leaves stale results in the others: file based shares it between the
+# processes of one host; use Redis or Memcached when serving from several.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'search_results': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'search_results',
+    },
+    # Department subtrees (DepartmentClosure.descendant_ids); shared for the
+    # same reason, so a department move is seen by every worker
+    'department_hierarchy': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'department_hierarchy',
+    },
+}
+
+SEARCH_CACHE = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'search_results',
+    'MAX_AGE': 300,
+    'L1_MAX_ENTRIES': 256,
+}
+
+# Service audit trail, written in batches by a background thread
+AUDIT_LOG = {
+    'ENABLED': True,
+    'ASYNC': True,
+    'BATCH_SIZE': 200,
+    'FLUSH_INTERVAL': 1.0,
+    'QUEUE_SIZE': 10000,
+    'RETRY_BACKOFF': 0.5,
+    'MAX_ATTEMPTS': 5,
+    # Closed months of the field-level change log (archive_audit_partitions)
+    'ARCHIVE_DIR': BASE_DIR / 'audit_archive',
+}
+
+# Idle resource imports: rows are validated by a process pool once an import
+# has PARALLEL_MIN_ROWS rows (VALIDATION_WORKERS None = one per CPU). Uploads
+# are kept in UPLOAD_DIR until the import finishes, so an interrupted import
+# can be resumed; a 'processing' import without a checkpoint for STALE_AFTER
+# seconds counts as interrupted.
+RESOURCE_IMPORT = {
+    'VALIDATION_WORKERS': None,
+    'VALIDATION_CHUNK_SIZE': 2000,
+    'PARALLEL_MIN_ROWS': 10000,
+    'UPLOAD_DIR': BASE_DIR / 'imports',
+    'STALE_AFTER': 15 * 60,
+}
+
+# Idle resource exports: generated files and how long their download links work
+RESOURCE_EXPORT = {
+    'EXPORT_DIR': BASE_DIR / 'exports',
+    'DOWNLOAD_EXPIRY': 24 * 60 * 60,
+}
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
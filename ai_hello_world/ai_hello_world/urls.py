@@ -529,6 +529,7 @@ urlpatterns = [
             'GET /api/health/ - System Health Check',
             'GET /api/v1/auth/health - Auth Health Check',
             'GET /api/v1/idle-resources - List Resources',
+            'GET /api/v1/idle-resources/stream - Stream Resources (NDJSON)',
             'POST /api/v1/idle-resources - Create Resource',
             'POST /api/v1/idle-resources/export - Export Resources',
             'POST /api/v1/idle-resources/search - Advanced Search',
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class AuthenticationConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'authentication'
+    verbose_name = 'Authentication'
+
+    def ready(self):
+        # Register department hierarchy signal handlers
+        from . import signals  # noqa: F401
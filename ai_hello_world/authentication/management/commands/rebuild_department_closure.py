@@ -0,0 +1,21 @@
+"""
+Rebuild the department hierarchy closure table (department_closure).
+
+Usage:
+    python manage.py rebuild_department_closure
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from authentication.models import DepartmentClosure
+
+
+class Command(BaseCommand):
+    help = 'Recompute department_closure from departments.parent_department_id'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rows = DepartmentClosure.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f'Wrote {rows} department closure rows'))
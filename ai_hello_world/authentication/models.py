@@ -61,6 +61,157 @@ class Department(models.Model):
         verbose_name_plural = 'Departments'
 
 
+class DepartmentClosure(models.Model):
+    """
+    MANDATORY DOCSTRING - DepartmentClosure model for the department hierarchy (closure table).
+    
+    Source Information (REQUIRED):
+    - Database Table: department_closure
+    - Derived from: departments.parent_department_id
+    - Business Module: authentication
+    
+    Business Rules (REQUIRED):
+        - One row per (ancestor, descendant) pair, including each
+          department paired with itself at depth 0
+        - Any subtree is a single indexed lookup on ancestor, whatever the
+          depth of the tree; scoped queries use it as one IN list/subquery
+        - Maintained by signals on Department (authentication.signals);
+          moving a department re-links its whole subtree, and a parent may
+          not become its own descendant
+        - Descendant sets are cached per department in the shared
+          'department_hierarchy' cache alias (every worker process sees the
+          same generation) and invalidated on every department save or delete
+        - ``manage.py rebuild_department_closure`` recomputes every row
+    
+    Relationships (REQUIRED):
+        - Related to Department twice (ancestor, descendant), cascade delete
+    
+    Verification Source: DD/database_v0.1.md - Section: departments
+    (parent_department hierarchy)
+    """
+    ancestor = models.ForeignKey(Department, on_delete=models.CASCADE, related_name='descendant_links')
+    descendant = models.ForeignKey(Department, on_delete=models.CASCADE, related_name='ancestor_links')
+    depth = models.PositiveIntegerField(default=0)
+    
+    CACHE_ALIAS = 'department_hierarchy'
+    CACHE_GENERATION_KEY = 'department-closure:generation'
+    CACHE_TIMEOUT = 3600
+    
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
+    
+    @classmethod
+    def insert_node(cls, department_id, parent_id):
+        """Add a new leaf: itself at depth 0 plus every ancestor of its parent."""
+        rows = [cls(ancestor_id=department_id, descendant_id=department_id, depth=0)]
+        if parent_id:
+            rows.extend(
+                cls(ancestor_id=ancestor_id, descendant_id=department_id, depth=depth + 1)
+                for ancestor_id, depth in cls.objects.filter(descendant_id=parent_id).values_list('ancestor_id', 'depth')
+            )
+        cls.objects.bulk_create(rows, ignore_conflicts=True)
+    
+    @classmethod
+    def move_subtree(cls, department_id, parent_id):
+        """
+        Re-link a department and its whole subtree under a new parent.
+        
+        Paths inside the subtree are kept; paths from former ancestors are
+        dropped and paths from the new parent's ancestors are added.
+        """
+        subtree = list(cls.objects.filter(ancestor_id=department_id).values_list('descendant_id', 'depth'))
+        subtree_ids = [descendant_id for descendant_id, _ in subtree]
+        cls.objects.filter(descendant_id__in=subtree_ids).exclude(ancestor_id__in=subtree_ids).delete()
+        if parent_id:
+            ancestors = list(cls.objects.filter(descendant_id=parent_id).values_list('ancestor_id', 'depth'))
+            cls.objects.bulk_create([
+                cls(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=up + 1 + down)
+                for ancestor_id, up in ancestors
+                for descendant_id, down in subtree
+            ], ignore_conflicts=True)
+    
+    @classmethod
+    def detach_subtree(cls, department_id):
+        """Before a delete: the children become roots (parent SET NULL), so cut their upward paths."""
+        below = cls.objects.filter(ancestor_id=department_id, depth__gt=0).values_list('descendant_id', flat=True)
+        above = cls.objects.filter(descendant_id=department_id, depth__gt=0).values_list('ancestor_id', flat=True)
+        cls.objects.filter(descendant_id__in=list(below), ancestor_id__in=list(above)).delete()
+    
+    @classmethod
+    def is_descendant(cls, department_id, ancestor_id):
+        """Whether department_id lies in ancestor_id's subtree (itself included)."""
+        return cls.objects.filter(ancestor_id=ancestor_id, descendant_id=department_id).exists()
+    
+    @classmethod
+    def rebuild(cls):
+        """Recompute every row from the parent links in memory (cycles are cut)."""
+        parents = dict(Department.objects.values_list('department_id', 'parent_department_id'))
+        rows = []
+        for department_id in parents:
+            ancestor_id, depth, seen = department_id, 0, set()
+            while ancestor_id is not None and ancestor_id not in seen:
+                seen.add(ancestor_id)
+                rows.append(cls(ancestor_id=ancestor_id, descendant_id=department_id, depth=depth))
+                ancestor_id, depth = parents.get(ancestor_id), depth + 1
+        cls.objects.all().delete()
+        cls.objects.bulk_create(rows, batch_size=1000)
+        cls.invalidate_cache()
+        return len(rows)
+    
+    @classmethod
+    def descendants_subquery(cls, department_id):
+        """values() QuerySet of the subtree's ids, usable in a ``department_id__in`` filter."""
+        return cls.objects.filter(ancestor_id=department_id).values('descendant_id')
+    
+    @classmethod
+    def descendant_ids(cls, department_id):
+        """
+        Ids (str) of a department and all its descendants, cached.
+        
+        Falls back to the department itself when it has no closure rows
+        yet, matching the pre-hierarchy behaviour.
+        """
+        if not department_id:
+            return []
+        cache = cls._cache()
+        # A random token, so a lost generation key never revives old entries
+        generation = cache.get_or_set(cls.CACHE_GENERATION_KEY, lambda: uuid.uuid4().hex, timeout=None)
+        key = f"department-closure:{generation}:{department_id}"
+        descendant_ids = cache.get(key)
+        if descendant_ids is None:
+            descendant_ids = [
+                str(descendant_id) for descendant_id in
+                cls.objects.filter(ancestor_id=department_id).order_by('depth', 'descendant_id')
+                .values_list('descendant_id', flat=True)
+            ] or [str(department_id)]
+            cache.set(key, descendant_ids, timeout=cls.CACHE_TIMEOUT)
+        return descendant_ids
+    
+    @classmethod
+    def invalidate_cache(cls):
+        """Make every cached descendant set unreachable."""
+        # A plain set, not incr: incr is not atomic on the file based backend
+        cls._cache().set(cls.CACHE_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+    
+    @classmethod
+    def _cache(cls):
+        from django.core.cache import InvalidCacheBackendError, caches
+        
+        try:
+            return caches[cls.CACHE_ALIAS]
+        except InvalidCacheBackendError:
+            return caches['default']
+    
+    class Meta:
+        db_table = 'department_closure'
+        verbose_name = 'Department Closure'
+        verbose_name_plural = 'Department Closure'
+        unique_together = ['ancestor', 'descendant']
+        indexes = [
+            models.Index(fields=['descendant', 'depth']),
+        ]
+
+
 class Employee(models.Model):
     """
     MANDATORY DOCSTRING - Employee model for employee information and management.
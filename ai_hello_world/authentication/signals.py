@@ -0,0 +1,60 @@
+"""
+Authentication Signal Handlers
+
+Keeps the department closure table (department_closure) in step with
+Department.parent_department. Handlers run inside the caller's
+transaction, so a rolled-back write never leaves closure rows behind.
+"""
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .models import Department, DepartmentClosure
+
+
+@receiver(pre_save, sender=Department)
+def reject_department_cycles(sender, instance, raw=False, **kwargs):
+    """A department cannot be moved under itself or one of its descendants."""
+    if raw or instance.parent_department_id is None:
+        return
+    if instance.parent_department_id == instance.pk or DepartmentClosure.is_descendant(
+        instance.parent_department_id, instance.pk
+    ):
+        raise ValidationError("A department cannot be its own ancestor")
+
+
+@receiver(post_save, sender=Department)
+def sync_closure_on_department_save(sender, instance, created, raw=False, **kwargs):
+    """Insert new departments; re-link the subtree when the parent changed."""
+    if raw:
+        return
+    if created:
+        DepartmentClosure.insert_node(instance.pk, instance.parent_department_id)
+        return
+    # depth 0 is the department itself, depth 1 its recorded parent
+    links = dict(
+        DepartmentClosure.objects.filter(descendant_id=instance.pk, depth__lte=1).values_list('depth', 'ancestor_id')
+    )
+    if 0 not in links:
+        # Saved before the closure table existed
+        DepartmentClosure.insert_node(instance.pk, instance.parent_department_id)
+    elif links.get(1) != instance.parent_department_id:
+        DepartmentClosure.move_subtree(instance.pk, instance.parent_department_id)
+
+
+@receiver(pre_delete, sender=Department)
+def detach_closure_on_department_delete(sender, instance, **kwargs):
+    """Children are re-parented to NULL by a signal-less UPDATE; cut their upward paths first."""
+    DepartmentClosure.detach_subtree(instance.pk)
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def invalidate_department_hierarchy_cache(sender, raw=False, using=None, **kwargs):
+    """Expire cached descendant sets now and again on commit."""
+    if raw:
+        return
+    DepartmentClosure.invalidate_cache()
+    transaction.on_commit(DepartmentClosure.invalidate_cache, using=using)
@@ -0,0 +1,60 @@
+"""
+Conditional GET support (ETag / Last-Modified validators).
+
+Views compute validators from cheap metadata (a record's version, or an
+aggregate fingerprint of a filtered list) before building the payload, and
+answer matching If-None-Match / If-Modified-Since requests with 304 Not
+Modified without serializing anything.
+
+Source: IMPLEMENTATION_ROADMAP.md - Phase 1: Foundation Setup
+
+Business Rules:
+    - ETags are weak (W/"..."): bodies also carry volatile fields such as
+      executionTime, so only semantic equivalence is promised
+    - The ETag covers every input that changes the body: the record
+      version or list fingerprint, plus the normalized query parameters
+    - Precondition evaluation follows RFC 9110 (django.utils.cache)
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Optional
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def make_etag(*parts) -> str:
+    """Weak ETag over the given parts (any JSON-serializable values)."""
+    digest = hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str, separators=(',', ':')).encode('utf-8')
+    ).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def _timestamp(last_modified: Optional[datetime]):
+    return int(last_modified.timestamp()) if last_modified else None
+
+
+def not_modified_response(request, etag: str, last_modified: Optional[datetime] = None):
+    """
+    304 (or 412) response when the request's preconditions say so, else None.
+
+    Arguments:
+    - request: Incoming request
+    - etag: Current ETag of the resource
+    - last_modified: Current modification time (aware datetime) or None
+    """
+    response = get_conditional_response(request, etag=etag, last_modified=_timestamp(last_modified))
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag: str, last_modified: Optional[datetime] = None):
+    """Attach ETag and Last-Modified headers to a response."""
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(_timestamp(last_modified))
+    return response
@@ -0,0 +1,86 @@
+"""
+Benchmark ORJSONRenderer against DRF's JSONRenderer on list payloads.
+
+Payloads mirror the idle resource list response with raw UUID, Decimal and
+datetime values, as services hand them to DRF.
+
+Usage:
+    python manage.py benchmark_renderers [--rows 100 10000] [--repeat 20]
+"""
+
+import statistics
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from common.renderers import ORJSONRenderer
+
+
+def build_list_payload(rows):
+    """A list API response with ``rows`` records."""
+    now = timezone.now()
+    records = [
+        {
+            'id': uuid.uuid4(),
+            'employeeName': f'Nguyễn Văn {index}',
+            'employeeId': uuid.uuid4(),
+            'departmentId': uuid.uuid4(),
+            'idleType': ('developer', 'tester', 'analyst')[index % 3],
+            'status': 'available',
+            'idleFromDate': (now - timedelta(days=index % 400)).date(),
+            'idleToDate': (now + timedelta(days=index % 90)).date(),
+            'idleMM': index % 12,
+            'isUrgent': index % 5 == 0,
+            'salesPrice': Decimal('1250.50') + index,
+            'skills': ['Python', 'Django', 'PostgreSQL'],
+            'experienceYears': index % 15,
+            'updatedAt': now - timedelta(minutes=index),
+            'version': 1 + index % 4,
+        }
+        for index in range(rows)
+    ]
+    return {
+        'records': records,
+        'totalCount': rows,
+        'pageInfo': {'currentPage': 1, 'totalPages': 1, 'hasNextPage': False, 'hasPreviousPage': False},
+        'aggregations': {'byIdleType': {'developer': rows // 3}},
+        'executionTime': 12,
+    }
+
+
+def time_renderer(renderer, payload, repeat):
+    """Median seconds per render over ``repeat`` runs."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        renderer.render(payload)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+class Command(BaseCommand):
+    help = 'Compare ORJSONRenderer with JSONRenderer on 100 and 10k row list payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[100, 10000],
+                            help='Payload sizes in records')
+        parser.add_argument('--repeat', type=int, default=20,
+                            help='Renders per renderer and size (median is reported)')
+
+    def handle(self, *args, **options):
+        stdlib, fast = JSONRenderer(), ORJSONRenderer()
+        self.stdout.write(f"{'rows':>8} {'JSONRenderer':>14} {'ORJSONRenderer':>16} {'speedup':>9} {'bytes':>10}")
+
+        for rows in options['rows']:
+            payload = build_list_payload(rows)
+            baseline = time_renderer(stdlib, payload, options['repeat'])
+            candidate = time_renderer(fast, payload, options['repeat'])
+            self.stdout.write(
+                f"{rows:>8} {baseline * 1000:>12.2f}ms {candidate * 1000:>14.2f}ms "
+                f"{baseline / candidate:>8.1f}x {len(fast.render(payload)):>10}"
+            )
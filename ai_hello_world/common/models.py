@@ -16,7 +16,9 @@ Business Rules:
     - Consistent timestamp tracking
 """
 import uuid
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import F
+from django.db.models.signals import post_save, pre_save
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 
@@ -160,15 +162,15 @@ class VersionedModel(models.Model):
     Version field is incremented on each update to prevent concurrent 
     modification issues in high-concurrency environments.
     
+    save() increments the version in Python and does not check it; use
+    BaseModel.compare_and_swap() where concurrent writers must be detected.
+    
     Usage:
         def update_with_version_check(self, data, expected_version):
-            if self.version != expected_version:
-                raise ValidationError("Record was modified by another user")
-            
             for key, value in data.items():
                 setattr(self, key, value)
-            self.version += 1
-            self.save()
+            if not self.compare_and_swap(data.keys(), expected_version):
+                raise ValidationError("Record was modified by another user")
     """
     version = models.PositiveIntegerField(
         default=1,
@@ -198,6 +200,10 @@ class BaseModel(UUIDBaseModel, AuditableModel, SoftDeleteModel, VersionedModel):
     Use this as the base for most models in the application where
     you need complete functionality.
     
+    Optimistic locking writes go through compare_and_swap(), a single
+    conditional UPDATE ... WHERE id = ? AND version = ? that increments the
+    version in SQL, so two writers holding the same version cannot both win.
+    
     Usage:
         class IdleResource(BaseModel):
             resource_type = models.CharField(max_length=50)
@@ -205,8 +211,98 @@ class BaseModel(UUIDBaseModel, AuditableModel, SoftDeleteModel, VersionedModel):
             
             class Meta:
                 db_table = 'idle_resources'
+        
+        resource.status = 'allocated'
+        if not resource.compare_and_swap(['status'], expected_version=3):
+            ...  # modified by another user
     """
     
+    def compare_and_swap(self, update_fields, expected_version=None, using=None):
+        """
+        Write ``update_fields`` only if the stored version is unchanged.
+        
+        The values come from the instance attributes. version is set to
+        version + 1 and updated_at to now in the same statement. pre_save
+        and post_save are sent like save(update_fields=...) would, so
+        signal-driven derived data stays in step.
+        
+        Args:
+            update_fields (iterable): Field names to write
+            expected_version (int): Version the caller read (defaults to
+                self.version)
+            using (str): Database alias
+        
+        Returns:
+            bool: True if the row was written; False on a version conflict
+                or if the row no longer exists. The instance's version and
+                updated_at are only advanced on success.
+        """
+        cls = type(self)
+        if expected_version is None:
+            expected_version = self.version
+        using = using or router.db_for_write(cls, instance=self)
+        update_fields = frozenset(update_fields) - {'version', 'updated_at'}
+        
+        pre_save.send(sender=cls, instance=self, raw=False, using=using, update_fields=update_fields)
+        now = timezone.now()
+        values = {}
+        for name in update_fields:
+            field = self._meta.get_field(name)
+            values[field.attname] = getattr(self, field.attname)
+        
+        with transaction.atomic(using=using, savepoint=False):
+            written = cls._base_manager.using(using).filter(pk=self.pk, version=expected_version).update(
+                version=F('version') + 1, updated_at=now, **values
+            )
+            if not written:
+                return False
+            self.version = expected_version + 1
+            self.updated_at = now
+            post_save.send(
+                sender=cls, instance=self, created=False, raw=False, using=using,
+                update_fields=update_fields | {'version', 'updated_at'}
+            )
+        return True
+    
+    def soft_delete(self, user_id=None, expected_version=None):
+        """
+        Soft delete the record if it has not changed since it was read.
+        
+        Args:
+            user_id (str): ID of user performing the deletion
+            expected_version (int): Version the caller read (defaults to
+                self.version)
+        
+        Returns:
+            bool: True on success, False on a version conflict (the
+                instance is left as it was)
+        """
+        previous = (self.is_deleted, self.deleted_at, self.deleted_by)
+        self.is_deleted = True
+        self.deleted_at = timezone.now()
+        if user_id:
+            self.deleted_by = user_id
+        if self.compare_and_swap(['is_deleted', 'deleted_at', 'deleted_by'], expected_version):
+            return True
+        self.is_deleted, self.deleted_at, self.deleted_by = previous
+        return False
+    
+    def restore(self, expected_version=None):
+        """
+        Restore a soft-deleted record if it has not changed since it was read.
+        
+        Returns:
+            bool: True on success, False on a version conflict
+        """
+        previous = (self.is_deleted, self.deleted_at, self.deleted_by)
+        self.is_deleted = False
+        self.deleted_at = None
+        self.deleted_by = None
+        if self.compare_and_swap(['is_deleted', 'deleted_at', 'deleted_by'], expected_version):
+            return True
+        self.is_deleted, self.deleted_at, self.deleted_by = previous
+        return False
+    
     class Meta:
         abstract = True
 
@@ -0,0 +1,124 @@
+"""
+Fast JSON rendering for API responses.
+
+ORJSONRenderer is a drop-in replacement for DRF's JSONRenderer that encodes
+with orjson: dicts, lists, strings, numbers, UUIDs, datetimes, dates and
+times are serialized natively in Rust, and everything else goes through a
+fallback hook that mirrors DRF's JSONEncoder.
+
+Source: IMPLEMENTATION_ROADMAP.md - Phase 1: Foundation Setup
+
+Business Rules:
+    - Output matches JSONRenderer: UTF-8, compact separators, UTC datetimes
+      with a "Z" suffix, Decimal (hourly_rate, salesPrice) as JSON numbers
+    - Non-string dictionary keys (UUIDs, ints) are allowed
+    - ``indent`` in the Accept header is honored (two spaces, as orjson
+      only supports that width)
+    - Payloads orjson cannot encode (e.g. integers beyond 64 bits) and
+      environments without orjson fall back to JSONRenderer
+    - NaN and Infinity raise ValueError as in JSONRenderer; orjson would
+      write them as null. Payloads are only scanned for them when the
+      output contains a null
+"""
+
+import contextlib
+import datetime
+import decimal
+import json
+import math
+
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(obj):
+    """orjson fallback for types it does not serialize natively (see DRF's JSONEncoder)."""
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, QuerySet):
+        return tuple(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, 'tolist'):
+        # Numpy arrays and array scalars
+        return obj.tolist()
+    if hasattr(obj, '__getitem__'):
+        cls = list if isinstance(obj, (list, tuple)) else dict
+        with contextlib.suppress(Exception):
+            return cls(obj)
+    if hasattr(obj, '__iter__'):
+        return tuple(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _has_non_finite(value) -> bool:
+    """True if ``value`` holds a float or Decimal NaN/Infinity at any depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, decimal.Decimal):
+        return not value.is_finite()
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    if getattr(value, 'dtype', None) is not None and value.dtype.kind == 'f':
+        return _has_non_finite(value.tolist())
+    return False
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def dumps(data, indent=False) -> bytes:
+    """Encode ``data`` as UTF-8 JSON bytes, compact unless ``indent`` is set."""
+    content = None
+    if orjson is not None:
+        try:
+            content = orjson.dumps(
+                data, default=_default, option=(_OPTIONS | orjson.OPT_INDENT_2) if indent else _OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            pass  # Fall through to the stdlib encoder
+        else:
+            if b'null' in content and _has_non_finite(data):
+                # orjson wrote NaN/Infinity as null; the stdlib encoder raises like JSONRenderer
+                content = None
+        if content is not None:
+            # Same escaping as JSONRenderer: U+2028/U+2029 are invalid in JavaScript strings
+            if b'\xe2\x80\xa8' in content or b'\xe2\x80\xa9' in content:
+                content = content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+            return content
+
+    content = json.dumps(
+        data, cls=encoders.JSONEncoder, ensure_ascii=False, allow_nan=False,
+        indent=2 if indent else None, separators=None if indent else (',', ':')
+    )
+    return content.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode('utf-8')
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson.
+
+    Same media type, format and output as JSONRenderer, several times
+    faster on large list payloads.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        return dumps(data, indent=bool(indent))
@@ -0,0 +1,146 @@
+"""
+Constant-memory XLSX reading and writing.
+
+Workbooks are never loaded as a whole: reading uses openpyxl's read-only
+mode, which parses the sheet XML as rows are requested, and writing uses
+write-only worksheets, which serialize each appended row to a temporary
+file. Memory stays flat whatever the number of rows.
+
+Source: DD/MDE-03/04-dao/DAO-MDE-03-05_v0.1.md - DAO-MDE-03-05-01: Data Import
+Processing, DAO-MDE-03-05-02: Data Export Generation
+
+Business Rules:
+    - Rows are read from the first (active) worksheet unless a sheet name is
+      given, with cached formula results instead of formulas
+    - Written cells: lists become comma-separated text, UUIDs and other
+      objects their string form; characters XML cannot hold are dropped
+    - openpyxl is optional: without it XLSX files are rejected with
+      SpreadsheetError and CSV keeps working
+"""
+
+import datetime
+import decimal
+
+try:
+    import openpyxl
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+except ImportError:  # pragma: no cover - optional dependency
+    openpyxl = None
+    ILLEGAL_CHARACTERS_RE = None
+
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# XLSX files are ZIP archives
+_ZIP_SIGNATURE = b'PK\x03\x04'
+
+
+class SpreadsheetError(Exception):
+    """Raised when a workbook cannot be read or written."""
+
+
+def _require_openpyxl():
+    if openpyxl is None:
+        raise SpreadsheetError("Excel files need the openpyxl package")
+
+
+def is_xlsx(file) -> bool:
+    """Whether a seekable binary file starts like an XLSX (ZIP) archive."""
+    position = file.tell()
+    try:
+        return file.read(len(_ZIP_SIGNATURE)) == _ZIP_SIGNATURE
+    finally:
+        file.seek(position)
+
+
+def iter_xlsx_rows(file, sheet_name=None):
+    """
+    Yield each row of a worksheet as a tuple of cell values.
+
+    Rows are as long as their last stored cell, so trailing empty cells
+    may be missing.
+
+    Arguments:
+    - file: Path or seekable binary file
+    - sheet_name (str): Worksheet to read (default: the active one)
+
+    Raises:
+    - SpreadsheetError: If openpyxl is missing, the file is not a valid
+      workbook or the sheet does not exist
+    """
+    _require_openpyxl()
+    try:
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    except Exception as e:
+        raise SpreadsheetError(f"Not a valid Excel workbook: {e}")
+    try:
+        if sheet_name is None:
+            worksheet = workbook.active
+        elif sheet_name in workbook.sheetnames:
+            worksheet = workbook[sheet_name]
+        else:
+            raise SpreadsheetError(f"Worksheet '{sheet_name}' not found")
+        # Saved dimensions can be wrong; read to the real end of the sheet
+        worksheet.reset_dimensions()
+        yield from worksheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def cell_text(value) -> str:
+    """Text of a read cell value, as a CSV reader would have returned it."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, datetime.datetime):
+        if value.time() == datetime.time.min:
+            return value.date().isoformat()
+        return value.isoformat()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _cell_value(value):
+    if value is None or isinstance(value, (bool, int, float, decimal.Decimal)):
+        return value
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        # Excel has no time zones; aware values are written in UTC
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value
+    if isinstance(value, (list, tuple)):
+        value = ', '.join(str(item) for item in value)
+    elif not isinstance(value, str):
+        value = str(value)
+    return ILLEGAL_CHARACTERS_RE.sub('', value)
+
+
+def write_xlsx(target, sheets):
+    """
+    Write worksheets row by row.
+
+    Arguments:
+    - target: Path or writable binary file
+    - sheets: Iterable of (title, rows) pairs, each rows an iterable of
+      sequences. Both are consumed lazily, so a later sheet may describe
+      an earlier one (e.g. its row count).
+
+    Returns:
+    - Dictionary {title: rows written}
+    """
+    _require_openpyxl()
+    workbook = openpyxl.Workbook(write_only=True)
+    written = {}
+    for title, rows in sheets:
+        worksheet = workbook.create_sheet(title=title)
+        count = 0
+        for row in rows:
+            worksheet.append([_cell_value(value) for value in row])
+            count += 1
+        written[title] = count
+    workbook.save(target)
+    return written
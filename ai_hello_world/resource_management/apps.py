@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class ResourceManagementConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'resource_management'
+    verbose_name = 'Resource Management'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+
+        # Register derived-data signal handlers
+        from . import signals
+        post_migrate.connect(signals.create_fulltext_index, sender=self)
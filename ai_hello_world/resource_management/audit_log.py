@@ -0,0 +1,415 @@
+"""
+Field-level change log for idle resources, partitioned by month.
+
+Backs the change tracking and retention parts of SVE-MDE-03-09. Instead of
+full record snapshots, each entry stores only the fields that changed as
+{field: [old, new]}. Entries live in one table per calendar month
+(audit_changes_YYYYMM), created on demand.
+
+Source: DD/MDE-03/03-service/SVE-MDE-03-09_v0.1.md - Audit Trail Service
+(SVE-MDE-03-09-02 Audit Trail Query, SVE-MDE-03-09-04 Audit Data Retention)
+
+Business Rules:
+    - Every partition is indexed on (entity, entity_id, changed_at, id)
+    - Timestamps are stored as fixed-width UTC text, so text order is time
+      order on every backend
+    - Queries walk partitions newest first and page with an opaque
+      (changed_at, id) cursor; partitions outside the time range are never
+      touched
+    - Entries are written by signals (resource_management.signals); bulk
+      writes that bypass signals must call record_changes()
+    - Closed months can be archived: rows are streamed to a gzip JSON-lines
+      file and the partition is dropped. The row count check and the DROP
+      run in one transaction holding the partition's write lock, so no row
+      can land between the check and the drop. The live month is never
+      read or locked, and archives can be restored
+"""
+
+import base64
+import binascii
+import gzip
+import json
+import os
+import re
+import uuid
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+
+PARTITION_PREFIX = 'audit_changes_'
+
+_PARTITION_RE = re.compile(rf'^{PARTITION_PREFIX}(\d{{6}})$')
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+_COLUMNS = ('id', 'entity', 'entity_id', 'changed_at', 'operation', 'changes', 'user_id', 'version')
+
+ARCHIVE_BATCH_SIZE = 5000
+MAX_QUERY_LIMIT = 500
+
+# Partitions known to exist, per database alias. Only filled when the
+# CREATE ran outside a transaction, so a rollback cannot make it stale.
+_known = {}
+
+
+def _db_alias(model=None):
+    from .models import IdleResource
+    return router.db_for_write(model or IdleResource)
+
+
+def _dumps(value):
+    return json.dumps(value, cls=DjangoJSONEncoder, separators=(',', ':'))
+
+
+def _format_timestamp(value):
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, dt_timezone.utc)
+    return value.astimezone(dt_timezone.utc).strftime(_TIMESTAMP_FORMAT)
+
+
+def _parse_timestamp(value):
+    return datetime.strptime(value, _TIMESTAMP_FORMAT).replace(tzinfo=dt_timezone.utc)
+
+
+def month_key(value):
+    """'YYYYMM' of a datetime in UTC."""
+    return _format_timestamp(value)[:7].replace('-', '')
+
+
+def partition_name(month):
+    """Table name for a 'YYYYMM' month."""
+    if not re.fullmatch(r'\d{6}', str(month)):
+        raise ValueError(f"Invalid partition month '{month}'")
+    return f'{PARTITION_PREFIX}{month}'
+
+
+def list_partitions(using=None):
+    """Existing partition months ('YYYYMM'), oldest first."""
+    using = using or _db_alias()
+    with connections[using].cursor() as cursor:
+        tables = connections[using].introspection.table_names(cursor)
+    return sorted(match.group(1) for match in map(_PARTITION_RE.match, tables) if match)
+
+
+def ensure_partition(month, using=None):
+    """Create the partition table and its index if they do not exist."""
+    using = using or _db_alias()
+    name = partition_name(month)
+    if name in _known.get(using, ()):
+        return name
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {name} ("
+            "id VARCHAR(32) NOT NULL PRIMARY KEY, "
+            "entity VARCHAR(50) NOT NULL, "
+            "entity_id VARCHAR(64) NOT NULL, "
+            "changed_at VARCHAR(26) NOT NULL, "
+            "operation VARCHAR(10) NOT NULL, "
+            "changes TEXT NOT NULL, "
+            "user_id VARCHAR(36) NULL, "
+            "version INTEGER NULL)"
+        )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name}_record ON {name} (entity, entity_id, changed_at, id)"
+        )
+    if not connection.in_atomic_block:
+        _known.setdefault(using, set()).add(name)
+    return name
+
+
+def diff(old, new):
+    """{field: [old, new]} for the fields whose values differ."""
+    old = old or {}
+    return {
+        field: [old.get(field), value]
+        for field, value in new.items()
+        if field not in old or old[field] != value
+    }
+
+
+def snapshot(instance, fields):
+    """Current values of ``fields`` on a model instance."""
+    return {field: getattr(instance, field) for field in fields}
+
+
+def change_entry(instance, operation, fields, user_id=None):
+    """
+    Entry for one instance, diffing its load-time snapshot with its current values.
+
+    Returns None for an update that changed none of ``fields`` or whose
+    previous values are unknown (the instance was not loaded from the
+    database).
+    """
+    current = snapshot(instance, fields)
+    previous = getattr(instance, '_audit_snapshot', None)
+    if operation == 'create':
+        changes = {field: [None, value] for field, value in current.items() if value not in (None, '', [], {})}
+    elif operation == 'delete':
+        changes = {field: [value, None] for field, value in (previous or current).items()}
+    else:
+        if previous is None:
+            return None
+        changes = diff(previous, current)
+        if not changes:
+            return None
+    return {
+        'entity': instance._meta.db_table,
+        'entity_id': str(instance.pk),
+        'operation': operation,
+        'changes': changes,
+        'user_id': user_id,
+        'version': getattr(instance, 'version', None),
+    }
+
+
+def record_changes(entries, using=None, changed_at=None):
+    """
+    Append change entries, one INSERT batch per month partition.
+
+    Arguments:
+    - entries (iterable): Dicts with entity, entity_id, operation, changes
+      and optionally user_id, version and changed_at (datetime)
+    - using (str): Database alias
+    - changed_at (datetime): Default timestamp (now)
+
+    Returns:
+    - Number of entries written
+    """
+    using = using or _db_alias()
+    default_time = changed_at or timezone.now()
+    by_partition = {}
+    for entry in entries:
+        if entry is None:
+            continue
+        timestamp = entry.get('changed_at') or default_time
+        by_partition.setdefault(month_key(timestamp), []).append((
+            uuid.uuid4().hex,
+            entry['entity'],
+            str(entry['entity_id']),
+            _format_timestamp(timestamp),
+            entry['operation'],
+            _dumps(entry['changes']),
+            None if entry.get('user_id') is None else str(entry['user_id'])[:36],
+            entry.get('version'),
+        ))
+
+    written = 0
+    for month, rows in by_partition.items():
+        name = ensure_partition(month, using)
+        with connections[using].cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {name} ({', '.join(_COLUMNS)}) VALUES ({', '.join(['%s'] * len(_COLUMNS))})",
+                rows
+            )
+        written += len(rows)
+    return written
+
+
+def encode_cursor(changed_at, entry_id):
+    raw = json.dumps({'t': changed_at, 'i': entry_id}, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    (changed_at text, id) from an opaque cursor.
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        changed_at, entry_id = payload['t'], payload['i']
+        _parse_timestamp(changed_at)
+        uuid.UUID(hex=entry_id)
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+        raise ValidationError("Invalid audit history cursor")
+    return changed_at, entry_id
+
+
+def query_changes(entity, entity_id=None, start=None, end=None, cursor=None, limit=50, using=None):
+    """
+    Change entries for an entity (or one record of it), newest first.
+
+    Arguments:
+    - entity (str): Entity name (the source table, e.g. 'idle_resources')
+    - entity_id: Record id; None for every record of the entity
+    - start (datetime): Inclusive lower bound
+    - end (datetime): Exclusive upper bound
+    - cursor (str): next_cursor of the previous page
+    - limit (int): Page size (at most MAX_QUERY_LIMIT)
+    - using (str): Database alias
+
+    Returns:
+    - Dictionary with 'results' (id, entity, entity_id, changed_at,
+      operation, changes as {field: {'old', 'new'}}, user_id, version) and
+      'next_cursor' (None on the last page)
+    """
+    using = using or _db_alias()
+    limit = max(1, min(limit, MAX_QUERY_LIMIT))
+    after = decode_cursor(cursor) if cursor else None
+
+    months = list_partitions(using)
+    if start is not None:
+        months = [month for month in months if month >= month_key(start)]
+    if end is not None:
+        months = [month for month in months if month <= month_key(end)]
+    if after is not None:
+        # Partitions newer than the cursor were exhausted on earlier pages
+        months = [month for month in months if month <= after[0][:7].replace('-', '')]
+
+    rows = []
+    for month in reversed(months):
+        conditions, params = ['entity = %s'], [entity]
+        if entity_id is not None:
+            conditions.append('entity_id = %s')
+            params.append(str(entity_id))
+        if start is not None:
+            conditions.append('changed_at >= %s')
+            params.append(_format_timestamp(start))
+        if end is not None:
+            conditions.append('changed_at < %s')
+            params.append(_format_timestamp(end))
+        if after is not None:
+            conditions.append('(changed_at < %s OR (changed_at = %s AND id < %s))')
+            params.extend([after[0], after[0], after[1]])
+        with connections[using].cursor() as db_cursor:
+            db_cursor.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM {partition_name(month)} "
+                f"WHERE {' AND '.join(conditions)} ORDER BY changed_at DESC, id DESC LIMIT %s",
+                params + [limit + 1 - len(rows)]
+            )
+            rows.extend(db_cursor.fetchall())
+        if len(rows) > limit:
+            break
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        'results': [_format_row(row) for row in rows],
+        'next_cursor': encode_cursor(rows[-1][3], rows[-1][0]) if has_more else None,
+    }
+
+
+def _format_row(row):
+    entry = dict(zip(_COLUMNS, row))
+    entry['changed_at'] = _parse_timestamp(entry['changed_at'])
+    entry['changes'] = {
+        field: {'old': values[0], 'new': values[1]} for field, values in json.loads(entry['changes']).items()
+    }
+    return entry
+
+
+def archive_partition(month, archive_dir, using=None, batch_size=ARCHIVE_BATCH_SIZE):
+    """
+    Move a closed month to a gzip JSON-lines file and drop its table.
+
+    Rows are streamed in keyset batches to a temporary file that is renamed
+    into place once complete; the table is only dropped after the file is
+    written and its row count matches, checked under the same lock as the
+    drop.
+
+    Returns:
+    - Dictionary with partition, rows, path and bytes
+
+    Raises:
+    - ValueError: If the month is the current (live) month or later, or
+      the partition does not exist
+    """
+    using = using or _db_alias()
+    name = partition_name(month)
+    if month >= month_key(timezone.now()):
+        raise ValueError(f"Partition {name} is still live")
+    if month not in list_partitions(using):
+        raise ValueError(f"Partition {name} does not exist")
+
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f'{name}.jsonl.gz')
+    temporary = f'{path}.tmp'
+    written = 0
+    last = None
+    with gzip.open(temporary, 'wt', encoding='utf-8') as archive:
+        while True:
+            condition, params = '', []
+            if last is not None:
+                condition, params = 'WHERE changed_at > %s OR (changed_at = %s AND id > %s)', [last[0], last[0], last[1]]
+            with connections[using].cursor() as cursor:
+                cursor.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM {name} {condition} ORDER BY changed_at, id LIMIT %s",
+                    params + [batch_size]
+                )
+                rows = cursor.fetchall()
+            if not rows:
+                break
+            for row in rows:
+                archive.write(_dumps(dict(zip(_COLUMNS, row))) + '\n')
+            written += len(rows)
+            last = (rows[-1][3], rows[-1][0])
+
+    connection = connections[using]
+    try:
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            _lock_partition(cursor, connection.vendor, name)
+            cursor.execute(f"SELECT COUNT(*) FROM {name}")
+            if cursor.fetchone()[0] != written:
+                raise ValueError(f"Partition {name} changed while it was being archived")
+            cursor.execute(f"DROP TABLE {name}")
+            os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    _known.get(using, set()).discard(name)
+
+    return {'partition': name, 'rows': written, 'path': path, 'bytes': os.path.getsize(path)}
+
+
+def _lock_partition(cursor, vendor, name):
+    """Block writes to a partition until the surrounding transaction ends."""
+    if vendor == 'postgresql':
+        cursor.execute(f"LOCK TABLE {name} IN ACCESS EXCLUSIVE MODE")
+    elif vendor == 'mysql':
+        cursor.execute(f"SELECT COUNT(*) FROM {name} FOR UPDATE")
+    else:
+        # SQLite has one database-wide write lock; any write statement takes it
+        cursor.execute(f"DELETE FROM {name} WHERE 1 = 0")
+
+
+def restore_partition(path, using=None, batch_size=ARCHIVE_BATCH_SIZE):
+    """
+    Load an archive written by archive_partition() back into its table.
+
+    Returns:
+    - Number of rows restored
+    """
+    using = using or _db_alias()
+    match = re.search(rf'{PARTITION_PREFIX}(\d{{6}})\.jsonl\.gz$', path)
+    if not match:
+        raise ValueError(f"Not an audit partition archive: {path}")
+    name = ensure_partition(match.group(1), using)
+
+    restored = 0
+    batch = []
+    with gzip.open(path, 'rt', encoding='utf-8') as archive:
+        for line in archive:
+            entry = json.loads(line)
+            batch.append(tuple(entry[column] for column in _COLUMNS))
+            if len(batch) >= batch_size:
+                restored += _insert_rows(name, batch, using)
+                batch = []
+    restored += _insert_rows(name, batch, using)
+    return restored
+
+
+def _insert_rows(name, rows, using):
+    if not rows:
+        return 0
+    with connections[using].cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {name} ({', '.join(_COLUMNS)}) VALUES ({', '.join(['%s'] * len(_COLUMNS))})",
+            rows
+        )
+    return len(rows)
@@ -0,0 +1,136 @@
+"""
+Facet aggregation for idle resource listings and advanced search.
+
+Computes value counts for several facets of the *current* filter set in a
+single SQL round-trip: one GROUP BY branch per facet, glued together with
+UNION ALL. This replaces the placeholder facets of API-MDE-03-09 and the
+``aggregations`` block of API-MDE-03-01.
+
+Source: DD/MDE-03/02-api/API-MDE-03-09_v0.1.md - Advanced Search
+
+Business Rules:
+    - Counts are distinct resources, so multi-valued facets (location, via
+      availability periods) never double count a resource
+    - NULL facet values are omitted
+    - Unknown facet names are ignored rather than rejected
+"""
+
+import uuid
+
+from django.db.models import CharField, Count, F, Value
+from django.db.models.functions import Cast
+
+
+# API facet name -> IdleResource lookup path
+FACET_FIELDS = {
+    'departmentId': 'employee__department_id',
+    'idleType': 'resource_type',
+    'status': 'status',
+    'jobRank': 'employee__position',
+    'location': 'availability_periods__location_constraints',
+}
+
+# Same facets on the flat idle_resource_read_model projection; location lives
+# on availability periods and is counted through a subquery instead
+READ_MODEL_FACET_FIELDS = {
+    'departmentId': 'department_id',
+    'idleType': 'resource_type',
+    'status': 'status',
+    'jobRank': 'position',
+}
+
+# Facets backed by UUID columns; SQLite returns them as 32-char hex
+_UUID_FACETS = {'departmentId'}
+
+DEFAULT_FACETS = ('departmentId', 'idleType')
+
+
+def _location_branch(queryset, name):
+    """Location facet of a projection queryset, grouped over availability periods."""
+    from .models import ResourceAvailability
+
+    return (
+        ResourceAvailability.objects
+        .filter(resource_id__in=queryset.values('id'), is_deleted=False)
+        .annotate(facet_name=Value(name, output_field=CharField()),
+                  facet_value=Cast(F('location_constraints'), output_field=CharField()))
+        .values('facet_name', 'facet_value')
+        .annotate(facet_count=Count('resource_id', distinct=True))
+        .values_list('facet_name', 'facet_value', 'facet_count')
+    )
+
+
+def _facet_branch(queryset, name):
+    """GROUP BY query yielding (facet, value, count) rows for one facet."""
+    if _is_read_model(queryset):
+        if name == 'location':
+            return _location_branch(queryset, name)
+        path = READ_MODEL_FACET_FIELDS[name]
+    else:
+        path = FACET_FIELDS[name]
+    branch = queryset.order_by()
+    if name == 'location':
+        branch = branch.filter(availability_periods__is_deleted=False)
+    return (
+        branch
+        .annotate(facet_name=Value(name, output_field=CharField()),
+                  facet_value=Cast(F(path), output_field=CharField()))
+        .values('facet_name', 'facet_value')
+        .annotate(facet_count=Count('id', distinct=True))
+        .values_list('facet_name', 'facet_value', 'facet_count')
+    )
+
+
+def _is_read_model(queryset):
+    return queryset.model._meta.db_table == 'idle_resource_read_model'
+
+
+def _present_value(name, value):
+    """Normalise a raw grouped value for the API response."""
+    if name in _UUID_FACETS:
+        try:
+            return str(uuid.UUID(value))
+        except (TypeError, ValueError):
+            return value
+    return value
+
+
+def compute_facets(queryset, facet_names=None):
+    """
+    Count resources per facet value for an idle resource queryset.
+
+    Arguments:
+    - queryset: Filtered IdleResource or IdleResourceReadModel queryset
+      (any ordering)
+    - facet_names (iterable): API facet names; defaults to DEFAULT_FACETS
+
+    Returns:
+    - Dictionary {facet_name: {value: count}} ordered by count descending
+    """
+    names = [name for name in (facet_names or DEFAULT_FACETS) if name in FACET_FIELDS]
+    if not names:
+        return {}
+
+    # Plain rows only: select_related/extra select columns would break the UNION
+    base = queryset.select_related(None).order_by()
+    branches = [_facet_branch(base, name) for name in names]
+    combined = branches[0].union(*branches[1:], all=True) if len(branches) > 1 else branches[0]
+
+    facets = {name: {} for name in names}
+    for name, value, count in combined:
+        if value is None or value == '':
+            continue
+        facets[name][_present_value(name, value)] = count
+
+    return {
+        name: dict(sorted(values.items(), key=lambda item: (-item[1], item[0])))
+        for name, values in facets.items()
+    }
+
+
+def list_aggregations(facets):
+    """Shape facet counts as the list API ``aggregations`` block."""
+    return {
+        'byDepartment': facets.get('departmentId', {}),
+        'byIdleType': facets.get('idleType', {}),
+    }
@@ -0,0 +1,267 @@
+"""
+Full-text search index for idle resources (SQLite FTS5).
+
+Backs the ``searchQuery`` parameter of API-MDE-03-01 and the ``query`` field
+of API-MDE-03-09. One FTS5 row is kept per IdleResource covering employee
+name, employee number, skills, position and free-text notes.
+
+Source: DD/MDE-03/02-api/API-MDE-03-09_v0.1.md - Advanced Search
+
+Business Rules:
+    - Text is folded before indexing and querying: case, combining marks and
+      the Vietnamese letter "đ" all collapse, so "Đức" matches "duc"
+    - Every query term is a prefix match ("jav" finds "java")
+    - Terms are ANDed; results are ranked with bm25, weighting name and
+      employee number above skills, position and notes
+    - The index is maintained by signals (resource_management.signals);
+      bulk writes that bypass signals must call index_resources()
+    - On databases without FTS5 the search degrades to icontains filters
+"""
+
+import re
+import unicodedata
+
+from django.db import connections, router
+from django.db.models import Q
+from django.db.utils import OperationalError
+
+
+FTS_TABLE = 'idle_resource_fts'
+
+# bm25 weights follow column order; resource_id is UNINDEXED
+_BM25_WEIGHTS = '0.0, 10.0, 8.0, 4.0, 2.0, 1.0'
+
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+_available = {}
+
+
+def fold_text(text):
+    """Lower-case and strip diacritics, including Vietnamese đ/Đ."""
+    if not text:
+        return ''
+    text = str(text).replace('đ', 'd').replace('Đ', 'D')
+    decomposed = unicodedata.normalize('NFD', text)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped.casefold()
+
+
+def build_match_expression(query):
+    """
+    Turn a user query into an FTS5 MATCH expression.
+
+    Each word becomes a quoted prefix term, which also neutralises FTS5
+    operators and punctuation in user input. Returns '' for empty queries.
+    """
+    terms = _TERM_RE.findall(fold_text(query))
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _db_alias(model=None):
+    from .models import IdleResource
+    return router.db_for_write(model or IdleResource)
+
+
+def is_available(using=None):
+    """Whether the FTS5 table exists on the given database."""
+    using = using or _db_alias()
+    if using not in _available:
+        connection = connections[using]
+        if connection.vendor != 'sqlite':
+            _available[using] = False
+        else:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE]
+                )
+                _available[using] = cursor.fetchone() is not None
+    return _available[using]
+
+
+def create_index(using=None):
+    """Create the FTS5 virtual table if the backend supports it."""
+    using = using or _db_alias()
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return False
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                "resource_id UNINDEXED, employee_name, employee_number, skills, position, notes, "
+                "tokenize = 'unicode61 remove_diacritics 2')"
+            )
+    except OperationalError:
+        # SQLite built without FTS5
+        _available[using] = False
+        return False
+    _available[using] = True
+    return True
+
+
+def _collect_documents(resource_ids):
+    """Load everything the index needs for a batch of resources in three queries."""
+    from .models import IdleResource, ResourceAvailability, ResourceSkill
+
+    documents = {}
+    rows = IdleResource.objects.filter(id__in=resource_ids).values_list(
+        'id', 'skills', 'employee__first_name', 'employee__last_name',
+        'employee__employee_number', 'employee__position'
+    )
+    for pk, skills, first_name, last_name, number, position in rows:
+        skill_names = [
+            skill.get('name', '') if isinstance(skill, dict) else str(skill)
+            for skill in (skills if isinstance(skills, list) else [])
+        ]
+        documents[pk] = {
+            'employee_name': f"{first_name or ''} {last_name or ''}".strip(),
+            'employee_number': number or '',
+            'skills': skill_names,
+            'position': position or '',
+            'notes': [],
+        }
+
+    detailed = ResourceSkill.objects.filter(
+        resource_id__in=documents.keys(), is_deleted=False
+    ).values_list('resource_id', 'skill_name', 'notes')
+    for resource_id, skill_name, notes in detailed:
+        documents[resource_id]['skills'].append(skill_name)
+        if notes:
+            documents[resource_id]['notes'].append(notes)
+
+    periods = ResourceAvailability.objects.filter(
+        resource_id__in=documents.keys(), is_deleted=False
+    ).exclude(notes='').values_list('resource_id', 'notes')
+    for resource_id, notes in periods:
+        documents[resource_id]['notes'].append(notes)
+
+    return documents
+
+
+def index_resources(resource_ids, using=None):
+    """
+    (Re)index the given resources; ids that no longer exist are removed.
+
+    Returns the number of documents written.
+    """
+    resource_ids = list(resource_ids)
+    using = using or _db_alias()
+    if not resource_ids or not is_available(using):
+        return 0
+
+    documents = _collect_documents(resource_ids)
+    keys = [pk.hex for pk in resource_ids]
+    with connections[using].cursor() as cursor:
+        placeholders = ', '.join(['%s'] * len(keys))
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE resource_id IN ({placeholders})", keys)
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} "
+            "(resource_id, employee_name, employee_number, skills, position, notes) "
+            "VALUES (%s, %s, %s, %s, %s, %s)",
+            [
+                (
+                    pk.hex,
+                    fold_text(doc['employee_name']),
+                    fold_text(doc['employee_number']),
+                    fold_text(' '.join(doc['skills'])),
+                    fold_text(doc['position']),
+                    fold_text(' '.join(doc['notes'])),
+                )
+                for pk, doc in documents.items()
+            ]
+        )
+    return len(documents)
+
+
+def remove_resources(resource_ids, using=None):
+    """Drop index rows for deleted resources."""
+    keys = [pk.hex for pk in resource_ids]
+    using = using or _db_alias()
+    if not keys or not is_available(using):
+        return
+    with connections[using].cursor() as cursor:
+        placeholders = ', '.join(['%s'] * len(keys))
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE resource_id IN ({placeholders})", keys)
+
+
+def _fallback_condition(query):
+    """icontains filter used when FTS5 is unavailable."""
+    condition = Q()
+    for term in query.split():
+        condition &= (
+            Q(employee__first_name__icontains=term) |
+            Q(employee__last_name__icontains=term) |
+            Q(employee__employee_number__icontains=term) |
+            Q(employee__position__icontains=term) |
+            Q(skills__icontains=term)
+        )
+    return condition
+
+
+def _read_model_fallback_condition(query):
+    """icontains filter on the flat projection columns."""
+    condition = Q()
+    for term in query.split():
+        condition &= (
+            Q(employee_name__icontains=term) |
+            Q(employee_number__icontains=term) |
+            Q(position__icontains=term) |
+            Q(skills__icontains=term)
+        )
+    return condition
+
+
+def _fallback_condition_for(queryset, query):
+    """Fallback filter matching the queryset's model (source tables or projection)."""
+    if queryset.model._meta.db_table == 'idle_resource_read_model':
+        return _read_model_fallback_condition(query)
+    return _fallback_condition(query)
+
+
+def _id_column(queryset):
+    """Qualified primary key column of the queryset's table."""
+    opts = queryset.model._meta
+    return f"{opts.db_table}.{opts.pk.column}"
+
+
+def filter_queryset(queryset, query):
+    """
+    Restrict a queryset to full-text matches (order untouched).
+
+    Works on IdleResource and on IdleResourceReadModel, which share ids.
+    """
+    expression = build_match_expression(query)
+    if not expression:
+        return queryset
+    if not is_available(queryset.db):
+        return queryset.filter(_fallback_condition_for(queryset, query))
+    return queryset.extra(
+        where=[
+            f"{_id_column(queryset)} IN (SELECT resource_id FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s)"
+        ],
+        params=[expression]
+    )
+
+
+def rank_queryset(queryset, query):
+    """
+    Restrict to matches and order by relevance (best first).
+
+    Adds a ``search_rank`` attribute (bm25; lower is better) to each row.
+    """
+    expression = build_match_expression(query)
+    if not expression:
+        return queryset
+    if not is_available(queryset.db):
+        return queryset.filter(_fallback_condition_for(queryset, query))
+    return queryset.extra(
+        select={'search_rank': f"bm25({FTS_TABLE}, {_BM25_WEIGHTS})"},
+        tables=[FTS_TABLE],
+        where=[
+            f"{FTS_TABLE}.resource_id = {_id_column(queryset)}",
+            f"{FTS_TABLE} MATCH %s",
+        ],
+        params=[expression],
+        order_by=['search_rank']
+    )
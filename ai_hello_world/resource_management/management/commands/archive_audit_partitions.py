@@ -0,0 +1,65 @@
+"""
+Archive closed months of the field-level audit change log.
+
+Schedule monthly (e.g. cron on the 1st at 01:00). Every partition older
+than --older-than-months is streamed to <archive-dir>/audit_changes_YYYYMM.jsonl.gz
+and dropped; the current and next month partitions are created ahead of use.
+Use --restore to load an archive back.
+
+Usage:
+    python manage.py archive_audit_partitions [--older-than-months 12] [--archive-dir PATH]
+    python manage.py archive_audit_partitions --restore PATH
+"""
+
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from resource_management import audit_log
+
+
+class Command(BaseCommand):
+    help = 'Move closed audit change log partitions to compressed archive files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than-months', type=int, default=12,
+                            help='Archive partitions at least this many months before the current one')
+        parser.add_argument('--archive-dir', default=None,
+                            help="Archive directory (default AUDIT_LOG['ARCHIVE_DIR'])")
+        parser.add_argument('--restore', metavar='PATH', default=None,
+                            help='Restore one archive file instead of archiving')
+
+    def handle(self, *args, **options):
+        if options['restore']:
+            try:
+                restored = audit_log.restore_partition(options['restore'])
+            except (OSError, ValueError) as e:
+                raise CommandError(str(e))
+            self.stdout.write(self.style.SUCCESS(f"Restored {restored} entries from {options['restore']}"))
+            return
+
+        if options['older_than_months'] < 1:
+            raise CommandError('--older-than-months must be at least 1')
+        archive_dir = options['archive_dir'] or getattr(settings, 'AUDIT_LOG', {}).get(
+            'ARCHIVE_DIR', os.path.join(settings.BASE_DIR, 'audit_archive')
+        )
+
+        now = timezone.now()
+        current = now.year * 12 + now.month - 1
+        for offset in (0, 1):
+            year, month = divmod(current + offset, 12)
+            audit_log.ensure_partition(f'{year:04d}{month + 1:02d}')
+
+        year, month = divmod(current - options['older_than_months'], 12)
+        cutoff = f'{year:04d}{month + 1:02d}'
+        archived = 0
+        for partition in audit_log.list_partitions():
+            if partition > cutoff:
+                break
+            result = audit_log.archive_partition(partition, archive_dir)
+            archived += 1
+            self.stdout.write(f"{result['partition']}: {result['rows']} entries -> {result['path']} ({result['bytes']} bytes)")
+
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} partitions'))
@@ -0,0 +1,47 @@
+"""
+Rebuild the denormalized idle resource read model (idle_resource_read_model).
+
+Usage:
+    python manage.py rebuild_read_model [--batch-size 1000]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from resource_management.models import IdleResource, IdleResourceReadModel
+
+
+class Command(BaseCommand):
+    help = 'Recompute idle_resource_read_model from idle_resources, employees and departments'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of resources projected per transaction')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        processed = 0
+        last_id = None
+
+        # Walk ids by keyset so writes between batches never disturb the scan
+        while True:
+            queryset = IdleResource.objects.order_by('id')
+            if last_id is not None:
+                queryset = queryset.filter(id__gt=last_id)
+            batch = list(queryset.values_list('id', flat=True)[:batch_size])
+            if not batch:
+                break
+
+            with transaction.atomic():
+                IdleResourceReadModel.refresh_resources(batch)
+            processed += len(batch)
+            last_id = batch[-1]
+
+        # Rows whose resource vanished without a signal (raw SQL, fixtures)
+        orphans = IdleResourceReadModel.objects.exclude(
+            id__in=IdleResource.objects.values('id')
+        ).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Projected {processed} resources ({orphans} orphaned rows removed)'
+        ))
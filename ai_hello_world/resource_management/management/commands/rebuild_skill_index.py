@@ -0,0 +1,44 @@
+"""
+Rebuild the normalized skill index (resource_skill_index).
+
+Usage:
+    python manage.py rebuild_skill_index [--batch-size 1000]
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from resource_management.models import IdleResource, ResourceSkillToken
+
+
+class Command(BaseCommand):
+    help = 'Recompute resource_skill_index from idle_resources.skills and resource_skills'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of resources re-indexed per transaction')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        added = removed = processed = 0
+        last_id = None
+
+        # Walk ids by keyset so writes between batches never disturb the scan
+        while True:
+            queryset = IdleResource.objects.order_by('id')
+            if last_id is not None:
+                queryset = queryset.filter(id__gt=last_id)
+            batch = list(queryset.values_list('id', flat=True)[:batch_size])
+            if not batch:
+                break
+
+            with transaction.atomic():
+                result = ResourceSkillToken.sync_resources(batch)
+            added += result['added']
+            removed += result['removed']
+            processed += len(batch)
+            last_id = batch[-1]
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Re-indexed {processed} resources ({added} tokens added, {removed} removed)'
+        ))
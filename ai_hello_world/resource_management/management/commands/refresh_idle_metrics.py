@@ -0,0 +1,34 @@
+"""
+Refresh the computed idle_mm / is_urgent columns of idle_resources.
+
+Schedule nightly (e.g. cron at 00:05): urgency depends on the current date
+and drifts without any write. Use --recompute-idle-months after loading
+data that bypassed IdleResource.save().
+
+Usage:
+    python manage.py refresh_idle_metrics [--batch-size 1000] [--recompute-idle-months]
+"""
+
+from django.core.management.base import BaseCommand
+
+from resource_management.models import IdleResource
+
+
+class Command(BaseCommand):
+    help = 'Recompute time-dependent idle resource columns with batched UPDATE statements'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of resources updated per transaction')
+        parser.add_argument('--recompute-idle-months', action='store_true',
+                            help='Also recompute idle_mm from the availability window')
+
+    def handle(self, *args, **options):
+        result = IdleResource.bulk_refresh_computed_fields(
+            batch_size=options['batch_size'],
+            recompute_idle_months=options['recompute_idle_months']
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Scanned {result['scanned']} resources ({result['changed']} urgency flags changed)"
+        ))
@@ -0,0 +1,64 @@
+"""
+Resume interrupted idle resource imports from their last checkpoint.
+
+Run at worker start-up (or from cron) to pick up imports whose worker died:
+without ids, every failed import and every 'processing' import that has
+not checkpointed for RESOURCE_IMPORT['STALE_AFTER'] seconds is resumed.
+
+Usage:
+    python manage.py resume_imports [IMPORT_ID ...] [--force] [--dry-run]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from resource_management.models import ImportSession
+from services.exceptions import DataNotFoundException, ValidationException
+from services.resource_management.import_service import ResourceImportService, is_resumable, is_stale
+
+
+class Command(BaseCommand):
+    help = 'Continue interrupted imports from their last checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('import_ids', nargs='*', metavar='IMPORT_ID',
+                            help='Imports to resume (default: all interrupted imports)')
+        parser.add_argument('--force', action='store_true',
+                            help="Also take over 'processing' imports that checkpointed recently")
+        parser.add_argument('--dry-run', action='store_true',
+                            help='List the imports that would be resumed')
+
+    def handle(self, *args, **options):
+        if options['import_ids']:
+            import_ids = options['import_ids']
+        else:
+            import_ids = [
+                str(session.pk)
+                for session in ImportSession.objects.filter(status__in=('processing', 'failed')).order_by('started_at')
+                if is_resumable(session) and (session.status == 'failed' or options['force'] or is_stale(session))
+            ]
+
+        if options['dry_run']:
+            for import_id in import_ids:
+                self.stdout.write(import_id)
+            return
+
+        failures = 0
+        for import_id in import_ids:
+            try:
+                result = ResourceImportService({'user_id': 'system'}).resume_import(import_id, force=options['force']).data
+            except (DataNotFoundException, ValidationException) as e:
+                failures += 1
+                self.stderr.write(f'{import_id}: {e.message}')
+                continue
+            except Exception as e:
+                failures += 1
+                self.stderr.write(f'{import_id}: failed again: {e}')
+                continue
+            self.stdout.write(
+                f"{import_id}: {result['status']} ({result['created']} created, {result['updated']} updated, "
+                f"{result['invalid_rows']} invalid)"
+            )
+
+        if failures:
+            raise CommandError(f'{failures} of {len(import_ids)} imports could not be resumed')
+        self.stdout.write(self.style.SUCCESS(f'Resumed {len(import_ids)} imports'))
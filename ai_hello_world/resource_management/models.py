@@ -5,12 +5,89 @@ Fixed version without duplicate primary keys.
 """
 
 import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from common.models import BaseModel, TimestampedModel
 
 
+def _apply_resource_filters(queryset, filters, department_field):
+    """
+    Apply list/search filter criteria to an idle resource queryset.
+    
+    Shared by IdleResource and IdleResourceReadModel so both read paths
+    have exactly the same filter semantics; only the department column
+    differs (a join on the source tables, a plain column on the projection).
+    """
+    from django.db.models import Q
+    
+    if not filters:
+        return queryset
+    
+    # Status filter
+    if 'status' in filters:
+        queryset = queryset.filter(status=filters['status'])
+    
+    # Resource type filter (single value or list)
+    if 'resource_type' in filters:
+        if isinstance(filters['resource_type'], (list, tuple)):
+            queryset = queryset.filter(resource_type__in=filters['resource_type'])
+        else:
+            queryset = queryset.filter(resource_type=filters['resource_type'])
+    
+    # Department filter
+    if 'department_id' in filters:
+        queryset = queryset.filter(**{department_field: filters['department_id']})
+    
+    # Department access scope (one IN list, see DepartmentClosure)
+    if 'department_scope' in filters:
+        queryset = queryset.filter(**{f'{department_field}__in': filters['department_scope']})
+    
+    # Skills filter (exact, case-insensitive token match via the skill index)
+    if 'skills' in filters:
+        skills = filters['skills'] if isinstance(filters['skills'], list) else [filters['skills']]
+        if ResourceSkillToken.tokens_for(skills):
+            match = filters.get('skills_match', 'all')
+            queryset = queryset.filter(id__in=ResourceSkillToken.matching_resource_ids(skills, match))
+    
+    # Experience filter
+    if 'min_experience' in filters:
+        queryset = queryset.filter(experience_years__gte=filters['min_experience'])
+    
+    # Availability filter
+    if 'available_from' in filters:
+        queryset = queryset.filter(
+            Q(availability_start__lte=filters['available_from']) |
+            Q(availability_start__isnull=True)
+        )
+    
+    if 'available_until' in filters:
+        queryset = queryset.filter(
+            Q(availability_end__gte=filters['available_until']) |
+            Q(availability_end__isnull=True)
+        )
+    
+    # Urgent cases only (stored, indexed flag)
+    if filters.get('urgent_only'):
+        queryset = queryset.filter(is_urgent=True)
+    
+    # Idle start date range filter
+    if 'date_from' in filters:
+        queryset = queryset.filter(availability_start__date__gte=filters['date_from'])
+    
+    if 'date_to' in filters:
+        queryset = queryset.filter(availability_start__date__lte=filters['date_to'])
+    
+    # Full-text search (FTS5 index, see resource_management.fulltext)
+    if filters.get('search_query'):
+        from resource_management import fulltext
+        queryset = fulltext.filter_queryset(queryset, filters['search_query'])
+    
+    return queryset
+
+
 class IdleResource(BaseModel):
     """
     MANDATORY DOCSTRING - IdleResource model for managing idle personnel information and availability.
@@ -36,8 +113,10 @@ class IdleResource(BaseModel):
     
     Custom Methods (from DAO specifications):
         - create_with_validation(): Create resource with business rule validation
+        - bulk_create_with_validation(): Batched creates with set-wise lookups
         - update_with_version_check(): Update with optimistic locking
-        - list_with_filters(): Dynamic filtering with pagination
+        - bulk_update_with_version_check(): Versioned updates in chunked conditional UPDATEs
+        - list_with_filters(): Dynamic filtering with offset or cursor pagination
         - check_availability(): Check resource availability for date range
     
     Verification Source: This information can be verified by checking
@@ -104,6 +183,33 @@ class IdleResource(BaseModel):
         blank=True,
         help_text="Hourly rate for cost calculations"
     )
+    idle_mm = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Idle months between availability start and end (computed)"
+    )
+    is_urgent = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Urgent idle case flag (computed, refreshed nightly)"
+    )
+    
+    # Urgency thresholds, see is_urgent_case()
+    URGENT_IDLE_MONTHS = 2
+    URGENT_END_WINDOW_DAYS = 14
+    
+    # Columns the computed fields depend on
+    _COMPUTED_SOURCES = {'availability_start', 'availability_end', 'status', 'is_deleted'}
+    
+    # Columns callers may change through the update DAO methods
+    UPDATABLE_FIELDS = (
+        'resource_type', 'status', 'availability_start', 'availability_end',
+        'skills', 'experience_years', 'hourly_rate'
+    )
+    
+    # Columns whose changes are kept in the audit change log
+    AUDITED_FIELDS = UPDATABLE_FIELDS + ('is_deleted',)
     
     def __str__(self):
         return f"IdleResource {self.id} - {self.employee.first_name} {self.employee.last_name} ({self.resource_type})"
@@ -128,6 +234,181 @@ class IdleResource(BaseModel):
         
         return True
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember audited values as loaded, so changes can be logged as diffs."""
+        from . import audit_log
+        
+        instance = super().from_db(db, field_names, values)
+        if all(field in field_names for field in cls.AUDITED_FIELDS):
+            instance._audit_snapshot = audit_log.snapshot(instance, cls.AUDITED_FIELDS)
+        return instance
+    
+    def save(self, *args, **kwargs):
+        """Recompute idle_mm and is_urgent whenever their inputs are written."""
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.refresh_computed_fields()
+        elif self._COMPUTED_SOURCES.intersection(update_fields):
+            self.refresh_computed_fields()
+            kwargs['update_fields'] = {*update_fields, 'idle_mm', 'is_urgent'}
+        super().save(*args, **kwargs)
+    
+    def compare_and_swap(self, update_fields, expected_version=None, using=None):
+        """Recompute idle_mm and is_urgent along with a conditional update."""
+        if self._COMPUTED_SOURCES.intersection(update_fields):
+            self.refresh_computed_fields()
+            update_fields = {*update_fields, 'idle_mm', 'is_urgent'}
+        return super().compare_and_swap(update_fields, expected_version, using)
+    
+    def refresh_computed_fields(self, today=None):
+        """Set idle_mm and is_urgent from the current field values."""
+        self.idle_mm = self.calculate_idle_months(self.availability_start, self.availability_end)
+        self.is_urgent = self.is_urgent_case(today)
+    
+    @staticmethod
+    def calculate_idle_months(start, end):
+        """Whole calendar months between two datetimes (UTC), or None if either is missing."""
+        if not start or not end:
+            return None
+        if timezone.is_aware(start):
+            start = start.astimezone(dt_timezone.utc)
+        if timezone.is_aware(end):
+            end = end.astimezone(dt_timezone.utc)
+        months = (end.year - start.year) * 12 + (end.month - start.month)
+        return max(0, months)
+    
+    def is_urgent_case(self, today=None):
+        """
+        Whether this is an urgent idle case as of ``today``.
+        
+        Business Rules:
+        - Only available, non-deleted resources can be urgent
+        - Urgent once the idle period so far (start to the earlier of end
+          and today) spans URGENT_IDLE_MONTHS or more (API-MDE-03-01)
+        - Urgent when the availability window ends within
+          URGENT_END_WINDOW_DAYS, so the resource has to be placed soon
+        """
+        if self.status != 'available' or self.is_deleted:
+            return False
+        now = today or timezone.now()
+        if self.availability_start:
+            reference = min(self.availability_end, now) if self.availability_end else now
+            elapsed = self.calculate_idle_months(self.availability_start, reference)
+            if elapsed is not None and elapsed >= self.URGENT_IDLE_MONTHS:
+                return True
+        if self.availability_end:
+            return now <= self.availability_end <= now + timedelta(days=self.URGENT_END_WINDOW_DAYS)
+        return False
+    
+    @classmethod
+    def urgent_condition(cls, today=None):
+        """
+        SQL counterpart of is_urgent_case() as a Q object.
+        
+        Relies on the stored idle_mm for the "ended before today" case, so
+        it must be applied after idle_mm is up to date.
+        """
+        from django.db.models import Q
+        
+        now = today or timezone.now()
+        current = now.astimezone(dt_timezone.utc)
+        # First instant of the month URGENT_IDLE_MONTHS - 1 months before this one;
+        # starts before it have idled at least URGENT_IDLE_MONTHS calendar months
+        month_index = current.year * 12 + current.month - 1 - (cls.URGENT_IDLE_MONTHS - 1)
+        cutoff = datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=dt_timezone.utc)
+        
+        long_idle = Q(availability_start__lt=cutoff) & (
+            Q(availability_end__isnull=True) |
+            Q(availability_end__gte=now) |
+            Q(idle_mm__gte=cls.URGENT_IDLE_MONTHS)
+        )
+        ending_soon = Q(
+            availability_end__gte=now,
+            availability_end__lte=now + timedelta(days=cls.URGENT_END_WINDOW_DAYS)
+        )
+        return Q(status='available', is_deleted=False) & (long_idle | ending_soon)
+    
+    @classmethod
+    def idle_months_expression(cls):
+        """SQL expression equal to calculate_idle_months(availability_start, availability_end)."""
+        from django.db.models import Case, IntegerField, Value, When
+        from django.db.models.functions import ExtractMonth, ExtractYear, Greatest
+        
+        utc = dt_timezone.utc
+        months = (
+            (ExtractYear('availability_end', tzinfo=utc) - ExtractYear('availability_start', tzinfo=utc)) * 12 +
+            ExtractMonth('availability_end', tzinfo=utc) - ExtractMonth('availability_start', tzinfo=utc)
+        )
+        return Case(
+            When(availability_start__isnull=True, then=Value(None)),
+            When(availability_end__isnull=True, then=Value(None)),
+            default=Greatest(months, Value(0)),
+            output_field=IntegerField()
+        )
+    
+    @classmethod
+    def bulk_refresh_computed_fields(cls, batch_size=1000, today=None, recompute_idle_months=False):
+        """
+        Refresh computed columns with batched UPDATE statements.
+        
+        Run nightly: is_urgent depends on the current date, so it drifts
+        without any write. idle_mm only changes on write and is recomputed
+        just when asked (backfills). Only rows whose value changes are
+        written; the read model projection gets the same updates.
+        
+        Arguments:
+        - batch_size (int): Resources per batch of UPDATEs
+        - today (datetime): Reference time (defaults to now)
+        - recompute_idle_months (bool): Also recompute idle_mm in SQL
+        
+        Returns:
+        - Dictionary with the number of resources scanned and flags changed
+        """
+        from django.db import transaction
+        
+        urgent = cls.urgent_condition(today)
+        scanned = changed = 0
+        last_id = None
+        
+        # Walk ids by keyset so the scan is stable while rows are updated
+        while True:
+            queryset = cls.objects.order_by('id')
+            if last_id is not None:
+                queryset = queryset.filter(id__gt=last_id)
+            batch = list(queryset.values_list('id', flat=True)[:batch_size])
+            if not batch:
+                break
+            
+            with transaction.atomic():
+                rows = cls.objects.filter(id__in=batch)
+                if recompute_idle_months:
+                    rows.update(idle_mm=cls.idle_months_expression())
+                flipped = rows.filter(urgent, is_urgent=False).update(is_urgent=True)
+                flipped += rows.filter(is_urgent=True).exclude(urgent).update(is_urgent=False)
+                
+                # UPDATEs bypass signals, so bring the projection along
+                if recompute_idle_months:
+                    IdleResourceReadModel.refresh_resources(batch)
+                elif flipped:
+                    # The projection mirrors every column the condition reads
+                    projection = IdleResourceReadModel.objects.filter(id__in=batch)
+                    projected_at = timezone.now()
+                    projection.filter(urgent, is_urgent=False).update(is_urgent=True, projected_at=projected_at)
+                    projection.filter(is_urgent=True).exclude(urgent).update(
+                        is_urgent=False, projected_at=projected_at
+                    )
+            
+            changed += flipped
+            scanned += len(batch)
+            last_id = batch[-1]
+        
+        if changed or recompute_idle_months:
+            from services.common.cache_service import search_cache
+            search_cache.invalidate()
+        
+        return {'scanned': scanned, 'changed': changed}
+    
     def clean(self):
         """Validate business rules."""
         super().clean()
@@ -158,7 +439,9 @@ class IdleResource(BaseModel):
             'hourly_rate': float(self.hourly_rate) if self.hourly_rate else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'version': self.version
+            'version': self.version,
+            'idle_mm': self.idle_mm,
+            'is_urgent': self.is_urgent
         }
     
     # DAO Methods Implementation
@@ -204,6 +487,113 @@ class IdleResource(BaseModel):
         if existing:
             warnings.append(f"Employee {employee.employee_id} already has an active resource record")
         
+        errors.extend(cls._creation_errors(data))
+        if errors:
+            return {'success': False, 'errors': errors, 'warnings': warnings}
+        
+        # Create resource
+        resource = cls.objects.create(**cls._creation_values(data, employee, created_by))
+        
+        return {
+            'success': True,
+            'resource': resource,
+            'resource_id': str(resource.id),
+            'warnings': warnings,
+            'audit_trail_id': str(resource.id)
+        }
+    
+    @classmethod
+    def bulk_create_with_validation(cls, records, created_by=None, batch_size=500):
+        """
+        Create many resources with the rules of create_with_validation.
+        
+        Source: DAO-MDE-03-01_v0.1.md - DAO-MDE-03-01-01: Create with Validation
+        
+        Instead of two lookups and an INSERT per record, all employees are
+        resolved with one IN query, active-resource conflicts are found with
+        one grouped query, records are validated in memory and the valid
+        ones are inserted with bulk_create.
+        
+        Arguments:
+        - records (list): Resource data dictionaries, as for create_with_validation
+        - created_by (str): User who created the resources
+        - batch_size (int): Rows per INSERT statement
+        
+        Returns:
+        - Dictionary with per-record 'results' (in input order, each shaped
+          like the create_with_validation result) and 'created'/'failed' counts
+        
+        Business Rules:
+        - Same errors and warnings as create_with_validation; an earlier
+          record in the same call counts as an existing active resource
+        - Records that fail validation do not stop the others
+        """
+        from django.db import transaction
+        from django.db.models import Count
+        from authentication.models import Employee
+        from . import audit_log
+        
+        employee_keys = []
+        for data in records:
+            try:
+                employee_keys.append(uuid.UUID(str(data.get('employee_id'))))
+            except ValueError:
+                employee_keys.append(None)
+        wanted = {key for key in employee_keys if key is not None}
+        employees = Employee.objects.in_bulk(wanted)
+        active = {
+            row['employee_id']
+            for row in cls.objects.filter(employee_id__in=wanted, status__in=['available', 'allocated'])
+            .values('employee_id').annotate(resources=Count('id'))
+        }
+        
+        results = []
+        pending = []
+        for data, key in zip(records, employee_keys):
+            employee = employees.get(key)
+            if employee is None:
+                results.append({
+                    'success': False, 'errors': [f"Employee {data.get('employee_id')} not found"], 'warnings': []
+                })
+                continue
+            
+            warnings = []
+            if employee.pk in active:
+                warnings.append(f"Employee {employee.employee_id} already has an active resource record")
+            errors = cls._creation_errors(data)
+            if errors:
+                results.append({'success': False, 'errors': errors, 'warnings': warnings})
+                continue
+            
+            resource = cls(**cls._creation_values(data, employee, created_by))
+            # bulk_create bypasses save(), which fills these in
+            resource.refresh_computed_fields()
+            if resource.status in ('available', 'allocated'):
+                active.add(employee.pk)
+            pending.append(resource)
+            results.append({
+                'success': True,
+                'resource': resource,
+                'resource_id': str(resource.id),
+                'warnings': warnings,
+                'audit_trail_id': str(resource.id)
+            })
+        
+        with transaction.atomic():
+            cls.objects.bulk_create(pending, batch_size=batch_size)
+            cls._sync_derived_data([resource.id for resource in pending])
+            audit_log.record_changes(
+                audit_log.change_entry(resource, 'create', cls.AUDITED_FIELDS, resource.created_by)
+                for resource in pending
+            )
+        
+        return {'results': results, 'created': len(pending), 'failed': len(records) - len(pending)}
+    
+    @staticmethod
+    def _creation_errors(data):
+        """Record-level validation shared by the create DAO methods."""
+        errors = []
+        
         # Validate date ranges
         availability_start = data.get('availability_start')
         availability_end = data.get('availability_end')
@@ -217,31 +607,21 @@ class IdleResource(BaseModel):
         if skills and not isinstance(skills, list):
             errors.append("Skills must be a list")
         
-        if errors:
-            return {'success': False, 'errors': errors, 'warnings': warnings}
-        
-        # Create resource
-        resource_data = {
+        return errors
+    
+    @staticmethod
+    def _creation_values(data, employee, created_by):
+        return {
             'employee': employee,
             'resource_type': data.get('resource_type', 'developer'),
             'status': data.get('status', 'available'),
-            'availability_start': availability_start,
-            'availability_end': availability_end,
-            'skills': skills,
+            'availability_start': data.get('availability_start'),
+            'availability_end': data.get('availability_end'),
+            'skills': data.get('skills', []),
             'experience_years': data.get('experience_years', 0),
             'hourly_rate': data.get('hourly_rate'),
             'created_by': created_by or 'system'
         }
-        
-        resource = cls.objects.create(**resource_data)
-        
-        return {
-            'success': True,
-            'resource': resource,
-            'resource_id': str(resource.id),
-            'warnings': warnings,
-            'audit_trail_id': str(resource.id)
-        }
     
     def update_with_version_check(self, data, updated_by=None):
         """
@@ -260,27 +640,20 @@ class IdleResource(BaseModel):
         - Check version for optimistic locking
         - Validate update data
         - Update audit fields
+        - The version check and increment are one conditional UPDATE
+          (compare_and_swap), so concurrent writers cannot both succeed
         """
         from django.core.exceptions import ValidationError
         
         # Version check for optimistic locking
         current_version = data.get('version')
         if current_version is not None and current_version != self.version:
-            return {
-                'success': False,
-                'error': 'Resource has been modified by another user. Please refresh and try again.',
-                'current_version': self.version,
-                'provided_version': current_version
-            }
+            return self._version_conflict(self.version, current_version)
+        expected_version = self.version
         
         # Update fields
-        updatable_fields = [
-            'resource_type', 'status', 'availability_start', 'availability_end',
-            'skills', 'experience_years', 'hourly_rate'
-        ]
-        
         updated_fields = []
-        for field in updatable_fields:
+        for field in self.UPDATABLE_FIELDS:
             if field in data:
                 setattr(self, field, data[field])
                 updated_fields.append(field)
@@ -290,24 +663,263 @@ class IdleResource(BaseModel):
             self.updated_by = updated_by
         
         try:
-            self.full_clean()
-            self.save(update_fields=updated_fields + ['updated_by', 'updated_at', 'version'])
-            
-            return {
-                'success': True,
-                'resource': self,
-                'updated_fields': updated_fields,
-                'new_version': self.version
-            }
+            self.clean_update()
         except ValidationError as e:
             return {
                 'success': False,
                 'error': str(e),
                 'validation_errors': e.message_dict if hasattr(e, 'message_dict') else [str(e)]
             }
+        
+        if not self.compare_and_swap(updated_fields + ['updated_by'], expected_version):
+            stored_version = type(self).objects.filter(pk=self.pk).values_list('version', flat=True).first()
+            return self._version_conflict(stored_version, expected_version)
+        
+        return {
+            'success': True,
+            'resource': self,
+            'updated_fields': updated_fields,
+            'new_version': self.version
+        }
+    
+    def clean_update(self):
+        """
+        Validate an instance whose fields were set from request data.
+        
+        Like full_clean without the employee, uniqueness and constraint
+        queries (neither the employee nor the key changes), but clean()
+        only runs once every field converted: raw strings such as
+        '2026-01-01' or 'abc' never reach its comparisons. Plain dates
+        become aware datetimes in the current time zone.
+        
+        Raises:
+        - ValidationError: Field errors, else business rule errors
+        """
+        self.clean_fields(exclude=['employee'])
+        for name in ('availability_start', 'availability_end'):
+            value = getattr(self, name)
+            if value is not None and timezone.is_naive(value):
+                setattr(self, name, timezone.make_aware(value))
+        self.clean()
+    
+    @staticmethod
+    def _version_conflict(current_version, provided_version):
+        return {
+            'success': False,
+            'error': 'Resource has been modified by another user. Please refresh and try again.',
+            'current_version': current_version,
+            'provided_version': provided_version
+        }
     
     @classmethod
-    def list_with_filters(cls, filters=None, page=1, page_size=25, sort_by='created_at', sort_order='desc'):
+    def bulk_update_with_version_check(cls, updates, updated_by=None, rollback_on_error=True, chunk_size=500):
+        """
+        Update many resources with optimistic locking in a few statements.
+        
+        Source: DAO-MDE-03-01_v0.1.md - DAO-MDE-03-01-02: Update with Version Check
+        
+        Each chunk costs one SELECT (current rows, for validation and the
+        version pre-check) and one UPDATE whose SET clauses are CASE
+        expressions keyed by id and whose WHERE clause is
+        (id = ? AND version = ?) OR ...; the affected-row count tells
+        whether another writer got in between.
+        
+        Arguments:
+        - updates (list): Items {'id', 'version', 'data'}; data keys are
+          UPDATABLE_FIELDS, other keys are ignored
+        - updated_by (str): User who updated the resources
+        - rollback_on_error (bool): Write nothing unless every item succeeds
+        - chunk_size (int): Items per SELECT/UPDATE pair
+        
+        Returns:
+        - Dictionary with per-item 'results' (in request order: id, success,
+          error, changed_fields, new_version) and 'successful'/'failed' counts
+        
+        Business Rules:
+        - Same validation as update_with_version_check (full_clean)
+        - version is incremented in SQL; idle_mm/is_urgent are recomputed
+        - Duplicate ids in one request are rejected
+        - All chunks run in one transaction
+        """
+        from django.db import transaction
+        from django.db.models import Case, F, Q, Value, When
+        from . import audit_log
+        
+        results = [
+            {'id': str(item['id']), 'success': False, 'error': None, 'changed_fields': [], 'new_version': None}
+            for item in updates
+        ]
+        plans = []
+        seen = set()
+        
+        # Phase 1: read and validate, chunk by chunk, before writing anything
+        for offset in range(0, len(updates), chunk_size):
+            chunk = list(enumerate(updates[offset:offset + chunk_size], start=offset))
+            keys = {}
+            for position, item in chunk:
+                try:
+                    keys[position] = uuid.UUID(str(item['id']))
+                except ValueError:
+                    keys[position] = None
+            current = cls.objects.in_bulk([key for key in keys.values() if key is not None])
+            for position, item in chunk:
+                result = results[position]
+                resource = current.get(keys[position])
+                if result['id'] in seen:
+                    result['error'] = 'Resource appears more than once in the request'
+                    continue
+                seen.add(result['id'])
+                if resource is None or resource.is_deleted:
+                    result['error'] = 'Resource not found'
+                    continue
+                if resource.version != item['version']:
+                    result.update(cls._version_conflict(resource.version, item['version']))
+                    continue
+                
+                changed_fields = [field for field in cls.UPDATABLE_FIELDS if field in item['data']]
+                for field in changed_fields:
+                    setattr(resource, field, item['data'][field])
+                try:
+                    resource.clean_update()
+                except ValidationError as e:
+                    result['error'] = str(e)
+                    result['validation_errors'] = e.message_dict if hasattr(e, 'message_dict') else [str(e)]
+                    continue
+                resource.refresh_computed_fields()
+                result['changed_fields'] = changed_fields
+                plans.append((position, resource, item['version']))
+        
+        if rollback_on_error and len(plans) < len(updates):
+            for position, _, _ in plans:
+                results[position]['changed_fields'] = []
+                results[position]['error'] = 'Not applied: another item in the request failed'
+            return cls._bulk_update_summary(results)
+        
+        # Phase 2: conditional UPDATEs; the pre-checked version guards each row
+        now = timezone.now()
+        written_fields = set()
+        with transaction.atomic():
+            applied = []
+            for offset in range(0, len(plans), chunk_size):
+                chunk = plans[offset:offset + chunk_size]
+                fields = {'idle_mm', 'is_urgent'}
+                for position, _, _ in chunk:
+                    fields.update(results[position]['changed_fields'])
+                written_fields.update(fields)
+                
+                guard = Q()
+                for _, resource, version in chunk:
+                    guard |= Q(id=resource.id, version=version)
+                assignments = {
+                    name: Case(
+                        *[
+                            When(id=resource.id, then=Value(getattr(resource, name), output_field=cls._meta.get_field(name)))
+                            for position, resource, _ in chunk
+                            if name in results[position]['changed_fields'] or name in ('idle_mm', 'is_urgent')
+                        ],
+                        default=F(name),
+                        output_field=cls._meta.get_field(name)
+                    )
+                    for name in fields
+                }
+                affected = cls.objects.filter(guard, is_deleted=False).update(
+                    version=F('version') + 1, updated_at=now,
+                    **({'updated_by': updated_by} if updated_by else {}), **assignments
+                )
+                
+                if affected == len(chunk):
+                    applied.extend(chunk)
+                    continue
+                
+                # Lost a race: rows written by this statement carry our timestamp
+                won = Q()
+                for _, resource, version in chunk:
+                    won |= Q(id=resource.id, version=version + 1)
+                ours = set(cls.objects.filter(won, updated_at=now).values_list('id', flat=True))
+                for entry in chunk:
+                    position, resource, _ = entry
+                    if resource.id in ours:
+                        applied.append(entry)
+                    else:
+                        results[position]['changed_fields'] = []
+                        results[position]['error'] = (
+                            'Resource has been modified by another user. Please refresh and try again.'
+                        )
+            
+            if rollback_on_error and len(applied) < len(plans):
+                transaction.set_rollback(True)
+                for position, _, _ in applied:
+                    results[position]['changed_fields'] = []
+                    results[position]['error'] = 'Not applied: another item in the request failed'
+                return cls._bulk_update_summary(results)
+            
+            for position, _, version in applied:
+                results[position]['success'] = True
+                results[position]['new_version'] = version + 1
+            
+            resource_ids = [resource.id for _, resource, _ in applied]
+            cls._sync_derived_data(resource_ids, written_fields)
+            for _, resource, version in applied:
+                resource.version = version + 1
+            audit_log.record_changes(
+                audit_log.change_entry(resource, 'update', cls.AUDITED_FIELDS, updated_by)
+                for _, resource, _ in applied
+            )
+        
+        return cls._bulk_update_summary(results)
+    
+    @classmethod
+    def _sync_derived_data(cls, resource_ids, fields=None):
+        """
+        Refresh indexes and projections after a signal-less queryset write.
+        
+        The post_save handlers in signals.py do this per instance; bulk
+        writes call it once for the whole set of ids. fields=None means new
+        rows, which need every index.
+        """
+        from django.db import transaction
+        from services.common.cache_service import search_cache
+        from . import fulltext
+        from services.resource_management.similarity_service import similarity_index
+        
+        if not resource_ids:
+            return
+        IdleResourceReadModel.refresh_resources(resource_ids)
+        if fields is None or 'skills' in fields:
+            ResourceSkillToken.sync_resources(resource_ids)
+            fulltext.index_resources(resource_ids)
+            # As the post_save handlers do; the watermark only covers other processes
+            similarity_index.mark_dirty(resource_ids)
+            transaction.on_commit(lambda: similarity_index.mark_dirty(resource_ids))
+        search_cache.invalidate()
+        transaction.on_commit(search_cache.invalidate)
+    
+    @staticmethod
+    def _bulk_update_summary(results):
+        successful = sum(1 for result in results if result['success'])
+        return {'results': results, 'successful': successful, 'failed': len(results) - successful}
+    
+    @classmethod
+    def build_filtered_queryset(cls, filters=None):
+        """
+        Build the base queryset for the given filter criteria.
+        
+        Shared by every listing path (offset pages, cursor pages) so that
+        all of them apply exactly the same filter semantics.
+        
+        Arguments:
+        - filters (dict): Filter criteria
+        
+        Returns:
+        - QuerySet of IdleResource with employee/department joined
+        """
+        queryset = cls.objects.select_related('employee', 'employee__department').all()
+        return _apply_resource_filters(queryset, filters, 'employee__department__department_id')
+    
+    @classmethod
+    def list_with_filters(cls, filters=None, page=1, page_size=25, sort_by='created_at', sort_order='desc',
+                          cursor=None, pagination_mode='offset', fields=None, count_mode='exact',
+                          read_model=False):
         """
         Dynamic filtering with pagination.
         
@@ -315,55 +927,44 @@ class IdleResource(BaseModel):
         
         Arguments:
         - filters (dict): Filter criteria
-        - page (int): Page number
+        - page (int): Page number (offset mode only)
         - page_size (int): Items per page
         - sort_by (str): Sort field
         - sort_order (str): Sort direction
+        - cursor (str): Opaque cursor returned by a previous cursor-mode call
+        - pagination_mode (str): 'offset' (default) or 'cursor'
+        - fields (list): Column paths to project (e.g. 'status',
+          'employee__first_name'); None returns full to_dict() records
+        - count_mode (str): 'exact' (default), 'estimate' or 'none'
+          (offset mode only, see resource_management.pagination)
+        - read_model (bool): Read from the idle_resource_read_model
+          projection instead of joining the source tables; fields are then
+          projection columns (e.g. 'employee_name', 'idle_mm')
         
         Returns:
         - Dictionary with filtered results and pagination info
+        
+        Business Rules:
+        - Offset mode returns a total count per count_mode; exact counts are
+          reused across pages and sorts until the next write
+        - Cursor mode seeks on (sort key, id) and never counts or OFFSETs,
+          so every page costs the same regardless of scroll depth
+        - Passing a cursor implies cursor mode
+        - With fields, records are plain values() dicts: only those columns
+          (plus id and the sort key) are selected, joins follow the paths,
+          and no model instances are built
         """
-        from django.core.paginator import Paginator
-        from django.db.models import Q
+        if read_model:
+            queryset = IdleResourceReadModel.build_filtered_queryset(filters)
+        else:
+            queryset = cls.build_filtered_queryset(filters)
+        if fields:
+            queryset = queryset.values(*dict.fromkeys(['id', sort_by, *fields]))
         
-        queryset = cls.objects.select_related('employee', 'employee__department').all()
+        if cursor is not None or pagination_mode == 'cursor':
+            return cls._list_with_cursor(queryset, filters, page_size, sort_by, sort_order, cursor, fields)
         
-        # Apply filters
-        if filters:
-            # Status filter
-            if 'status' in filters:
-                queryset = queryset.filter(status=filters['status'])
-            
-            # Resource type filter
-            if 'resource_type' in filters:
-                queryset = queryset.filter(resource_type=filters['resource_type'])
-            
-            # Department filter
-            if 'department_id' in filters:
-                queryset = queryset.filter(employee__department__department_id=filters['department_id'])
-            
-            # Skills filter
-            if 'skills' in filters:
-                skills = filters['skills'] if isinstance(filters['skills'], list) else [filters['skills']]
-                for skill in skills:
-                    queryset = queryset.filter(skills__icontains=skill)
-            
-            # Experience filter
-            if 'min_experience' in filters:
-                queryset = queryset.filter(experience_years__gte=filters['min_experience'])
-            
-            # Availability filter
-            if 'available_from' in filters:
-                queryset = queryset.filter(
-                    Q(availability_start__lte=filters['available_from']) |
-                    Q(availability_start__isnull=True)
-                )
-            
-            if 'available_until' in filters:
-                queryset = queryset.filter(
-                    Q(availability_end__gte=filters['available_until']) |
-                    Q(availability_end__isnull=True)
-                )
+        from resource_management.pagination import paginate_offset
         
         # Apply sorting
         sort_field = sort_by
@@ -372,19 +973,81 @@ class IdleResource(BaseModel):
         
         queryset = queryset.order_by(sort_field)
         
-        # Pagination
-        paginator = Paginator(queryset, page_size)
-        page_obj = paginator.get_page(page)
+        result = paginate_offset(queryset, page, page_size, count_mode)
+        
+        return {
+            'records': result['rows'] if fields else [resource.to_dict() for resource in result['rows']],
+            'total_count': result['total_count'],
+            'count_exact': result['count_exact'],
+            'page_info': result['page_info'],
+            'filters_applied': filters or {},
+            'sort_info': {
+                'sort_by': sort_by,
+                'sort_order': sort_order
+            }
+        }
+    
+    @classmethod
+    def _list_with_cursor(cls, queryset, filters, page_size, sort_by, sort_order, cursor, fields=None):
+        """
+        Keyset (seek) pagination on (sort key, id).
+        
+        NULL sort keys are treated as the smallest value, matching SQLite's
+        native ordering, so the seek predicate and ORDER BY always agree.
+        """
+        from resource_management.pagination import KeysetCursor
+        
+        if sort_by not in KeysetCursor.SORTABLE_FIELDS:
+            raise ValidationError(f"Field '{sort_by}' cannot be used for cursor pagination")
+        
+        descending = sort_order.lower() == 'desc'
+        direction = 'next'
+        
+        if cursor is not None:
+            position = KeysetCursor.decode(cursor, queryset.model, sort_by, sort_order)
+            direction = position.direction
+            # Walking backwards means scanning in the opposite order
+            scan_descending = descending if direction == 'next' else not descending
+            queryset = queryset.filter(
+                KeysetCursor.seek_condition(sort_by, position.value, position.pk, scan_descending)
+            )
+        else:
+            scan_descending = descending
+        
+        queryset = queryset.order_by(*KeysetCursor.ordering(sort_by, scan_descending))
+        
+        # Fetch one extra row to learn whether another page exists
+        rows = list(queryset[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        
+        if direction == 'prev':
+            rows.reverse()
+            has_next_page, has_previous_page = cursor is not None, has_more
+        else:
+            has_next_page, has_previous_page = has_more, cursor is not None
+        
+        def boundary(row):
+            # Projected rows are dicts; the cursor only needs the key and id
+            return queryset.model(id=row['id'], **{sort_by: row[sort_by]}) if fields else row
+        
+        next_cursor = None
+        previous_cursor = None
+        if rows and has_next_page:
+            next_cursor = KeysetCursor.encode(boundary(rows[-1]), sort_by, sort_order, 'next')
+        if rows and has_previous_page:
+            previous_cursor = KeysetCursor.encode(boundary(rows[0]), sort_by, sort_order, 'prev')
         
         return {
-            'records': [resource.to_dict() for resource in page_obj],
-            'total_count': paginator.count,
+            'records': rows if fields else [resource.to_dict() for resource in rows],
+            'total_count': None,
+            'count_exact': False,
             'page_info': {
-                'current_page': page,
-                'total_pages': paginator.num_pages,
                 'page_size': page_size,
-                'has_next_page': page_obj.has_next(),
-                'has_previous_page': page_obj.has_previous()
+                'has_next_page': has_next_page,
+                'has_previous_page': has_previous_page,
+                'next_cursor': next_cursor,
+                'previous_cursor': previous_cursor
             },
             'filters_applied': filters or {},
             'sort_info': {
@@ -460,6 +1123,10 @@ class IdleResource(BaseModel):
             models.Index(fields=['employee', 'status']),
             models.Index(fields=['availability_start', 'availability_end']),
             models.Index(fields=['resource_type', 'status']),
+            models.Index(fields=['idle_mm', 'id']),
+            models.Index(fields=['is_urgent', 'availability_start']),
+            # Incremental similarity index refresh (rows stamped since the last one)
+            models.Index(fields=['updated_at']),
         ]
 
 
@@ -481,6 +1148,7 @@ class ImportSession(BaseModel):
     Relationships (REQUIRED):
         - Can be linked to user who initiated import
         - Related to imported resources through metadata
+        - Has ImportStaging rows while the import is processed
     
     Verification Source: DD/database_v0.1.md, DAO-MDE-03-01_v0.1.md
     """
@@ -520,6 +1188,71 @@ class ImportSession(BaseModel):
         ]
 
 
+class ImportStaging(models.Model):
+    """
+    MANDATORY DOCSTRING - ImportStaging model for rows of an import being processed.
+    
+    Source Information (REQUIRED):
+    - Database Table: import_staging
+    - Database Design: DD/database_v0.1.md - Section: import_staging
+    - DAO Specification: DD/MDE-03/04-dao/DAO-MDE-03-05_v0.1.md - DAO-MDE-03-05-01: Data Import Processing
+    - Business Module: resource_management
+    
+    Business Rules (REQUIRED):
+        - One row per data row of the uploaded file; record_index is the
+          1-based data row number and is unique within a session
+        - raw_data keeps the row as read, transformed_data the values after
+          column mapping (and, once validated, the cleaned values)
+        - validation_status moves pending -> valid / invalid / duplicate,
+          and valid rows become imported / updated when merged
+        - Rows are temporary: they are deleted when the session completes
+    
+    Relationships (REQUIRED):
+        - Belongs to ImportSession via session FK (cascade delete)
+    
+    Verification Source: DD/database_v0.1.md, DAO-MDE-03-05_v0.1.md
+    """
+    id = models.BigAutoField(primary_key=True)
+    session = models.ForeignKey(
+        ImportSession,
+        on_delete=models.CASCADE,
+        related_name='staging_records',
+        help_text="Import session the row belongs to"
+    )
+    record_index = models.PositiveIntegerField(help_text="Data row number in the uploaded file (1-based)")
+    raw_data = models.JSONField(default=dict, help_text="Row as read from the file")
+    transformed_data = models.JSONField(null=True, blank=True, help_text="Mapped and cleaned values")
+    validation_status = models.CharField(
+        max_length=20,
+        default='pending',
+        choices=[
+            ('pending', 'Pending'),
+            ('valid', 'Valid'),
+            ('invalid', 'Invalid'),
+            ('duplicate', 'Duplicate'),
+            ('imported', 'Imported'),
+            ('updated', 'Updated')
+        ],
+        help_text="Validation / merge state of the row"
+    )
+    validation_errors = models.JSONField(default=list, blank=True, help_text="Validation error details")
+    created_at = models.DateTimeField(default=timezone.now)
+    
+    def __str__(self):
+        return f"ImportStaging {self.session_id}#{self.record_index} ({self.validation_status})"
+    
+    class Meta:
+        db_table = 'import_staging'
+        verbose_name = 'Import Staging Row'
+        verbose_name_plural = 'Import Staging Rows'
+        constraints = [
+            models.UniqueConstraint(fields=['session', 'record_index'], name='import_staging_session_row'),
+        ]
+        indexes = [
+            models.Index(fields=['session', 'validation_status', 'record_index']),
+        ]
+
+
 class ExportSession(BaseModel):
     """
     MANDATORY DOCSTRING - ExportSession model for tracking data export operations.
@@ -757,4 +1490,426 @@ class ResourceAvailability(BaseModel):
             models.Index(fields=['resource', 'start_date', 'end_date']),
             models.Index(fields=['availability_type', 'is_allocated']),
             models.Index(fields=['start_date', 'end_date']),
-        ]
\ No newline at end of file
+        ]
+
+
+class ResourceSkillToken(models.Model):
+    """
+    Normalized skill index (inverted index) over idle resources.
+    
+    Source Information (REQUIRED):
+    - Database Table: resource_skill_index
+    - Derived from: idle_resources.skills and resource_skills.skill_name
+    - Business Module: resource_management
+    
+    Business Rules (REQUIRED):
+        - One row per (resource, normalized skill token)
+        - Tokens are trimmed, whitespace-collapsed and case-folded, so
+          "Java" and "JavaScript" are distinct tokens
+        - Kept in sync by post_save/post_delete signals on IdleResource
+          and ResourceSkill (see resource_management.signals)
+        - Soft-deleted ResourceSkill rows are not indexed
+        - Bulk writes that bypass signals must call sync_resources()
+    
+    Relationships (REQUIRED):
+        - Related to IdleResource via FK (cascade delete)
+    
+    Custom Methods:
+        - normalize(): Canonical token for a raw skill value
+        - sync_resources(): Recompute tokens for the given resources
+        - matching_resource_ids(): Subquery of resources matching skills (AND/OR)
+    """
+    resource = models.ForeignKey(
+        IdleResource,
+        on_delete=models.CASCADE,
+        related_name='skill_tokens',
+        help_text="Resource this skill token belongs to"
+    )
+    token = models.CharField(max_length=100, help_text="Normalized skill token")
+    
+    def __str__(self):
+        return f"{self.resource_id} - {self.token}"
+    
+    @staticmethod
+    def normalize(skill):
+        """Return the canonical token for a skill value, or '' if unusable."""
+        if isinstance(skill, dict):
+            skill = skill.get('name') or skill.get('skill_name') or ''
+        if not isinstance(skill, str):
+            return ''
+        return ' '.join(skill.split()).casefold()[:100]
+    
+    @classmethod
+    def tokens_for(cls, skills):
+        """Normalize an iterable of raw skills into a set of tokens."""
+        tokens = {cls.normalize(skill) for skill in (skills or [])}
+        tokens.discard('')
+        return tokens
+    
+    @classmethod
+    def sync_resources(cls, resource_ids):
+        """
+        Recompute index rows for the given resources.
+        
+        Only the difference between the stored and the desired token sets is
+        written, so re-saving an unchanged resource costs two reads.
+        
+        Arguments:
+        - resource_ids (iterable): IdleResource primary keys
+        
+        Returns:
+        - Dictionary with added/removed token counts
+        """
+        resource_ids = list(resource_ids)
+        if not resource_ids:
+            return {'added': 0, 'removed': 0}
+        
+        desired = {resource_id: set() for resource_id in resource_ids}
+        for resource_id, skills in IdleResource.objects.filter(id__in=resource_ids).values_list('id', 'skills'):
+            desired[resource_id] |= cls.tokens_for(skills if isinstance(skills, list) else [])
+        detailed = ResourceSkill.objects.filter(
+            resource_id__in=resource_ids, is_deleted=False
+        ).values_list('resource_id', 'skill_name')
+        for resource_id, skill_name in detailed:
+            desired[resource_id] |= cls.tokens_for([skill_name])
+        
+        existing = {resource_id: {} for resource_id in resource_ids}
+        for pk, resource_id, token in cls.objects.filter(resource_id__in=resource_ids).values_list('id', 'resource_id', 'token'):
+            existing[resource_id][token] = pk
+        
+        to_create = []
+        stale_ids = []
+        for resource_id in resource_ids:
+            current = existing[resource_id]
+            for token in desired[resource_id] - current.keys():
+                to_create.append(cls(resource_id=resource_id, token=token))
+            stale_ids.extend(pk for token, pk in current.items() if token not in desired[resource_id])
+        
+        if stale_ids:
+            cls.objects.filter(id__in=stale_ids).delete()
+        if to_create:
+            cls.objects.bulk_create(to_create, ignore_conflicts=True)
+        
+        return {'added': len(to_create), 'removed': len(stale_ids)}
+    
+    @classmethod
+    def matching_resource_ids(cls, skills, match='all'):
+        """
+        Subquery of resource ids having the requested skills.
+        
+        Arguments:
+        - skills (list): Raw skill names
+        - match (str): 'all' (AND, default) or 'any' (OR)
+        
+        Returns:
+        - values() QuerySet usable in an ``id__in`` filter
+        """
+        from django.db.models import Count
+        
+        tokens = cls.tokens_for(skills)
+        queryset = cls.objects.filter(token__in=tokens)
+        if match == 'all' and len(tokens) > 1:
+            queryset = (
+                queryset.values('resource_id')
+                .annotate(matched=Count('token', distinct=True))
+                .filter(matched=len(tokens))
+            )
+        return queryset.values('resource_id')
+    
+    class Meta:
+        db_table = 'resource_skill_index'
+        verbose_name = 'Resource Skill Token'
+        verbose_name_plural = 'Resource Skill Tokens'
+        unique_together = ['resource', 'token']
+        indexes = [
+            models.Index(fields=['token', 'resource']),
+        ]
+
+
+class IdleResourceReadModel(models.Model):
+    """
+    Denormalized read model (projection) of the idle resource grid.
+    
+    Source Information (REQUIRED):
+    - Database Table: idle_resource_read_model
+    - Derived from: idle_resources, employees, departments
+    - Business Module: resource_management
+    
+    Business Rules (REQUIRED):
+        - One flat row per IdleResource, sharing its primary key, so list,
+          search and stream reads need no joins
+        - Employee full name and department name are resolved once on
+          write; idle_mm and is_urgent are copied from the source columns
+        - Kept in sync by post_save/post_delete signals on IdleResource,
+          Employee and Department (see resource_management.signals); the
+          handlers run inside the writer's transaction
+        - Bulk writes that bypass signals must call refresh_resources();
+          ``manage.py rebuild_read_model`` recomputes every row
+        - Every write of a row, including employee/department propagation
+          and the is_urgent refresh, sets projected_at: it changes whenever
+          the row's API body can, unlike the resource's updated_at/version
+    
+    Relationships (REQUIRED):
+        - None enforced; id, employee_id and department_id mirror the
+          source keys so the projection can be rebuilt at any time
+    
+    Custom Methods:
+        - refresh_resources(): Recompute rows for the given resources
+        - refresh_employees(): Recompute rows for the given employees
+        - rename_department(): Propagate a department name change
+        - detach_department(): Clear a deleted department
+        - build_filtered_queryset(): Same filters as IdleResource, no joins
+        - fingerprint(): count / max(projected_at) validator for list ETags
+    """
+    id = models.UUIDField(primary_key=True, editable=False, help_text="IdleResource primary key")
+    employee_id = models.UUIDField(help_text="Employee primary key")
+    employee_number = models.CharField(max_length=20, blank=True, help_text="Employee number")
+    employee_name = models.CharField(max_length=101, help_text="Employee full name")
+    position = models.CharField(max_length=100, blank=True, help_text="Employee job position")
+    department_id = models.UUIDField(null=True, blank=True, help_text="Department primary key")
+    department_name = models.CharField(max_length=100, null=True, blank=True, help_text="Department name")
+    resource_type = models.CharField(max_length=50, help_text="Type of resource")
+    status = models.CharField(max_length=20, help_text="Current availability status")
+    availability_start = models.DateTimeField(null=True, blank=True, help_text="Start of availability")
+    availability_end = models.DateTimeField(null=True, blank=True, help_text="End of availability")
+    idle_mm = models.PositiveIntegerField(null=True, blank=True, help_text="Idle months (idleMM)")
+    is_urgent = models.BooleanField(default=False, help_text="Urgent idle case flag")
+    skills = models.JSONField(default=list, blank=True, help_text="Array of skills")
+    experience_years = models.PositiveIntegerField(null=True, blank=True, help_text="Years of experience")
+    hourly_rate = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True,
+                                      help_text="Hourly rate (salesPrice)")
+    is_deleted = models.BooleanField(default=False, help_text="Soft-delete flag of the resource")
+    created_at = models.DateTimeField(help_text="Resource creation time")
+    updated_at = models.DateTimeField(help_text="Resource last update time")
+    version = models.PositiveIntegerField(default=1, help_text="Resource version")
+    projected_at = models.DateTimeField(default=timezone.now, help_text="Last write of this projection row")
+    
+    # Source columns read by refresh_resources(), in projection field order
+    SOURCE_FIELDS = (
+        'id', 'employee_id', 'employee__employee_number', 'employee__first_name', 'employee__last_name',
+        'employee__position', 'employee__department_id', 'employee__department__department_name',
+        'resource_type', 'status', 'availability_start', 'availability_end', 'idle_mm', 'is_urgent',
+        'skills', 'experience_years', 'hourly_rate', 'is_deleted', 'created_at', 'updated_at', 'version',
+    )
+    
+    def __str__(self):
+        return f"{self.id} - {self.employee_name} ({self.resource_type})"
+    
+    def to_dict(self):
+        """Same shape as IdleResource.to_dict()."""
+        return {
+            'id': str(self.id),
+            'employee_name': self.employee_name,
+            'employee_id': str(self.employee_id),
+            'department_id': str(self.department_id) if self.department_id else None,
+            'resource_type': self.resource_type,
+            'status': self.status,
+            'availability_start': self.availability_start.isoformat() if self.availability_start else None,
+            'availability_end': self.availability_end.isoformat() if self.availability_end else None,
+            'skills': self.skills,
+            'experience_years': self.experience_years,
+            'hourly_rate': float(self.hourly_rate) if self.hourly_rate else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'version': self.version,
+            'idle_mm': self.idle_mm,
+            'is_urgent': self.is_urgent
+        }
+    
+    @classmethod
+    def _from_source(cls, row, projected_at):
+        (pk, employee_id, employee_number, first_name, last_name, position, department_id,
+         department_name, resource_type, status, start, end, idle_mm, is_urgent, skills,
+         experience_years, hourly_rate, is_deleted, created_at, updated_at, version) = row
+        return cls(
+            id=pk,
+            employee_id=employee_id,
+            employee_number=employee_number or '',
+            employee_name=f"{first_name} {last_name}",
+            position=position or '',
+            department_id=department_id,
+            department_name=department_name,
+            resource_type=resource_type,
+            status=status,
+            availability_start=start,
+            availability_end=end,
+            idle_mm=idle_mm,
+            is_urgent=is_urgent,
+            skills=skills if skills is not None else [],
+            experience_years=experience_years,
+            hourly_rate=hourly_rate,
+            is_deleted=is_deleted,
+            created_at=created_at,
+            updated_at=updated_at,
+            version=version,
+            projected_at=projected_at,
+        )
+    
+    @classmethod
+    def refresh_resources(cls, resource_ids, using=None):
+        """
+        Recompute projection rows for the given resources.
+        
+        Reads the sources in one joined query and writes one upsert; ids
+        whose resource no longer exists are removed.
+        
+        Arguments:
+        - resource_ids (iterable): IdleResource primary keys
+        - using (str): Database alias
+        
+        Returns:
+        - Dictionary with upserted/removed row counts
+        """
+        resource_ids = list(resource_ids)
+        if not resource_ids:
+            return {'upserted': 0, 'removed': 0}
+        
+        manager = cls.objects.db_manager(using)
+        projected_at = timezone.now()
+        rows = [
+            cls._from_source(row, projected_at)
+            for row in IdleResource.objects.using(using).filter(id__in=resource_ids)
+            .values_list(*cls.SOURCE_FIELDS)
+        ]
+        if rows:
+            manager.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['id'],
+                update_fields=[field.name for field in cls._meta.concrete_fields if not field.primary_key],
+            )
+        
+        found = {row.id for row in rows}
+        missing = [pk for pk in resource_ids if pk not in found]
+        removed = manager.filter(id__in=missing).delete()[0] if missing else 0
+        return {'upserted': len(rows), 'removed': removed}
+    
+    @classmethod
+    def refresh_employees(cls, employee_ids, using=None):
+        """Recompute the rows of every resource belonging to the given employees."""
+        resource_ids = IdleResource.objects.using(using).filter(
+            employee_id__in=list(employee_ids)
+        ).values_list('id', flat=True)
+        return cls.refresh_resources(resource_ids, using=using)
+    
+    @classmethod
+    def rename_department(cls, department_id, department_name, using=None):
+        """Propagate a department name change with one UPDATE."""
+        return cls.objects.db_manager(using).filter(department_id=department_id).update(
+            department_name=department_name, projected_at=timezone.now()
+        )
+    
+    @classmethod
+    def detach_department(cls, department_id, using=None):
+        """Mirror Employee.department SET_NULL when a department is deleted."""
+        return cls.objects.db_manager(using).filter(department_id=department_id).update(
+            department_id=None, department_name=None, projected_at=timezone.now()
+        )
+    
+    @classmethod
+    def build_filtered_queryset(cls, filters=None):
+        """
+        Projection counterpart of IdleResource.build_filtered_queryset().
+        
+        Arguments:
+        - filters (dict): Filter criteria (same keys as IdleResource)
+        
+        Returns:
+        - QuerySet of IdleResourceReadModel reading a single table
+        """
+        return _apply_resource_filters(cls.objects.all(), filters, 'department_id')
+    
+    @classmethod
+    def fingerprint(cls, queryset):
+        """
+        Aggregate fingerprint of a filtered projection queryset in one query.
+        
+        max(projected_at) moves on every write of a matching row (resource
+        saves, employee renames, department changes, the is_urgent refresh)
+        and on every insert; the count changes on deletes and on rows
+        leaving the filter.
+        
+        Returns:
+        - Dictionary with count and last_projected
+        """
+        from django.db.models import Count, Max
+        
+        return queryset.order_by().aggregate(
+            count=Count('id'),
+            last_projected=Max('projected_at'),
+        )
+    
+    class Meta:
+        db_table = 'idle_resource_read_model'
+        verbose_name = 'Idle Resource Read Model'
+        verbose_name_plural = 'Idle Resource Read Model'
+        indexes = [
+            models.Index(fields=['status', 'resource_type']),
+            models.Index(fields=['department_id', 'availability_start']),
+            models.Index(fields=['resource_type', 'availability_start']),
+            models.Index(fields=['availability_start', 'id']),
+            models.Index(fields=['availability_end', 'id']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['updated_at', 'id']),
+            models.Index(fields=['employee_id']),
+            models.Index(fields=['idle_mm', 'id']),
+            models.Index(fields=['is_urgent', 'availability_start']),
+        ]
+
+
+class AuditTrail(models.Model):
+    """
+    MANDATORY DOCSTRING - AuditTrail model for the service operation audit log.
+    
+    Source Information (REQUIRED):
+    - Database Table: audit_trail
+    - DAO Specification: DD/MDE-03/04-dao/DAO-MDE-03-04_v0.1.md - DAO-MDE-03-04-01: Create Audit Entry
+    - Business Module: resource_management
+    
+    Business Rules (REQUIRED):
+        - Append-only: one row per audited service operation, never updated
+        - status is 'success' or 'error'; error rows carry error_message
+        - Written in batches by services.common.audit_service, not per call
+        - User context (id, role, department, IP, user agent, session) is
+          copied onto the row so it stays readable after the user changes
+    
+    Relationships (REQUIRED):
+        - resource_id references the audited record by value (no FK), so
+          audit rows outlive hard deletes
+    
+    Verification Source: DAO-MDE-03-04_v0.1.md
+    """
+    audit_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    resource_id = models.CharField(max_length=64, null=True, blank=True, help_text="Audited record, if any")
+    operation_type = models.CharField(max_length=100, help_text="Service operation name")
+    status = models.CharField(
+        max_length=10,
+        choices=[('success', 'Success'), ('error', 'Error')],
+        help_text="Outcome of the operation"
+    )
+    operation_details = models.JSONField(default=dict, blank=True, help_text="Summarized arguments and result")
+    previous_values = models.JSONField(null=True, blank=True, help_text="Values before the operation")
+    new_values = models.JSONField(null=True, blank=True, help_text="Values after the operation")
+    error_message = models.TextField(blank=True, help_text="Error raised by the operation")
+    user_id = models.CharField(max_length=36, null=True, blank=True)
+    user_role = models.CharField(max_length=50, null=True, blank=True)
+    department_id = models.CharField(max_length=36, null=True, blank=True)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.CharField(max_length=255, blank=True)
+    session_id = models.CharField(max_length=100, null=True, blank=True)
+    operation_timestamp = models.DateTimeField(default=timezone.now, help_text="When the operation finished")
+    additional_metadata = models.JSONField(default=dict, blank=True)
+    
+    def __str__(self):
+        return f"{self.operation_type} {self.status} at {self.operation_timestamp}"
+    
+    class Meta:
+        db_table = 'audit_trail'
+        verbose_name = 'Audit Trail Entry'
+        verbose_name_plural = 'Audit Trail Entries'
+        indexes = [
+            models.Index(fields=['operation_timestamp']),
+            models.Index(fields=['resource_id', 'operation_timestamp']),
+            models.Index(fields=['user_id', 'operation_timestamp']),
+            models.Index(fields=['operation_type', 'operation_timestamp']),
+        ]
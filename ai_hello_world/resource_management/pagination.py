@@ -0,0 +1,253 @@
+"""
+Pagination helpers for resource management listings.
+
+Offset pagination costs a COUNT(*) plus an OFFSET scan that grows with the
+page number. Keyset pagination instead remembers the (sort key, id) of the
+last row served and asks the database for rows strictly after it, which the
+(availability_start, availability_end) and (status, resource_type) indexes
+can answer directly.
+
+Source: DAO-MDE-03-01_v0.1.md - DAO-MDE-03-01-03: List with Filters
+
+Offset pages can also skip or bound their COUNT(*) (count modes):
+    - exact: full COUNT(*), remembered per filtered query (its SQL and
+      parameters, so every filter and scope is part of the key) until the
+      next write
+    - estimate: a remembered exact count if there is one, otherwise a COUNT
+      over at most ESTIMATE_COUNT_LIMIT + 1 rows ("at least N" beyond that)
+    - none: no count; has_next_page comes from fetching one extra row
+
+Business Rules:
+    - Cursors are opaque to clients (URL-safe base64 JSON)
+    - A cursor is only valid for the sort field and order it was issued for
+    - The primary key is always the tiebreaker so ordering is total
+    - NULL sort keys sort as the smallest value in both directions
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import Paginator
+from django.db.models import F, Q
+
+from services.common.cache_service import search_cache
+
+
+COUNT_MODES = ('exact', 'estimate', 'none')
+
+# Rows an estimate-mode count may touch before it settles for "at least N"
+ESTIMATE_COUNT_LIMIT = 1000
+
+
+@dataclass
+class CursorPosition:
+    """Decoded cursor: the boundary row and the direction to walk from it."""
+    value: Any
+    pk: uuid.UUID
+    direction: str
+
+
+class KeysetCursor:
+    """Encode, decode and apply keyset cursors for IdleResource listings."""
+
+    # Columns that live on idle_resources itself; joined columns cannot be
+    # seeked without losing the index.
+    SORTABLE_FIELDS = (
+        'created_at',
+        'updated_at',
+        'availability_start',
+        'availability_end',
+        'status',
+        'resource_type',
+        'experience_years',
+        'hourly_rate',
+        'idle_mm',
+    )
+
+    DIRECTIONS = ('next', 'prev')
+
+    @classmethod
+    def encode(cls, instance, sort_by: str, sort_order: str, direction: str) -> str:
+        """Build an opaque cursor pointing at ``instance``."""
+        value = getattr(instance, sort_by)
+        field = instance._meta.get_field(sort_by)
+        payload = {
+            's': sort_by,
+            'o': sort_order.lower(),
+            'd': direction,
+            'v': None if value is None else field.value_to_string(instance),
+            'id': str(instance.pk),
+        }
+        raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    @classmethod
+    def decode(cls, cursor: str, model, sort_by: str, sort_order: str) -> CursorPosition:
+        """
+        Decode a cursor and check it matches the requested ordering.
+
+        Raises:
+            ValidationError: If the cursor is malformed or was issued for a
+                different sort field/order
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            pk = uuid.UUID(payload['id'])
+            direction = payload['d']
+            raw_value = payload['v']
+        except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+            raise ValidationError("Invalid pagination cursor")
+
+        if payload.get('s') != sort_by or payload.get('o') != sort_order.lower():
+            raise ValidationError("Pagination cursor does not match the requested sort")
+        if direction not in cls.DIRECTIONS:
+            raise ValidationError("Invalid pagination cursor")
+
+        value = None
+        if raw_value is not None:
+            value = model._meta.get_field(sort_by).to_python(raw_value)
+
+        return CursorPosition(value=value, pk=pk, direction=direction)
+
+    @staticmethod
+    def ordering(sort_by: str, descending: bool) -> list:
+        """ORDER BY expressions for a scan in the given direction."""
+        if descending:
+            return [F(sort_by).desc(nulls_last=True), F('id').desc()]
+        return [F(sort_by).asc(nulls_first=True), F('id').asc()]
+
+    @staticmethod
+    def seek_condition(sort_by: str, value, pk, descending: bool) -> Q:
+        """
+        Rows strictly after (value, pk) in the scan order.
+
+        With NULL as the smallest key, an ascending scan visits NULLs first
+        and a descending scan visits them last.
+        """
+        if descending:
+            if value is None:
+                return Q(**{f'{sort_by}__isnull': True, 'id__lt': pk})
+            return (
+                Q(**{f'{sort_by}__lt': value}) |
+                Q(**{sort_by: value, 'id__lt': pk}) |
+                Q(**{f'{sort_by}__isnull': True})
+            )
+
+        if value is None:
+            return (
+                Q(**{f'{sort_by}__isnull': True, 'id__gt': pk}) |
+                Q(**{f'{sort_by}__isnull': False})
+            )
+        return Q(**{f'{sort_by}__gt': value}) | Q(**{sort_by: value, 'id__gt': pk})
+
+
+def count_key(queryset):
+    """
+    Cache key of a queryset's row count.
+
+    Built from the SQL of the rows it counts (ordering and selected columns
+    left out) and its parameters, so two querysets share a count only if
+    they filter identically. None when the query can match nothing.
+    """
+    try:
+        sql, params = queryset.order_by().values('pk').query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    # Parameters stay in order: they are positional
+    canonical = json.dumps([queryset.db, sql, list(params)], default=str, separators=(',', ':'))
+    return f"count:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+
+def count_rows(queryset, count_mode='exact'):
+    """
+    Count a queryset according to ``count_mode``.
+
+    Arguments:
+    - queryset: Filtered queryset (ordering is ignored)
+    - count_mode (str): 'exact', 'estimate' or 'none'
+
+    Returns:
+    - (count, is_exact); (None, False) in 'none' mode. An inexact count is
+      a lower bound. Exact counts are remembered under count_key().
+    """
+    if count_mode == 'none':
+        return None, False
+
+    cache_key = count_key(queryset)
+    if cache_key:
+        cached = search_cache.peek(cache_key)
+        if cached is not None:
+            return cached, True
+
+    if count_mode == 'estimate':
+        bounded = queryset.order_by()[:ESTIMATE_COUNT_LIMIT + 1].count()
+        if bounded > ESTIMATE_COUNT_LIMIT:
+            return bounded, False
+        count = bounded
+    else:
+        count = queryset.count()
+
+    if cache_key:
+        search_cache.store(cache_key, count)
+    return count, True
+
+
+def paginate_offset(queryset, page, page_size, count_mode='exact'):
+    """
+    Page an ordered queryset by page number.
+
+    Returns:
+    - Dictionary with rows, total_count, count_exact and page_info
+      (current_page, total_pages, page_size, has_next_page,
+      has_previous_page). total_pages is None when the count is not exact.
+
+    Business Rules:
+    - With an exact count the Paginator clamps out-of-range pages
+    - Otherwise pages are sliced directly and one extra row tells whether a
+      next page exists
+    """
+    total_count, count_exact = count_rows(queryset, count_mode)
+
+    if count_exact:
+        paginator = Paginator(queryset, page_size)
+        paginator.count = total_count
+        page_obj = paginator.get_page(page)
+        return {
+            'rows': list(page_obj),
+            'total_count': total_count,
+            'count_exact': True,
+            'page_info': {
+                'current_page': page_obj.number,
+                'total_pages': paginator.num_pages,
+                'page_size': page_size,
+                'has_next_page': page_obj.has_next(),
+                'has_previous_page': page_obj.has_previous()
+            }
+        }
+
+    offset = (page - 1) * page_size
+    rows = list(queryset[offset:offset + page_size + 1])
+    has_next_page = len(rows) > page_size
+    rows = rows[:page_size]
+    if total_count is not None:
+        # Rows seen so far are a lower bound too
+        total_count = max(total_count, offset + len(rows) + int(has_next_page))
+    return {
+        'rows': rows,
+        'total_count': total_count,
+        'count_exact': False,
+        'page_info': {
+            'current_page': page,
+            'total_pages': None,
+            'page_size': page_size,
+            'has_next_page': has_next_page,
+            'has_previous_page': page > 1
+        }
+    }
@@ -54,14 +54,26 @@ class GetIdleResourceListRequestSerializer(serializers.Serializer):
     sortBy = serializers.CharField(default='idleFrom', required=False)
     sortOrder = serializers.ChoiceField(choices=['asc', 'desc'], default='desc', required=False)
     
+    # Keyset pagination
+    paginationMode = serializers.ChoiceField(choices=['offset', 'cursor'], default='offset', required=False)
+    cursor = serializers.CharField(required=False, allow_null=True, allow_blank=False)
+    countMode = serializers.ChoiceField(choices=['exact', 'estimate', 'none'], default='exact', required=False)
+    
     # Filters
-    departmentId = serializers.CharField(required=False, allow_null=True)
+    departmentId = serializers.UUIDField(required=False, allow_null=True)
     idleType = serializers.CharField(required=False, allow_null=True)
     dateFrom = serializers.DateField(required=False, allow_null=True)
     dateTo = serializers.DateField(required=False, allow_null=True)
     specialAction = serializers.CharField(required=False, allow_null=True)
     searchQuery = serializers.CharField(required=False, allow_null=True)
     urgentOnly = serializers.BooleanField(default=False, required=False)
+    skills = serializers.ListField(
+        child=serializers.CharField(max_length=100),
+        required=False,
+        default=list
+    )
+    skillsMatch = serializers.ChoiceField(choices=['all', 'any'], default='all', required=False)
+    includeAggregations = serializers.BooleanField(default=True, required=False)
     
     # Column selection
     includeColumns = serializers.ListField(
@@ -79,6 +91,9 @@ class PageInfoSerializer(serializers.Serializer):
     total_pages = serializers.IntegerField(read_only=True)
     has_next_page = serializers.BooleanField(read_only=True)
     has_previous_page = serializers.BooleanField(read_only=True)
+    next_cursor = serializers.CharField(read_only=True, allow_null=True, required=False)
+    previous_cursor = serializers.CharField(read_only=True, allow_null=True, required=False)
+    total_count_exact = serializers.BooleanField(read_only=True, required=False)
 
 
 class GetIdleResourceListResponseSerializer(serializers.Serializer):
@@ -92,6 +107,38 @@ class GetIdleResourceListResponseSerializer(serializers.Serializer):
     execution_time = serializers.IntegerField(read_only=True)
 
 
+class StreamIdleResourcesRequestSerializer(serializers.Serializer):
+    """
+    GET /api/v1/idle-resources/stream request parameters
+    """
+    # 'format' is reserved by DRF for renderer selection
+    streamFormat = serializers.ChoiceField(choices=['ndjson', 'json-seq'], default='ndjson', required=False)
+    chunkSize = serializers.IntegerField(default=2000, min_value=100, max_value=10000, required=False)
+    sortBy = serializers.CharField(default='idleFrom', required=False)
+    sortOrder = serializers.ChoiceField(choices=['asc', 'desc'], default='desc', required=False)
+    
+    # Filters (same semantics as the list API)
+    departmentId = serializers.UUIDField(required=False, allow_null=True)
+    idleType = serializers.CharField(required=False, allow_null=True)
+    dateFrom = serializers.DateField(required=False, allow_null=True)
+    dateTo = serializers.DateField(required=False, allow_null=True)
+    searchQuery = serializers.CharField(required=False, allow_null=True)
+    urgentOnly = serializers.BooleanField(default=False, required=False)
+    skills = serializers.ListField(
+        child=serializers.CharField(max_length=100),
+        required=False,
+        default=list
+    )
+    skillsMatch = serializers.ChoiceField(choices=['all', 'any'], default='all', required=False)
+    
+    # Column selection
+    includeColumns = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        default=list
+    )
+
+
 class GetIdleResourceDetailRequestSerializer(serializers.Serializer):
     """
     GET /api/v1/idle-resources/{id} request parameters
@@ -312,12 +359,30 @@ class GetMasterDataResponseSerializer(serializers.Serializer):
 
 
 # Export/Import Serializers
+class ExportFiltersSerializer(serializers.Serializer):
+    """
+    Export filters; the list API filters with the same types
+    """
+    departmentId = serializers.UUIDField(required=False, allow_null=True)
+    idleType = serializers.CharField(required=False, allow_null=True)
+    dateFrom = serializers.DateField(required=False, allow_null=True)
+    dateTo = serializers.DateField(required=False, allow_null=True)
+    searchQuery = serializers.CharField(required=False, allow_null=True)
+    urgentOnly = serializers.BooleanField(default=False, required=False)
+    skills = serializers.ListField(
+        child=serializers.CharField(max_length=100),
+        required=False,
+        default=list
+    )
+    skillsMatch = serializers.ChoiceField(choices=['all', 'any'], default='all', required=False)
+
+
 class ExportIdleResourcesRequestSerializer(serializers.Serializer):
     """
     POST /api/v1/idle-resources/export request body
     """
     format = serializers.ChoiceField(choices=['excel', 'csv'], default='excel')
-    filters = serializers.DictField(required=False, default=dict)
+    filters = ExportFiltersSerializer(required=False, default=dict)
     columns = serializers.ListField(
         child=serializers.CharField(),
         required=False,
@@ -344,6 +409,7 @@ class ExportIdleResourcesResponseSerializer(serializers.Serializer):
     createdAt = serializers.DateTimeField(read_only=True)
     expiresAt = serializers.DateTimeField(read_only=True)
     downloadToken = serializers.CharField(read_only=True)
+    executionTime = serializers.IntegerField(read_only=True)
 
 
 class ImportIdleResourcesRequestSerializer(serializers.Serializer):
@@ -365,6 +431,13 @@ class ImportIdleResourcesRequestSerializer(serializers.Serializer):
     batchSize = serializers.IntegerField(default=100, min_value=1, max_value=1000)
 
 
+class ResumeImportRequestSerializer(serializers.Serializer):
+    """
+    POST /api/v1/idle-resources/import/{id}/resume request body
+    """
+    force = serializers.BooleanField(default=False, required=False)
+
+
 class ImportErrorReportSerializer(serializers.Serializer):
     """
     Individual error in import report
@@ -402,6 +475,7 @@ class ImportIdleResourcesResponseSerializer(serializers.Serializer):
     )
     importSummary = ImportSummarySerializer(read_only=True)
     auditTrailId = serializers.CharField(read_only=True)
+    executionTime = serializers.IntegerField(read_only=True)
 
 
 # Advanced Search Serializers
@@ -429,11 +503,13 @@ class AdvancedSearchRequestSerializer(serializers.Serializer):
         required=False,
         default=list
     )
-    sortBy = serializers.CharField(required=False, default='updatedAt')
+    sortBy = serializers.CharField(required=False, default='relevance')
     sortOrder = serializers.ChoiceField(choices=['asc', 'desc'], default='desc', required=False)
     page = serializers.IntegerField(default=1, min_value=1)
     pageSize = serializers.IntegerField(default=20, min_value=1, max_value=100)
     includeCount = serializers.BooleanField(default=True, required=False)
+    # Overrides includeCount; defaults to 'exact' ('none' when includeCount is false)
+    countMode = serializers.ChoiceField(choices=['exact', 'estimate', 'none'], required=False)
     includeAggregations = serializers.BooleanField(default=True, required=False)
     searchMode = serializers.ChoiceField(
         choices=['standard', 'advanced', 'fuzzy'],
@@ -542,4 +618,80 @@ class ValidateDataResponseSerializer(serializers.Serializer):
     duplicateCount = serializers.IntegerField(read_only=True)
     businessRuleResults = serializers.DictField(read_only=True, default=dict)
     suggestions = ValidationSuggestionSerializer(many=True, read_only=True, default=list)
-    validationSummary = ValidationSummarySerializer(read_only=True)
\ No newline at end of file
+    validationSummary = ValidationSummarySerializer(read_only=True)
+
+
+# Availability Serializers
+class BatchAvailabilityRequestSerializer(serializers.Serializer):
+    """
+    POST /api/v1/idle-resources/availability request body
+    """
+    resourceIds = serializers.ListField(
+        child=serializers.UUIDField(),
+        min_length=1,
+        max_length=1000
+    )
+    startDate = serializers.DateTimeField()
+    endDate = serializers.DateTimeField()
+    
+    def validate(self, data):
+        if data['startDate'] >= data['endDate']:
+            raise serializers.ValidationError({'endDate': 'End date must be after start date'})
+        return data
+
+
+# Matching Serializers
+class MatchWeightsSerializer(serializers.Serializer):
+    """
+    Optional score component weights (normalized server-side)
+    """
+    skills = serializers.FloatField(required=False, min_value=0)
+    availability = serializers.FloatField(required=False, min_value=0)
+    experience = serializers.FloatField(required=False, min_value=0)
+    rate = serializers.FloatField(required=False, min_value=0)
+    location = serializers.FloatField(required=False, min_value=0)
+
+
+class MatchResourcesRequestSerializer(serializers.Serializer):
+    """
+    POST /api/v1/idle-resources/match request body
+    """
+    requiredSkills = serializers.ListField(
+        child=serializers.CharField(max_length=100),
+        required=False,
+        default=list
+    )
+    minExperience = serializers.IntegerField(required=False, allow_null=True, min_value=0)
+    maxHourlyRate = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False, allow_null=True, min_value=0
+    )
+    startDate = serializers.DateTimeField()
+    endDate = serializers.DateTimeField()
+    location = serializers.ChoiceField(
+        choices=['remote', 'onsite', 'hybrid', 'flexible'],
+        required=False,
+        allow_null=True
+    )
+    limit = serializers.IntegerField(default=20, min_value=1, max_value=200)
+    weights = MatchWeightsSerializer(required=False)
+    
+    def validate(self, data):
+        if data['startDate'] >= data['endDate']:
+            raise serializers.ValidationError({'endDate': 'End date must be after start date'})
+        return data
+
+
+# Change History Serializers
+class ResourceHistoryRequestSerializer(serializers.Serializer):
+    """
+    GET /api/v1/idle-resources/{id}/history query parameters
+    """
+    startDate = serializers.DateTimeField(required=False)
+    endDate = serializers.DateTimeField(required=False)
+    cursor = serializers.CharField(required=False, max_length=200)
+    limit = serializers.IntegerField(default=50, min_value=1, max_value=500)
+    
+    def validate(self, data):
+        if 'startDate' in data and 'endDate' in data and data['startDate'] >= data['endDate']:
+            raise serializers.ValidationError({'endDate': 'End date must be after start date'})
+        return data
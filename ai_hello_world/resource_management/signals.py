@@ -0,0 +1,214 @@
+"""
+Resource Management Signal Handlers
+
+Keeps derived data (indexes and projections) in step with the source
+models. Handlers run inside the caller's transaction, so a rolled-back
+write never leaves derived rows behind.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.models import Department, Employee
+from services.common.cache_service import search_cache
+from services.resource_management.similarity_service import similarity_index
+
+from . import audit_log, fulltext
+from .models import (
+    IdleResource,
+    IdleResourceReadModel,
+    ResourceAvailability,
+    ResourceSkill,
+    ResourceSkillToken,
+)
+
+# IdleResource columns that feed the full-text index
+_FULLTEXT_FIELDS = {'skills', 'employee', 'employee_id'}
+
+
+@receiver(post_save, sender=IdleResource)
+def sync_skill_index_on_resource_save(sender, instance, update_fields=None, raw=False, **kwargs):
+    """Re-index skills when an IdleResource's skills may have changed."""
+    if raw:
+        return
+    if update_fields is not None and 'skills' not in update_fields:
+        return
+    ResourceSkillToken.sync_resources([instance.pk])
+
+
+@receiver(post_save, sender=ResourceSkill)
+@receiver(post_delete, sender=ResourceSkill)
+def sync_skill_index_on_detailed_skill_change(sender, instance, raw=False, **kwargs):
+    """Re-index the owning resource when a detailed skill changes."""
+    if raw:
+        return
+    if not IdleResource.objects.filter(pk=instance.resource_id).exists():
+        # Cascade delete of the resource; its tokens go with it
+        return
+    ResourceSkillToken.sync_resources([instance.resource_id])
+
+
+@receiver(post_save, sender=IdleResource)
+def sync_fulltext_on_resource_save(sender, instance, update_fields=None, raw=False, using=None, **kwargs):
+    """Re-index the resource document when indexed columns may have changed."""
+    if raw:
+        return
+    if update_fields is not None and not _FULLTEXT_FIELDS.intersection(update_fields):
+        return
+    fulltext.index_resources([instance.pk], using=using)
+
+
+@receiver(post_delete, sender=IdleResource)
+def remove_fulltext_on_resource_delete(sender, instance, using=None, **kwargs):
+    """Drop the resource document."""
+    fulltext.remove_resources([instance.pk], using=using)
+
+
+@receiver(post_save, sender=Employee)
+def sync_fulltext_on_employee_save(sender, instance, raw=False, using=None, **kwargs):
+    """Employee name, number and position are part of every resource document."""
+    if raw:
+        return
+    resource_ids = list(
+        IdleResource.objects.using(using).filter(employee=instance).values_list('id', flat=True)
+    )
+    fulltext.index_resources(resource_ids, using=using)
+
+
+@receiver(post_save, sender=ResourceSkill)
+@receiver(post_delete, sender=ResourceSkill)
+@receiver(post_save, sender=ResourceAvailability)
+@receiver(post_delete, sender=ResourceAvailability)
+def sync_fulltext_on_child_change(sender, instance, raw=False, using=None, **kwargs):
+    """Detailed skills and availability notes feed the skills/notes columns."""
+    if raw:
+        return
+    # index_resources() drops the document if the parent itself is gone
+    fulltext.index_resources([instance.resource_id], using=using)
+
+
+@receiver(post_save, sender=IdleResource)
+def sync_read_model_on_resource_save(sender, instance, raw=False, using=None, **kwargs):
+    """Upsert the resource's projection row."""
+    if raw:
+        return
+    IdleResourceReadModel.refresh_resources([instance.pk], using=using)
+
+
+@receiver(post_delete, sender=IdleResource)
+def remove_read_model_on_resource_delete(sender, instance, using=None, **kwargs):
+    """Drop the resource's projection row."""
+    IdleResourceReadModel.objects.using(using).filter(pk=instance.pk).delete()
+
+
+@receiver(post_save, sender=Employee)
+def sync_read_model_on_employee_save(sender, instance, raw=False, using=None, **kwargs):
+    """Name, number, position and department are copied onto every row of the employee."""
+    if raw:
+        return
+    IdleResourceReadModel.refresh_employees([instance.pk], using=using)
+
+
+@receiver(post_save, sender=Department)
+def sync_read_model_on_department_save(sender, instance, raw=False, using=None, **kwargs):
+    """Department names are denormalized onto the projection."""
+    if raw:
+        return
+    IdleResourceReadModel.rename_department(instance.pk, instance.department_name, using=using)
+
+
+@receiver(post_delete, sender=Department)
+def detach_read_model_on_department_delete(sender, instance, using=None, **kwargs):
+    """Employees are detached with a signal-less SET NULL UPDATE; mirror it."""
+    IdleResourceReadModel.detach_department(instance.pk, using=using)
+
+
+@receiver(post_save, sender=IdleResource)
+def log_resource_changes_on_save(sender, instance, created=False, raw=False, using=None, **kwargs):
+    """Append the changed audited fields to the monthly change log."""
+    if raw:
+        return
+    entry = audit_log.change_entry(
+        instance, 'create' if created else 'update', sender.AUDITED_FIELDS,
+        instance.updated_by or instance.created_by
+    )
+    if entry is not None:
+        audit_log.record_changes([entry], using=using)
+    # Later saves of this instance diff against what was just written
+    instance._audit_snapshot = audit_log.snapshot(instance, sender.AUDITED_FIELDS)
+
+
+@receiver(post_delete, sender=IdleResource)
+def log_resource_changes_on_delete(sender, instance, using=None, **kwargs):
+    """Hard deletes keep the last audited values in the change log."""
+    audit_log.record_changes(
+        [audit_log.change_entry(instance, 'delete', sender.AUDITED_FIELDS, instance.updated_by)], using=using
+    )
+
+
+@receiver(post_save, sender=IdleResource)
+@receiver(post_delete, sender=IdleResource)
+@receiver(post_save, sender=Employee)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(post_save, sender=ResourceSkill)
+@receiver(post_delete, sender=ResourceSkill)
+@receiver(post_save, sender=ResourceAvailability)
+@receiver(post_delete, sender=ResourceAvailability)
+def invalidate_search_cache(sender, raw=False, using=None, **kwargs):
+    """
+    Expire cached search/list results on any write that can change them.
+
+    Invalidated immediately so this transaction's own reads miss, and again
+    on commit so nothing cached from pre-commit data survives.
+    """
+    if raw:
+        return
+    search_cache.invalidate()
+    transaction.on_commit(search_cache.invalidate, using=using)
+
+
+def mark_similarity_dirty(resource_ids, using=None):
+    """
+    Queue resources for the next similarity index refresh.
+
+    Marked at once for this transaction's reads and again on commit, in case
+    a refresh in between read the pre-commit rows.
+    """
+    resource_ids = list(resource_ids)
+    similarity_index.mark_dirty(resource_ids)
+    transaction.on_commit(lambda: similarity_index.mark_dirty(resource_ids), using=using)
+
+
+@receiver(post_save, sender=IdleResource)
+@receiver(post_delete, sender=IdleResource)
+def mark_similarity_dirty_on_resource_change(sender, instance, raw=False, using=None, **kwargs):
+    """Skills or deletion of the resource itself."""
+    if raw:
+        return
+    mark_similarity_dirty([instance.pk], using=using)
+
+
+@receiver(post_save, sender=ResourceSkill)
+@receiver(post_delete, sender=ResourceSkill)
+def mark_similarity_dirty_on_skill_change(sender, instance, raw=False, using=None, **kwargs):
+    """Detailed skills are weighted terms of their resource."""
+    if raw:
+        return
+    mark_similarity_dirty([instance.resource_id], using=using)
+
+
+@receiver(post_save, sender=Employee)
+def mark_similarity_dirty_on_employee_save(sender, instance, raw=False, using=None, **kwargs):
+    """The position is a term of every resource of the employee."""
+    if raw:
+        return
+    mark_similarity_dirty(
+        IdleResource.objects.using(using).filter(employee=instance).values_list('id', flat=True), using=using
+    )
+
+
+def create_fulltext_index(sender, using=None, **kwargs):
+    """post_migrate hook: make sure the FTS5 table exists."""
+    fulltext.create_index(using=using)
@@ -12,7 +12,10 @@ app_name = 'resource_management'
 urlpatterns = [
     # Idle Resource CRUD endpoints
     path('idle-resources', views.get_idle_resource_list, name='get_idle_resource_list'),
+    path('idle-resources/stream', views.stream_idle_resources, name='stream_idle_resources'),
     path('idle-resources/<uuid:resource_id>', views.get_idle_resource_detail, name='get_idle_resource_detail'),
+    path('idle-resources/<uuid:resource_id>/similar', views.get_similar_idle_resources, name='get_similar_idle_resources'),
+    path('idle-resources/<uuid:resource_id>/history', views.get_idle_resource_history, name='get_idle_resource_history'),
     
     # Create using POST to idle-resources (not /create)
     # This will be handled by views.create_idle_resource when method is POST
@@ -26,11 +29,19 @@ urlpatterns = [
     
     # Export/Import operations
     path('idle-resources/export', views.export_idle_resources, name='export_idle_resources'),
+    path('idle-resources/export/<uuid:export_id>/download', views.download_export, name='download_export'),
     path('idle-resources/import', views.import_idle_resources, name='import_idle_resources'),
+    path('idle-resources/import/<uuid:import_id>/resume', views.resume_import, name='resume_import'),
     
     # Advanced search
     path('idle-resources/search', views.advanced_search_idle_resources, name='advanced_search_idle_resources'),
     
+    # Batch availability check
+    path('idle-resources/availability', views.check_batch_availability, name='check_batch_availability'),
+    
+    # Staffing demand matching
+    path('idle-resources/match', views.match_idle_resources, name='match_idle_resources'),
+    
     # Validation
     path('idle-resources/validate', views.validate_data, name='validate_data'),
     
@@ -9,15 +9,38 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils import timezone
 from datetime import datetime, timedelta
+import time
 import uuid
 
+from authentication.models import Department
+from common.conditional import make_etag, not_modified_response, set_validators
+from common.renderers import dumps
+from common.spreadsheets import XLSX_CONTENT_TYPE
+from services.base import ReadOnlyService
+from services.common.cache_service import CacheService, build_query_signature
+from services.exceptions import DataNotFoundException, ValidationException
+from services.resource_management.availability_service import AvailabilityService
+from services.resource_management.change_history_service import ChangeHistoryService
+from services.resource_management.crud_service import ResourceCRUDService
+from services.resource_management.export_service import ResourceExportService
+from services.resource_management.import_service import ResourceImportService
+from services.resource_management.matching_service import MatchingService
+from services.resource_management.similarity_service import SimilarityService
+
+from . import audit_log, facets, fulltext
+from .models import IdleResource, IdleResourceReadModel
+from .pagination import paginate_offset
+
 from .serializers import (
     GetIdleResourceListRequestSerializer,
+    StreamIdleResourcesRequestSerializer,
     GetIdleResourceListResponseSerializer,
     GetIdleResourceDetailRequestSerializer,
-    GetIdleResourceDetailResponseSerializer,
     CreateIdleResourceRequestSerializer,
     CreateIdleResourceResponseSerializer,
     UpdateIdleResourceRequestSerializer,
@@ -25,13 +48,14 @@ from .serializers import (
     DeleteIdleResourceRequestSerializer,
     DeleteIdleResourceResponseSerializer,
     BulkUpdateIdleResourcesRequestSerializer,
-    BulkUpdateIdleResourcesResponseSerializer,
     ExportIdleResourcesRequestSerializer,
-    ExportIdleResourcesResponseSerializer,
     ImportIdleResourcesRequestSerializer,
-    ImportIdleResourcesResponseSerializer,
+    ResumeImportRequestSerializer,
     AdvancedSearchRequestSerializer,
     AdvancedSearchResponseSerializer,
+    BatchAvailabilityRequestSerializer,
+    MatchResourcesRequestSerializer,
+    ResourceHistoryRequestSerializer,
     ValidateDataRequestSerializer,
     ValidateDataResponseSerializer,
     GetMasterDataRequestSerializer,
@@ -105,6 +129,11 @@ def get_idle_resource_list(request):
     page_size = serializer.validated_data.get('pageSize', 25)
     sort_by = serializer.validated_data.get('sortBy', 'idleFrom')
     sort_order = serializer.validated_data.get('sortOrder', 'desc')
+    pagination_mode = serializer.validated_data.get('paginationMode', 'offset')
+    cursor = serializer.validated_data.get('cursor')
+    count_mode = serializer.validated_data.get('countMode', 'exact')
+    include_aggregations = serializer.validated_data.get('includeAggregations', True)
+    include_columns = _parse_columns(serializer.validated_data.get('includeColumns', []))
     
     # Filter parameters
     filters = {
@@ -114,61 +143,188 @@ def get_idle_resource_list(request):
         'dateTo': serializer.validated_data.get('dateTo'),
         'specialAction': serializer.validated_data.get('specialAction'),
         'searchQuery': serializer.validated_data.get('searchQuery'),
-        'urgentOnly': serializer.validated_data.get('urgentOnly', False)
+        'urgentOnly': serializer.validated_data.get('urgentOnly', False),
+        'skills': serializer.validated_data.get('skills', []),
+        'skillsMatch': serializer.validated_data.get('skillsMatch', 'all')
     }
     
-    # TODO: Implement business logic using ResourceCRUDService
-    # user_context = _extract_user_context(request)
-    # 
-    # from services.resource_management.crud_service import ResourceCRUDService
-    # crud_service = ResourceCRUDService(user_context)
-    # 
-    # result = crud_service.list_resources(
-    #     filters={k: v for k, v in filters.items() if v is not None},
-    #     pagination={'page': page, 'page_size': page_size},
-    #     sorting={'field': sort_by, 'order': sort_order}
-    # )
-    #
-    # if not result.success:
-    #     return Response({
-    #         'error': 'Failed to retrieve resources',
-    #         'details': result.errors
-    #     }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
-    # MOCK RESPONSE - Fixed payload for testing
-    mock_records = []
-    for i in range(min(page_size, 5)):  # Generate up to 5 mock records
-        mock_records.append({
-            'id': str(uuid.uuid4()),
-            'employeeName': f'Employee {i+1}',
-            'employeeId': f'EMP{str(i+1).zfill(3)}',
-            'departmentId': str(uuid.uuid4()),
-            'jobRank': ['Junior', 'Senior', 'Lead', 'Manager'][i % 4],
-            'currentLocation': ['Hanoi', 'HCMC', 'Da Nang'][i % 3],
-            'idleType': ['Bench', 'Training', 'Available'][i % 3],
-            'idleFromDate': '2025-01-01',
-            'idleToDate': '2025-12-31',
-            'idleMM': 12,
-            'salesPrice': 500000 + (i * 100000),
-            'specialAction': ['Training', 'Certification', None][i % 3],
-            'pic': f'Manager {i+1}'
-        })
+    if sort_by not in _LIST_SORT_FIELDS:
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': {'sortBy': [f"Unsupported sort field '{sort_by}'"]}
+        }, status=status.HTTP_400_BAD_REQUEST)
     
-    mock_response_data = {
-        'records': mock_records,
-        'totalCount': 100,  # Mock total count
-        'pageInfo': {
-            'currentPage': page,
-            'totalPages': (100 + page_size - 1) // page_size,
-            'hasNextPage': page < ((100 + page_size - 1) // page_size),
-            'hasPreviousPage': page > 1
-        },
-        'aggregations': {},
-        'executionTime': 150
+    unknown_columns = [column for column in include_columns if column not in _LIST_COLUMNS]
+    if unknown_columns:
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': {'includeColumns': [f"Unknown column '{column}'" for column in unknown_columns]}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    started = time.monotonic()
+    dao_filters = _scope_filters(request, _build_list_filters(filters))
+    
+    def load_page():
+        result = IdleResource.list_with_filters(
+            filters=dao_filters,
+            page=page,
+            page_size=page_size,
+            sort_by=_LIST_SORT_FIELDS[sort_by],
+            sort_order=sort_order,
+            cursor=cursor,
+            pagination_mode=pagination_mode,
+            fields=_projection_fields(include_columns) if include_columns else None,
+            count_mode=count_mode,
+            read_model=True
+        )
+        
+        if include_columns:
+            records = [_project_record(row, include_columns) for row in result['records']]
+        else:
+            records = [_format_list_record(record) for record in result['records']]
+        
+        page_info = result['page_info']
+        if cursor is not None or pagination_mode == 'cursor':
+            # Cursor mode: no COUNT(*), so no page numbers either
+            response_page_info = {
+                'hasNextPage': page_info['has_next_page'],
+                'hasPreviousPage': page_info['has_previous_page'],
+                'nextCursor': page_info['next_cursor'],
+                'previousCursor': page_info['previous_cursor']
+            }
+        else:
+            response_page_info = {
+                'currentPage': page_info['current_page'],
+                'totalPages': page_info['total_pages'],
+                'hasNextPage': page_info['has_next_page'],
+                'hasPreviousPage': page_info['has_previous_page'],
+                'totalCountExact': result['count_exact']
+            }
+        
+        aggregations = {}
+        # Later cursor pages skip the grouped scan; the client has it from page one
+        if include_aggregations and cursor is None:
+            aggregations = facets.list_aggregations(facets.compute_facets(
+                IdleResourceReadModel.build_filtered_queryset(dao_filters), facets.DEFAULT_FACETS
+            ))
+        
+        return {
+            'records': records,
+            'totalCount': result['total_count'],
+            'pageInfo': response_page_info,
+            'aggregations': aggregations
+        }
+    
+    try:
+        # Conditional GET: one aggregate query decides whether anything changed.
+        # ETag only: max(projected_at) moves backwards when rows leave the
+        # filter, so it is no Last-Modified.
+        fingerprint = IdleResourceReadModel.fingerprint(IdleResourceReadModel.build_filtered_queryset(dao_filters))
+        etag = make_etag(
+            'idle-resources', fingerprint['count'], fingerprint['last_projected'],
+            build_query_signature(dict(serializer.validated_data))
+        )
+        not_modified = not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        
+        cached = CacheService(_extract_user_context(request)).get_or_compute(
+            'list', dict(serializer.validated_data), load_page
+        )
+    except ValidationError as e:
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': {'cursor' if cursor is not None else 'non_field_errors': e.messages}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    response_data = {
+        **cached.data,
+        'executionTime': int((time.monotonic() - started) * 1000),
+        'cacheInfo': _cache_info(cached)
     }
     
-    # Return the response directly to ensure correct format
-    return Response(mock_response_data, status=status.HTTP_200_OK)
+    return set_validators(Response(response_data, status=status.HTTP_200_OK), etag)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def stream_idle_resources(request):
+    """
+    Stream Idle Resources API
+    
+    Endpoint: GET /api/v1/idle-resources/stream
+    
+    Writes every matching record as newline-delimited JSON (or RFC 7464
+    JSON text sequences with streamFormat=json-seq) for bulk consumers.
+    Rows are read with a server-side chunked iterator, so memory stays
+    bounded and output starts after the first chunk, not the whole result.
+    
+    Query Parameters: StreamIdleResourcesRequestSerializer
+    Response: One list-format record per line
+    """
+    
+    serializer = StreamIdleResourcesRequestSerializer(data=request.query_params)
+    if not serializer.is_valid():
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': serializer.errors
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    validated_data = serializer.validated_data
+    sort_by = validated_data.get('sortBy', 'idleFrom')
+    sort_order = validated_data.get('sortOrder', 'desc')
+    include_columns = _parse_columns(validated_data.get('includeColumns', []))
+    
+    if sort_by not in _LIST_SORT_FIELDS:
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': {'sortBy': [f"Unsupported sort field '{sort_by}'"]}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    unknown_columns = [column for column in include_columns if column not in _LIST_COLUMNS]
+    if unknown_columns:
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': {'includeColumns': [f"Unknown column '{column}'" for column in unknown_columns]}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Filter values are checked while the queryset is built, before the
+    # response starts; later errors could only truncate the stream
+    try:
+        queryset = IdleResourceReadModel.build_filtered_queryset(
+            _scope_filters(request, _build_list_filters(validated_data))
+        )
+    except ValidationError as e:
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': {'non_field_errors': e.messages}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    sort_field = _LIST_SORT_FIELDS[sort_by]
+    if sort_order == 'desc':
+        queryset = queryset.order_by(f'-{sort_field}', '-id')
+    else:
+        queryset = queryset.order_by(sort_field, 'id')
+    
+    chunk_size = validated_data.get('chunkSize', 2000)
+    if include_columns:
+        rows = queryset.values(*_projection_fields(include_columns)).iterator(chunk_size=chunk_size)
+        records = (_project_record(row, include_columns) for row in rows)
+    else:
+        rows = queryset.iterator(chunk_size=chunk_size)
+        records = (_format_list_record(resource.to_dict()) for resource in rows)
+    
+    if validated_data.get('streamFormat') == 'json-seq':
+        content_type, prefix = 'application/json-seq', b'\x1e'
+    else:
+        content_type, prefix = 'application/x-ndjson', b''
+    
+    response = StreamingHttpResponse(
+        (prefix + dumps(record) + b'\n' for record in records),
+        content_type=content_type
+    )
+    # Ask reverse proxies not to buffer the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
 
 
 @api_view(['GET'])
@@ -191,57 +347,151 @@ def get_idle_resource_detail(request, resource_id):
             'details': serializer.errors
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    include_audit = serializer.validated_data.get('include_audit', True)
-    include_related = serializer.validated_data.get('include_related', False)
+    # Validators first: a 304 costs one indexed lookup and no serialization
+    # projected_at, not version: employee and department changes alter the body too
+    projected_at = IdleResourceReadModel.objects.filter(pk=resource_id, is_deleted=False).values_list(
+        'projected_at', flat=True
+    ).first()
+    if projected_at is None:
+        return Response({
+            'error': 'Resource not found',
+            'details': {'resourceId': [f'Idle resource {resource_id} not found']}
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    etag = make_etag(
+        'idle-resource', str(resource_id), projected_at, build_query_signature(dict(serializer.validated_data))
+    )
+    not_modified = not_modified_response(request, etag, projected_at)
+    if not_modified is not None:
+        return not_modified
+    
+    row = IdleResourceReadModel.objects.get(pk=resource_id)
+    response_data = _format_detail_record(row)
+    if serializer.validated_data.get('include_audit', True):
+        response_data['audit_info'] = _detail_audit_info(resource_id)
+    if serializer.validated_data.get('include_related', False):
+        response_data['related_data'] = _detail_related_data(row)
+    
+    return set_validators(Response(response_data, status=status.HTTP_200_OK), etag, projected_at)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_similar_idle_resources(request, resource_id):
+    """
+    Similar Idle Resources API
     
-    # TODO: Implement business logic using ResourceCRUDService
-    # user_context = _extract_user_context(request)
-    # 
-    # from services.resource_management.crud_service import ResourceCRUDService
-    # crud_service = ResourceCRUDService(user_context)
-    # 
-    # result = crud_service.read_resource(
-    #     record_id=resource_id,
-    #     include_metadata=include_audit
-    # )
-    #
-    # if not result.success:
-    #     return Response({
-    #         'error': 'Resource not found',
-    #         'details': result.errors
-    #     }, status=status.HTTP_404_NOT_FOUND)
+    Endpoint: GET /api/v1/idle-resources/{id}/similar
     
-    # MOCK RESPONSE
-    mock_response_data = {
-        'id': resource_id,
-        'employee_name': 'Nguyen Van A',
-        'employee_id': 'EMP001',
-        'department_id': str(uuid.uuid4()),
-        'child_department_id': str(uuid.uuid4()),
-        'job_rank': 'Senior',
-        'current_location': 'Hanoi',
-        'expected_working_places': ['Hanoi', 'HCMC'],
-        'idle_type': 'Bench',
-        'idle_from_date': '2025-01-01',
-        'idle_to_date': '2025-12-31',
-        'idle_mm': 12,
-        'japanese_level': 'N2',
-        'english_level': 'Intermediate',
-        'source_type': 'FJPer',
-        'sales_price': 500000,
-        'special_action': 'Training',
-        'change_dept_lending': 'Not Yet Open',
-        'skills_experience': 'Java, Spring Boot, React',
-        'progress_notes': 'Currently learning new technologies',
-        'pic': 'Manager Name',
-        'created_at': timezone.now().isoformat(),
-        'updated_at': timezone.now().isoformat(),
-        'version': 1
-    }
+    Recommends resources with the most similar skill profile (TF-IDF
+    cosine similarity over skills, proficiency and position).
     
-    response_serializer = GetIdleResourceDetailResponseSerializer(data=mock_response_data)
-    response_serializer.is_valid()
-    return Response(response_serializer.data, status=status.HTTP_200_OK)
+    Query Parameters:
+    - limit: Number of recommendations (default 10, max 100)
+    """
+    
+    try:
+        limit = int(request.query_params.get('limit', 10))
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= 100:
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': {'limit': ['Must be an integer between 1 and 100']}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    started = time.monotonic()
+    try:
+        service_response = SimilarityService(_extract_user_context(request)).find_similar(resource_id, limit)
+    except DataNotFoundException as e:
+        return Response({
+            'error': 'Resource not found',
+            'details': {'resourceId': [e.message]}
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    employees = dict(
+        (str(pk), (employee_name, position))
+        for pk, employee_name, position in IdleResourceReadModel.objects.filter(
+            id__in=[item['resource_id'] for item in service_response.data]
+        ).values_list('id', 'employee_name', 'position')
+    )
+    
+    similar = []
+    for item in service_response.data:
+        employee_name, position = employees.get(item['resource_id'], (None, None))
+        similar.append({
+            'resourceId': item['resource_id'],
+            'employeeName': employee_name,
+            'position': position,
+            'score': item['score'],
+            'sharedSkills': item['shared_skills'],
+            'sharedPositions': item['shared_positions']
+        })
+    
+    return Response({
+        'resourceId': str(resource_id),
+        'similar': similar,
+        'executionTime': int((time.monotonic() - started) * 1000)
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_idle_resource_history(request, resource_id):
+    """
+    Idle Resource Change History API
+    
+    Endpoint: GET /api/v1/idle-resources/{id}/history
+    
+    Field-level changes of one resource, newest first. Pass nextCursor
+    back as cursor for the following page.
+    
+    Query Parameters: ResourceHistoryRequestSerializer
+    """
+    
+    serializer = ResourceHistoryRequestSerializer(data=request.query_params)
+    if not serializer.is_valid():
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': serializer.errors
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    validated_data = serializer.validated_data
+    started = time.monotonic()
+    try:
+        service_response = ChangeHistoryService(_extract_user_context(request)).get_resource_history(
+            resource_id,
+            start=validated_data.get('startDate'),
+            end=validated_data.get('endDate'),
+            cursor=validated_data.get('cursor'),
+            limit=validated_data['limit']
+        )
+    except ValidationException as e:
+        return Response({
+            'error': 'Invalid query parameters',
+            'details': {'cursor': [e.message]}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except DataNotFoundException as e:
+        return Response({
+            'error': 'Resource not found',
+            'details': {'resourceId': [e.message]}
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    return Response({
+        'resourceId': str(resource_id),
+        'history': [
+            {
+                'changedAt': _iso(entry['changed_at']),
+                'operation': entry['operation'],
+                'changes': entry['changes'],
+                'userId': entry['user_id'],
+                'version': entry['version']
+            }
+            for entry in service_response.data
+        ],
+        'nextCursor': service_response.metadata['next_cursor'],
+        'executionTime': int((time.monotonic() - started) * 1000)
+    }, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -512,81 +762,56 @@ def bulk_update_idle_resources(request):
     validate_all = serializer.validated_data.get('validate_all', True)
     operation_id = serializer.validated_data.get('operation_id', str(uuid.uuid4()))
     
-    # TODO: Implement business logic using ResourceCRUDService
-    # user_context = _extract_user_context(request)
-    # 
-    # from services.resource_management.crud_service import ResourceCRUDService
-    # crud_service = ResourceCRUDService(user_context)
-    # 
-    # result = crud_service.bulk_update_resources(
-    #     updates=updates,
-    #     options={
-    #         'rollback_on_error': rollback_on_error,
-    #         'validate_all': validate_all,
-    #         'operation_id': operation_id
-    #     }
-    # )
-    
-    # MOCK RESPONSE
-    mock_results = []
-    successful = 0
-    failed = 0
-    
-    for update in updates:
-        is_success = True  # Mock success for most items
-        if is_success:
-            successful += 1
-            mock_updated_record = {
-                'id': update['id'],
-                'employee_name': 'Updated Name',
-                'employee_id': 'EMP001',
-                'department_id': str(uuid.uuid4()),
-                'job_rank': 'Senior',
-                'current_location': 'Hanoi',
-                'expected_working_places': ['Hanoi'],
-                'idle_type': 'Bench',
-                'idle_from_date': '2025-01-01',
-                'idle_to_date': '2025-12-31',
-                'idle_mm': 12,
-                'created_at': timezone.now().isoformat(),
-                'updated_at': timezone.now().isoformat(),
-                'version': update['version'] + 1
+    started = time.monotonic()
+    try:
+        service_response = ResourceCRUDService(_extract_user_context(request)).bulk_update_resources(
+            updates=[
+                {'id': update['id'], 'version': update['version'], 'data': _bulk_update_data(update['data'])}
+                for update in updates
+            ],
+            options={
+                'rollback_on_error': rollback_on_error,
+                'validate_all': validate_all,
+                'operation_id': operation_id
             }
-            
-            mock_results.append({
-                'id': update['id'],
-                'success': True,
-                'updated_record': mock_updated_record,
-                'error_message': None,
-                'changed_fields': list(update['data'].keys())
-            })
-        else:
-            failed += 1
-            mock_results.append({
-                'id': update['id'],
-                'success': False,
-                'updated_record': None,
-                'error_message': 'Version conflict or validation error',
-                'changed_fields': []
-            })
+        )
+    except ValidationException as e:
+        return Response({
+            'error': 'Invalid request payload',
+            'details': {'updates': [e.message]}
+        }, status=status.HTTP_400_BAD_REQUEST)
     
-    mock_response_data = {
+    outcome = service_response.data
+    updated_ids = [result['id'] for result in outcome['results'] if result['success']]
+    records = {
+        str(row.id): _format_detail_record(row)
+        for row in IdleResourceReadModel.objects.filter(id__in=updated_ids)
+    }
+    
+    return Response({
         'operation_id': operation_id,
-        'results': mock_results,
+        'results': [
+            {
+                'id': result['id'],
+                'success': result['success'],
+                'updated_record': records.get(result['id']),
+                'error_message': result['error'],
+                'changed_fields': result['changed_fields'],
+                'current_version': result.get('current_version'),
+                'validation_errors': result.get('validation_errors')
+            }
+            for result in outcome['results']
+        ],
         'summary': {
             'total_requested': len(updates),
-            'successful': successful,
-            'failed': failed,
-            'errors': failed,
+            'successful': outcome['successful'],
+            'failed': outcome['failed'],
+            'errors': outcome['failed'],
             'warnings': 0
         },
-        'execution_time': 500,
+        'execution_time': int((time.monotonic() - started) * 1000),
         'completed_at': timezone.now().isoformat()
-    }
-    
-    response_serializer = BulkUpdateIdleResourcesResponseSerializer(data=mock_response_data)
-    response_serializer.is_valid()
-    return Response(response_serializer.data, status=status.HTTP_200_OK)
+    }, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -610,30 +835,101 @@ def export_idle_resources(request):
         }, status=status.HTTP_400_BAD_REQUEST)
     
     validated_data = serializer.validated_data
-    export_format = validated_data.get('format', 'excel')
-    file_name = validated_data.get('fileName', 'idle_resources_export')
+    columns = validated_data.get('columns') or list(_LIST_COLUMNS)
+    sort_by = validated_data.get('sortBy', 'idleFromDate')
+    
+    errors = {}
+    if sort_by not in _LIST_SORT_FIELDS:
+        errors['sortBy'] = [f"Unsupported sort field '{sort_by}'"]
+    unknown_columns = [column for column in columns if column not in _LIST_COLUMNS]
+    if unknown_columns:
+        errors['columns'] = [f"Unknown column '{column}'" for column in unknown_columns]
+    if errors:
+        return Response({
+            'error': 'Invalid request payload',
+            'details': errors
+        }, status=status.HTTP_400_BAD_REQUEST)
     
-    # MOCK RESPONSE
-    export_id = str(uuid.uuid4())
-    file_extension = 'xlsx' if export_format == 'excel' else 'csv'
-    generated_filename = f"{file_name}_{timezone.now().strftime('%Y%m%d')}.{file_extension}"
+    start_time = time.monotonic()
+    queryset = IdleResourceReadModel.build_filtered_queryset(
+        _scope_filters(request, _build_list_filters(validated_data.get('filters', {})))
+    )
+    sort_field = _LIST_SORT_FIELDS[sort_by]
+    if validated_data.get('sortOrder', 'desc') == 'desc':
+        queryset = queryset.order_by(f'-{sort_field}', '-id')
+    else:
+        queryset = queryset.order_by(sort_field, 'id')
+    
+    # Rows are read in chunks and written one by one; the result is never held in memory
+    rows = queryset.values(*_projection_fields(columns)).iterator(chunk_size=2000)
+    records = ([_LIST_COLUMNS[column][1](row) for column in columns] for row in rows)
+    
+    try:
+        service_response = ResourceExportService(_extract_user_context(request)).export_resources(
+            columns, records, {
+                'export_format': validated_data.get('format', 'excel'),
+                'file_name': validated_data.get('fileName'),
+                # JSON form of the filters that were applied
+                'filters': {
+                    key: value for key, value in serializer.data['filters'].items()
+                    if key in validated_data.get('filters', {})
+                },
+                'sort': {'sortBy': sort_by, 'sortOrder': validated_data.get('sortOrder', 'desc')},
+                'include_metadata': validated_data.get('includeMetadata', True),
+            }
+        )
+    except ValidationException as e:
+        return Response({
+            'error': 'Invalid request payload',
+            'details': {'format': [e.message]}
+        }, status=status.HTTP_400_BAD_REQUEST)
     
-    mock_response_data = {
-        'exportId': export_id,
-        'fileUrl': f'https://storage.example.com/exports/{generated_filename}',
-        'fileName': generated_filename,
-        'fileSize': 2048576,
-        'recordCount': 150,
-        'format': export_format,
-        'status': 'completed',
-        'createdAt': timezone.now().isoformat(),
-        'expiresAt': (timezone.now() + timedelta(days=1)).isoformat(),
-        'downloadToken': 'secure-token-' + str(uuid.uuid4())[:8]
+    export = service_response.data
+    download_url = request.build_absolute_uri(
+        f"/api/v1/idle-resources/export/{export['export_id']}/download?token={export['download_token']}"
+    )
+    response_data = {
+        'exportId': export['export_id'],
+        'fileUrl': download_url,
+        'fileName': export['file_name'],
+        'fileSize': export['file_size'],
+        'recordCount': export['record_count'],
+        'format': export['format'],
+        'status': export['status'],
+        'createdAt': export['created_at'].isoformat(),
+        'expiresAt': export['expires_at'].isoformat(),
+        'downloadToken': export['download_token'],
+        'executionTime': round((time.monotonic() - start_time) * 1000, 2)
     }
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def download_export(request, export_id):
+    """
+    Download Export API
     
-    response_serializer = ExportIdleResourcesResponseSerializer(data=mock_response_data)
-    response_serializer.is_valid()
-    return Response(response_serializer.data, status=status.HTTP_200_OK)
+    Endpoint: GET /api/v1/idle-resources/export/{id}/download?token=...
+    
+    Streams a completed export file; token is the downloadToken returned
+    by POST /api/v1/idle-resources/export.
+    """
+    
+    try:
+        service_response = ResourceExportService(_extract_user_context(request)).get_export_file(
+            export_id, request.query_params.get('token')
+        )
+    except ValidationException as e:
+        return Response({'error': e.message}, status=status.HTTP_403_FORBIDDEN)
+    except DataNotFoundException as e:
+        return Response({'error': e.message}, status=status.HTTP_404_NOT_FOUND)
+    
+    export = service_response.data
+    content_type = XLSX_CONTENT_TYPE if export['format'] == 'excel' else 'text/csv'
+    return FileResponse(
+        open(export['path'], 'rb'), as_attachment=True, filename=export['file_name'], content_type=content_type
+    )
 
 
 @api_view(['POST'])
@@ -657,43 +953,67 @@ def import_idle_resources(request):
         }, status=status.HTTP_400_BAD_REQUEST)
     
     validated_data = serializer.validated_data
-    import_mode = validated_data.get('importMode', 'validate')
-    
-    # MOCK RESPONSE
-    import_id = str(uuid.uuid4())
-    
-    mock_response_data = {
-        'importId': import_id,
-        'status': 'completed',
-        'totalRows': 100,
-        'validRows': 95,
-        'invalidRows': 5,
-        'processedRows': 95,
-        'duplicateRows': 2,
-        'errorReport': [
-            {
-                'row': 3,
-                'field': 'employeeId',
-                'error': 'Required field missing'
-            },
+    started = time.monotonic()
+    try:
+        service_response = ResourceImportService(_extract_user_context(request)).import_resources(
+            validated_data['file'],
             {
-                'row': 7,
-                'field': 'idleFromDate',
-                'error': 'Invalid date format'
+                'import_mode': validated_data['importMode'],
+                'duplicate_handling': validated_data['duplicateHandling'],
+                'validate_only': validated_data['validateOnly'],
+                'column_mapping': validated_data['columnMapping'],
+                'rollback_on_error': validated_data['rollbackOnError'],
+                'batch_size': validated_data['batchSize']
             }
-        ],
-        'warningReport': [],
-        'importSummary': {
-            'created': 90,
-            'updated': 5,
-            'skipped': 5
-        },
-        'auditTrailId': str(uuid.uuid4())
-    }
+        )
+    except ValidationException as e:
+        return Response({
+            'error': 'Invalid import file',
+            'details': {'file': [e.message]}
+        }, status=status.HTTP_400_BAD_REQUEST)
     
-    response_serializer = ImportIdleResourcesResponseSerializer(data=mock_response_data)
-    response_serializer.is_valid()
-    return Response(response_serializer.data, status=status.HTTP_200_OK)
+    return Response(_format_import_result(service_response.data, started), status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def resume_import(request, import_id):
+    """
+    Resume Import API
+    
+    Endpoint: POST /api/v1/idle-resources/import/{id}/resume
+    
+    Continues an interrupted import from its last checkpoint. A session
+    still 'processing' is only taken over once it is stale, or with force.
+    
+    Request Body: ResumeImportRequestSerializer
+    Response: ImportIdleResourcesResponseSerializer
+    """
+    
+    serializer = ResumeImportRequestSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({
+            'error': 'Invalid request payload',
+            'details': serializer.errors
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    started = time.monotonic()
+    try:
+        service_response = ResourceImportService(_extract_user_context(request)).resume_import(
+            import_id, force=serializer.validated_data['force']
+        )
+    except DataNotFoundException as e:
+        return Response({
+            'error': 'Import not found',
+            'details': {'importId': [e.message]}
+        }, status=status.HTTP_404_NOT_FOUND)
+    except ValidationException as e:
+        return Response({
+            'error': 'Import cannot be resumed',
+            'details': {'importId': [e.message]}
+        }, status=status.HTTP_409_CONFLICT)
+    
+    return Response(_format_import_result(service_response.data, started), status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -720,58 +1040,215 @@ def advanced_search_idle_resources(request):
     query = validated_data.get('query', '')
     page = validated_data.get('page', 1)
     page_size = validated_data.get('pageSize', 20)
+    sort_by = validated_data.get('sortBy', 'relevance')
+    sort_order = validated_data.get('sortOrder', 'desc')
+    count_mode = validated_data.get('countMode') or (
+        'exact' if validated_data.get('includeCount', True) else 'none'
+    )
     
-    # Generate mock search results
-    mock_records = []
-    for i in range(min(page_size, 5)):
-        mock_records.append({
-            'id': str(uuid.uuid4()),
-            'employeeName': f'Java Developer {i+1}',
-            'employeeId': f'DEV{str(i+1).zfill(3)}',
-            'departmentId': str(uuid.uuid4()),
-            'jobRank': 'Senior',
-            'currentLocation': 'Hanoi',
-            'idleType': 'Bench',
-            'idleFromDate': '2025-01-01',
-            'idleToDate': '2025-12-31',
-            'skillsExperience': 'Java, Spring Boot, React',
-            'specialAction': 'Training'
-        })
+    if sort_by != 'relevance' and sort_by not in _LIST_SORT_FIELDS:
+        return Response({
+            'error': 'Invalid request payload',
+            'details': {'sortBy': [f"Unsupported sort field '{sort_by}'"]}
+        }, status=status.HTTP_400_BAD_REQUEST)
     
-    mock_response_data = {
-        'results': mock_records,
-        'totalCount': 50,
-        'pageInfo': {
-            'currentPage': page,
-            'totalPages': 3,
-            'hasNextPage': page < 3
-        },
-        'facets': {
-            'departmentId': {
-                'DEPT001': 30,
-                'DEPT002': 20
+    requested_facets = validated_data.get('facets') or list(facets.DEFAULT_FACETS)
+    include_aggregations = validated_data.get('includeAggregations', True)
+    
+    started = time.monotonic()
+    
+    def run_search():
+        search_started = time.monotonic()
+        dao_filters = _scope_filters(request, _build_search_filters(validated_data.get('filters') or {}))
+        base_queryset = IdleResourceReadModel.build_filtered_queryset(dao_filters)
+        filtered = fulltext.filter_queryset(base_queryset, query)
+        
+        # One grouped round-trip covers both the facets and the aggregations
+        facet_names = list(requested_facets)
+        if include_aggregations:
+            facet_names += [name for name in facets.DEFAULT_FACETS if name not in facet_names]
+        facet_counts = facets.compute_facets(filtered, facet_names)
+        
+        if query.strip() and sort_by == 'relevance':
+            queryset = fulltext.rank_queryset(base_queryset, query)
+        else:
+            queryset = filtered
+            sort_field = _LIST_SORT_FIELDS.get(sort_by, 'updated_at')
+            queryset = queryset.order_by(f'-{sort_field}' if sort_order == 'desc' else sort_field, '-id')
+        
+        page_result = paginate_offset(queryset, page, page_size, count_mode)
+        page_info = page_result['page_info']
+        
+        search_results = []
+        for resource in page_result['rows']:
+            record = _format_list_record(resource.to_dict())
+            if hasattr(resource, 'search_rank'):
+                # bm25 is "lower is better"; expose a positive score
+                record['searchScore'] = round(-resource.search_rank, 4)
+            search_results.append(record)
+        
+        return {
+            'results': search_results,
+            'totalCount': page_result['total_count'],
+            'pageInfo': {
+                'currentPage': page_info['current_page'],
+                'totalPages': page_info['total_pages'],
+                'hasNextPage': page_info['has_next_page'],
+                'hasPreviousPage': page_info['has_previous_page'],
+                'totalCountExact': page_result['count_exact']
             },
-            'idleType': {
-                'Bench': 35,
-                'Training': 15
-            }
-        },
-        'aggregations': {},
-        'searchMetadata': {
-            'query': query,
-            'searchTime': 120
-        },
-        'suggestedFilters': [],
-        'executionTime': 120,
-        'cacheInfo': {
-            'hit': False,
-            'ttl': 300
+            'facets': {name: facet_counts.get(name, {}) for name in requested_facets},
+            'aggregations': facets.list_aggregations(facet_counts) if include_aggregations else {},
+            'searchMetadata': {
+                'query': query,
+                'searchTime': int((time.monotonic() - search_started) * 1000)
+            },
+            'suggestedFilters': []
         }
+    
+    cached = CacheService(_extract_user_context(request)).get_or_compute(
+        'search', dict(validated_data), run_search
+    )
+    
+    response_data = {
+        **cached.data,
+        'executionTime': int((time.monotonic() - started) * 1000),
+        'cacheInfo': _cache_info(cached)
     }
     
-    response_serializer = AdvancedSearchResponseSerializer(data=mock_response_data)
-    response_serializer.is_valid()
-    return Response(response_serializer.data, status=status.HTTP_200_OK)
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def check_batch_availability(request):
+    """
+    Batch Availability Check API
+    
+    Endpoint: POST /api/v1/idle-resources/availability
+    
+    Checks every listed resource against one date range and returns
+    per-resource conflicts and free windows.
+    
+    Request Body: BatchAvailabilityRequestSerializer
+    """
+    
+    serializer = BatchAvailabilityRequestSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({
+            'error': 'Invalid request payload',
+            'details': serializer.errors
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    validated_data = serializer.validated_data
+    started = time.monotonic()
+    try:
+        service_response = AvailabilityService(_extract_user_context(request)).check_batch_availability(
+            validated_data['resourceIds'], validated_data['startDate'], validated_data['endDate']
+        )
+    except ValidationException as e:
+        return Response({
+            'error': 'Invalid request payload',
+            'details': {'resourceIds': [e.message]}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    results = {
+        resource_id: {
+            'isAvailable': result['is_available'],
+            'reason': result.get('reason'),
+            'conflicts': [
+                {
+                    'type': conflict['type'],
+                    'message': conflict['message'],
+                    'allocationReference': conflict.get('allocation_reference'),
+                    'start': conflict.get('start'),
+                    'end': conflict.get('end')
+                }
+                for conflict in result['conflicts']
+            ],
+            'freeWindows': result['free_windows'],
+            'availabilityWindow': result['availability_window']
+        }
+        for resource_id, result in service_response.data['results'].items()
+    }
+    
+    return Response({
+        'results': results,
+        'availableIds': [resource_id for resource_id, result in results.items() if result['isAvailable']],
+        'notFound': service_response.data['not_found'],
+        'executionTime': int((time.monotonic() - started) * 1000)
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def match_idle_resources(request):
+    """
+    Resource Matching API
+    
+    Endpoint: POST /api/v1/idle-resources/match
+    
+    Ranks available resources for a staffing demand and explains each
+    score component.
+    
+    Request Body: MatchResourcesRequestSerializer
+    """
+    
+    serializer = MatchResourcesRequestSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response({
+            'error': 'Invalid request payload',
+            'details': serializer.errors
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    validated_data = serializer.validated_data
+    started = time.monotonic()
+    try:
+        service_response = MatchingService(_extract_user_context(request)).find_matches(
+            {
+                'required_skills': validated_data.get('requiredSkills', []),
+                'min_experience': validated_data.get('minExperience'),
+                'max_hourly_rate': validated_data.get('maxHourlyRate'),
+                'start_date': validated_data['startDate'],
+                'end_date': validated_data['endDate'],
+                'location': validated_data.get('location'),
+            },
+            limit=validated_data.get('limit', 20),
+            weights=validated_data.get('weights')
+        )
+    except ValidationException as e:
+        return Response({
+            'error': 'Invalid request payload',
+            'details': {'non_field_errors': [e.message]}
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Names for the top matches only, in one query
+    employees = dict(
+        (str(pk), (employee_name, str(employee_id)))
+        for pk, employee_name, employee_id in IdleResourceReadModel.objects.filter(
+            id__in=[match['resource_id'] for match in service_response.data]
+        ).values_list('id', 'employee_name', 'employee_id')
+    )
+    
+    matches = []
+    for match in service_response.data:
+        employee_name, employee_id = employees.get(match['resource_id'], (None, None))
+        matches.append({
+            'resourceId': match['resource_id'],
+            'employeeId': employee_id,
+            'employeeName': employee_name,
+            'score': match['score'],
+            'breakdown': match['breakdown'],
+            'matchedSkills': match['matched_skills'],
+            'missingSkills': match['missing_skills']
+        })
+    
+    return Response({
+        'matches': matches,
+        'candidateCount': service_response.metadata['candidate_count'],
+        'eligibleCount': service_response.metadata['eligible_count'],
+        'executionTime': int((time.monotonic() - started) * 1000)
+    }, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -879,6 +1356,16 @@ def get_master_data(request):
     user_role = request.query_params.get('userRole')
     department_scope = request.query_params.get('departmentScope')
     
+    # Conditional GET: departments are the table-backed part of master data
+    departments = Department.objects.aggregate(count=Count('department_id'), last_modified=Max('updated_at'))
+    etag = make_etag(
+        'master-data', departments['count'], departments['last_modified'],
+        sorted(data_types), user_role, department_scope
+    )
+    not_modified = not_modified_response(request, etag, departments['last_modified'])
+    if not_modified is not None:
+        return not_modified
+    
     # TODO: Implement business logic using MasterDataService
     # user_context = _extract_user_context(request)
     # 
@@ -936,7 +1423,9 @@ def get_master_data(request):
         mock_response_data = filtered_data
     
     # Return mock data directly - bypassing serializer validation issues
-    return Response(mock_response_data, status=status.HTTP_200_OK)
+    return set_validators(
+        Response(mock_response_data, status=status.HTTP_200_OK), etag, departments['last_modified']
+    )
 
 
 def _extract_user_context(request):
@@ -953,6 +1442,252 @@ def _extract_user_context(request):
     }
 
 
+def _format_import_result(result, started):
+    """Import response body for a ResourceImportService summary."""
+    return {
+        'importId': result['import_id'],
+        'status': result['status'],
+        'totalRows': result['total_rows'],
+        'validRows': result['valid_rows'],
+        'invalidRows': result['invalid_rows'],
+        'processedRows': result['processed_rows'],
+        'duplicateRows': result['duplicate_rows'],
+        'errorReport': result['errors'],
+        'warningReport': [],
+        'importSummary': {
+            'created': result['created'],
+            'updated': result['updated'],
+            'skipped': result['skipped']
+        },
+        'auditTrailId': result['import_id'],
+        'executionTime': int((time.monotonic() - started) * 1000)
+    }
+
+
+def _cache_info(service_response):
+    """cacheInfo block for a CacheService response."""
+    cache_info = service_response.metadata['cacheInfo']
+    return {'hit': cache_info['hit'], 'ttl': cache_info['ttl']}
+
+
+# API sortBy values -> idle_resources columns
+_LIST_SORT_FIELDS = {
+    'idleFrom': 'availability_start',
+    'idleFromDate': 'availability_start',
+    'idleTo': 'availability_end',
+    'idleToDate': 'availability_end',
+    'idleType': 'resource_type',
+    'idleMM': 'idle_mm',
+    'status': 'status',
+    'salesPrice': 'hourly_rate',
+    'experienceYears': 'experience_years',
+    'createdAt': 'created_at',
+    'updatedAt': 'updated_at',
+}
+
+
+def _build_list_filters(filters):
+    """Translate API list filters into IdleResource.list_with_filters criteria."""
+    dao_filters = {}
+    if filters.get('departmentId'):
+        dao_filters['department_id'] = filters['departmentId']
+    if filters.get('idleType'):
+        dao_filters['resource_type'] = filters['idleType']
+    if filters.get('dateFrom'):
+        dao_filters['date_from'] = filters['dateFrom']
+    if filters.get('dateTo'):
+        dao_filters['date_to'] = filters['dateTo']
+    if filters.get('skills'):
+        dao_filters['skills'] = filters['skills']
+        dao_filters['skills_match'] = filters.get('skillsMatch', 'all')
+    if filters.get('searchQuery'):
+        dao_filters['search_query'] = filters['searchQuery']
+    if filters.get('urgentOnly'):
+        dao_filters['urgent_only'] = True
+    return dao_filters
+
+
+def _scope_filters(request, dao_filters):
+    """Restrict DAO filters to the caller's department scope (manager: whole subtree)."""
+    scope = [dept for dept in ReadOnlyService(_extract_user_context(request)).get_user_department_scope() if dept]
+    if not scope:
+        # Admins, and callers without a department, are not restricted
+        return dao_filters
+    return {**dao_filters, 'department_scope': scope}
+
+
+def _build_search_filters(filters):
+    """Translate advanced search filters into IdleResource filter criteria."""
+    dao_filters = {}
+    if filters.get('departmentId'):
+        dao_filters['department_id'] = filters['departmentId']
+    if filters.get('idleType'):
+        dao_filters['resource_type'] = list(filters['idleType'])
+    date_range = filters.get('dateRange') or {}
+    if date_range.get('from'):
+        dao_filters['date_from'] = date_range['from']
+    if date_range.get('to'):
+        dao_filters['date_to'] = date_range['to']
+    return dao_filters
+
+
+def _format_list_record(record):
+    """Map a to_dict() row (source or read model) onto the list API record format."""
+    idle_from = record['availability_start'][:10] if record['availability_start'] else None
+    idle_to = record['availability_end'][:10] if record['availability_end'] else None
+    return {
+        'id': record['id'],
+        'employeeName': record['employee_name'],
+        'employeeId': record['employee_id'],
+        'departmentId': record['department_id'],
+        'idleType': record['resource_type'],
+        'status': record['status'],
+        'idleFromDate': idle_from,
+        'idleToDate': idle_to,
+        'idleMM': record['idle_mm'],
+        'isUrgent': record['is_urgent'],
+        'salesPrice': record['hourly_rate'],
+        'skills': record['skills'],
+        'experienceYears': record['experience_years'],
+        'updatedAt': record['updated_at'],
+        'version': record['version']
+    }
+
+
+def _format_detail_record(row):
+    """Detail response body for an IdleResourceReadModel row."""
+    return {
+        'id': str(row.id),
+        'employee_name': row.employee_name,
+        'employee_id': str(row.employee_id),
+        'department_id': str(row.department_id) if row.department_id else None,
+        'child_department_id': None,
+        'job_rank': row.position,
+        'current_location': None,
+        'expected_working_places': [],
+        'idle_type': row.resource_type,
+        'idle_from_date': _iso_date(row.availability_start),
+        'idle_to_date': _iso_date(row.availability_end),
+        'idle_mm': row.idle_mm,
+        'japanese_level': None,
+        'english_level': None,
+        'source_type': None,
+        'sales_price': row.hourly_rate,
+        'special_action': None,
+        'change_dept_lending': None,
+        'skills_experience': ', '.join(
+            skill.get('name', '') if isinstance(skill, dict) else str(skill) for skill in row.skills or []
+        ),
+        'progress_notes': None,
+        'pic': None,
+        'created_at': row.created_at,
+        'updated_at': row.updated_at,
+        'version': row.version
+    }
+
+
+# Change log entries in the detail audit_info
+_DETAIL_AUDIT_TRAIL = 10
+
+
+def _detail_audit_info(resource_id):
+    """Detail audit_info: who created / last updated the resource and its latest changes."""
+    created_by, updated_by = IdleResource.objects.filter(pk=resource_id).values_list(
+        'created_by', 'updated_by'
+    ).first() or (None, None)
+    trail = audit_log.query_changes(IdleResource._meta.db_table, resource_id, limit=_DETAIL_AUDIT_TRAIL)['results']
+    return {
+        'created_by': created_by,
+        'updated_by': updated_by,
+        'audit_trail': [
+            {
+                'changed_at': entry['changed_at'],
+                'operation': entry['operation'],
+                'changes': entry['changes'],
+                'user_id': entry['user_id'],
+                'version': entry['version']
+            }
+            for entry in trail
+        ]
+    }
+
+
+def _detail_related_data(row):
+    """Detail related_data from the denormalized read model row (no extra queries)."""
+    return {
+        'employee': {
+            'id': str(row.employee_id),
+            'employee_number': row.employee_number,
+            'full_name': row.employee_name,
+            'position': row.position
+        },
+        'department': {
+            'id': str(row.department_id),
+            'name': row.department_name
+        } if row.department_id else None
+    }
+
+
+# API field names accepted in bulk update data -> idle_resources columns
+_BULK_FIELD_ALIASES = {
+    'idle_type': 'resource_type',
+    'idle_from_date': 'availability_start',
+    'idle_to_date': 'availability_end',
+    'sales_price': 'hourly_rate',
+}
+
+
+def _bulk_update_data(data):
+    """Translate API field names in a bulk update item; model names pass through."""
+    return {_BULK_FIELD_ALIASES.get(key, key): value for key, value in data.items()}
+
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+def _iso_date(value):
+    return value.isoformat()[:10] if value else None
+
+
+# includeColumns name -> (read model columns to select, row -> value); mirrors _format_list_record
+_LIST_COLUMNS = {
+    'id': (('id',), lambda row: str(row['id'])),
+    'employeeName': (('employee_name',), lambda row: row['employee_name']),
+    'employeeId': (('employee_id',), lambda row: str(row['employee_id'])),
+    'departmentId': (
+        ('department_id',),
+        lambda row: str(row['department_id']) if row['department_id'] else None
+    ),
+    'idleType': (('resource_type',), lambda row: row['resource_type']),
+    'status': (('status',), lambda row: row['status']),
+    'idleFromDate': (('availability_start',), lambda row: _iso_date(row['availability_start'])),
+    'idleToDate': (('availability_end',), lambda row: _iso_date(row['availability_end'])),
+    'idleMM': (('idle_mm',), lambda row: row['idle_mm']),
+    'isUrgent': (('is_urgent',), lambda row: row['is_urgent']),
+    'salesPrice': (('hourly_rate',), lambda row: float(row['hourly_rate']) if row['hourly_rate'] else None),
+    'skills': (('skills',), lambda row: row['skills']),
+    'experienceYears': (('experience_years',), lambda row: row['experience_years']),
+    'updatedAt': (('updated_at',), lambda row: _iso(row['updated_at'])),
+    'version': (('version',), lambda row: row['version']),
+}
+
+
+def _parse_columns(values):
+    """Accept both repeated (?includeColumns=a&includeColumns=b) and comma-separated values."""
+    return [column.strip() for value in values for column in value.split(',') if column.strip()]
+
+
+def _projection_fields(columns):
+    """Database columns needed to build the requested API columns."""
+    return list(dict.fromkeys(path for column in columns for path in _LIST_COLUMNS[column][0]))
+
+
+def _project_record(row, columns):
+    """Build a list record holding only the requested columns from a values() row."""
+    return {column: _LIST_COLUMNS[column][1](row) for column in columns}
+
+
 def _calculate_idle_months(from_date, to_date):
     """Helper function to calculate idle months between two dates."""
     if not from_date or not to_date:
@@ -77,7 +77,7 @@ class BaseService(ABC):
             raise
     
     def _log_audit_success(self, operation: str, result: Any, args: tuple, kwargs: dict):
-        """Log successful operation for audit trail."""
+        """Log successful operation for audit trail (queued, written when the transaction commits)."""
         # Import here to avoid circular imports
         try:
             from .common.audit_service import AuditService
@@ -89,7 +89,7 @@ class BaseService(ABC):
                 kwargs=kwargs
             )
         except ImportError:
-            # Audit service not yet implemented, skip logging
+            # Audit service not installed in this deployment, skip logging
             pass
     
     def _log_audit_error(self, operation: str, error: str, args: tuple, kwargs: dict):
@@ -104,7 +104,7 @@ class BaseService(ABC):
                 kwargs=kwargs
             )
         except ImportError:
-            # Audit service not yet implemented, skip logging
+            # Audit service not installed in this deployment, skip logging
             pass
     
     def validate_user_permissions(self, required_permissions: List[str]) -> bool:
@@ -138,11 +138,15 @@ class BaseService(ABC):
             return [user_dept] if user_dept else []
     
     def _get_department_hierarchy(self, department_id: str) -> List[str]:
-        """Get department and all its child departments."""
-        # This would typically query a department hierarchy table
-        # For now, return just the department itself
-        # In a real implementation, this would recursively find child departments
-        return [department_id] if department_id else []
+        """
+        Get department and all its child departments.
+        
+        One lookup on the department closure table, whatever the depth of
+        the tree, and cached until the next department change.
+        """
+        from authentication.models import DepartmentClosure
+        
+        return DepartmentClosure.descendant_ids(department_id)
     
     def get_current_timestamp(self):
         """Get current timestamp for operations."""
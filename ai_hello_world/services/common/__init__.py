@@ -0,0 +1 @@
+# Cross-cutting services shared by the business modules
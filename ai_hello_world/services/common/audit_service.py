@@ -0,0 +1,324 @@
+"""
+Audit Service implementing DAO-MDE-03-04-01 (Create Audit Entry)
+
+Records every BaseService.execute_with_audit call in audit_trail without
+adding a database round-trip to the call itself.
+
+Source: DD/MDE-03/04-dao/DAO-MDE-03-04_v0.1.md - DAO-MDE-03-04-01: Create Audit Entry
+
+Business Rules:
+    - Entries are built in the calling thread and put on a bounded queue;
+      one background thread writes them with bulk_create
+    - A batch is written once BATCH_SIZE entries are waiting or
+      FLUSH_INTERVAL seconds after its first entry arrived
+    - Success entries are queued when the surrounding transaction commits,
+      so rolled-back operations are never audited as successes; error
+      entries are queued at once
+    - When the queue is full the caller writes its own entry (back
+      pressure instead of dropping entries), retrying like a batch
+    - A batch that fails to save is retried with exponential backoff
+      (RETRY_BACKOFF seconds, doubling up to 30) up to MAX_ATTEMPTS times,
+      then written row by row so one bad row cannot hold back the others;
+      rows that still fail are logged in full to the dead letter logger.
+      At shutdown a retrying batch is handed back to flush() instead
+    - The queue is drained at interpreter exit
+    - Arguments and results are summarized: sizes of large collections,
+      not their contents
+
+Configuration (settings.AUDIT_LOG, all optional):
+    ENABLED, ASYNC, BATCH_SIZE, FLUSH_INTERVAL, QUEUE_SIZE, RETRY_BACKOFF,
+    MAX_ATTEMPTS
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core import serializers
+from django.db import close_old_connections, transaction
+
+from ..base import ServiceResponse
+
+
+logger = logging.getLogger(__name__)
+# Full rows that could not be written, for replay from the log
+dead_letter_logger = logging.getLogger(__name__ + '.dead_letter')
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Longest wait between two attempts at writing the same batch
+_MAX_BACKOFF = 30.0
+
+# How long a caller waits for queue space before writing its entry itself
+_PUT_TIMEOUT = 0.05
+
+# Summaries keep at most this many items/keys per level and this many levels
+_MAX_ITEMS = 20
+_MAX_DEPTH = 3
+_MAX_TEXT = 500
+
+_STOP = object()
+
+
+def _audit_settings() -> Dict:
+    return getattr(settings, 'AUDIT_LOG', {})
+
+
+def summarize(value, depth: int = 0):
+    """JSON-safe, size-bounded description of an argument or result."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= _MAX_TEXT else value[:_MAX_TEXT] + '...'
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, ServiceResponse):
+        return {
+            'success': value.success,
+            'errors': [summarize(error, depth + 1) for error in value.errors[:_MAX_ITEMS]],
+            'metadata': summarize(value.metadata, depth + 1),
+        }
+    if depth >= _MAX_DEPTH:
+        if isinstance(value, (list, tuple, set, frozenset, dict)):
+            return {'type': type(value).__name__, 'length': len(value)}
+        return type(value).__name__
+    if isinstance(value, dict):
+        summary = {str(key): summarize(item, depth + 1) for key, item in list(value.items())[:_MAX_ITEMS]}
+        if len(value) > _MAX_ITEMS:
+            summary['...'] = {'length': len(value)}
+        return summary
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if len(value) > _MAX_ITEMS:
+            return {'type': type(value).__name__, 'length': len(value)}
+        return [summarize(item, depth + 1) for item in value]
+    return type(value).__name__
+
+
+def _resource_id(args: tuple, kwargs: Dict) -> Optional[str]:
+    """The audited record: a resource_id keyword or a leading id argument."""
+    candidate = kwargs.get('resource_id', args[0] if args else None)
+    if isinstance(candidate, uuid.UUID):
+        return str(candidate)
+    if isinstance(candidate, str):
+        try:
+            return str(uuid.UUID(candidate))
+        except ValueError:
+            return None
+    return None
+
+
+class BufferedAuditWriter:
+    """
+    Bounded queue of unsaved AuditTrail rows with a background batch writer.
+
+    One instance per process (``audit_writer`` below). The thread starts on
+    first use and is restarted in a forked child.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, flush_interval: Optional[float] = None,
+                 queue_size: Optional[int] = None, asynchronous: Optional[bool] = None,
+                 retry_backoff: Optional[float] = None, max_attempts: Optional[int] = None):
+        config = _audit_settings()
+        self.batch_size = batch_size or config.get('BATCH_SIZE', DEFAULT_BATCH_SIZE)
+        self.flush_interval = flush_interval or config.get('FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)
+        self.asynchronous = config.get('ASYNC', True) if asynchronous is None else asynchronous
+        self.retry_backoff = retry_backoff or config.get('RETRY_BACKOFF', DEFAULT_RETRY_BACKOFF)
+        self.max_attempts = max_attempts or config.get('MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS)
+        self._queue = queue.Queue(maxsize=queue_size or config.get('QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        # Batches the writer thread gave up on at shutdown, left for flush()
+        self._unwritten = []
+
+    def submit(self, entry):
+        """Queue an unsaved AuditTrail row for writing."""
+        if not self.asynchronous:
+            self._write_with_retry([entry])
+            return
+        self._ensure_started()
+        try:
+            self._queue.put(entry, timeout=_PUT_TIMEOUT)
+        except queue.Full:
+            self._write_with_retry([entry])
+
+    def flush(self):
+        """Write everything queued so far from the calling thread."""
+        with self._lock:
+            unwritten, self._unwritten = self._unwritten, []
+        # No backoff here: flush() runs at exit, one more attempt per batch
+        if unwritten and not self._write(unwritten):
+            self._write_rows(unwritten)
+        batch = self._take(self.batch_size)
+        while batch:
+            if not self._write(batch):
+                self._write_rows(batch)
+            batch = self._take(self.batch_size)
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop the background thread after it has written what it holds, then drain the rest."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            # Interrupts retry backoff; a failing batch goes to flush() below
+            self._stopping.set()
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+                thread.join(timeout)
+            except queue.Full:
+                pass
+        self.flush()
+
+    def pending(self) -> int:
+        """Number of queued entries not yet handed to the writer thread."""
+        return self._queue.qsize()
+
+    def _ensure_started(self):
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            if self._pid is None:
+                atexit.register(self.shutdown)
+            # A forked child inherits the queue but not the thread
+            self._pid = os.getpid()
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+            self._thread.start()
+
+    def _take(self, limit: int) -> list:
+        batch = []
+        while len(batch) < limit:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not _STOP:
+                batch.append(entry)
+        return batch
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            entry = self._queue.get()
+            if entry is _STOP:
+                break
+            batch = [entry]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            close_old_connections()
+            self._write_with_retry(batch)
+        close_old_connections()
+
+    def _write_with_retry(self, batch: list):
+        delay = self.retry_backoff
+        for attempt in range(self.max_attempts):
+            if attempt:
+                if self._stopping.wait(delay):
+                    with self._lock:
+                        self._unwritten.extend(batch)
+                    return
+                delay = min(delay * 2, _MAX_BACKOFF)
+                # The failure may have left a broken connection behind
+                close_old_connections()
+            if self._write(batch):
+                return
+        self._write_rows(batch)
+
+    def _write_rows(self, batch: list):
+        """Write a batch one row at a time, dead-lettering the rows that fail."""
+        for entry in batch:
+            if len(batch) > 1 and self._write([entry]):
+                continue
+            dead_letter_logger.error(
+                "Dropped audit trail entry that could not be written: %s",
+                serializers.serialize('json', [entry])
+            )
+
+    def _write(self, batch: list) -> bool:
+        from resource_management.models import AuditTrail
+
+        try:
+            AuditTrail.objects.bulk_create(batch, batch_size=self.batch_size)
+        except Exception:
+            # Auditing must never fail the audited operation
+            logger.exception("Failed to write %d audit trail entries", len(batch))
+            return False
+        return True
+
+
+audit_writer = BufferedAuditWriter()
+
+
+class AuditService:
+    """
+    Audit entry points used by BaseService.execute_with_audit.
+    """
+
+    @classmethod
+    def log_operation(cls, operation: str, user_context: Dict, result: Any = None,
+                      args: tuple = (), kwargs: Optional[Dict] = None):
+        """Record a successful operation once the surrounding transaction commits."""
+        if not _audit_settings().get('ENABLED', True):
+            return
+        entry = cls.build_entry(operation, 'success', user_context, args, kwargs or {}, result=result)
+        transaction.on_commit(lambda: audit_writer.submit(entry))
+
+    @classmethod
+    def log_error(cls, operation: str, user_context: Dict, error: str,
+                  args: tuple = (), kwargs: Optional[Dict] = None):
+        """Record a failed operation immediately; its transaction is already rolled back."""
+        if not _audit_settings().get('ENABLED', True):
+            return
+        audit_writer.submit(cls.build_entry(operation, 'error', user_context, args, kwargs or {}, error=error))
+
+    @staticmethod
+    def build_entry(operation: str, status: str, user_context: Dict, args: tuple, kwargs: Dict,
+                    result: Any = None, error: str = ''):
+        """Unsaved AuditTrail row for one operation."""
+        from resource_management.models import AuditTrail
+
+        user_context = user_context or {}
+        details = {'args': summarize(list(args)), 'kwargs': summarize(kwargs)}
+        if status == 'success':
+            details['result'] = summarize(result)
+        return AuditTrail(
+            resource_id=_resource_id(args, kwargs),
+            operation_type=operation,
+            status=status,
+            operation_details=details,
+            error_message=str(error)[:_MAX_TEXT * 4],
+            user_id=summarize(user_context.get('user_id')),
+            user_role=user_context.get('role'),
+            department_id=summarize(user_context.get('department_id')),
+            ip_address=user_context.get('ip_address') or None,
+            user_agent=(user_context.get('user_agent') or '')[:255],
+            session_id=user_context.get('session_id'),
+        )
@@ -0,0 +1,284 @@
+"""
+Cache Service implementing SVE-MDE-03-15
+
+Caches idle resource search and list results so repeated dashboard queries
+are answered without touching the database.
+
+Source: DD/MDE-03/02-api/API-MDE-03-09_v0.1.md - Step 4: Check Cache for Similar Queries
+
+Business Rules:
+    - The cache key is the query signature (normalized filters) plus the
+      caller's department scope and cache scope
+    - Two layers: an in-process LRU (L1) in front of a Django cache alias
+      (L2) shared by worker processes; the alias must be a shared backend
+      (file based, Redis, Memcached), since with locmem a write in one
+      process leaves stale results in the others
+    - The generation is read from L2 on every lookup, so L1 entries of
+      other processes go stale with it
+    - Entries live for maxAge seconds (300 by default)
+    - Any IdleResource write replaces a global generation token that is
+      part of every key, so all cached results go stale at once (a fresh
+      random value, not incr, which the file based backend does not make
+      atomic)
+    - Concurrent identical misses in one process share a single computation
+
+Configuration (settings.SEARCH_CACHE, all optional):
+    ENABLED, CACHE_ALIAS, MAX_AGE, L1_MAX_ENTRIES
+"""
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+
+from ..base import ReadOnlyService, ServiceResponse
+
+
+DEFAULT_MAX_AGE = 300
+DEFAULT_L1_MAX_ENTRIES = 256
+
+_GENERATION_KEY = 'search-cache:generation'
+
+
+def _cache_settings() -> Dict:
+    return getattr(settings, 'SEARCH_CACHE', {})
+
+
+def _normalize(value):
+    """Canonical form of a filter value: empty values dropped, sets sorted."""
+    if isinstance(value, dict):
+        normalized = {}
+        for key, item in value.items():
+            item = _normalize(item)
+            if item not in (None, '', [], {}):
+                normalized[str(key)] = item
+        return normalized
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_normalize(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True, default=str))
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    return value
+
+
+def build_query_signature(params: Dict) -> str:
+    """
+    Stable signature for a set of query parameters.
+
+    Key order, surrounding whitespace, list order and empty values do not
+    change the signature.
+    """
+    canonical = json.dumps(_normalize(params), sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU of (expires_at, value) pairs."""
+
+    def __init__(self, max_entries: int = DEFAULT_L1_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Return (value, remaining_seconds) or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            remaining = expires_at - time.monotonic()
+            if remaining <= 0:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value, remaining
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class _Flight:
+    """One in-progress computation that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SearchResultCache:
+    """
+    Two-level result cache with generation based invalidation.
+
+    One instance per process (``search_cache`` below); services and views
+    go through CacheService rather than using it directly.
+    """
+
+    def __init__(self, alias: Optional[str] = None, max_age: Optional[int] = None,
+                 l1_max_entries: Optional[int] = None):
+        config = _cache_settings()
+        self.alias = alias or config.get('CACHE_ALIAS', 'default')
+        self.max_age = max_age or config.get('MAX_AGE', DEFAULT_MAX_AGE)
+        self.l1 = LRUCache(l1_max_entries or config.get('L1_MAX_ENTRIES', DEFAULT_L1_MAX_ENTRIES))
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return _cache_settings().get('ENABLED', True)
+
+    @property
+    def l2(self):
+        try:
+            return caches[self.alias]
+        except InvalidCacheBackendError:
+            return caches['default']
+
+    def current_generation(self) -> str:
+        """Generation token shared through L2; random, so it never repeats."""
+        generation = self.l2.get(_GENERATION_KEY)
+        if generation is None:
+            self.l2.add(_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+            generation = self.l2.get(_GENERATION_KEY)
+        return generation
+
+    def invalidate(self):
+        """Make every cached entry unreachable."""
+        # A plain set is atomic on every backend; racing invalidations each
+        # leave a token no cached key has used
+        self.l2.set(_GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+        # Entries of old generations would only age out; free them now
+        self.l1.clear()
+
+    def clear(self):
+        """Drop L1 and start a new generation (tests, maintenance)."""
+        self.invalidate()
+
+    def peek(self, key: str):
+        """Cached value for ``key`` in the current generation, or None."""
+        if not self.enabled:
+            return None
+        full_key = f"search-cache:{self.current_generation()}:{key}"
+        cached = self.l1.get(full_key)
+        if cached is not None:
+            return cached[0]
+        stored = self.l2.get(full_key)
+        if stored is not None and time.time() - stored[0] < self.max_age:
+            return stored[1]
+        return None
+
+    def store(self, key: str, value: Any, max_age: Optional[int] = None):
+        """Cache ``value`` under ``key`` in the current generation."""
+        if not self.enabled:
+            return
+        max_age = max_age or self.max_age
+        full_key = f"search-cache:{self.current_generation()}:{key}"
+        self.l1.set(full_key, value, max_age)
+        self.l2.set(full_key, (time.time(), value), timeout=max_age)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], max_age: Optional[int] = None):
+        """
+        Return (value, cache_info) for ``key``, computing it on a miss.
+
+        cache_info is {'hit': bool, 'ttl': seconds, 'layer': 'l1'|'l2'|None}.
+        """
+        max_age = max_age or self.max_age
+        if not self.enabled:
+            return compute(), {'hit': False, 'ttl': 0, 'layer': None}
+
+        full_key = f"search-cache:{self.current_generation()}:{key}"
+
+        cached = self.l1.get(full_key)
+        if cached is not None:
+            value, remaining = cached
+            return value, {'hit': True, 'ttl': int(remaining), 'layer': 'l1'}
+
+        stored = self.l2.get(full_key)
+        if stored is not None:
+            stored_at, value = stored
+            remaining = max_age - (time.time() - stored_at)
+            if remaining > 0:
+                self.l1.set(full_key, value, remaining)
+                return value, {'hit': True, 'ttl': int(remaining), 'layer': 'l2'}
+
+        value, shared = self._single_flight(full_key, compute, max_age)
+        return value, {'hit': shared, 'ttl': max_age, 'layer': None}
+
+    def _single_flight(self, full_key: str, compute: Callable[[], Any], max_age: int):
+        """Run ``compute`` once per key; concurrent callers wait for that result."""
+        with self._flights_lock:
+            flight = self._flights.get(full_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[full_key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+
+        try:
+            flight.value = compute()
+            self.l1.set(full_key, flight.value, max_age)
+            self.l2.set(full_key, (time.time(), flight.value), timeout=max_age)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[full_key]
+            flight.done.set()
+        return flight.value, False
+
+
+search_cache = SearchResultCache()
+
+
+class CacheService(ReadOnlyService):
+    """
+    Cache Service implementing SVE-MDE-03-15
+    Scopes cached query results to the caller's department access.
+    """
+
+    def get_or_compute(self, cache_scope: str, params: Dict, compute: Callable[[], Any],
+                       max_age: Optional[int] = None) -> ServiceResponse:
+        """
+        Return cached results for a query, computing and storing them on a miss.
+
+        Args:
+            cache_scope: Cache scope identifier (e.g. 'search', 'list')
+            params: Query parameters; normalized into the query signature
+            compute: Zero-argument callable producing the result on a miss
+            max_age: Maximum cache age in seconds
+
+        Returns:
+            ServiceResponse with the result as data and cacheInfo in metadata
+        """
+        department_scope = sorted(str(dept) for dept in self.get_user_department_scope() if dept)
+        key = f"{cache_scope}:{','.join(department_scope) or '*'}:{build_query_signature(params)}"
+        value, cache_info = search_cache.get_or_compute(key, compute, max_age)
+        return ServiceResponse.success_response(data=value, metadata={'cacheInfo': cache_info})
+
+    @staticmethod
+    def invalidate():
+        """Invalidate every cached query result."""
+        search_cache.invalidate()
@@ -0,0 +1 @@
+# Resource management services package
@@ -0,0 +1,184 @@
+"""
+Batch Availability Service
+
+Checks many idle resources against one date range in two queries, instead
+of one IdleResource.check_availability() round-trip per candidate.
+
+Source: DD/MDE-03/04-dao/DAO-MDE-03-01_v0.1.md - DAO-MDE-03-01-04: Check Availability
+
+Business Rules:
+    - Same conflict rules as IdleResource.check_availability(): status must
+      be 'available', the range must sit inside the resource's availability
+      window, and allocated periods overlapping the range are conflicts
+    - Allocated periods for all resources are loaded in one query, sorted by
+      (resource, start), and swept once to merge busy intervals
+    - Free windows are the parts of the range, clipped to the availability
+      window, not covered by any allocated period
+    - Soft-deleted resources and periods are ignored
+"""
+
+from itertools import groupby
+from typing import Dict, Iterable, List, Tuple
+
+from ..base import ReadOnlyService, ServiceResponse
+from ..exceptions import ValidationException
+
+
+MAX_BATCH_SIZE = 1000
+
+
+def merge_intervals(intervals: Iterable[Tuple]) -> List[Tuple]:
+    """Merge (start, end) intervals sorted by start into disjoint intervals."""
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_windows(window_start, window_end, busy: List[Tuple]) -> List[Tuple]:
+    """Gaps in [window_start, window_end) left by merged busy intervals."""
+    windows = []
+    cursor = window_start
+    for start, end in busy:
+        if end <= cursor:
+            continue
+        if start >= window_end:
+            break
+        if start > cursor:
+            windows.append((cursor, start))
+        cursor = max(cursor, end)
+    if cursor < window_end:
+        windows.append((cursor, window_end))
+    return windows
+
+
+class AvailabilityService(ReadOnlyService):
+    """
+    Batch availability checks for staffing many candidates at once.
+    """
+
+    def check_batch_availability(self, resource_ids: List, start_date, end_date) -> ServiceResponse:
+        """
+        Check availability of many resources for one date range.
+
+        Args:
+            resource_ids: IdleResource primary keys (duplicates are ignored)
+            start_date: Start of the requested range (datetime)
+            end_date: End of the requested range (datetime)
+
+        Returns:
+            ServiceResponse whose data is {'results': {id: result},
+            'not_found': [ids]}. Each result has is_available, conflicts,
+            free_windows and availability_window (plus reason when the
+            status rules the resource out).
+        """
+        return self.execute_with_audit(
+            'check_batch_availability',
+            self._check_batch_availability,
+            resource_ids, start_date, end_date
+        )
+
+    def _check_batch_availability(self, resource_ids, start_date, end_date):
+        from resource_management.models import IdleResource, ResourceAvailability
+
+        if start_date >= end_date:
+            raise ValidationException("Start date must be before end date")
+        resource_ids = list(dict.fromkeys(str(pk) for pk in resource_ids))
+        if len(resource_ids) > MAX_BATCH_SIZE:
+            raise ValidationException(f"At most {MAX_BATCH_SIZE} resources can be checked at once")
+
+        resources = {
+            str(row['id']): row
+            for row in IdleResource.objects.filter(id__in=resource_ids, is_deleted=False).values(
+                'id', 'status', 'availability_start', 'availability_end'
+            )
+        }
+
+        # One query for every overlapping allocation, ordered for the sweep
+        allocations = ResourceAvailability.objects.filter(
+            resource_id__in=resources.keys(),
+            is_deleted=False,
+            is_allocated=True,
+            start_date__lt=end_date,
+            end_date__gt=start_date
+        ).order_by('resource_id', 'start_date').values_list(
+            'resource_id', 'start_date', 'end_date', 'allocation_reference'
+        )
+        allocations_by_resource = {
+            str(resource_id): [row[1:] for row in rows]
+            for resource_id, rows in groupby(allocations, key=lambda row: row[0])
+        }
+
+        results = {
+            resource_id: self._resource_result(
+                resources[resource_id], start_date, end_date,
+                allocations_by_resource.get(resource_id, [])
+            )
+            for resource_id in resource_ids if resource_id in resources
+        }
+
+        return ServiceResponse.success_response(
+            data={
+                'results': results,
+                'not_found': [resource_id for resource_id in resource_ids if resource_id not in resources]
+            },
+            metadata={'checked_count': len(results)}
+        )
+
+    def _resource_result(self, resource: Dict, start_date, end_date, allocations: List[Tuple]) -> Dict:
+        window_start = resource['availability_start']
+        window_end = resource['availability_end']
+        availability_window = {
+            'start': window_start.isoformat() if window_start else None,
+            'end': window_end.isoformat() if window_end else None
+        }
+
+        if resource['status'] != 'available':
+            return {
+                'is_available': False,
+                'reason': f"Resource status is {resource['status']}",
+                'conflicts': [],
+                'free_windows': [],
+                'availability_window': availability_window
+            }
+
+        conflicts = []
+        if window_start and start_date < window_start:
+            conflicts.append({
+                'type': 'availability_window',
+                'message': f'Resource not available before {window_start.date()}'
+            })
+        if window_end and end_date > window_end:
+            conflicts.append({
+                'type': 'availability_window',
+                'message': f'Resource not available after {window_end.date()}'
+            })
+        for period_start, period_end, reference in allocations:
+            conflicts.append({
+                'type': 'allocation_conflict',
+                'message': f'Resource allocated from {period_start.date()} to {period_end.date()}',
+                'allocation_reference': reference,
+                'start': period_start.isoformat(),
+                'end': period_end.isoformat()
+            })
+
+        range_start = max(start_date, window_start) if window_start else start_date
+        range_end = min(end_date, window_end) if window_end else end_date
+        windows = []
+        if range_start < range_end:
+            busy = merge_intervals((period_start, period_end) for period_start, period_end, _ in allocations)
+            windows = [
+                {'start': free_start.isoformat(), 'end': free_end.isoformat()}
+                for free_start, free_end in free_windows(range_start, range_end, busy)
+            ]
+
+        return {
+            'is_available': not conflicts,
+            'conflicts': conflicts,
+            'free_windows': windows,
+            'availability_window': availability_window
+        }
@@ -0,0 +1,79 @@
+"""
+Change History Service implementing SVE-MDE-03-09-02 (Audit Trail Query)
+
+Pages through the field-level change log of idle resources
+(resource_management.audit_log) by record and time range.
+
+Source: DD/MDE-03/03-service/SVE-MDE-03-09_v0.1.md - SVE-MDE-03-09-02: Audit Trail Query
+
+Business Rules:
+    - Newest changes first, paged with an opaque cursor
+    - Only month partitions overlapping the time range are read
+    - Users outside admin only see history of resources in their
+      department scope; other resources are reported as not found
+"""
+
+from typing import Optional
+
+from ..base import ReadOnlyService, ServiceResponse
+from ..exceptions import DataNotFoundException, ValidationException
+
+
+DEFAULT_LIMIT = 50
+
+
+class ChangeHistoryService(ReadOnlyService):
+    """
+    Field-level change history of idle resources.
+    """
+
+    def get_resource_history(self, resource_id, start=None, end=None, cursor: Optional[str] = None,
+                             limit: int = DEFAULT_LIMIT) -> ServiceResponse:
+        """
+        Change entries of one idle resource.
+
+        Args:
+            resource_id: IdleResource primary key
+            start: Inclusive lower bound (datetime)
+            end: Exclusive upper bound (datetime)
+            cursor: next_cursor of the previous page
+            limit: Page size
+
+        Returns:
+            ServiceResponse whose data is a list of entries (changed_at,
+            operation, changes as {field: {'old', 'new'}}, user_id,
+            version), with next_cursor in metadata
+        """
+        return self.execute_with_audit(
+            'get_resource_history', self._get_resource_history, resource_id, start, end, cursor, limit
+        )
+
+    def _get_resource_history(self, resource_id, start, end, cursor, limit):
+        from django.core.exceptions import ValidationError
+        from resource_management import audit_log
+        from resource_management.models import IdleResource, IdleResourceReadModel
+
+        if start is not None and end is not None and start >= end:
+            raise ValidationException("Start date must be before end date")
+
+        scope = [str(department) for department in self.get_user_department_scope() if department]
+        if scope:
+            department_id = IdleResourceReadModel.objects.filter(pk=resource_id).values_list(
+                'department_id', flat=True
+            ).first()
+            if department_id is None or str(department_id) not in scope:
+                raise DataNotFoundException(
+                    f"Idle resource {resource_id} not found", resource_type='IdleResource', resource_id=str(resource_id)
+                )
+
+        try:
+            page = audit_log.query_changes(
+                IdleResource._meta.db_table, resource_id, start=start, end=end, cursor=cursor, limit=limit
+            )
+        except ValidationError as e:
+            raise ValidationException(e.messages[0])
+
+        return ServiceResponse.success_response(
+            data=page['results'],
+            metadata={'next_cursor': page['next_cursor']}
+        )
@@ -0,0 +1,61 @@
+"""
+Resource CRUD Service
+
+Write operations on idle resources that go beyond a single instance save.
+
+Source: DD/MDE-03/04-dao/DAO-MDE-03-01_v0.1.md - DAO-MDE-03-01-02: Update with Version Check
+
+Business Rules:
+    - Bulk updates use optimistic locking per item: an item only applies if
+      its version still matches the stored one
+    - With rollback_on_error nothing is written unless every item succeeds
+    - Bulk requests are limited to MAX_BULK_UPDATE items
+"""
+
+from typing import Dict, List, Optional
+
+from ..base import ServiceResponse, WriteService
+from ..exceptions import ValidationException
+
+
+MAX_BULK_UPDATE = 5000
+BULK_CHUNK_SIZE = 500
+
+
+class ResourceCRUDService(WriteService):
+    """
+    Create/update/delete operations for idle resources.
+    """
+
+    def bulk_update_resources(self, updates: List[Dict], options: Optional[Dict] = None) -> ServiceResponse:
+        """
+        Apply many versioned updates in chunked conditional UPDATEs.
+
+        Args:
+            updates: Items {'id', 'version', 'data'} with model field names in data
+            options: rollback_on_error (default True), operation_id
+
+        Returns:
+            ServiceResponse whose data has per-item 'results' (request order)
+            and 'successful'/'failed' counts
+        """
+        return self.execute_with_audit('bulk_update_resources', self._bulk_update_resources, updates, options or {})
+
+    def _bulk_update_resources(self, updates, options):
+        from resource_management.models import IdleResource
+
+        if not updates:
+            raise ValidationException("At least one update is required")
+        if len(updates) > MAX_BULK_UPDATE:
+            raise ValidationException(f"At most {MAX_BULK_UPDATE} resources can be updated at once")
+
+        outcome = IdleResource.bulk_update_with_version_check(
+            updates,
+            updated_by=self.user_context.get('user_id'),
+            rollback_on_error=options.get('rollback_on_error', True),
+            chunk_size=BULK_CHUNK_SIZE
+        )
+        return ServiceResponse.success_response(
+            data=outcome,
+            metadata={'operation_id': options.get('operation_id')}
+        )
@@ -0,0 +1,227 @@
+"""
+Resource Export Service implementing DAO-MDE-03-05-02 (Data Export Generation)
+
+Writes idle resource rows to a CSV or Excel (.xlsx) file under
+RESOURCE_EXPORT['EXPORT_DIR'] and tracks the run in an ExportSession. Rows
+are consumed from an iterator and written one at a time (XLSX through a
+write-only workbook, see common.spreadsheets), so memory stays flat
+whatever the number of records.
+
+Source: DD/MDE-03/04-dao/DAO-MDE-03-05_v0.1.md - DAO-MDE-03-05-02: Data Export Generation
+
+Business Rules:
+    - The session is 'processing' while the file is written, then
+      'completed' with file_path, file_size and total_records, or 'failed'
+    - Excel exports with include_metadata get a second worksheet describing
+      the export (time, filters, record count)
+    - Files are downloaded with a signed token that expires after
+      RESOURCE_EXPORT['DOWNLOAD_EXPIRY'] seconds
+"""
+
+import csv
+import os
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+
+from common.spreadsheets import SpreadsheetError, write_xlsx
+
+from ..base import ServiceResponse, WriteService
+from ..exceptions import DataNotFoundException, ValidationException
+
+
+DEFAULT_DOWNLOAD_EXPIRY = 24 * 60 * 60
+FILE_EXTENSIONS = {'excel': 'xlsx', 'csv': 'csv'}
+_TOKEN_SALT = 'resource_management.export'
+
+
+def _export_settings() -> Dict:
+    return getattr(settings, 'RESOURCE_EXPORT', {})
+
+
+def _download_expiry() -> int:
+    return _export_settings().get('DOWNLOAD_EXPIRY', DEFAULT_DOWNLOAD_EXPIRY)
+
+
+def _export_dir() -> Path:
+    return Path(_export_settings().get('EXPORT_DIR') or Path(settings.BASE_DIR) / 'exports')
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(item) for item in value)
+    return value
+
+
+class ResourceExportService(WriteService):
+    """
+    Streaming export of idle resources to CSV / Excel files.
+    """
+
+    def export_resources(self, headers: Sequence[str], rows: Iterable[Sequence],
+                         options: Optional[Dict] = None) -> ServiceResponse:
+        """
+        Write rows to an export file.
+
+        Args:
+            headers: Column titles (first row of the file)
+            rows: Iterable of value sequences in header order; consumed once
+            options: export_format ('excel' or 'csv'), file_name (without
+                extension), filters and sort (recorded on the session),
+                include_metadata
+
+        Returns:
+            ServiceResponse whose data describes the export (see _summary),
+            including a download_token
+
+        Like the import, not wrapped in one transaction: the session shows
+        'processing' while the file is written.
+        """
+        options = options or {}
+        try:
+            result = self._export_resources(headers, rows, options)
+        except Exception as e:
+            self._log_audit_error('export_resources', str(e), (), options)
+            raise
+        self._log_audit_success('export_resources', result, (), options)
+        return result
+
+    def _export_resources(self, headers, rows, options):
+        from resource_management.models import ExportSession
+
+        export_format = options.get('export_format', 'excel')
+        if export_format not in FILE_EXTENSIONS:
+            raise ValidationException(f"Unsupported export format '{export_format}'")
+        extension = FILE_EXTENSIONS[export_format]
+        file_name = f"{options.get('file_name') or 'idle_resources_export'}_{timezone.now():%Y%m%d}.{extension}"
+
+        session = ExportSession.objects.create(
+            session_name=f'Export {file_name}',
+            export_format=export_format,
+            filters=options.get('filters') or {},
+            status='processing',
+            started_at=timezone.now(),
+            created_by=self.user_context.get('user_id') or 'system',
+            metadata={'file_name': file_name, 'columns': list(headers), 'sort': options.get('sort')}
+        )
+        export_dir = _export_dir()
+        path = export_dir / f'{session.pk}.{extension}'
+        try:
+            export_dir.mkdir(parents=True, exist_ok=True)
+            if export_format == 'excel':
+                record_count = self._write_xlsx(path, session, headers, rows, options.get('include_metadata', True))
+            else:
+                record_count = self._write_csv(path, headers, rows)
+        except Exception as e:
+            if path.exists():
+                path.unlink()
+            ExportSession.objects.filter(pk=session.pk).update(
+                status='failed', completed_at=timezone.now(),
+                metadata={**session.metadata, 'error': str(e)}
+            )
+            if isinstance(e, SpreadsheetError):
+                raise ValidationException(str(e))
+            raise
+
+        session.status = 'completed'
+        session.file_path = str(path)
+        session.file_size = os.path.getsize(path)
+        session.total_records = record_count
+        session.completed_at = timezone.now()
+        session.save(update_fields=['status', 'file_path', 'file_size', 'total_records', 'completed_at'])
+        return ServiceResponse.success_response(data=self._summary(session))
+
+    @staticmethod
+    def _write_csv(path, headers, rows):
+        count = 0
+        # BOM so that Excel opens the file as UTF-8
+        with open(path, 'w', encoding='utf-8-sig', newline='') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(headers)
+            for row in rows:
+                writer.writerow([_csv_value(value) for value in row])
+                count += 1
+        return count
+
+    @staticmethod
+    def _write_xlsx(path, session, headers, rows, include_metadata):
+        written = {'records': 0}
+
+        def data_rows():
+            yield headers
+            for row in rows:
+                written['records'] += 1
+                yield row
+
+        def sheets():
+            # Built lazily: the info sheet is created after the data sheet is written
+            yield 'Idle Resources', data_rows()
+            if include_metadata:
+                yield 'Export Info', [
+                    ('Export ID', str(session.pk)),
+                    ('Exported At', session.started_at),
+                    ('Exported By', session.created_by),
+                    ('Filters', ', '.join(f'{key}={value}' for key, value in session.filters.items())),
+                    ('Records', written['records']),
+                ]
+
+        write_xlsx(path, sheets())
+        return written['records']
+
+    def get_export_file(self, export_id, token: str) -> ServiceResponse:
+        """
+        Completed export for a download request.
+
+        Args:
+            export_id: ExportSession id
+            token: download_token returned by export_resources
+
+        Returns:
+            ServiceResponse whose data is {'path', 'file_name', 'format'}
+
+        Raises:
+            ValidationException: If the token is invalid, for another export
+                or expired
+            DataNotFoundException: If the export does not exist, is not
+                completed or its file is gone
+        """
+        from resource_management.models import ExportSession
+
+        try:
+            signed_id = signing.TimestampSigner(salt=_TOKEN_SALT).unsign(token or '', max_age=_download_expiry())
+        except signing.SignatureExpired:
+            raise ValidationException("The download link has expired")
+        except signing.BadSignature:
+            raise ValidationException("Invalid download token")
+        if signed_id != str(export_id):
+            raise ValidationException("Invalid download token")
+
+        session = ExportSession.objects.filter(pk=export_id, status='completed').first()
+        if session is None or not session.file_path or not os.path.exists(session.file_path):
+            raise DataNotFoundException("Export file not found", resource_type='ExportSession', resource_id=str(export_id))
+        return ServiceResponse.success_response(data={
+            'path': session.file_path,
+            'file_name': session.metadata.get('file_name') or os.path.basename(session.file_path),
+            'format': session.export_format,
+        })
+
+    @staticmethod
+    def _summary(session):
+        return {
+            'export_id': str(session.pk),
+            'file_name': session.metadata['file_name'],
+            'file_size': session.file_size,
+            'record_count': session.total_records,
+            'format': session.export_format,
+            'status': session.status,
+            'created_at': session.created_at,
+            'expires_at': session.completed_at + timedelta(seconds=_download_expiry()),
+            'download_token': signing.TimestampSigner(salt=_TOKEN_SALT).sign(str(session.pk)),
+        }
+
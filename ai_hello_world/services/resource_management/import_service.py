@@ -0,0 +1,885 @@
+"""
+Resource Import Service implementing DAO-MDE-03-05-01 (Data Import Processing)
+
+Imports idle resources from an uploaded CSV or Excel (.xlsx) file in four
+passes, none of which holds the file or all of its rows in memory:
+
+    1. stage     stream the file row by row (XLSX through a read-only
+                 workbook, see common.spreadsheets), apply the column mapping and
+                 bulk_create the rows into import_staging, batch_size at a time
+    2. validate  read staged rows in record_index order, one chunk at a time;
+                 large imports fan the chunks out to a process pool
+                 (RESOURCE_IMPORT settings)
+    3. resolve   find duplicates (same employee and availability start) of
+                 earlier rows or of existing resources
+    4. merge     create / update idle resources set-wise per chunk through
+                 IdleResource.bulk_create_with_validation and
+                 bulk_update_with_version_check
+
+Source: DD/MDE-03/04-dao/DAO-MDE-03-05_v0.1.md - DAO-MDE-03-05-01: Data Import Processing
+
+Business Rules:
+    - Every chunk commits on its own and updates the ImportSession counters
+      (processed_records, failed_records), so progress is visible while the
+      import runs
+    - Every chunk also commits a checkpoint in ImportSession.metadata
+      (pass, last record_index and, while staging, a hash of the rows staged
+      so far). An interrupted import is continued from it by resume_import()
+      (resume_imports command, POST .../import/{id}/resume) without
+      repeating committed chunks; the upload is kept under
+      RESOURCE_IMPORT['UPLOAD_DIR'] until the import finishes
+    - rollbackOnError: nothing is merged when any row is invalid
+    - duplicateHandling: 'skip' leaves the existing resource alone, 'update'
+      updates it from the row, 'error' rejects the row; a repeat of an
+      earlier row in the same file is skipped (or rejected for 'error')
+    - importMode 'validate' (or validateOnly) stops before the merge;
+      importMode 'update' implies duplicateHandling 'update'
+    - Staging rows are deleted once the session is finished (completed, or
+      failed by rollbackOnError); sessions interrupted by an error keep them
+      for resuming
+"""
+
+import codecs
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from common.spreadsheets import SpreadsheetError, cell_text, is_xlsx, iter_xlsx_rows
+
+from ..base import ServiceResponse, WriteService
+from ..exceptions import DataNotFoundException, ValidationException
+
+
+MAX_ERROR_REPORT = 1000
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_VALIDATION_CHUNK_SIZE = 2000
+DEFAULT_PARALLEL_MIN_ROWS = 10000
+# A 'processing' session without a checkpoint for this long has lost its worker
+DEFAULT_STALE_AFTER = 15 * 60
+
+# Import target -> (API name used in error reports, accepted column headers
+# after normalization)
+IMPORT_FIELDS = {
+    'employee': ('employeeId', ('employee', 'employeeid', 'employeenumber', 'employeeno', 'employeecode')),
+    'resource_type': ('idleType', ('resourcetype', 'idletype', 'type')),
+    'status': ('status', ('status',)),
+    'availability_start': ('idleFromDate', ('availabilitystart', 'idlefromdate', 'idlefrom', 'startdate')),
+    'availability_end': ('idleToDate', ('availabilityend', 'idletodate', 'idleto', 'enddate')),
+    'skills': ('skills', ('skills', 'skillset')),
+    'experience_years': ('experienceYears', ('experienceyears', 'experience', 'yearsofexperience')),
+    'hourly_rate': ('salesPrice', ('hourlyrate', 'salesprice', 'rate')),
+}
+REQUIRED_FIELDS = ('employee', 'resource_type')
+
+_HEADER_TARGETS = {alias: target for target, (_, aliases) in IMPORT_FIELDS.items() for alias in aliases}
+_SKILL_SEPARATORS = re.compile(r'[,;|]')
+
+
+def normalize_header(name) -> str:
+    """'Idle From Date', 'idle_from_date' and 'idleFromDate' all become 'idlefromdate'."""
+    return re.sub(r'[^0-9a-z]', '', str(name).lower())
+
+
+def build_column_map(headers, column_mapping: Optional[Dict] = None) -> Dict[str, str]:
+    """
+    Map file headers to import targets.
+
+    Args:
+        headers: Header row of the file
+        column_mapping: Optional {file header: target}; the target may be a
+            model field name or any accepted header spelling
+
+    Returns:
+        {header: target} for every header that maps to a target
+
+    Raises:
+        ValidationException: On an unknown mapping target or file header,
+            two headers mapping to one target, or a missing required column
+    """
+    explicit = {}
+    for header, target in (column_mapping or {}).items():
+        if header not in headers:
+            raise ValidationException(f"Mapped column '{header}' is not in the file")
+        resolved = _HEADER_TARGETS.get(normalize_header(target), target if target in IMPORT_FIELDS else None)
+        if resolved is None:
+            raise ValidationException(f"Unknown import field '{target}'")
+        explicit[header] = resolved
+
+    column_map = {}
+    for header in headers:
+        target = explicit.get(header) if header in explicit else _HEADER_TARGETS.get(normalize_header(header))
+        if target is None:
+            continue
+        if target in column_map.values():
+            raise ValidationException(f"More than one column maps to '{IMPORT_FIELDS[target][0]}'")
+        column_map[header] = target
+
+    missing = [IMPORT_FIELDS[target][0] for target in REQUIRED_FIELDS if target not in column_map.values()]
+    if missing:
+        raise ValidationException(f"Missing required columns: {', '.join(missing)}")
+    return column_map
+
+
+def iter_csv_rows(upload):
+    """
+    Yield (record_index, {header: value}) for each data row of an uploaded CSV.
+
+    The file is decoded incrementally (UTF-8, optional BOM), so only the
+    current row is held in memory. Blank lines are skipped but still count
+    towards record_index, which is the 1-based data row number.
+    """
+    upload.seek(0)
+    lines = codecs.iterdecode(upload, 'utf-8-sig')
+    try:
+        reader = csv.reader(lines)
+        headers = [header.strip() for header in next(reader, [])]
+        yield headers
+        for record_index, cells in enumerate(reader, start=1):
+            if not any(cell.strip() for cell in cells):
+                continue
+            yield record_index, dict(zip(headers, cells))
+    except UnicodeDecodeError:
+        raise ValidationException("The file must be a UTF-8 encoded CSV file or an Excel (.xlsx) workbook")
+    except csv.Error as e:
+        raise ValidationException(f"Malformed CSV file: {e}")
+
+
+def iter_xlsx_upload_rows(upload):
+    """
+    iter_csv_rows() for an uploaded Excel workbook (first worksheet).
+
+    The workbook is opened read-only, so rows are parsed as they are
+    consumed. Cells are converted to the text a CSV export of the sheet
+    would hold (dates as ISO dates, whole numbers without '.0').
+    """
+    upload.seek(0)
+    try:
+        rows = iter_xlsx_rows(upload)
+        headers = [cell_text(header).strip() for header in next(rows, ())]
+        yield headers
+        for record_index, cells in enumerate(rows, start=1):
+            values = [cell_text(cell) for cell in cells]
+            if not any(value.strip() for value in values):
+                continue
+            yield record_index, dict(zip(headers, values))
+    except SpreadsheetError as e:
+        raise ValidationException(str(e))
+
+
+def iter_upload_rows(upload):
+    """Rows of an uploaded CSV or XLSX file, told apart by content."""
+    upload.seek(0)
+    if is_xlsx(upload):
+        return iter_xlsx_upload_rows(upload)
+    return iter_csv_rows(upload)
+
+
+def _import_settings() -> Dict:
+    return getattr(settings, 'RESOURCE_IMPORT', {})
+
+
+def _upload_dir() -> Path:
+    return Path(_import_settings().get('UPLOAD_DIR') or Path(settings.BASE_DIR) / 'imports')
+
+
+def _checkpoint(phase, record_index, content_hash=None) -> Dict:
+    """Checkpoint of a pass: rows up to record_index are committed."""
+    checkpoint = {'phase': phase, 'record_index': record_index, 'at': timezone.now().isoformat()}
+    if content_hash is not None:
+        checkpoint['hash'] = content_hash
+    return checkpoint
+
+
+def _row_bytes(record_index, raw) -> bytes:
+    """Canonical bytes of a file row for the staging content hash."""
+    return json.dumps([record_index, raw], sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+
+def is_resumable(session) -> bool:
+    """Whether an import session stopped before its last pass finished."""
+    checkpoint = (session.metadata or {}).get('checkpoint')
+    return session.status in ('processing', 'failed') and bool(checkpoint) and checkpoint['phase'] != 'done'
+
+
+def is_stale(session) -> bool:
+    """Whether a 'processing' session has not checkpointed for RESOURCE_IMPORT['STALE_AFTER'] seconds."""
+    checkpoint = (session.metadata or {}).get('checkpoint') or {}
+    if not checkpoint.get('at'):
+        return True
+    stale_after = _import_settings().get('STALE_AFTER', DEFAULT_STALE_AFTER)
+    return datetime.fromisoformat(checkpoint['at']) < timezone.now() - timedelta(seconds=stale_after)
+
+
+def load_lookups(employee_keys=None):
+    """
+    Reference data for validate_row().
+
+    Employees are looked up by id or employee number in one query: only
+    the given keys, or every employee when employee_keys is None (the
+    table shipped once to each parallel validation worker).
+    """
+    import uuid
+    from django.db.models import Q
+    from authentication.models import Employee
+    from resource_management.models import IdleResource
+
+    queryset = Employee.objects.all()
+    if employee_keys is not None:
+        ids, numbers = set(), set()
+        for key in employee_keys:
+            try:
+                ids.add(uuid.UUID(key))
+            except ValueError:
+                numbers.add(key)
+        queryset = queryset.filter(Q(employee_id__in=ids) | Q(employee_number__in=numbers)) if ids or numbers else None
+
+    employees = {}
+    if queryset is not None:
+        for employee_id, employee_number, is_active in queryset.values_list(
+            'employee_id', 'employee_number', 'is_active'
+        ).iterator(chunk_size=5000):
+            employees[str(employee_id)] = employees[employee_number] = (str(employee_id), is_active)
+
+    field = IdleResource._meta.get_field
+    return {
+        'employees': employees,
+        'resource_types': {value for value, _ in field('resource_type').choices},
+        'statuses': {value for value, _ in field('status').choices if value != 'deleted'},
+    }
+
+
+def _parse_datetime(value):
+    parsed = parse_datetime(value)
+    if parsed is None:
+        parsed_date = parse_date(value.replace('/', '-'))
+        if parsed_date is None:
+            raise ValueError(value)
+        parsed = datetime.combine(parsed_date, dt_time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def validate_row(values: Dict, lookups: Dict):
+    """
+    Clean and validate one mapped row.
+
+    Args:
+        values: {target: text} as staged
+        lookups: load_lookups() result
+
+    Returns:
+        (cleaned, errors): cleaned holds JSON-safe values of the non-empty
+        columns (employee as its id, dates as ISO text); errors is a list
+        of {'field', 'error'} with API field names
+    """
+    cleaned, errors = {}, []
+
+    def error(target, message):
+        errors.append({'field': IMPORT_FIELDS[target][0], 'error': message})
+
+    present = {target: str(value).strip() for target, value in values.items() if value is not None and str(value).strip()}
+    for target in REQUIRED_FIELDS:
+        if target not in present:
+            error(target, 'Required field missing')
+
+    if 'employee' in present:
+        match = lookups['employees'].get(present['employee'])
+        if match is None:
+            match = lookups['employees'].get(present['employee'].lower())
+        if match is None:
+            error('employee', f"Employee {present['employee']} not found")
+        elif not match[1]:
+            error('employee', f"Employee {present['employee']} is not active")
+        else:
+            cleaned['employee_id'] = match[0]
+
+    for target, allowed in (('resource_type', lookups['resource_types']), ('status', lookups['statuses'])):
+        if target in present:
+            value = present[target].lower()
+            if value in allowed:
+                cleaned[target] = value
+            else:
+                error(target, f"Invalid value '{present[target]}'")
+
+    dates = {}
+    for target in ('availability_start', 'availability_end'):
+        if target in present:
+            try:
+                dates[target] = _parse_datetime(present[target])
+                cleaned[target] = dates[target].isoformat()
+            except ValueError:
+                error(target, 'Invalid date format. Expected YYYY-MM-DD')
+    if len(dates) == 2 and dates['availability_start'] >= dates['availability_end']:
+        error('availability_end', 'Idle To Date must be after Idle From Date')
+
+    if 'skills' in present:
+        cleaned['skills'] = [skill.strip() for skill in _SKILL_SEPARATORS.split(present['skills']) if skill.strip()]
+
+    if 'experience_years' in present:
+        try:
+            cleaned['experience_years'] = int(present['experience_years'])
+            if cleaned['experience_years'] < 0:
+                raise ValueError
+        except ValueError:
+            error('experience_years', 'Must be a whole number of years, 0 or more')
+
+    if 'hourly_rate' in present:
+        try:
+            rate = Decimal(present['hourly_rate'].replace(',', ''))
+            if not rate.is_finite() or rate < 0 or rate.as_tuple().exponent < -2 or rate >= Decimal('1e8'):
+                raise InvalidOperation
+            cleaned['hourly_rate'] = str(rate)
+        except InvalidOperation:
+            error('hourly_rate', 'Must be a non-negative amount with at most 2 decimals')
+
+    return cleaned, errors
+
+
+# Lookups of a validation worker process, set once by _init_validation_worker()
+_worker_lookups = None
+
+
+def _worker_context():
+    """
+    Start method of the validation pool.
+
+    The importing process runs threads (audit writer, server threads), and a
+    forked child can inherit one of their locks held; forkserver workers are
+    forked from a clean single-threaded server instead (spawn where
+    forkserver is unavailable).
+    """
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+
+def _init_validation_worker(lookups):
+    global _worker_lookups
+    _worker_lookups = lookups
+
+
+def validate_chunk(rows, lookups=None):
+    """
+    validate_row() over a list of mapped rows, in order.
+
+    Runs in a validation worker (lookups from _init_validation_worker) or
+    in-process with explicit lookups. Touches no database, so workers need
+    no connection of their own.
+    """
+    lookups = _worker_lookups if lookups is None else lookups
+    return [validate_row(values, lookups) for values in rows]
+
+
+def _resource_values(cleaned):
+    """Model values of a cleaned row."""
+    values = {key: value for key, value in cleaned.items() if key not in ('employee_id', 'resource_id', 'version')}
+    for key in ('availability_start', 'availability_end'):
+        if key in values:
+            values[key] = datetime.fromisoformat(values[key])
+    if 'hourly_rate' in values:
+        values['hourly_rate'] = Decimal(values['hourly_rate'])
+    return values
+
+
+def _duplicate_key(employee_id, availability_start):
+    if availability_start is None:
+        return employee_id, None
+    if isinstance(availability_start, str):
+        availability_start = datetime.fromisoformat(availability_start)
+    return employee_id, availability_start.timestamp()
+
+
+def _update_staging(rows, fields):
+    """
+    Write ``fields`` of staged rows with one prepared UPDATE per row (executemany).
+
+    QuerySet.bulk_update builds a CASE expression per field and row, which
+    dominates the cost of large imports.
+    """
+    from resource_management.models import ImportStaging
+
+    if not rows:
+        return
+    connection = connections[router.db_for_write(ImportStaging)]
+    model_fields = [ImportStaging._meta.get_field(field) for field in fields]
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"UPDATE {ImportStaging._meta.db_table} "
+            f"SET {', '.join(f'{field.column} = %s' for field in model_fields)} WHERE id = %s",
+            [
+                [field.get_db_prep_save(getattr(row, field.attname), connection) for field in model_fields] + [row.pk]
+                for row in rows
+            ]
+        )
+
+
+class ResourceImportService(WriteService):
+    """
+    Streaming, chunked import of idle resources through import_staging.
+    """
+
+    def import_resources(self, upload, options: Optional[Dict] = None) -> ServiceResponse:
+        """
+        Import an uploaded CSV or Excel (.xlsx) file.
+
+        Args:
+            upload: Uploaded file (binary, seekable)
+            options: import_mode, duplicate_handling, validate_only,
+                column_mapping, rollback_on_error, batch_size
+
+        Returns:
+            ServiceResponse whose data is the import summary (see _summary)
+
+        Not wrapped in one transaction like execute_with_audit: every chunk
+        commits on its own so the session shows progress. The operation is
+        audited the same way.
+        """
+        try:
+            result = self._import_resources(upload, options or {})
+        except Exception as e:
+            self._log_audit_error('import_resources', str(e), (upload,), options or {})
+            raise
+        self._log_audit_success('import_resources', result, (upload,), options or {})
+        return result
+
+    def _import_resources(self, upload, options):
+        from resource_management.models import ImportSession
+
+        batch_size = options.get('batch_size') or DEFAULT_BATCH_SIZE
+        handling = 'update' if options.get('import_mode') == 'update' else options.get('duplicate_handling', 'skip')
+        validate_only = options.get('validate_only') or options.get('import_mode') == 'validate'
+
+        rows = iter_upload_rows(upload)
+        try:
+            column_map = build_column_map(next(rows), options.get('column_mapping'))
+        finally:
+            rows.close()
+
+        file_name = getattr(upload, 'name', '') or 'upload.csv'
+        session = ImportSession.objects.create(
+            session_name=f'Import {file_name}',
+            file_name=file_name,
+            status='processing',
+            started_at=timezone.now(),
+            created_by=self.user_context.get('user_id') or 'system',
+            metadata={
+                'column_map': column_map,
+                'duplicate_handling': handling,
+                'validate_only': bool(validate_only),
+                'rollback_on_error': options.get('rollback_on_error', True),
+                'batch_size': batch_size,
+                'checkpoint': _checkpoint('stage', 0, hashlib.sha256().hexdigest()),
+            }
+        )
+        try:
+            self._store_upload(session, upload)
+        except Exception:
+            session.delete()
+            raise
+        return self._run(session)
+
+    def resume_import(self, import_id, force: bool = False) -> ServiceResponse:
+        """
+        Continue an interrupted import from its last checkpoint.
+
+        Args:
+            import_id: ImportSession id
+            force: Also take over a 'processing' session whose last
+                checkpoint is recent (its worker is assumed dead)
+
+        Returns:
+            ServiceResponse whose data is the import summary (see _summary)
+
+        Raises:
+            DataNotFoundException: If the session does not exist
+            ValidationException: If the session finished, is still running,
+                or its stored file is gone or changed while rows remain
+                to be staged
+        """
+        try:
+            result = self._resume_import(import_id, force)
+        except Exception as e:
+            self._log_audit_error('resume_import', str(e), (import_id,), {'force': force})
+            raise
+        self._log_audit_success('resume_import', result, (import_id,), {'force': force})
+        return result
+
+    def _resume_import(self, import_id, force):
+        from resource_management.models import ImportSession
+
+        with transaction.atomic():
+            session = ImportSession.objects.select_for_update().filter(pk=import_id).first()
+            if session is None:
+                raise DataNotFoundException(
+                    "Import session not found", resource_type='ImportSession', resource_id=str(import_id)
+                )
+            checkpoint = session.metadata.get('checkpoint')
+            if not is_resumable(session):
+                raise ValidationException(f"Import {import_id} has finished and cannot be resumed")
+            if session.status == 'processing' and not force and not is_stale(session):
+                raise ValidationException(
+                    f"Import {import_id} is still running (last checkpoint at {checkpoint['at']})"
+                )
+            if checkpoint['phase'] == 'stage' and not (session.file_path and os.path.exists(session.file_path)):
+                raise ValidationException(f"The uploaded file of import {import_id} is no longer available")
+
+            session.status = 'processing'
+            session.errors = []
+            session.completed_at = None
+            session.metadata['checkpoint'] = {**checkpoint, 'at': timezone.now().isoformat()}
+            session.metadata['resumed'] = session.metadata.get('resumed', 0) + 1
+            session.save(update_fields=['status', 'errors', 'completed_at', 'metadata', 'updated_at'])
+        return self._run(session)
+
+    def _store_upload(self, session, upload):
+        """Copy the upload to RESOURCE_IMPORT['UPLOAD_DIR'] so a resumed import can read it again."""
+        from resource_management.models import ImportSession
+
+        upload_dir = _upload_dir()
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        path = upload_dir / f'{session.pk}{os.path.splitext(session.file_name)[1].lower()}'
+        digest = hashlib.sha256()
+        upload.seek(0)
+        with open(path, 'wb') as handle:
+            for block in iter(lambda: upload.read(1 << 20), b''):
+                digest.update(block)
+                handle.write(block)
+        session.file_path = str(path)
+        session.metadata['file_sha256'] = digest.hexdigest()
+        ImportSession.objects.filter(pk=session.pk).update(file_path=session.file_path, metadata=session.metadata)
+
+    def _run(self, session):
+        """Run the passes from the session's checkpoint to the end."""
+        from resource_management.models import ImportSession
+
+        options = session.metadata
+        batch_size = options['batch_size']
+        phase = options['checkpoint']['phase']
+        try:
+            if phase == 'stage':
+                self._stage(session, batch_size)
+                phase = self._advance(session, 'validate')
+            if phase == 'validate':
+                self._validate(session, batch_size)
+                phase = self._advance(session, 'resolve')
+            if phase == 'resolve':
+                self._resolve_duplicates(session, options['duplicate_handling'], batch_size)
+                phase = self._advance(session, 'merge')
+
+            if options['validate_only']:
+                final_status = 'completed'
+            elif (
+                options['rollback_on_error'] and session.metadata['checkpoint']['record_index'] == 0
+                and session.staging_records.filter(validation_status='invalid').exists()
+            ):
+                # Decided before the first merge chunk; a resumed merge keeps going
+                final_status = 'failed'
+            else:
+                self._merge(session, batch_size)
+                final_status = 'completed'
+        except Exception as e:
+            # The checkpoint is kept: the session can be resumed
+            ImportSession.objects.filter(pk=session.pk).update(
+                status='failed', completed_at=timezone.now(), errors=[{'row': None, 'field': None, 'error': str(e)}]
+            )
+            raise
+
+        counts = dict(
+            session.staging_records.values_list('validation_status').annotate(count=Count('id')).order_by()
+        )
+        session.refresh_from_db()
+        session.errors = [
+            {'row': record_index, **error}
+            for record_index, errors in session.staging_records.filter(validation_status='invalid')
+            .order_by('record_index').values_list('record_index', 'validation_errors')[:MAX_ERROR_REPORT]
+            for error in errors
+        ][:MAX_ERROR_REPORT]
+        session.status = final_status
+        session.completed_at = timezone.now()
+        session.metadata = {
+            **session.metadata,
+            'checkpoint': _checkpoint('done', 0),
+            'summary': {
+                'created': counts.get('imported', 0),
+                'updated': counts.get('updated', 0),
+                'duplicates': counts.get('duplicate', 0),
+            },
+        }
+        session.save(update_fields=['errors', 'status', 'completed_at', 'metadata', 'updated_at'])
+        # Nothing can resume a finished session, whatever its status
+        if not is_resumable(session):
+            session.staging_records.all().delete()
+        if session.file_path and os.path.exists(session.file_path):
+            os.remove(session.file_path)
+
+        return ServiceResponse.success_response(data=self._summary(session), metadata={'session_id': str(session.pk)})
+
+    @staticmethod
+    def _save_checkpoint(session, checkpoint, **updates):
+        """Record a checkpoint; call inside the transaction of the batch it covers."""
+        from resource_management.models import ImportSession
+
+        session.metadata['checkpoint'] = checkpoint
+        ImportSession.objects.filter(pk=session.pk).update(metadata=session.metadata, **updates)
+
+    def _advance(self, session, phase):
+        self._save_checkpoint(session, _checkpoint(phase, 0))
+        return phase
+
+    def _stage(self, session, batch_size):
+        """
+        Pass 1: stream rows of the stored file into import_staging, batch_size per INSERT.
+
+        Every batch commits together with a checkpoint holding its last
+        record_index and a SHA-256 over all rows staged so far. A resumed
+        import skips the rows up to the checkpoint, checking that they hash
+        to the same value, i.e. that it is reading the same file.
+        """
+        from resource_management.models import ImportStaging
+
+        checkpoint = session.metadata['checkpoint']
+        column_map = session.metadata['column_map']
+        offset = checkpoint['record_index']
+        digest = hashlib.sha256()
+
+        def flush(batch):
+            with transaction.atomic():
+                ImportStaging.objects.bulk_create(batch)
+                self._save_checkpoint(
+                    session, _checkpoint('stage', batch[-1].record_index, digest.hexdigest()),
+                    total_records=F('total_records') + len(batch)
+                )
+
+        with open(session.file_path, 'rb') as handle:
+            rows = iter_upload_rows(handle)
+            next(rows)
+            verified = offset == 0
+            batch = []
+            for record_index, raw in rows:
+                digest.update(_row_bytes(record_index, raw))
+                if record_index <= offset:
+                    if record_index == offset:
+                        verified = digest.hexdigest() == checkpoint['hash']
+                        if not verified:
+                            break
+                    continue
+                batch.append(ImportStaging(
+                    session=session,
+                    record_index=record_index,
+                    raw_data=raw,
+                    transformed_data={target: raw.get(header) for header, target in column_map.items()},
+                ))
+                if len(batch) >= batch_size:
+                    flush(batch)
+                    batch = []
+            if not verified:
+                raise ValidationException("The stored import file does not match the staged rows")
+            if batch:
+                flush(batch)
+
+    def _staged_chunks(self, session, status, batch_size, after=0):
+        """Staged rows of one status in record_index order, batch_size at a time (keyset)."""
+        last = after
+        while True:
+            chunk = list(
+                session.staging_records.filter(validation_status=status, record_index__gt=last)
+                .order_by('record_index').defer('raw_data')[:batch_size]
+            )
+            if not chunk:
+                return
+            yield chunk
+            last = chunk[-1].record_index
+
+    def _validate(self, session, batch_size):
+        """
+        Pass 2: clean and validate staged rows chunk by chunk.
+
+        Large imports are validated by a pool of worker processes, each
+        given the employee and enum lookups once at start-up. Only
+        2 x workers chunks are in flight, and results are stored in chunk
+        order, so error reports stay in row order.
+        """
+        config = _import_settings()
+        workers = config.get('VALIDATION_WORKERS') or os.cpu_count() or 1
+        min_rows = config.get('PARALLEL_MIN_ROWS', DEFAULT_PARALLEL_MIN_ROWS)
+        report = []
+
+        pending = session.staging_records.filter(validation_status='pending').count()
+        if workers < 2 or pending < min_rows:
+            for chunk in self._staged_chunks(session, 'pending', batch_size):
+                lookups = load_lookups({
+                    str(row.transformed_data.get('employee')).strip()
+                    for row in chunk if row.transformed_data.get('employee')
+                })
+                self._store_validation(session, chunk, validate_chunk([row.transformed_data for row in chunk], lookups), report)
+            return
+
+        chunk_size = config.get('VALIDATION_CHUNK_SIZE', DEFAULT_VALIDATION_CHUNK_SIZE)
+        workers = min(workers, -(-pending // chunk_size))
+        in_flight = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=_worker_context(),
+            initializer=_init_validation_worker, initargs=(load_lookups(),)
+        ) as executor:
+            for chunk in self._staged_chunks(session, 'pending', chunk_size):
+                in_flight.append((chunk, executor.submit(validate_chunk, [row.transformed_data for row in chunk])))
+                if len(in_flight) >= 2 * workers:
+                    chunk, future = in_flight.popleft()
+                    self._store_validation(session, chunk, future.result(), report)
+            while in_flight:
+                chunk, future = in_flight.popleft()
+                self._store_validation(session, chunk, future.result(), report)
+
+    def _store_validation(self, session, chunk, results, report):
+        """Write one validated chunk and add its errors to the session report."""
+        failed = 0
+        for row, (cleaned, errors) in zip(chunk, results):
+            row.transformed_data = cleaned
+            row.validation_errors = errors
+            row.validation_status = 'invalid' if errors else 'valid'
+            if errors:
+                failed += 1
+                report.extend({'row': row.record_index, **error} for error in errors[:MAX_ERROR_REPORT - len(report)])
+        updates = {'failed_records': F('failed_records') + failed, 'errors': report} if failed else {}
+        with transaction.atomic():
+            _update_staging(chunk, ('transformed_data', 'validation_errors', 'validation_status'))
+            self._save_checkpoint(session, _checkpoint('validate', chunk[-1].record_index), **updates)
+
+    def _resolve_duplicates(self, session, handling, batch_size):
+        """
+        Pass 3: mark repeats of earlier rows and rows matching existing resources.
+
+        Only the (employee, availability start) keys of valid rows are kept
+        across chunks; a resumed pass rebuilds them from the rows before
+        its checkpoint.
+        """
+        from resource_management.models import IdleResource, ImportSession
+
+        offset = session.metadata['checkpoint']['record_index']
+        seen = {
+            _duplicate_key(values['employee_id'], values.get('availability_start'))
+            for values in session.staging_records.filter(validation_status='valid', record_index__lte=offset)
+            .values_list('transformed_data', flat=True).iterator()
+        }
+        for chunk in self._staged_chunks(session, 'valid', batch_size, after=offset):
+            existing = {
+                _duplicate_key(str(employee_id), availability_start): (str(pk), version)
+                for pk, employee_id, availability_start, version in IdleResource.objects.filter(
+                    employee_id__in={row.transformed_data['employee_id'] for row in chunk}, is_deleted=False
+                ).values_list('id', 'employee_id', 'availability_start', 'version')
+            }
+            changed = []
+            failed = 0
+            for row in chunk:
+                key = _duplicate_key(row.transformed_data['employee_id'], row.transformed_data.get('availability_start'))
+                if key in seen:
+                    message = 'Duplicate of an earlier row in the file'
+                elif key in existing and handling != 'update':
+                    message = 'Idle resource already exists for this employee and Idle From Date'
+                else:
+                    message = None
+                    if key in existing:
+                        row.transformed_data['resource_id'], row.transformed_data['version'] = existing[key]
+                        changed.append(row)
+                seen.add(key)
+                if message is None:
+                    continue
+                if handling == 'error':
+                    row.validation_status = 'invalid'
+                    row.validation_errors = [{'field': IMPORT_FIELDS['employee'][0], 'error': message}]
+                    failed += 1
+                else:
+                    row.validation_status = 'duplicate'
+                changed.append(row)
+            with transaction.atomic():
+                _update_staging(changed, ('transformed_data', 'validation_errors', 'validation_status'))
+                self._save_checkpoint(
+                    session, _checkpoint('resolve', chunk[-1].record_index),
+                    **({'failed_records': F('failed_records') + failed} if failed else {})
+                )
+
+    def _merge(self, session, batch_size):
+        """Pass 4: write valid rows into idle_resources, one transaction (and checkpoint) per chunk."""
+        from resource_management.models import IdleResource
+
+        # The importing user, also when another worker resumes the import
+        user_id = session.created_by
+        offset = session.metadata['checkpoint']['record_index']
+        for chunk in self._staged_chunks(session, 'valid', batch_size, after=offset):
+            creates = [row for row in chunk if 'resource_id' not in row.transformed_data]
+            updates = [row for row in chunk if 'resource_id' in row.transformed_data]
+            with transaction.atomic():
+                outcome = []
+                if creates:
+                    outcome += IdleResource.bulk_create_with_validation(
+                        [dict(_resource_values(row.transformed_data), employee_id=row.transformed_data['employee_id'])
+                         for row in creates],
+                        created_by=user_id,
+                        batch_size=batch_size
+                    )['results']
+                if updates:
+                    outcome += IdleResource.bulk_update_with_version_check(
+                        [
+                            {
+                                'id': row.transformed_data['resource_id'],
+                                'version': row.transformed_data['version'],
+                                'data': _resource_values(row.transformed_data)
+                            }
+                            for row in updates
+                        ],
+                        updated_by=user_id,
+                        rollback_on_error=False,
+                        chunk_size=batch_size
+                    )['results']
+
+                failed = 0
+                merged_status = ['imported'] * len(creates) + ['updated'] * len(updates)
+                for row, result, merged in zip(creates + updates, outcome, merged_status):
+                    if result['success']:
+                        row.validation_status = merged
+                        continue
+                    failed += 1
+                    row.validation_status = 'invalid'
+                    message = result.get('error') or '; '.join(result.get('errors') or [])
+                    row.validation_errors = [{'field': None, 'error': message}]
+                _update_staging(creates + updates, ('validation_status', 'validation_errors'))
+                chunk_created = sum(row.validation_status == 'imported' for row in creates)
+                chunk_updated = sum(row.validation_status == 'updated' for row in updates)
+                self._save_checkpoint(
+                    session, _checkpoint('merge', chunk[-1].record_index),
+                    processed_records=F('processed_records') + chunk_created + chunk_updated,
+                    failed_records=F('failed_records') + failed
+                )
+
+    @staticmethod
+    def _summary(session):
+        """Import summary of a finished session."""
+        summary = session.metadata.get('summary', {})
+        return {
+            'import_id': str(session.pk),
+            'status': session.status,
+            'total_rows': session.total_records,
+            'valid_rows': session.total_records - session.failed_records,
+            'invalid_rows': session.failed_records,
+            'processed_rows': session.processed_records,
+            'duplicate_rows': summary.get('duplicates', 0),
+            'errors': session.errors,
+            'created': summary.get('created', 0),
+            'updated': summary.get('updated', 0),
+            'skipped': session.total_records - session.processed_records - session.failed_records,
+        }
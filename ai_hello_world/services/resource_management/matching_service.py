@@ -0,0 +1,359 @@
+"""
+Resource Matching Service
+
+Ranks idle resources against a staffing demand (required skills, minimum
+experience, maximum hourly rate, date window, location) and explains each
+score.
+
+Candidate features are loaded once per data generation into NumPy arrays:
+skill membership per normalized token, experience, rate, availability
+window, allocated intervals and a location bitmask. Every demand is then
+scored with vectorized operations over all candidates at once.
+
+Source: DD/MDE-03/04-dao/DAO-MDE-03-01_v0.1.md - IdleResource, ResourceSkill,
+ResourceAvailability
+
+Business Rules:
+    - Only resources with status 'available' are candidates
+    - Hard constraints: hourly_rate must not exceed maxHourlyRate (unknown
+      rates pass) and the resource must be free for part of the window
+    - Score components, each in [0, 1]:
+        skills        share of required skills held (skill index tokens)
+        availability  share of the window inside the availability window
+                      and not covered by allocated periods
+        experience    experience_years / minExperience, capped at 1
+        rate          headroom under maxHourlyRate (0.5 when unknown)
+        location      1 on a match or 'flexible', 0.5 when unknown
+    - The total is the weighted sum; weights are normalized to sum to 1
+    - Features are rebuilt after any write (search cache generation)
+"""
+
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+from ..base import ReadOnlyService, ServiceResponse
+from ..common.cache_service import search_cache
+from ..exceptions import ValidationException
+
+
+DEFAULT_WEIGHTS = {
+    'skills': 0.40,
+    'availability': 0.25,
+    'experience': 0.15,
+    'rate': 0.10,
+    'location': 0.10,
+}
+
+LOCATIONS = ('remote', 'onsite', 'hybrid', 'flexible')
+_LOCATION_BITS = {name: 1 << index for index, name in enumerate(LOCATIONS)}
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 200
+
+
+class CandidateFeatures:
+    """Column-oriented feature arrays for every candidate resource."""
+
+    def __init__(self, resource_ids, experience, rate, window_start, window_end,
+                 token_rows, alloc_rows, alloc_start, alloc_end, location_mask):
+        self.resource_ids = resource_ids
+        self.experience = experience
+        self.rate = rate
+        self.window_start = window_start
+        self.window_end = window_end
+        self.token_rows = token_rows
+        self.alloc_rows = alloc_rows
+        self.alloc_start = alloc_start
+        self.alloc_end = alloc_end
+        self.location_mask = location_mask
+
+    def __len__(self):
+        return len(self.resource_ids)
+
+    @classmethod
+    def load(cls):
+        """Read candidates, skill tokens and periods in three queries."""
+        from resource_management.models import IdleResource, ResourceAvailability, ResourceSkillToken
+
+        rows = list(
+            IdleResource.objects.filter(status='available', is_deleted=False)
+            .order_by('id')
+            .values_list('id', 'experience_years', 'hourly_rate', 'availability_start', 'availability_end')
+        )
+        index = {row[0]: position for position, row in enumerate(rows)}
+        count = len(rows)
+
+        resource_ids = np.array([str(row[0]) for row in rows], dtype=object)
+        # None becomes NaN
+        experience = np.array([row[1] for row in rows], dtype=float)
+        rate = np.array(
+            [np.nan if row[2] is None else float(row[2]) for row in rows], dtype=float
+        )
+        window_start = np.array(
+            [-np.inf if row[3] is None else row[3].timestamp() for row in rows], dtype=float
+        )
+        window_end = np.array(
+            [np.inf if row[4] is None else row[4].timestamp() for row in rows], dtype=float
+        )
+
+        token_lists = {}
+        for resource_id, token in ResourceSkillToken.objects.filter(
+            resource__status='available', resource__is_deleted=False
+        ).values_list('resource_id', 'token'):
+            position = index.get(resource_id)
+            if position is not None:
+                token_lists.setdefault(token, []).append(position)
+        token_rows = {token: np.array(positions, dtype=np.int64) for token, positions in token_lists.items()}
+
+        alloc_rows, alloc_start, alloc_end = [], [], []
+        location_mask = np.zeros(count, dtype=np.uint8)
+        periods = ResourceAvailability.objects.filter(
+            resource__status='available', resource__is_deleted=False, is_deleted=False
+        ).values_list('resource_id', 'start_date', 'end_date', 'is_allocated', 'location_constraints')
+        for resource_id, start, end, is_allocated, location in periods:
+            position = index.get(resource_id)
+            if position is None:
+                continue
+            if is_allocated:
+                alloc_rows.append(position)
+                alloc_start.append(start.timestamp())
+                alloc_end.append(end.timestamp())
+            location_mask[position] |= _LOCATION_BITS.get(location, 0)
+
+        return cls(
+            resource_ids=resource_ids,
+            experience=experience,
+            rate=rate,
+            window_start=window_start,
+            window_end=window_end,
+            token_rows=token_rows,
+            alloc_rows=np.array(alloc_rows, dtype=np.int64),
+            alloc_start=np.array(alloc_start, dtype=float),
+            alloc_end=np.array(alloc_end, dtype=float),
+            location_mask=location_mask,
+        )
+
+
+_features_lock = threading.Lock()
+_features_cache = {'generation': None, 'features': None}
+
+
+def get_candidate_features() -> CandidateFeatures:
+    """Features for the current data generation, loading them on first use."""
+    generation = search_cache.current_generation()
+    with _features_lock:
+        if _features_cache['generation'] != generation or _features_cache['features'] is None:
+            _features_cache['features'] = CandidateFeatures.load()
+            _features_cache['generation'] = generation
+        return _features_cache['features']
+
+
+def _covered_time(count, rows, starts, ends):
+    """
+    Length of the union of intervals [starts, ends) per row.
+
+    Overlapping allocations of one resource are counted once: intervals
+    are sorted by row and start, and each only adds the part after the
+    furthest end of the earlier intervals of its row.
+    """
+    keep = ends > starts
+    rows, starts, ends = rows[keep], starts[keep], ends[keep]
+    covered = np.zeros(count)
+    if not len(rows):
+        return covered
+    order = np.lexsort((starts, rows))
+    rows, starts, ends = rows[order], starts[order], ends[order]
+    # Move each row onto its own stretch of the axis so the running maximum
+    # of the ends never carries over from one row to the next
+    offset = rows * (ends.max() - starts.min() + 1.0)
+    reach = np.maximum.accumulate(ends + offset) - offset
+    previous = np.concatenate(([-np.inf], reach[:-1]))
+    previous[np.concatenate(([True], rows[1:] != rows[:-1]))] = -np.inf
+    np.add.at(covered, rows, np.clip(ends - np.maximum(starts, previous), 0, None))
+    return covered
+
+
+def score_candidates(features: CandidateFeatures, demand: Dict, weights: Dict) -> Dict:
+    """
+    Score every candidate for a demand with vectorized operations.
+
+    Returns:
+        Dictionary of arrays: 'eligible' (bool), 'total', one array per
+        component, and 'skill_bitmap' (candidates x required tokens)
+    """
+    count = len(features)
+    required = demand['skill_tokens']
+
+    # Skills: bitmap of candidates x required tokens
+    skill_bitmap = np.zeros((count, len(required)), dtype=bool)
+    for column, token in enumerate(required):
+        rows = features.token_rows.get(token)
+        if rows is not None:
+            skill_bitmap[rows, column] = True
+    skills = skill_bitmap.mean(axis=1) if required else np.ones(count)
+
+    # Availability: part of the window inside the resource window, minus allocations
+    start, end = demand['start'], demand['end']
+    duration = end - start
+    free_start = np.maximum(features.window_start, start)
+    free_end = np.minimum(features.window_end, end)
+    free = np.clip(free_end - free_start, 0, None)
+    if len(features.alloc_rows):
+        # Allocated time is only counted where it falls inside the free span
+        rows = features.alloc_rows
+        free = np.clip(free - _covered_time(
+            count, rows,
+            np.maximum(features.alloc_start, free_start[rows]),
+            np.minimum(features.alloc_end, free_end[rows])
+        ), 0, None)
+    availability = free / duration
+
+    # Experience
+    min_experience = demand.get('min_experience')
+    experience = np.nan_to_num(features.experience, nan=0.0)
+    if min_experience:
+        experience_score = np.minimum(experience / min_experience, 1.0)
+    else:
+        experience_score = np.ones(count)
+
+    # Rate
+    max_rate = demand.get('max_hourly_rate')
+    rate_known = ~np.isnan(features.rate)
+    if max_rate is not None:
+        rate = np.nan_to_num(features.rate, nan=0.0)
+        if max_rate > 0:
+            headroom = np.clip((max_rate - rate) / max_rate, 0, 1)
+        else:
+            # A zero budget leaves no headroom to scale by: only free resources fit
+            headroom = (rate <= 0).astype(float)
+        rate_score = np.where(rate_known, headroom, 0.5)
+        within_budget = ~rate_known | (rate <= max_rate)
+    else:
+        rate_score = np.ones(count)
+        within_budget = np.ones(count, dtype=bool)
+
+    # Location
+    location = demand.get('location')
+    if location:
+        wanted = _LOCATION_BITS.get(location, 0) | _LOCATION_BITS['flexible']
+        location_score = np.where(
+            features.location_mask == 0, 0.5,
+            ((features.location_mask & wanted) != 0).astype(float)
+        )
+    else:
+        location_score = np.ones(count)
+
+    components = {
+        'skills': skills,
+        'availability': availability,
+        'experience': experience_score,
+        'rate': rate_score,
+        'location': location_score,
+    }
+    total = sum(weights[name] * values for name, values in components.items())
+
+    return {
+        'eligible': within_budget & (availability > 0),
+        'total': total,
+        'skill_bitmap': skill_bitmap,
+        **components,
+    }
+
+
+class MatchingService(ReadOnlyService):
+    """
+    Top-N idle resource matching for project staffing demands.
+    """
+
+    def find_matches(self, demand: Dict, limit: int = DEFAULT_LIMIT,
+                     weights: Optional[Dict] = None) -> ServiceResponse:
+        """
+        Rank available resources for a staffing demand.
+
+        Args:
+            demand: required_skills (list), min_experience (int),
+                max_hourly_rate (number), start_date / end_date (datetime),
+                location (one of LOCATIONS)
+            limit: Number of matches to return (at most MAX_LIMIT)
+            weights: Optional component weights overriding DEFAULT_WEIGHTS
+
+        Returns:
+            ServiceResponse whose data is a list of matches, best first,
+            each with resource_id, score, breakdown, matched_skills and
+            missing_skills
+        """
+        return self.execute_with_audit('find_matches', self._find_matches, demand, limit, weights)
+
+    def _find_matches(self, demand, limit, weights):
+        from resource_management.models import ResourceSkillToken
+
+        if demand['start_date'] >= demand['end_date']:
+            raise ValidationException("Start date must be before end date")
+        if demand.get('location') and demand['location'] not in LOCATIONS:
+            raise ValidationException(f"Unknown location '{demand['location']}'")
+
+        weights = self._normalize_weights(weights)
+        limit = max(1, min(limit, MAX_LIMIT))
+
+        # Keep the caller's spelling for the response, match on tokens
+        required = {}
+        for skill in demand.get('required_skills') or []:
+            token = ResourceSkillToken.normalize(skill)
+            if token:
+                required.setdefault(token, skill)
+        tokens = list(required)
+
+        features = get_candidate_features()
+        scored = score_candidates(features, {
+            'skill_tokens': tokens,
+            'start': demand['start_date'].timestamp(),
+            'end': demand['end_date'].timestamp(),
+            'min_experience': demand.get('min_experience'),
+            'max_hourly_rate': float(demand['max_hourly_rate']) if demand.get('max_hourly_rate') is not None else None,
+            'location': demand.get('location'),
+        }, weights)
+
+        eligible = np.flatnonzero(scored['eligible'])
+        if len(eligible) > limit:
+            top = eligible[np.argpartition(-scored['total'][eligible], limit - 1)[:limit]]
+        else:
+            top = eligible
+        # Best score first; resource id breaks ties deterministically
+        top = top[np.lexsort((features.resource_ids[top].astype(str), -scored['total'][top]))]
+
+        matches = []
+        for position in top:
+            bitmap = scored['skill_bitmap'][position]
+            matches.append({
+                'resource_id': features.resource_ids[position],
+                'score': round(float(scored['total'][position]), 4),
+                'breakdown': {
+                    name: {
+                        'score': round(float(scored[name][position]), 4),
+                        'weight': weights[name],
+                    }
+                    for name in DEFAULT_WEIGHTS
+                },
+                'matched_skills': [required[token] for token, held in zip(tokens, bitmap) if held],
+                'missing_skills': [required[token] for token, held in zip(tokens, bitmap) if not held],
+            })
+
+        return ServiceResponse.success_response(
+            data=matches,
+            metadata={'candidate_count': len(features), 'eligible_count': int(len(eligible))}
+        )
+
+    def _normalize_weights(self, weights: Optional[Dict]) -> Dict:
+        merged = dict(DEFAULT_WEIGHTS)
+        for name, value in (weights or {}).items():
+            if name not in DEFAULT_WEIGHTS:
+                raise ValidationException(f"Unknown score component '{name}'")
+            if value < 0:
+                raise ValidationException(f"Weight for '{name}' must not be negative")
+            merged[name] = float(value)
+        total = sum(merged.values())
+        if total <= 0:
+            raise ValidationException("At least one weight must be positive")
+        return {name: round(value / total, 4) for name, value in merged.items()}
@@ -0,0 +1,382 @@
+"""
+Similar Resource Service
+
+Recommends idle resources whose skill profile resembles a given resource,
+using TF-IDF vectors and cosine similarity held in memory.
+
+Each resource becomes a sparse term vector:
+    skill:<token>     from IdleResource.skills and ResourceSkill.skill_name,
+                      weighted by proficiency (beginner 1 .. expert 4)
+    position:<word>   from the employee's position, weighted 0.5
+
+Vectors are stored as coordinate arrays (row, term, weight) so a query is a
+handful of NumPy passes over the non-zero entries: no dense matrix and no
+per-resource Python loop.
+
+Source: DD/MDE-03/04-dao/DAO-MDE-03-01_v0.1.md - IdleResource, ResourceSkill
+
+Business Rules:
+    - IDF uses the smoothed form log((1 + N) / (1 + df)) + 1
+    - Soft-deleted resources and skills are not indexed
+    - The index refreshes incrementally when the data generation changes:
+      only resources marked dirty (by signals and bulk writes in this
+      process) or stamped since the last refresh (resource, employee or
+      skill updated_at, for writes of other processes) are re-read; those
+      that no longer load are dropped. No query walks every resource
+    - Hard deletes are caught through signals in this process and by a
+      periodic full rebuild everywhere else; until then recommendations are
+      checked against the table, and ids found missing are marked dirty
+"""
+
+import math
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from django.utils import timezone
+
+from ..base import ReadOnlyService, ServiceResponse
+from ..common.cache_service import search_cache
+from ..exceptions import DataNotFoundException
+
+
+PROFICIENCY_WEIGHTS = {
+    'beginner': 1.0,
+    'intermediate': 2.0,
+    'advanced': 3.0,
+    'expert': 4.0,
+}
+DEFAULT_SKILL_WEIGHT = 1.0
+POSITION_WEIGHT = 0.5
+
+# Rows committed slightly out of timestamp order are re-read, not missed
+WATERMARK_SLACK = timedelta(seconds=60)
+FULL_REBUILD_INTERVAL = 15 * 60
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 100
+_LOAD_BATCH = 500
+
+
+def resource_terms(skills, detailed_skills: Iterable, position: str) -> Dict[str, float]:
+    """
+    Term weights for one resource.
+
+    Arguments:
+    - skills: IdleResource.skills (list of names or {'name', 'level'} dicts)
+    - detailed_skills: (skill_name, proficiency_level) pairs from ResourceSkill
+    - position: Employee position
+    """
+    from resource_management.fulltext import fold_text
+    from resource_management.models import ResourceSkillToken
+
+    terms = {}
+
+    def add_skill(name, level):
+        token = ResourceSkillToken.normalize(name)
+        if token:
+            weight = PROFICIENCY_WEIGHTS.get(str(level or '').lower(), DEFAULT_SKILL_WEIGHT)
+            key = f'skill:{token}'
+            terms[key] = max(terms.get(key, 0.0), weight)
+
+    for skill in skills if isinstance(skills, list) else []:
+        if isinstance(skill, dict):
+            add_skill(skill.get('name') or skill.get('skill_name'), skill.get('level'))
+        else:
+            add_skill(skill, None)
+    for name, level in detailed_skills:
+        add_skill(name, level)
+    for word in fold_text(position).split():
+        terms[f'position:{word}'] = POSITION_WEIGHT
+    return terms
+
+
+class SimilarityIndex:
+    """
+    Incrementally maintained TF-IDF index over all idle resources.
+
+    Entries for a resource are appended contiguously; updating a resource
+    retires its old slice and appends a new one. Arrays are compacted once
+    retired entries outnumber live ones.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._dirty = set()
+        self._reset()
+
+    def _reset(self):
+        self.resource_ids: List[str] = []
+        self.positions: Dict[str, int] = {}
+        self.doc_alive = np.zeros(0, dtype=bool)
+        self.vocabulary: Dict[str, int] = {}
+        self.terms: List[str] = []
+        self.rows = np.zeros(0, dtype=np.int64)
+        self.cols = np.zeros(0, dtype=np.int64)
+        self.tf = np.zeros(0, dtype=float)
+        self.entry_alive = np.zeros(0, dtype=bool)
+        self.slices: Dict[int, tuple] = {}
+        self.idf = np.zeros(0)
+        self.norms = np.zeros(0)
+        self.generation = None
+        self.watermark = None
+        self.built_at = 0.0
+
+    def clear(self):
+        """Drop the index; the next refresh rebuilds it (tests, maintenance)."""
+        with self._lock:
+            self._reset()
+            self._dirty.clear()
+
+    def mark_dirty(self, resource_ids: Iterable):
+        """Queue resources for re-reading on the next refresh."""
+        with self._lock:
+            self._dirty.update(str(pk) for pk in resource_ids)
+
+    # Loading
+
+    def _load_terms(self, resource_ids: List[str]) -> Dict[str, Dict[str, float]]:
+        from resource_management.models import IdleResource, ResourceSkill
+
+        documents = {}
+        for offset in range(0, len(resource_ids), _LOAD_BATCH):
+            batch = resource_ids[offset:offset + _LOAD_BATCH]
+            detailed = {}
+            for resource_id, name, level in ResourceSkill.objects.filter(
+                resource_id__in=batch, is_deleted=False
+            ).values_list('resource_id', 'skill_name', 'proficiency_level'):
+                detailed.setdefault(str(resource_id), []).append((name, level))
+            for resource_id, skills, position in IdleResource.objects.filter(
+                id__in=batch, is_deleted=False
+            ).values_list('id', 'skills', 'employee__position'):
+                key = str(resource_id)
+                documents[key] = resource_terms(skills, detailed.get(key, []), position)
+        return documents
+
+    def _term_id(self, term: str) -> int:
+        term_id = self.vocabulary.get(term)
+        if term_id is None:
+            term_id = self.vocabulary[term] = len(self.terms)
+            self.terms.append(term)
+        return term_id
+
+    def _retire(self, position: int):
+        start, end = self.slices.pop(position, (0, 0))
+        self.entry_alive[start:end] = False
+        self.doc_alive[position] = False
+
+    def _apply(self, documents: Dict[str, Dict[str, float]], removed: Iterable[str]):
+        for resource_id in removed:
+            position = self.positions.get(resource_id)
+            if position is not None:
+                self._retire(position)
+
+        new_rows, new_cols, new_tf = [], [], []
+        start = len(self.rows)
+        added_docs = 0
+        for resource_id, terms in documents.items():
+            position = self.positions.get(resource_id)
+            if position is None:
+                position = self.positions[resource_id] = len(self.resource_ids)
+                self.resource_ids.append(resource_id)
+                added_docs += 1
+            else:
+                self._retire(position)
+            count = len(terms)
+            self.slices[position] = (start, start + count)
+            start += count
+            new_rows.extend([position] * count)
+            new_cols.extend(self._term_id(term) for term in terms)
+            new_tf.extend(terms.values())
+
+        if added_docs:
+            self.doc_alive = np.concatenate([self.doc_alive, np.zeros(added_docs, dtype=bool)])
+        for resource_id in documents:
+            self.doc_alive[self.positions[resource_id]] = True
+        self.rows = np.concatenate([self.rows, np.array(new_rows, dtype=np.int64)])
+        self.cols = np.concatenate([self.cols, np.array(new_cols, dtype=np.int64)])
+        self.tf = np.concatenate([self.tf, np.array(new_tf, dtype=float)])
+        self.entry_alive = np.concatenate([self.entry_alive, np.ones(len(new_rows), dtype=bool)])
+
+        if (~self.entry_alive).sum() > self.entry_alive.sum():
+            self._compact()
+        self._recompute_weights()
+
+    def _compact(self):
+        keep = self.entry_alive
+        # Number of kept entries before each index = its new offset
+        offsets = np.cumsum(keep) - keep
+        self.slices = {
+            position: (int(offsets[start]), int(offsets[start]) + end - start) if end > start else (0, 0)
+            for position, (start, end) in self.slices.items()
+        }
+        self.rows, self.cols, self.tf = self.rows[keep], self.cols[keep], self.tf[keep]
+        self.entry_alive = np.ones(len(self.rows), dtype=bool)
+
+    def _recompute_weights(self):
+        alive = self.entry_alive
+        doc_count = int(self.doc_alive.sum())
+        df = np.bincount(self.cols[alive], minlength=len(self.terms))
+        self.idf = np.log((1 + doc_count) / (1 + df)) + 1
+        weights = np.where(alive, self.tf * self.idf[self.cols], 0.0)
+        self.norms = np.sqrt(np.bincount(self.rows, weights ** 2, minlength=len(self.resource_ids)))
+
+    # Refresh
+
+    def rebuild(self):
+        """Re-read every resource."""
+        from resource_management.models import IdleResource
+
+        with self._lock:
+            started = timezone.now()
+            generation = search_cache.current_generation()
+            ids = [str(pk) for pk in IdleResource.objects.filter(is_deleted=False).values_list('id', flat=True)]
+            self._reset()
+            self._dirty.clear()
+            self._apply(self._load_terms(ids), [])
+            self.generation = generation
+            self.watermark = started - WATERMARK_SLACK
+            self.built_at = time.monotonic()
+
+    def refresh(self):
+        """Bring the index up to date, incrementally where possible."""
+        from django.db.models import Q
+        from resource_management.models import IdleResource, ResourceSkill
+
+        def stamped(queryset, field):
+            return {str(pk) for pk in queryset.values_list(field, flat=True)}
+
+        with self._lock:
+            generation = search_cache.current_generation()
+            if self.generation is None or time.monotonic() - self.built_at > FULL_REBUILD_INTERVAL:
+                self.rebuild()
+                return
+            if generation == self.generation and not self._dirty:
+                return
+
+            started = timezone.now()
+            changed = set(self._dirty)
+            # Soft deletes stamp updated_at too; they are dropped below
+            changed |= stamped(IdleResource.objects.filter(updated_at__gt=self.watermark), 'id')
+            changed |= stamped(IdleResource.objects.filter(employee__updated_at__gt=self.watermark), 'id')
+            changed |= stamped(ResourceSkill.objects.filter(
+                Q(updated_at__gt=self.watermark) | Q(created_at__gt=self.watermark)
+            ), 'resource_id')
+
+            documents = self._load_terms(sorted(changed))
+            removed = [resource_id for resource_id in changed if resource_id not in documents]
+            self._dirty.clear()
+            self._apply(documents, removed)
+            self.generation = generation
+            self.watermark = started - WATERMARK_SLACK
+
+    # Queries
+
+    def similar(self, resource_id: str, limit: int = DEFAULT_LIMIT) -> Optional[List[Dict]]:
+        """
+        Nearest neighbours of a resource by cosine similarity.
+
+        Returns:
+            List of {'resource_id', 'score', 'shared_terms'} best first, or
+            None if the resource is not indexed
+        """
+        with self._lock:
+            position = self.positions.get(str(resource_id))
+            if position is None or not self.doc_alive[position]:
+                return None
+
+            start, end = self.slices[position]
+            query_cols = self.cols[start:end]
+            query_weights = np.zeros(len(self.terms))
+            query_weights[query_cols] = self.tf[start:end] * self.idf[query_cols]
+            query_norm = math.sqrt(float((query_weights ** 2).sum()))
+            if query_norm == 0:
+                return []
+
+            contributions = np.where(
+                self.entry_alive, self.tf * self.idf[self.cols] * query_weights[self.cols], 0.0
+            )
+            dots = np.bincount(self.rows, contributions, minlength=len(self.resource_ids))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scores = np.where(self.norms > 0, dots / (self.norms * query_norm), 0.0)
+            scores[position] = 0.0
+            scores[~self.doc_alive] = 0.0
+
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > limit:
+                candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+            candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+            query_terms = set(query_cols.tolist())
+            results = []
+            for candidate in candidates:
+                candidate_start, candidate_end = self.slices[candidate]
+                shared = sorted(
+                    self.terms[col] for col in self.cols[candidate_start:candidate_end].tolist()
+                    if col in query_terms
+                )
+                results.append({
+                    'resource_id': self.resource_ids[candidate],
+                    'score': round(float(scores[candidate]), 4),
+                    'shared_terms': shared,
+                })
+            return results
+
+
+similarity_index = SimilarityIndex()
+
+
+class SimilarityService(ReadOnlyService):
+    """
+    "Find similar resources" recommendations.
+    """
+
+    def find_similar(self, resource_id, limit: int = DEFAULT_LIMIT) -> ServiceResponse:
+        """
+        Recommend resources with the most similar skill profile.
+
+        Args:
+            resource_id: IdleResource primary key
+            limit: Number of recommendations (at most MAX_LIMIT)
+
+        Returns:
+            ServiceResponse whose data lists resource_id, score and
+            shared_skills/shared_positions per recommendation
+
+        Raises:
+            DataNotFoundException: If the resource does not exist
+        """
+        from resource_management.models import IdleResource
+
+        limit = max(1, min(limit, MAX_LIMIT))
+        similarity_index.refresh()
+        results = similarity_index.similar(resource_id, limit)
+        if results is not None:
+            # Deletes of other processes (and rolled-back inserts) leave nothing to refresh from
+            listed = [str(resource_id)] + [result['resource_id'] for result in results]
+            existing = {str(pk) for pk in IdleResource.objects.filter(
+                id__in=listed, is_deleted=False
+            ).values_list('id', flat=True)}
+            missing = [listed_id for listed_id in listed if listed_id not in existing]
+            if missing:
+                similarity_index.mark_dirty(missing)
+            if str(resource_id) in missing:
+                results = None
+            else:
+                results = [result for result in results if result['resource_id'] in existing]
+        if results is None:
+            raise DataNotFoundException(
+                f"Resource {resource_id} not found",
+                resource_type='IdleResource',
+                resource_id=str(resource_id)
+            )
+
+        data = []
+        for result in results:
+            shared = result.pop('shared_terms')
+            result['shared_skills'] = [term.split(':', 1)[1] for term in shared if term.startswith('skill:')]
+            result['shared_positions'] = [term.split(':', 1)[1] for term in shared if term.startswith('position:')]
+            data.append(result)
+        return ServiceResponse.success_response(data=data)
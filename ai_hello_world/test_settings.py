@@ -2,6 +2,8 @@
 Test-specific Django settings for API testing
 """
 
+import tempfile
+
 from ai_hello_world.settings import *
 
 # Allow all hosts for testing
@@ -33,4 +35,26 @@ class DisableMigrations:
     def __getitem__(self, item):
         return None
 
-MIGRATION_MODULES = DisableMigrations()
\ No newline at end of file
+MIGRATION_MODULES = DisableMigrations()
+# Write audit entries in the calling thread: the test database connection
+# (and its open transaction) is not visible to a background writer
+AUDIT_LOG = {'ASYNC': False}
+
+# Keep caches per test process: the file based caches would carry entries
+# from one test run into the next
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'search_results': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'search-results',
+    },
+    'department_hierarchy': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'department-hierarchy',
+    },
+}
+
+# Uploads kept for resuming go to a throwaway directory, not the project
+RESOURCE_IMPORT = {**RESOURCE_IMPORT, 'UPLOAD_DIR': tempfile.mkdtemp(prefix='resource-import-tests-')}
@@ -0,0 +1,275 @@
+"""
+Test Suite for the month-partitioned field-level change log.
+
+Based on:
+- Service Specifications: DD/MDE-03/03-service/SVE-MDE-03-09_v0.1.md
+  (Audit Trail Query, Audit Data Retention)
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from resource_management import audit_log
+from resource_management.models import IdleResource
+from services.exceptions import DataNotFoundException
+from services.resource_management.change_history_service import ChangeHistoryService
+from tests.factories import DepartmentFactory, EmployeeFactory, IdleResourceFactory
+
+
+def _at(year, month, day=1):
+    return datetime(year, month, day, 12, tzinfo=dt_timezone.utc)
+
+
+def _entry(entity_id, changed_at, field='status', old='available', new='allocated'):
+    return {
+        'entity': 'idle_resources',
+        'entity_id': entity_id,
+        'operation': 'update',
+        'changes': {field: [old, new]},
+        'changed_at': changed_at,
+    }
+
+
+class ChangeRecordingTest(TestCase):
+    """
+    Test Cases for entries written on save, delete and bulk writes.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.resource = IdleResourceFactory(status='available', skills=['Python'])
+
+    def _history(self, resource_id=None):
+        return audit_log.query_changes('idle_resources', resource_id or self.resource.id)['results']
+
+    def test_create_records_initial_values(self):
+        """Test a new resource gets one create entry with its set fields."""
+        history = self._history()
+
+        self.assertEqual([entry['operation'] for entry in history], ['create'])
+        self.assertEqual(history[0]['changes']['status'], {'old': None, 'new': 'available'})
+
+    def test_update_records_only_changed_fields(self):
+        """Test an update stores the changed fields, not a full snapshot."""
+        # Given: a resource loaded from the database
+        resource = IdleResource.objects.get(pk=self.resource.pk)
+
+        # When: one field changes
+        resource.status = 'allocated'
+        resource.save()
+
+        # Then: the entry holds that field only
+        latest = self._history()[0]
+        self.assertEqual(latest['operation'], 'update')
+        self.assertEqual(latest['changes'], {'status': {'old': 'available', 'new': 'allocated'}})
+        self.assertEqual(latest['version'], resource.version)
+
+    def test_save_without_changes_records_nothing(self):
+        """Test saving unchanged values writes no entry."""
+        resource = IdleResource.objects.get(pk=self.resource.pk)
+        resource.save()
+
+        self.assertEqual(len(self._history()), 1)
+
+    def test_consecutive_saves_diff_against_previous_save(self):
+        """Test the snapshot is refreshed after each save."""
+        resource = IdleResource.objects.get(pk=self.resource.pk)
+        resource.status = 'allocated'
+        resource.save()
+        resource.status = 'unavailable'
+        resource.save()
+
+        self.assertEqual(
+            self._history()[0]['changes'], {'status': {'old': 'allocated', 'new': 'unavailable'}}
+        )
+
+    def test_bulk_update_records_entries(self):
+        """Test bulk updates, which bypass signals, are recorded."""
+        result = IdleResource.bulk_update_with_version_check(
+            [{'id': self.resource.id, 'version': self.resource.version, 'data': {'skills': ['Go']}}],
+            updated_by='bulk'
+        )
+
+        self.assertEqual(result['successful'], 1)
+        latest = self._history()[0]
+        self.assertEqual(latest['changes'], {'skills': {'old': ['Python'], 'new': ['Go']}})
+        self.assertEqual(latest['user_id'], 'bulk')
+
+    def test_delete_records_last_values(self):
+        """Test a hard delete keeps the last known values."""
+        resource_id = self.resource.id
+        IdleResource.objects.get(pk=resource_id).delete()
+
+        latest = self._history(resource_id)[0]
+        self.assertEqual(latest['operation'], 'delete')
+        self.assertEqual(latest['changes']['status'], {'old': 'available', 'new': None})
+
+
+class PartitionedQueryTest(TestCase):
+    """
+    Test Cases for month partitions and cursor pagination.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.entity_id = 'resource-1'
+        audit_log.record_changes([
+            _entry(self.entity_id, _at(2025, 1, day), old=str(day), new=str(day + 1)) for day in (3, 9)
+        ] + [
+            _entry(self.entity_id, _at(2025, 3, 5), old='10', new='11'),
+            _entry('resource-2', _at(2025, 3, 6)),
+        ])
+
+    def test_entries_go_to_their_month_partition(self):
+        """Test one table per month is created on demand."""
+        self.assertTrue({'202501', '202503'} <= set(audit_log.list_partitions()))
+        self.assertNotIn('202502', audit_log.list_partitions())
+
+    def test_cursor_pages_cover_every_month_newest_first(self):
+        """Test paging with the cursor returns each entry once, in order."""
+        seen, cursor = [], None
+        while True:
+            page = audit_log.query_changes('idle_resources', self.entity_id, cursor=cursor, limit=2)
+            seen.extend(entry['changed_at'] for entry in page['results'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, [_at(2025, 3, 5), _at(2025, 1, 9), _at(2025, 1, 3)])
+
+    def test_time_range_limits_results(self):
+        """Test start is inclusive and end exclusive."""
+        page = audit_log.query_changes('idle_resources', self.entity_id, start=_at(2025, 1, 9), end=_at(2025, 3, 5))
+
+        self.assertEqual([entry['changed_at'] for entry in page['results']], [_at(2025, 1, 9)])
+
+    def test_malformed_cursor_is_rejected(self):
+        """Test a tampered cursor raises ValidationError."""
+        with self.assertRaises(ValidationError):
+            audit_log.query_changes('idle_resources', self.entity_id, cursor='not-a-cursor')
+
+
+class PartitionArchiveTest(TestCase):
+    """
+    Test Cases for archiving and restoring closed months.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.archive_dir = tempfile.mkdtemp()
+        audit_log.record_changes([_entry(f'resource-{n}', _at(2024, 6, n + 1)) for n in range(5)])
+
+    def tearDown(self):
+        for name in os.listdir(self.archive_dir):
+            os.remove(os.path.join(self.archive_dir, name))
+        os.rmdir(self.archive_dir)
+
+    def test_archive_and_restore_round_trip(self):
+        """Test an archived month is dropped and can be restored unchanged."""
+        before = audit_log.query_changes('idle_resources', limit=10, start=_at(2024, 6), end=_at(2024, 7))['results']
+
+        result = audit_log.archive_partition('202406', self.archive_dir, batch_size=2)
+
+        self.assertEqual(result['rows'], 5)
+        self.assertNotIn('202406', audit_log.list_partitions())
+        with gzip.open(result['path'], 'rt', encoding='utf-8') as archive:
+            self.assertEqual(len([json.loads(line) for line in archive]), 5)
+
+        self.assertEqual(audit_log.restore_partition(result['path']), 5)
+        after = audit_log.query_changes('idle_resources', limit=10, start=_at(2024, 6), end=_at(2024, 7))['results']
+        self.assertEqual(after, before)
+
+    def test_partition_changed_during_archive_is_kept(self):
+        """Test a row written while archiving aborts the drop and leaves no archive behind."""
+        dumps = audit_log._dumps
+        # Sorts before the rows already streamed, so the keyset walk misses it
+        late_rows = [_entry('resource-late', datetime(2024, 6, 1, tzinfo=dt_timezone.utc))]
+
+        def dumps_with_late_write(value):
+            if late_rows:
+                audit_log.record_changes([late_rows.pop()])
+            return dumps(value)
+
+        with mock.patch.object(audit_log, '_dumps', dumps_with_late_write):
+            with self.assertRaises(ValueError):
+                audit_log.archive_partition('202406', self.archive_dir, batch_size=10)
+
+        self.assertIn('202406', audit_log.list_partitions())
+        self.assertEqual(os.listdir(self.archive_dir), [])
+        results = audit_log.query_changes(
+            'idle_resources', limit=10, start=datetime(2024, 6, 1, tzinfo=dt_timezone.utc), end=_at(2024, 7)
+        )['results']
+        self.assertEqual(len(results), 6)
+
+    def test_live_month_is_refused(self):
+        """Test the current month can never be archived."""
+        with self.assertRaises(ValueError):
+            audit_log.archive_partition(audit_log.month_key(timezone.now()), self.archive_dir)
+
+    def test_command_archives_old_partitions(self):
+        """Test the command archives old months and prepares the live ones."""
+        out = StringIO()
+        call_command('archive_audit_partitions', '--older-than-months', '1', '--archive-dir', self.archive_dir, stdout=out)
+
+        self.assertIn('Archived 1 partitions', out.getvalue())
+        self.assertIn(audit_log.month_key(timezone.now()), audit_log.list_partitions())
+        self.assertTrue(os.path.exists(os.path.join(self.archive_dir, 'audit_changes_202406.jsonl.gz')))
+
+
+class ChangeHistoryServiceTest(TestCase):
+    """
+    Test Cases for ChangeHistoryService and GET /api/v1/idle-resources/{id}/history.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.department = DepartmentFactory()
+        self.resource = IdleResourceFactory(status='available', employee=EmployeeFactory(department=self.department))
+        resource = IdleResource.objects.get(pk=self.resource.pk)
+        resource.status = 'allocated'
+        resource.save()
+
+    def test_user_outside_department_gets_not_found(self):
+        """Test history is limited to the user's department scope."""
+        service = ChangeHistoryService({'role': 'user', 'department_id': str(DepartmentFactory().department_id)})
+
+        with self.assertRaises(DataNotFoundException):
+            service.get_resource_history(self.resource.id)
+
+    def test_user_in_department_sees_history(self):
+        """Test a user of the resource's department can read it."""
+        service = ChangeHistoryService({'role': 'user', 'department_id': str(self.department.department_id)})
+
+        response = service.get_resource_history(self.resource.id)
+
+        self.assertEqual([entry['operation'] for entry in response.data], ['update', 'create'])
+
+    def test_api_returns_paged_history(self):
+        """Test the endpoint returns camelCase entries and a next cursor."""
+        client = APIClient()
+        url = f'/api/v1/idle-resources/{self.resource.id}/history'
+
+        first = client.get(url, {'limit': 1})
+        second = client.get(url, {'limit': 1, 'cursor': first.data['nextCursor']})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.data['history'][0]['changes'], {'status': {'old': 'available', 'new': 'allocated'}})
+        self.assertEqual(second.data['history'][0]['operation'], 'create')
+        self.assertIsNone(second.data['nextCursor'])
+
+    def test_api_rejects_bad_cursor(self):
+        """Test a malformed cursor is a 400."""
+        response = APIClient().get(f'/api/v1/idle-resources/{self.resource.id}/history', {'cursor': 'x'})
+
+        self.assertEqual(response.status_code, 400)
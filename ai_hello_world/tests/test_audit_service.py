@@ -0,0 +1,220 @@
+"""
+Test Suite for the buffered Audit Service.
+
+Based on:
+- DAO Specifications: DD/MDE-03/04-dao/DAO-MDE-03-04_v0.1.md (Create Audit Entry)
+"""
+
+import threading
+import uuid
+
+from django.db import transaction
+from django.test import TestCase
+
+from resource_management.models import AuditTrail
+from services.base import ReadOnlyService
+from services.common.audit_service import AuditService, BufferedAuditWriter, summarize
+from services.exceptions import ValidationException
+
+
+class _EchoService(ReadOnlyService):
+    """Minimal service for exercising execute_with_audit."""
+
+    def lookup(self, resource_id, fail=False):
+        return self.execute_with_audit('lookup', self._lookup, resource_id, fail=fail)
+
+    def _lookup(self, resource_id, fail=False):
+        if fail:
+            raise ValidationException("Lookup failed")
+        return {'resource_id': resource_id, 'rows': list(range(100))}
+
+
+class SummarizeTest(TestCase):
+    """
+    Test Cases for argument/result summaries.
+    """
+
+    def test_large_collections_are_reduced_to_sizes(self):
+        """Test audit details stay small whatever the payload."""
+        summary = summarize({'ids': list(range(5000)), 'when': uuid.UUID(int=1), 'nested': {'a': {'b': {'c': [1]}}}})
+
+        self.assertEqual(summary['ids'], {'type': 'list', 'length': 5000})
+        self.assertEqual(summary['when'], str(uuid.UUID(int=1)))
+        self.assertEqual(summary['nested']['a']['b'], {'type': 'dict', 'length': 1})
+
+
+class AuditServiceTest(TestCase):
+    """
+    Test Cases for AuditService through BaseService.execute_with_audit.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.service = _EchoService({'user_id': 'u-1', 'role': 'manager', 'ip_address': '10.0.0.1'})
+        self.resource_id = str(uuid.uuid4())
+
+    def test_success_is_written_on_commit(self):
+        """Test a committed operation leaves one success row with user context."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.lookup(self.resource_id)
+
+        entry = AuditTrail.objects.get()
+        self.assertEqual((entry.operation_type, entry.status), ('lookup', 'success'))
+        self.assertEqual(entry.resource_id, self.resource_id)
+        self.assertEqual((entry.user_id, entry.user_role, entry.ip_address), ('u-1', 'manager', '10.0.0.1'))
+        self.assertEqual(entry.operation_details['result']['rows'], {'type': 'list', 'length': 100})
+
+    def test_rolled_back_operation_is_not_audited_as_success(self):
+        """Test success entries of a rolled-back transaction are discarded."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                self.service.lookup(self.resource_id)
+                transaction.set_rollback(True)
+
+        self.assertEqual(callbacks, [])
+
+    def test_error_is_written_immediately(self):
+        """Test failures are recorded with their message."""
+        with self.assertRaises(ValidationException):
+            self.service.lookup(self.resource_id, fail=True)
+
+        entry = AuditTrail.objects.get()
+        self.assertEqual(entry.status, 'error')
+        self.assertIn('Lookup failed', entry.error_message)
+
+
+class BufferedAuditWriterTest(TestCase):
+    """
+    Test Cases for the background batch writer.
+    """
+
+    def _writer(self, expected=0, **options):
+        writer = BufferedAuditWriter(asynchronous=True, **options)
+        writer.batches = []
+        writer.threads = set()
+        writer.written = threading.Event()
+
+        def record(batch):
+            writer.batches.append(list(batch))
+            writer.threads.add(threading.current_thread().name)
+            if sum(len(b) for b in writer.batches) >= expected:
+                writer.written.set()
+            return True
+
+        writer._write = record
+        return writer
+
+    def test_background_thread_writes_in_batches(self):
+        """Test entries are grouped up to the batch size off the calling thread."""
+        writer = self._writer(batch_size=3, flush_interval=0.2, expected=7)
+        entries = [AuditService.build_entry('op', 'success', {}, (), {}) for _ in range(7)]
+
+        for entry in entries:
+            writer.submit(entry)
+        self.assertTrue(writer.written.wait(5))
+        writer.shutdown()
+
+        self.assertEqual(sum(len(batch) for batch in writer.batches), 7)
+        self.assertLessEqual(max(len(batch) for batch in writer.batches), 3)
+        self.assertEqual(writer.threads, {'audit-writer'})
+
+    def test_shutdown_drains_the_queue(self):
+        """Test nothing queued is lost when the writer stops."""
+        writer = self._writer(batch_size=100, flush_interval=60)
+        writer._ensure_started = lambda: None  # keep entries queued
+
+        for _ in range(5):
+            writer.submit(AuditService.build_entry('op', 'success', {}, (), {}))
+        self.assertEqual(writer.pending(), 5)
+        writer.shutdown()
+
+        self.assertEqual(writer.pending(), 0)
+        self.assertEqual(sum(len(batch) for batch in writer.batches), 5)
+
+    def test_full_queue_writes_in_the_caller(self):
+        """Test back pressure: a full queue makes the caller write its own entry."""
+        writer = self._writer(queue_size=1)
+        writer._ensure_started = lambda: None
+
+        writer.submit(AuditService.build_entry('first', 'success', {}, (), {}))
+        writer.submit(AuditService.build_entry('second', 'success', {}, (), {}))
+
+        self.assertEqual([[entry.operation_type for entry in batch] for batch in writer.batches], [['second']])
+        self.assertEqual(writer.pending(), 1)
+
+    def test_failed_batch_is_retried(self):
+        """Test a batch whose write fails is written on a later attempt, not dropped."""
+        writer = self._writer(batch_size=10, flush_interval=0.05, retry_backoff=0.01, expected=2)
+        record = writer._write
+        attempts = []
+
+        def fail_once(batch):
+            attempts.append(len(batch))
+            return len(attempts) > 1 and record(batch)
+
+        writer._write = fail_once
+        writer.submit(AuditService.build_entry('first', 'success', {}, (), {}))
+        writer.submit(AuditService.build_entry('second', 'success', {}, (), {}))
+        self.assertTrue(writer.written.wait(5))
+        writer.shutdown()
+
+        self.assertEqual(attempts, [2, 2])
+        self.assertEqual([[entry.operation_type for entry in batch] for batch in writer.batches], [['first', 'second']])
+
+    def test_unwritten_batch_is_flushed_at_shutdown(self):
+        """Test a batch still failing when the writer stops is written by the caller."""
+        writer = self._writer(batch_size=10, flush_interval=0.05, retry_backoff=60)
+        record = writer._write
+        failed = threading.Event()
+
+        def fail_in_thread(batch):
+            if threading.current_thread().name == 'audit-writer':
+                failed.set()
+                return False
+            return record(batch)
+
+        writer._write = fail_in_thread
+        writer.submit(AuditService.build_entry('op', 'success', {}, (), {}))
+        self.assertTrue(failed.wait(5))
+        writer.shutdown()
+
+        self.assertEqual(sum(len(batch) for batch in writer.batches), 1)
+        self.assertEqual(writer.threads, {'MainThread'})
+
+    def test_full_queue_write_failure_is_retried(self):
+        """Test the caller retries its own entry when the queue is full and the write fails."""
+        writer = self._writer(queue_size=1, retry_backoff=0.01)
+        writer._ensure_started = lambda: None
+        record = writer._write
+        attempts = []
+
+        def fail_once(batch):
+            attempts.append(len(batch))
+            return len(attempts) > 1 and record(batch)
+
+        writer._write = fail_once
+        writer.submit(AuditService.build_entry('first', 'success', {}, (), {}))
+        writer.submit(AuditService.build_entry('second', 'success', {}, (), {}))
+
+        self.assertEqual(attempts, [1, 1])
+        self.assertEqual([[entry.operation_type for entry in batch] for batch in writer.batches], [['second']])
+
+    def test_batch_failing_every_attempt_is_written_row_by_row(self):
+        """Test retries stop after max_attempts and only the bad row is dead-lettered."""
+        writer = self._writer(retry_backoff=0.01, max_attempts=3)
+        record = writer._write
+        attempts = []
+
+        def reject_bad_row(batch):
+            attempts.append(len(batch))
+            return all(entry.operation_type != 'bad' for entry in batch) and record(batch)
+
+        writer._write = reject_bad_row
+        batch = [AuditService.build_entry(operation, 'success', {}, (), {}) for operation in ('good', 'bad')]
+        with self.assertLogs('services.common.audit_service.dead_letter', 'ERROR') as logs:
+            writer._write_with_retry(batch)
+
+        self.assertEqual(attempts, [2, 2, 2, 1, 1])
+        self.assertEqual([[entry.operation_type for entry in batch] for batch in writer.batches], [['good']])
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('"operation_type": "bad"', logs.output[0])
@@ -12,14 +12,18 @@ Based on:
 
 import uuid
 from datetime import datetime, timedelta
+from django.core.management import call_command
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.db import IntegrityError
 import hashlib
+from unittest import mock
+
+from services.base import ReadOnlyService
 
 from authentication.models import (
-    Department, Employee, User, Profile, Role, Permission,
+    Department, DepartmentClosure, Employee, User, Profile, Role, Permission,
     UserRole, RolePermission, UserSession, SecurityPolicy,
     LoginAttempt, PasswordResetToken
 )
@@ -112,6 +116,102 @@ class DepartmentModelTest(TestCase):
         self.assertEqual(str(department), 'HR Department')
 
 
+class DepartmentClosureTest(TestCase):
+    """
+    Test Cases for the department hierarchy closure table.
+    """
+    
+    def setUp(self):
+        """Set up test data: a chain root > d1 > ... > d5 plus a sibling branch."""
+        self.chain = [DepartmentFactory(department_name='Root')]
+        for level in range(1, 6):
+            self.chain.append(DepartmentFactory(department_name=f'Level {level}', parent_department=self.chain[-1]))
+        self.sibling = DepartmentFactory(department_name='Sibling', parent_department=self.chain[0])
+    
+    def _ids(self, departments):
+        return sorted(str(department.department_id) for department in departments)
+    
+    def test_descendants_single_query_then_cached(self):
+        """Test a deep subtree is one query, then served from cache."""
+        root_id = self.chain[0].department_id
+        
+        with self.assertNumQueries(1):
+            descendants = DepartmentClosure.descendant_ids(root_id)
+        with self.assertNumQueries(0):
+            DepartmentClosure.descendant_ids(root_id)
+        
+        self.assertEqual(sorted(descendants), self._ids(self.chain + [self.sibling]))
+        self.assertEqual(
+            DepartmentClosure.objects.get(ancestor=self.chain[0], descendant=self.chain[5]).depth, 5
+        )
+    
+    def test_descendants_are_cached_in_the_shared_alias(self):
+        """Test subtrees and their generation live in the shared alias, not the per-process default."""
+        from django.core.cache import caches
+        
+        root_id = self.chain[0].department_id
+        descendants = DepartmentClosure.descendant_ids(root_id)
+        
+        shared = caches[DepartmentClosure.CACHE_ALIAS]
+        generation = shared.get(DepartmentClosure.CACHE_GENERATION_KEY)
+        self.assertEqual(shared.get(f"department-closure:{generation}:{root_id}"), descendants)
+        self.assertIsNone(caches['default'].get(DepartmentClosure.CACHE_GENERATION_KEY))
+    
+    def test_moving_a_department_moves_its_subtree(self):
+        """Test re-parenting re-links every descendant and refreshes the cache."""
+        # Given: A cached subtree of the sibling
+        DepartmentClosure.descendant_ids(self.sibling.department_id)
+        
+        # When: Moving Level 3 (with 4 and 5) under the sibling
+        self.chain[3].parent_department = self.sibling
+        self.chain[3].save()
+        
+        # Then: Paths follow the new parent
+        self.assertEqual(
+            sorted(DepartmentClosure.descendant_ids(self.sibling.department_id)),
+            self._ids([self.sibling] + self.chain[3:])
+        )
+        self.assertEqual(
+            sorted(DepartmentClosure.descendant_ids(self.chain[1].department_id)),
+            self._ids(self.chain[1:3])
+        )
+        self.assertEqual(
+            DepartmentClosure.objects.get(ancestor=self.chain[0], descendant=self.chain[5]).depth, 4
+        )
+    
+    def test_cycles_are_rejected(self):
+        """Test a department cannot move under its own descendant."""
+        self.chain[1].parent_department = self.chain[4]
+        
+        with self.assertRaises(ValidationError):
+            self.chain[1].save()
+    
+    def test_deleting_a_department_detaches_children(self):
+        """Test children of a deleted department become roots of their subtrees."""
+        self.chain[2].delete()
+        
+        self.assertEqual(
+            sorted(DepartmentClosure.descendant_ids(self.chain[0].department_id)),
+            self._ids(self.chain[:2] + [self.sibling])
+        )
+        self.assertFalse(DepartmentClosure.objects.filter(descendant=self.chain[3], depth__gt=0).exists())
+    
+    def test_rebuild_matches_incremental_maintenance(self):
+        """Test the rebuild command reproduces the maintained rows."""
+        expected = set(DepartmentClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth'))
+        DepartmentClosure.objects.all().delete()
+        
+        call_command('rebuild_department_closure', stdout=mock.MagicMock())
+        
+        self.assertEqual(set(DepartmentClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth')), expected)
+    
+    def test_manager_scope_covers_subtree(self):
+        """Test managers are scoped to their department and all descendants."""
+        service = ReadOnlyService({'role': 'manager', 'department_id': self.chain[3].department_id})
+        
+        self.assertEqual(sorted(service.get_user_department_scope()), self._ids(self.chain[3:]))
+
+
 class EmployeeModelTest(TestCase):
     """
     TDD Test Cases for Employee Model.
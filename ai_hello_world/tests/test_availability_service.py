@@ -0,0 +1,138 @@
+"""
+Test Suite for the batch Availability Service.
+
+Based on:
+- DAO Specifications: DD/MDE-03/04-dao/DAO-MDE-03-01_v0.1.md (Check Availability)
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from services.exceptions import ValidationException
+from services.resource_management.availability_service import (
+    AvailabilityService,
+    free_windows,
+    merge_intervals,
+)
+from tests.factories import IdleResourceFactory, ResourceAvailabilityFactory
+
+
+def _day(n):
+    return datetime(2026, 1, 1, tzinfo=dt_timezone.utc) + timedelta(days=n)
+
+
+class IntervalSweepTest(TestCase):
+    """
+    Test Cases for the interval merge and free window helpers.
+    """
+
+    def test_merge_overlapping_and_touching_intervals(self):
+        """Test sorted intervals are merged into disjoint ones."""
+        merged = merge_intervals([(1, 3), (2, 5), (5, 6), (8, 9)])
+
+        self.assertEqual(merged, [(1, 6), (8, 9)])
+
+    def test_free_windows_are_gaps_inside_the_range(self):
+        """Test free windows cover the range minus busy intervals."""
+        windows = free_windows(0, 10, [(-2, 1), (3, 4), (9, 12)])
+
+        self.assertEqual(windows, [(1, 3), (4, 9)])
+
+
+class AvailabilityServiceTest(TestCase):
+    """
+    Test Cases for AvailabilityService.check_batch_availability.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.service = AvailabilityService({'role': 'admin'})
+        self.free = IdleResourceFactory(status='available', availability_start=_day(0), availability_end=_day(60))
+        self.busy = IdleResourceFactory(status='available', availability_start=_day(0), availability_end=_day(60))
+        self.allocated = IdleResourceFactory(status='allocated')
+        ResourceAvailabilityFactory(
+            resource=self.busy, is_allocated=True, allocation_reference='PRJ-1',
+            start_date=_day(10), end_date=_day(15)
+        )
+        ResourceAvailabilityFactory(
+            resource=self.busy, is_allocated=True, allocation_reference='PRJ-2',
+            start_date=_day(14), end_date=_day(20)
+        )
+        # Not allocated, so never a conflict
+        ResourceAvailabilityFactory(resource=self.free, is_allocated=False, start_date=_day(10), end_date=_day(12))
+
+    def test_batch_check_uses_constant_queries(self):
+        """Test any number of candidates is checked in two queries."""
+        ids = [self.free.id, self.busy.id, self.allocated.id]
+        with self.assertNumQueries(2):
+            self.service._check_batch_availability(ids, _day(5), _day(25))
+
+    def test_batch_check_reports_conflicts_and_free_windows(self):
+        """Test per-resource results match the single-resource rules."""
+        response = self.service.check_batch_availability(
+            [self.free.id, self.busy.id, self.allocated.id], _day(5), _day(25)
+        )
+
+        results = response.data['results']
+        self.assertTrue(results[str(self.free.id)]['is_available'])
+        self.assertEqual(len(results[str(self.free.id)]['free_windows']), 1)
+
+        busy = results[str(self.busy.id)]
+        self.assertFalse(busy['is_available'])
+        self.assertEqual(
+            [c['allocation_reference'] for c in busy['conflicts']], ['PRJ-1', 'PRJ-2']
+        )
+        self.assertEqual(
+            busy['free_windows'],
+            [
+                {'start': _day(5).isoformat(), 'end': _day(10).isoformat()},
+                {'start': _day(20).isoformat(), 'end': _day(25).isoformat()},
+            ]
+        )
+
+        self.assertEqual(results[str(self.allocated.id)]['reason'], 'Resource status is allocated')
+
+    def test_batch_check_agrees_with_single_check(self):
+        """Test is_available matches IdleResource.check_availability for each resource."""
+        response = self.service.check_batch_availability(
+            [self.free.id, self.busy.id, self.allocated.id], _day(5), _day(25)
+        )
+
+        for resource in (self.free, self.busy, self.allocated):
+            single = resource.check_availability(_day(5), _day(25))
+            self.assertEqual(response.data['results'][str(resource.id)]['is_available'], single['is_available'])
+
+    def test_unknown_ids_are_reported(self):
+        """Test ids without a resource are listed as not found."""
+        missing = uuid.uuid4()
+        response = self.service.check_batch_availability([self.free.id, missing], _day(5), _day(25))
+
+        self.assertEqual(response.data['not_found'], [str(missing)])
+
+    def test_invalid_range_is_rejected(self):
+        """Test start must precede end."""
+        with self.assertRaises(ValidationException):
+            self.service.check_batch_availability([self.free.id], _day(5), _day(5))
+
+
+class BatchAvailabilityAPITest(TestCase):
+    """
+    API Test Cases for POST /api/v1/idle-resources/availability.
+    """
+
+    def test_api_returns_available_ids(self):
+        """Test the endpoint returns camelCase per-resource results."""
+        resource = IdleResourceFactory(status='available', availability_start=_day(0), availability_end=_day(60))
+
+        response = APIClient().post('/api/v1/idle-resources/availability', {
+            'resourceIds': [str(resource.id)],
+            'startDate': _day(5).isoformat(),
+            'endDate': _day(25).isoformat()
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['availableIds'], [str(resource.id)])
+        self.assertIn('freeWindows', response.data['results'][str(resource.id)])
@@ -0,0 +1,163 @@
+"""
+Test Suite for the search result Cache Service (SVE-MDE-03-15).
+
+Based on:
+- API Designs: DD/MDE-03/02-api/API-MDE-03-09_v0.1.md (Step 4: Check Cache)
+"""
+
+import threading
+import time
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from services.common.cache_service import (
+    CacheService,
+    LRUCache,
+    SearchResultCache,
+    build_query_signature,
+    search_cache,
+)
+from tests.factories import IdleResourceFactory
+
+
+class SearchResultCacheTest(TestCase):
+    """
+    Test Cases for key building, layering and single-flight behaviour.
+    """
+
+    def setUp(self):
+        """Set up a fresh cache for each test."""
+        search_cache.clear()
+        self.cache = SearchResultCache(max_age=60)
+
+    def test_signature_ignores_order_whitespace_and_empty_values(self):
+        """Test equivalent filter sets produce the same signature."""
+        first = build_query_signature({
+            'query': '  java   spring ', 'filters': {'idleType': ['Bench', 'Training'], 'departmentId': None}
+        })
+        second = build_query_signature({
+            'filters': {'idleType': ['Training', 'Bench']}, 'query': 'java spring'
+        })
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, build_query_signature({'query': 'java'}))
+
+    def test_lru_evicts_least_recently_used(self):
+        """Test the L1 layer keeps only the most recently used entries."""
+        lru = LRUCache(max_entries=2)
+        lru.set('a', 1, 60)
+        lru.set('b', 2, 60)
+        lru.get('a')
+        lru.set('c', 3, 60)
+
+        self.assertIsNotNone(lru.get('a'))
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual(len(lru), 2)
+
+    def test_l2_serves_after_l1_is_lost(self):
+        """Test a process with a cold L1 is served from the shared layer."""
+        calls = []
+        self.cache.get_or_compute('k', lambda: calls.append(1) or 'value')
+
+        other_process = SearchResultCache(max_age=60)
+        value, info = other_process.get_or_compute('k', lambda: calls.append(1) or 'value')
+
+        self.assertEqual(value, 'value')
+        self.assertEqual(info['layer'], 'l2')
+        self.assertEqual(len(calls), 1)
+
+    def test_invalidate_expires_all_entries(self):
+        """Test bumping the generation forces recomputation."""
+        self.cache.get_or_compute('k', lambda: 'old')
+        self.cache.invalidate()
+
+        value, info = self.cache.get_or_compute('k', lambda: 'new')
+
+        self.assertEqual(value, 'new')
+        self.assertFalse(info['hit'])
+
+    def test_invalidate_never_reuses_a_generation(self):
+        """Test every invalidation, in any process, moves to an unseen generation."""
+        other_process = SearchResultCache(max_age=60)
+        seen = {self.cache.current_generation()}
+
+        for cache in (self.cache, other_process, self.cache):
+            cache.invalidate()
+            seen.add(cache.current_generation())
+
+        self.assertEqual(len(seen), 4)
+        self.assertEqual(other_process.current_generation(), self.cache.current_generation())
+
+    def test_concurrent_misses_share_one_computation(self):
+        """Test identical concurrent misses run the computation once."""
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return 'value'
+
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_compute('k', compute)[0]))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['value'] * 5)
+
+    def test_department_scope_is_part_of_the_key(self):
+        """Test users with different department scopes never share entries."""
+        sales = CacheService({'role': 'user', 'department_id': 'sales'})
+        hr = CacheService({'role': 'user', 'department_id': 'hr'})
+
+        sales.get_or_compute('search', {'query': 'java'}, lambda: 'sales-result')
+        response = hr.get_or_compute('search', {'query': 'java'}, lambda: 'hr-result')
+
+        self.assertEqual(response.data, 'hr-result')
+        self.assertFalse(response.metadata['cacheInfo']['hit'])
+
+
+class SearchCacheAPITest(TestCase):
+    """
+    API Test Cases for cacheInfo and write-driven invalidation.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        search_cache.clear()
+        self.client = APIClient()
+        self.url = '/api/v1/idle-resources/search'
+        IdleResourceFactory(skills=['Java'])
+
+    def test_repeated_search_is_a_cache_hit(self):
+        """Test the second identical search is served from cache."""
+        first = self.client.post(self.url, {'query': 'java'}, format='json')
+        with self.assertNumQueries(0):
+            second = self.client.post(self.url, {'query': 'java'}, format='json')
+
+        self.assertFalse(first.data['cacheInfo']['hit'])
+        self.assertTrue(second.data['cacheInfo']['hit'])
+        self.assertEqual(second.data['results'], first.data['results'])
+
+    def test_resource_write_invalidates_cached_results(self):
+        """Test saving an IdleResource makes the next search recompute."""
+        self.client.post(self.url, {'query': 'java'}, format='json')
+        IdleResourceFactory(skills=['Java'])
+
+        response = self.client.post(self.url, {'query': 'java'}, format='json')
+
+        self.assertFalse(response.data['cacheInfo']['hit'])
+        self.assertEqual(response.data['totalCount'], 2)
+
+    def test_list_endpoint_uses_cache(self):
+        """Test repeated list requests are served from cache."""
+        self.client.get('/api/v1/idle-resources', {'pageSize': 10})
+        response = self.client.get('/api/v1/idle-resources', {'pageSize': 10})
+
+        self.assertTrue(response.data['cacheInfo']['hit'])
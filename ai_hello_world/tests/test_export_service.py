@@ -0,0 +1,182 @@
+"""
+Test Suite for the streaming Resource Export Service and spreadsheet helpers.
+
+Based on:
+- DAO Specifications: DD/MDE-03/04-dao/DAO-MDE-03-05_v0.1.md (Data Export Generation)
+"""
+
+import csv
+import io
+import os
+import shutil
+import tempfile
+from datetime import date, datetime, timedelta
+
+import openpyxl
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from common.spreadsheets import cell_text, iter_xlsx_rows, write_xlsx
+from resource_management.models import ExportSession, IdleResource
+from services.exceptions import ValidationException
+from services.resource_management.export_service import ResourceExportService
+from services.resource_management.import_service import ResourceImportService
+from tests.factories import EmployeeFactory, IdleResourceFactory
+
+
+class SpreadsheetTest(TestCase):
+    """
+    Test Cases for common.spreadsheets.
+    """
+
+    def test_written_rows_read_back(self):
+        """Test write-only output is read back row by row, lists as text."""
+        buffer = io.BytesIO()
+
+        written = write_xlsx(buffer, [('Data', (('name', 'skills'), ('Alice', ['Python', 'Go']), ('Bob\x07', None)))])
+        buffer.seek(0)
+
+        self.assertEqual(written, {'Data': 3})
+        self.assertEqual(list(iter_xlsx_rows(buffer)), [('name', 'skills'), ('Alice', 'Python, Go'), ('Bob',)])
+
+    def test_cell_text_matches_csv_text(self):
+        """Test cell values become the text a CSV export would hold."""
+        self.assertEqual(
+            [cell_text(value) for value in (None, 42.0, 45.5, datetime(2026, 3, 1), date(2026, 3, 2), 'x')],
+            ['', '42', '45.5', '2026-03-01', '2026-03-02', 'x']
+        )
+
+
+class XlsxImportTest(TestCase):
+    """
+    Test Cases for importing Excel workbooks.
+    """
+
+    def test_xlsx_rows_are_imported(self):
+        """Test a workbook from HR imports like the equivalent CSV."""
+        employee = EmployeeFactory(employee_number='EMP9401')
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['Employee No', 'Type', 'Start Date', 'End Date', 'Sales Price'])
+        sheet.append(['EMP9401', 'developer', datetime(2026, 4, 1), datetime(2026, 4, 30), 50])
+        sheet.append([None, None, None, None, None])
+        sheet.append(['EMP0000', 'developer', datetime(2026, 4, 1), None, None])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        upload = SimpleUploadedFile('hr.xlsx', buffer.getvalue())
+
+        result = ResourceImportService({'user_id': 'importer'}).import_resources(
+            upload, {'rollback_on_error': False}
+        ).data
+
+        self.assertEqual((result['created'], result['invalid_rows']), (1, 1))
+        self.assertEqual(result['errors'][0]['row'], 3)
+        resource = IdleResource.objects.get(employee=employee)
+        self.assertEqual(resource.availability_start.date(), date(2026, 4, 1))
+        self.assertEqual(str(resource.hourly_rate), '50.00')
+
+    def test_corrupt_workbook_is_rejected(self):
+        """Test a ZIP that is not a workbook is a validation error."""
+        upload = SimpleUploadedFile('hr.xlsx', b'PK\x03\x04 not really a workbook')
+
+        with self.assertRaises(ValidationException):
+            ResourceImportService({'user_id': 'importer'}).import_resources(upload)
+
+
+class ResourceExportServiceTest(TestCase):
+    """
+    Test Cases for ResourceExportService and the export API.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.export_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.export_dir, ignore_errors=True)
+        settings_override = override_settings(RESOURCE_EXPORT={'EXPORT_DIR': self.export_dir})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        now = timezone.now()
+        self.resources = [
+            IdleResourceFactory(availability_start=now + timedelta(days=i), skills=['Python', 'SQL'])
+            for i in range(3)
+        ]
+        self.client = APIClient()
+
+    def _export(self, **body):
+        response = self.client.post('/api/v1/idle-resources/export', body, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def test_excel_export_writes_all_rows(self):
+        """Test the export is a real workbook with a header, every record and an info sheet."""
+        data = self._export(columns=['id', 'skills', 'idleFromDate'], sortOrder='asc')
+
+        session = ExportSession.objects.get(pk=data['exportId'])
+        self.assertEqual((session.status, session.total_records), ('completed', 3))
+        self.assertEqual(data['recordCount'], 3)
+        self.assertTrue(data['fileName'].endswith('.xlsx'))
+
+        rows = list(iter_xlsx_rows(session.file_path))
+        self.assertEqual(rows[0], ('id', 'skills', 'idleFromDate'))
+        self.assertEqual([row[0] for row in rows[1:]], [str(resource.id) for resource in self.resources])
+        self.assertEqual(rows[1][1], 'Python, SQL')
+        info = dict(iter_xlsx_rows(session.file_path, sheet_name='Export Info'))
+        self.assertEqual(info['Records'], 3)
+
+    def test_csv_export_downloads_with_token(self):
+        """Test a CSV export is served by its signed download link only."""
+        data = self._export(format='csv', filters={'idleType': self.resources[0].resource_type})
+
+        response = self.client.get(data['fileUrl'])
+        self.assertEqual(response.status_code, 200)
+        content = b''.join(response.streaming_content).decode('utf-8-sig')
+        rows = list(csv.reader(io.StringIO(content)))
+        self.assertEqual(len(rows) - 1, data['recordCount'])
+        self.assertIn('employeeId', rows[0])
+
+        forged = self.client.get(f"/api/v1/idle-resources/export/{data['exportId']}/download?token=forged")
+        self.assertEqual(forged.status_code, 403)
+
+    def test_exported_workbook_can_be_imported(self):
+        """Test an export is a valid import file (round trip through XLSX)."""
+        data = self._export(columns=['employeeId', 'idleType', 'idleFromDate', 'idleToDate'], includeMetadata=False)
+        session = ExportSession.objects.get(pk=data['exportId'])
+        IdleResource.objects.filter(pk__in=[resource.pk for resource in self.resources]).delete()
+
+        with open(session.file_path, 'rb') as handle:
+            upload = SimpleUploadedFile('export.xlsx', handle.read())
+        result = ResourceImportService({'user_id': 'importer'}).import_resources(upload, {'import_mode': 'import'}).data
+
+        self.assertEqual((result['status'], result['created']), ('completed', 3))
+
+    def test_unknown_column_is_rejected(self):
+        """Test columns outside the list format are a 400."""
+        response = self.client.post('/api/v1/idle-resources/export', {'columns': ['password']}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('columns', response.data['details'])
+
+    def test_invalid_filters_are_rejected(self):
+        """Test malformed filter values are a 400 and start no export."""
+        response = self.client.post('/api/v1/idle-resources/export', {
+            'filters': {'dateFrom': 'garbage', 'departmentId': 'not-a-uuid'}
+        }, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data['details']['filters']), {'dateFrom', 'departmentId'})
+        self.assertFalse(ExportSession.objects.exists())
+
+    def test_failed_export_is_recorded(self):
+        """Test an error while writing marks the session failed and leaves no file."""
+        def rows():
+            yield ['a']
+            raise RuntimeError('database went away')
+
+        with self.assertRaises(RuntimeError):
+            ResourceExportService({'user_id': 'exporter'}).export_resources(['id'], rows(), {'export_format': 'csv'})
+
+        self.assertEqual(ExportSession.objects.get(created_by='exporter').status, 'failed')
+        self.assertEqual(os.listdir(self.export_dir), [])
@@ -0,0 +1,361 @@
+"""
+Test Suite for the streaming Resource Import Service.
+
+Based on:
+- DAO Specifications: DD/MDE-03/04-dao/DAO-MDE-03-05_v0.1.md (Data Import Processing)
+"""
+
+import io
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from resource_management.models import IdleResource, ImportSession, ImportStaging
+from services.exceptions import DataNotFoundException, ValidationException
+from services.resource_management.import_service import (
+    ResourceImportService,
+    build_column_map,
+    load_lookups,
+    validate_chunk,
+)
+from tests.factories import EmployeeFactory, IdleResourceFactory
+
+
+def _csv(*lines, name='resources.csv'):
+    return SimpleUploadedFile(name, ('\n'.join(lines) + '\n').encode('utf-8'), content_type='text/csv')
+
+
+class ColumnMappingTest(TestCase):
+    """
+    Test Cases for header to field mapping.
+    """
+
+    def test_known_headers_are_mapped_in_any_spelling(self):
+        """Test API names, model names and labels map to the same fields."""
+        column_map = build_column_map(['Employee ID', 'idle_type', 'idleFromDate', 'Notes'])
+
+        self.assertEqual(column_map, {
+            'Employee ID': 'employee', 'idle_type': 'resource_type', 'idleFromDate': 'availability_start'
+        })
+
+    def test_explicit_mapping_overrides_headers(self):
+        """Test columnMapping maps arbitrary headers."""
+        column_map = build_column_map(['Staff', 'Kind'], {'Staff': 'employeeId', 'Kind': 'resource_type'})
+
+        self.assertEqual(column_map, {'Staff': 'employee', 'Kind': 'resource_type'})
+
+    def test_missing_required_column_is_rejected(self):
+        """Test the employee and type columns are required."""
+        with self.assertRaises(ValidationException):
+            build_column_map(['Employee ID', 'Skills'])
+
+
+class ResourceImportServiceTest(TestCase):
+    """
+    Test Cases for ResourceImportService.import_resources.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.service = ResourceImportService({'user_id': 'importer', 'role': 'admin'})
+        self.alice = EmployeeFactory(employee_number='EMP9001')
+        self.bob = EmployeeFactory(employee_number='EMP9002')
+        self.header = 'employeeId,idleType,idleFromDate,idleToDate,skills,salesPrice'
+
+    def _import(self, *rows, **options):
+        return self.service.import_resources(_csv(self.header, *rows), options).data
+
+    def test_rows_are_imported_in_chunks(self):
+        """Test every valid row is created, whatever the batch size."""
+        # Given: five rows and a batch size of two
+        rows = [f'EMP9001,developer,2026-0{month}-01,2026-0{month}-20,Python;Django,45.50' for month in range(1, 6)]
+
+        # When
+        result = self._import(*rows, batch_size=2)
+
+        # Then: all rows are created and the session is complete
+        self.assertEqual((result['status'], result['total_rows'], result['created']), ('completed', 5, 5))
+        resources = IdleResource.objects.filter(employee=self.alice).order_by('availability_start')
+        self.assertEqual(resources.count(), 5)
+        self.assertEqual(resources[0].skills, ['Python', 'Django'])
+        self.assertEqual(str(resources[0].hourly_rate), '45.50')
+        self.assertEqual(resources[0].created_by, 'importer')
+
+        session = ImportSession.objects.get(pk=result['import_id'])
+        self.assertEqual((session.processed_records, session.failed_records), (5, 0))
+        self.assertFalse(ImportStaging.objects.filter(session=session).exists())
+
+    def test_invalid_rows_are_reported_in_row_order(self):
+        """Test errors carry the data row number and API field name."""
+        result = self._import(
+            'EMP9001,developer,2026-01-01,2026-01-20,,',
+            'EMP0000,developer,2026-01-01,2026-01-20,,',
+            'EMP9002,pilot,2026-01-20,2026-01-01,,',
+            rollback_on_error=False
+        )
+
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(result['invalid_rows'], 2)
+        self.assertEqual(
+            [(error['row'], error['field']) for error in result['errors']],
+            [(2, 'employeeId'), (3, 'idleType'), (3, 'idleToDate')]
+        )
+
+    def test_rollback_on_error_imports_nothing(self):
+        """Test one invalid row stops the merge of all rows."""
+        result = self._import(
+            'EMP9001,developer,2026-01-01,2026-01-20,,',
+            'EMP9002,developer,not-a-date,,,',
+        )
+
+        self.assertEqual(result['status'], 'failed')
+        self.assertFalse(IdleResource.objects.filter(employee__in=[self.alice, self.bob]).exists())
+
+    def test_validate_mode_writes_no_resources(self):
+        """Test importMode 'validate' only reports."""
+        result = self._import('EMP9001,developer,2026-01-01,2026-01-20,,', import_mode='validate')
+
+        self.assertEqual((result['status'], result['valid_rows'], result['created']), ('completed', 1, 0))
+        self.assertFalse(IdleResource.objects.filter(employee=self.alice).exists())
+
+    def test_duplicates_are_skipped_by_default(self):
+        """Test repeats of existing resources and of earlier rows are skipped."""
+        IdleResourceFactory(employee=self.alice, availability_start=timezone.make_aware(datetime(2026, 1, 1)))
+
+        result = self._import(
+            'EMP9001,developer,2026-01-01,2026-01-20,,',
+            'EMP9002,developer,2026-01-01,2026-01-20,,',
+            'EMP9002,developer,2026-01-01,2026-01-20,,',
+        )
+
+        self.assertEqual((result['created'], result['duplicate_rows'], result['skipped']), (1, 2, 2))
+        self.assertEqual(IdleResource.objects.filter(employee=self.alice).count(), 1)
+
+    def test_duplicate_update_changes_existing_resource(self):
+        """Test duplicateHandling 'update' updates the matching resource."""
+        existing = IdleResourceFactory(
+            employee=self.alice, availability_start=timezone.make_aware(datetime(2026, 1, 1)), skills=['Java']
+        )
+
+        result = self._import('EMP9001,developer,2026-01-01,2026-01-20,Go,', duplicate_handling='update')
+
+        self.assertEqual(result['updated'], 1)
+        existing.refresh_from_db()
+        self.assertEqual(existing.skills, ['Go'])
+        self.assertEqual(existing.updated_by, 'importer')
+
+    def test_duplicate_error_rejects_row(self):
+        """Test duplicateHandling 'error' reports the repeat as invalid."""
+        result = self._import(
+            'EMP9001,developer,2026-01-01,2026-01-20,,',
+            'EMP9001,developer,2026-01-01,2026-01-20,,',
+            duplicate_handling='error', rollback_on_error=False
+        )
+
+        self.assertEqual((result['created'], result['invalid_rows']), (1, 1))
+        self.assertEqual(result['errors'][0]['row'], 2)
+
+
+class ParallelValidationTest(TestCase):
+    """
+    Test Cases for validation in a process pool.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.upload_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.upload_dir, ignore_errors=True)
+        self.service = ResourceImportService({'user_id': 'importer', 'role': 'admin'})
+        for number in range(4):
+            EmployeeFactory(employee_number=f'EMP93{number:02d}')
+        # Every third row is invalid, so errors fall in several chunks
+        self.rows = [
+            f'EMP93{n % 4:02d},{"pilot" if n % 3 == 0 else "developer"},2026-{n % 12 + 1:02d}-0{n % 4 + 1},2027-01-01,,'
+            for n in range(1, 13)
+        ]
+
+    def _import(self):
+        upload = _csv('employeeId,idleType,idleFromDate,idleToDate,skills,salesPrice', *self.rows)
+        return self.service.import_resources(upload, {'rollback_on_error': False, 'batch_size': 5}).data
+
+    def test_validate_chunk_matches_rows(self):
+        """Test chunks are validated in order with explicit lookups."""
+        lookups = load_lookups(['EMP9300'])
+
+        results = validate_chunk([
+            {'employee': 'EMP9300', 'resource_type': 'developer'},
+            {'employee': 'EMP0404', 'resource_type': 'developer'},
+        ], lookups)
+
+        self.assertEqual([bool(errors) for _, errors in results], [False, True])
+
+    def test_parallel_validation_matches_serial(self):
+        """Test a pool of workers gives the same outcome, errors in row order."""
+        # Given: the same file validated in-process
+        with override_settings(RESOURCE_IMPORT={'UPLOAD_DIR': self.upload_dir, 'VALIDATION_WORKERS': 1}):
+            serial = self._import()
+        IdleResource.objects.filter(created_by='importer').delete()
+
+        # When: validated by two worker processes in chunks of three rows
+        with override_settings(RESOURCE_IMPORT={
+            'UPLOAD_DIR': self.upload_dir, 'VALIDATION_WORKERS': 2, 'VALIDATION_CHUNK_SIZE': 3, 'PARALLEL_MIN_ROWS': 0
+        }):
+            parallel = self._import()
+
+        # Then
+        self.assertEqual(parallel['errors'], serial['errors'])
+        self.assertEqual([error['row'] for error in parallel['errors']], [3, 6, 9, 12])
+        self.assertEqual((parallel['created'], parallel['invalid_rows']), (serial['created'], 4))
+
+
+class ResumableImportTest(TestCase):
+    """
+    Test Cases for checkpointed imports and resume_import.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.upload_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.upload_dir, ignore_errors=True)
+        settings_override = override_settings(RESOURCE_IMPORT={'UPLOAD_DIR': self.upload_dir, 'VALIDATION_WORKERS': 1})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.service = ResourceImportService({'user_id': 'importer', 'role': 'admin'})
+        self.alice = EmployeeFactory(employee_number='EMP9501')
+        self.rows = [f'EMP9501,developer,2026-0{month}-01,2026-0{month}-20,,' for month in range(1, 6)]
+
+    def _crash(self, *rows, when):
+        """Import until the checkpoint matching when() is about to commit."""
+        original = ResourceImportService._save_checkpoint
+
+        def save_checkpoint(session, checkpoint, **updates):
+            if when(checkpoint):
+                raise RuntimeError('worker killed')
+            return original(session, checkpoint, **updates)
+
+        upload = _csv('employeeId,idleType,idleFromDate,idleToDate,skills,salesPrice', *(rows or self.rows))
+        with patch.object(ResourceImportService, '_save_checkpoint', staticmethod(save_checkpoint)):
+            with self.assertRaises(RuntimeError):
+                self.service.import_resources(upload, {'batch_size': 2})
+        return ImportSession.objects.get(created_by='importer')
+
+    def test_import_resumes_after_crash_while_staging(self):
+        """Test staging continues after the last committed batch."""
+        # Given: the worker dies while committing the second batch
+        session = self._crash(when=lambda checkpoint: checkpoint['phase'] == 'stage' and checkpoint['record_index'] > 2)
+        self.assertEqual(session.status, 'failed')
+        self.assertEqual(session.metadata['checkpoint']['record_index'], 2)
+        self.assertEqual(session.staging_records.count(), 2)
+
+        # When
+        result = self.service.resume_import(session.pk).data
+
+        # Then: every row staged and created exactly once
+        self.assertEqual((result['status'], result['total_rows'], result['created']), ('completed', 5, 5))
+        self.assertEqual(IdleResource.objects.filter(employee=self.alice).count(), 5)
+
+    def test_import_resumes_after_crash_while_merging(self):
+        """Test merged chunks are not merged again."""
+        session = self._crash(when=lambda checkpoint: checkpoint['phase'] == 'merge' and checkpoint['record_index'] > 2)
+        self.assertEqual(IdleResource.objects.filter(employee=self.alice).count(), 2)
+
+        result = ResourceImportService({'user_id': 'system'}).resume_import(session.pk).data
+
+        self.assertEqual((result['created'], result['processed_rows']), (5, 5))
+        resources = IdleResource.objects.filter(employee=self.alice)
+        self.assertEqual(resources.count(), 5)
+        self.assertEqual(set(resources.values_list('created_by', flat=True)), {'importer'})
+
+    def test_changed_file_is_not_resumed(self):
+        """Test the content hash rejects a different file under the stored path."""
+        session = self._crash(when=lambda checkpoint: checkpoint['phase'] == 'stage' and checkpoint['record_index'] > 2)
+        with open(session.file_path, 'w') as handle:
+            handle.write('employeeId,idleType\nEMP9501,tester\nEMP9501,tester\nEMP9501,tester\n')
+
+        with self.assertRaises(ValidationException):
+            self.service.resume_import(session.pk)
+
+    def test_running_import_needs_force_until_stale(self):
+        """Test a recently checkpointed 'processing' import is not taken over."""
+        session = self._crash(when=lambda checkpoint: checkpoint['phase'] == 'validate')
+        ImportSession.objects.filter(pk=session.pk).update(status='processing')
+
+        with self.assertRaises(ValidationException):
+            self.service.resume_import(session.pk)
+        with override_settings(RESOURCE_IMPORT={'UPLOAD_DIR': self.upload_dir, 'VALIDATION_WORKERS': 1, 'STALE_AFTER': 0}):
+            result = self.service.resume_import(session.pk).data
+        self.assertEqual(result['created'], 5)
+
+    def test_finished_import_cannot_be_resumed(self):
+        """Test completed imports and unknown ids are rejected."""
+        result = self.service.import_resources(
+            _csv('employeeId,idleType', 'EMP9501,developer'), {'import_mode': 'import'}
+        ).data
+
+        with self.assertRaises(ValidationException):
+            self.service.resume_import(result['import_id'])
+        with self.assertRaises(DataNotFoundException):
+            self.service.resume_import('00000000-0000-0000-0000-000000000000')
+        response = APIClient().post(f"/api/v1/idle-resources/import/{result['import_id']}/resume", {}, format='json')
+        self.assertEqual(response.status_code, 409)
+
+    def test_rolled_back_import_keeps_no_staging(self):
+        """Test an import failed by rollbackOnError is finished: no staging rows, file or resume."""
+        result = self.service.import_resources(
+            _csv('employeeId,idleType', 'EMP9501,developer', 'EMP9501,pilot'), {'rollback_on_error': True}
+        ).data
+
+        session = ImportSession.objects.get(pk=result['import_id'])
+        self.assertEqual(session.status, 'failed')
+        self.assertFalse(ImportStaging.objects.filter(session=session).exists())
+        self.assertEqual(os.listdir(self.upload_dir), [])
+        with self.assertRaises(ValidationException):
+            self.service.resume_import(session.pk)
+
+    def test_command_resumes_interrupted_imports(self):
+        """Test resume_imports picks up failed imports by default."""
+        session = self._crash(when=lambda checkpoint: checkpoint['phase'] == 'resolve')
+        out = io.StringIO()
+
+        call_command('resume_imports', stdout=out)
+
+        session.refresh_from_db()
+        self.assertEqual(session.status, 'completed')
+        self.assertIn('Resumed 1 imports', out.getvalue())
+        self.assertEqual(IdleResource.objects.filter(employee=self.alice).count(), 5)
+
+
+class ImportAPITest(TestCase):
+    """
+    API Test Cases for POST /api/v1/idle-resources/import.
+    """
+
+    def test_api_imports_uploaded_file(self):
+        """Test a multipart upload is imported and summarized."""
+        EmployeeFactory(employee_number='EMP9101')
+        upload = _csv('Employee No,Type,Start Date,End Date', 'EMP9101,tester,2026-02-01,2026-02-28')
+
+        response = APIClient().post('/api/v1/idle-resources/import', {
+            'file': upload, 'importMode': 'import', 'batchSize': 50
+        }, format='multipart')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'completed')
+        self.assertEqual(response.data['importSummary']['created'], 1)
+
+    def test_api_rejects_file_without_required_columns(self):
+        """Test a file missing required columns is a 400."""
+        response = APIClient().post('/api/v1/idle-resources/import', {
+            'file': _csv('Name,Skills', 'Alice,Python')
+        }, format='multipart')
+
+        self.assertEqual(response.status_code, 400)
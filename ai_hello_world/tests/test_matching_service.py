@@ -0,0 +1,192 @@
+"""
+Test Suite for the vectorized resource Matching Service.
+
+Based on:
+- DAO Specifications: DD/MDE-03/04-dao/DAO-MDE-03-01_v0.1.md
+"""
+
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+import numpy as np
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from services.exceptions import ValidationException
+from services.resource_management.matching_service import (
+    DEFAULT_WEIGHTS,
+    CandidateFeatures,
+    MatchingService,
+    score_candidates,
+)
+from tests.factories import IdleResourceFactory, ResourceAvailabilityFactory
+
+
+def _day(n):
+    return datetime(2026, 1, 1, tzinfo=dt_timezone.utc) + timedelta(days=n)
+
+
+class MatchingServiceTest(TestCase):
+    """
+    Test Cases for MatchingService.find_matches.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.service = MatchingService({'role': 'admin'})
+        common = {'status': 'available', 'availability_start': _day(0), 'availability_end': _day(90)}
+        self.expert = IdleResourceFactory(
+            skills=['Python', 'Django'], experience_years=8, hourly_rate=Decimal('50.00'), **common
+        )
+        self.partial = IdleResourceFactory(
+            skills=['Python'], experience_years=2, hourly_rate=Decimal('40.00'), **common
+        )
+        self.expensive = IdleResourceFactory(
+            skills=['Python', 'Django'], experience_years=10, hourly_rate=Decimal('150.00'), **common
+        )
+        self.allocated = IdleResourceFactory(
+            skills=['Python', 'Django'], experience_years=8, hourly_rate=Decimal('50.00'), **common
+        )
+        ResourceAvailabilityFactory(
+            resource=self.allocated, is_allocated=True, start_date=_day(0), end_date=_day(90)
+        )
+        self.demand = {
+            'required_skills': ['python', 'Django'],
+            'min_experience': 5,
+            'max_hourly_rate': Decimal('100.00'),
+            'start_date': _day(10),
+            'end_date': _day(40),
+        }
+
+    def test_ranks_best_match_first_with_breakdown(self):
+        """Test the full-skill, experienced candidate ranks first and is explained."""
+        matches = self.service.find_matches(self.demand).data
+
+        self.assertEqual([m['resource_id'] for m in matches], [str(self.expert.id), str(self.partial.id)])
+        best = matches[0]
+        self.assertEqual(best['matched_skills'], ['python', 'Django'])
+        self.assertEqual(best['breakdown']['skills']['score'], 1.0)
+        self.assertEqual(best['breakdown']['availability']['score'], 1.0)
+        self.assertEqual(matches[1]['missing_skills'], ['Django'])
+        self.assertAlmostEqual(sum(c['weight'] for c in best['breakdown'].values()), 1.0, places=3)
+
+    def test_hard_constraints_exclude_candidates(self):
+        """Test over-budget and fully allocated resources are not returned."""
+        ids = {m['resource_id'] for m in self.service.find_matches(self.demand).data}
+
+        self.assertNotIn(str(self.expensive.id), ids)
+        self.assertNotIn(str(self.allocated.id), ids)
+
+    def test_zero_budget_excludes_every_paid_candidate(self):
+        """Test a max_hourly_rate of 0 is a budget, not a missing constraint."""
+        unpaid = IdleResourceFactory(
+            status='available', skills=['Python', 'Django'], experience_years=5,
+            hourly_rate=Decimal('0.00'), availability_start=_day(0), availability_end=_day(90)
+        )
+
+        matches = self.service.find_matches({**self.demand, 'max_hourly_rate': Decimal('0.00')}).data
+
+        self.assertEqual([m['resource_id'] for m in matches], [str(unpaid.id)])
+        self.assertEqual(matches[0]['breakdown']['rate']['score'], 1.0)
+
+    def test_features_follow_writes(self):
+        """Test a new resource is considered after it is saved."""
+        self.service.find_matches(self.demand)
+        newcomer = IdleResourceFactory(
+            status='available', skills=['Python', 'Django'], experience_years=5,
+            hourly_rate=Decimal('30.00'), availability_start=_day(0), availability_end=_day(90)
+        )
+
+        ids = [m['resource_id'] for m in self.service.find_matches(self.demand).data]
+
+        self.assertIn(str(newcomer.id), ids)
+
+    def test_invalid_weights_are_rejected(self):
+        """Test unknown score components are rejected."""
+        with self.assertRaises(ValidationException):
+            self.service.find_matches(self.demand, weights={'charisma': 1})
+
+    def test_overlapping_allocations_are_counted_once(self):
+        """Test availability subtracts the union of a resource's allocations."""
+        features = CandidateFeatures(
+            resource_ids=np.array(['a', 'b'], dtype=object),
+            experience=np.array([5.0, 5.0]),
+            rate=np.array([50.0, 50.0]),
+            window_start=np.full(2, _day(0).timestamp()),
+            window_end=np.full(2, _day(100).timestamp()),
+            token_rows={},
+            # a: days 10-20 and 15-25 overlap (15 days busy); b: days 30-40
+            alloc_rows=np.array([0, 0, 1]),
+            alloc_start=np.array([_day(10).timestamp(), _day(15).timestamp(), _day(30).timestamp()]),
+            alloc_end=np.array([_day(20).timestamp(), _day(25).timestamp(), _day(40).timestamp()]),
+            location_mask=np.zeros(2, dtype=np.uint8),
+        )
+        demand = {'skill_tokens': [], 'start': _day(0).timestamp(), 'end': _day(50).timestamp()}
+
+        scored = score_candidates(features, demand, DEFAULT_WEIGHTS)
+
+        np.testing.assert_allclose(scored['availability'], [35 / 50, 40 / 50])
+
+    def test_scoring_50k_candidates_is_fast(self):
+        """Test vectorized scoring of 50k candidates stays well under a second."""
+        count = 50_000
+        rng = np.random.default_rng(7)
+        features = CandidateFeatures(
+            resource_ids=np.array([str(i) for i in range(count)], dtype=object),
+            experience=rng.integers(0, 15, count).astype(float),
+            rate=rng.uniform(20, 200, count),
+            window_start=np.full(count, _day(0).timestamp()),
+            window_end=np.full(count, _day(120).timestamp()),
+            token_rows={token: rng.choice(count, count // 4, replace=False) for token in ('python', 'django', 'java')},
+            alloc_rows=rng.integers(0, count, count // 2),
+            alloc_start=np.full(count // 2, _day(20).timestamp()),
+            alloc_end=np.full(count // 2, _day(30).timestamp()),
+            location_mask=rng.integers(0, 16, count).astype(np.uint8),
+        )
+        demand = {
+            'skill_tokens': ['python', 'django'], 'start': _day(10).timestamp(), 'end': _day(40).timestamp(),
+            'min_experience': 5, 'max_hourly_rate': 100.0, 'location': 'remote',
+        }
+
+        started = time.perf_counter()
+        scored = score_candidates(features, demand, DEFAULT_WEIGHTS)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(scored['total'].shape, (count,))
+        self.assertLess(elapsed, 0.5)
+
+
+class MatchResourcesAPITest(TestCase):
+    """
+    API Test Cases for POST /api/v1/idle-resources/match.
+    """
+
+    def test_api_returns_ranked_matches(self):
+        """Test the endpoint returns camelCase matches with employee names."""
+        resource = IdleResourceFactory(
+            status='available', skills=['Go'], availability_start=_day(0), availability_end=_day(60)
+        )
+
+        response = APIClient().post('/api/v1/idle-resources/match', {
+            'requiredSkills': ['go'],
+            'startDate': _day(5).isoformat(),
+            'endDate': _day(25).isoformat(),
+            'limit': 5
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['matches'][0]['resourceId'], str(resource.id))
+        self.assertEqual(response.data['matches'][0]['matchedSkills'], ['go'])
+        self.assertIsNotNone(response.data['matches'][0]['employeeName'])
+
+    def test_api_rejects_all_zero_weights(self):
+        """Test weights that sum to zero are a 400, not a server error."""
+        response = APIClient().post('/api/v1/idle-resources/match', {
+            'startDate': _day(5).isoformat(),
+            'endDate': _day(25).isoformat(),
+            'weights': {name: 0 for name in DEFAULT_WEIGHTS}
+        }, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('weight', response.data['details']['non_field_errors'][0])
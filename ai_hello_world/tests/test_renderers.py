@@ -0,0 +1,87 @@
+"""
+Test Suite for the orjson-backed API renderer.
+"""
+
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from common.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(TestCase):
+    """
+    Test Cases for ORJSONRenderer output compatibility with JSONRenderer.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        self.renderer = ORJSONRenderer()
+        self.payload = {
+            'id': uuid.uuid4(),
+            'salesPrice': Decimal('1250.50'),
+            'updatedAt': datetime(2026, 3, 1, 8, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            'idleFromDate': date(2026, 1, 15),
+            'duration': timedelta(hours=2),
+            'label': gettext_lazy('Available'),
+            'tags': {'python'},
+            'name': 'Nguyễn Văn A',
+            'nested': [{'count': 3, 'ratio': 0.5, 'empty': None}],
+        }
+
+    def test_output_matches_json_renderer(self):
+        """Test UUID, Decimal, datetime and lazy strings encode like JSONRenderer."""
+        rendered = self.renderer.render(self.payload)
+
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(self.payload)))
+        self.assertIn(b'"2026-03-01T08:30:15.123456Z"', rendered)
+        self.assertIn('Nguyễn'.encode('utf-8'), rendered)
+
+    def test_non_string_keys_and_line_separators(self):
+        """Test UUID keys are allowed and U+2028 is escaped as JSONRenderer does."""
+        key = uuid.uuid4()
+        rendered = self.renderer.render({key: 'a\u2028b'})
+
+        self.assertEqual(rendered, f'{{"{key}":"a\\u2028b"}}'.encode('utf-8'))
+
+    def test_indent_and_empty_body(self):
+        """Test indent from the Accept header and None rendering to an empty body."""
+        rendered = self.renderer.render({'a': 1}, 'application/json; indent=4')
+
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+        self.assertEqual(self.renderer.render(None), b'')
+
+    def test_falls_back_for_unsupported_values(self):
+        """Test integers beyond 64 bits go through the stdlib encoder."""
+        self.assertEqual(self.renderer.render({'big': 2 ** 70}), b'{"big":1180591620717411303424}')
+
+    def test_non_finite_floats_are_rejected_like_json_renderer(self):
+        """Test NaN and Infinity raise instead of being written as null."""
+        for value in (float('nan'), float('inf'), Decimal('NaN'), [None, float('-inf')]):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render({'nested': [{'ratio': value}]})
+                with self.assertRaises(ValueError):
+                    self.renderer.render({'nested': [{'ratio': value}]})
+
+    def test_api_uses_renderer_by_default(self):
+        """Test /api/v1/ responses are rendered by ORJSONRenderer."""
+        response = APIClient().get('/api/v1/idle-resources')
+
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+    def test_benchmark_command_runs(self):
+        """Test the renderer benchmark reports one line per payload size."""
+        stdout = mock.MagicMock()
+        call_command('benchmark_renderers', rows=[10], repeat=1, stdout=stdout)
+
+        self.assertEqual(stdout.write.call_count, 2)
@@ -0,0 +1,571 @@
+"""
+API Test Suite for Resource Management Endpoints.
+
+Exercises the idle resource endpoints end to end through the DRF test
+client, using the same factories as the model tests.
+
+Based on:
+- API Designs: DD/MDE-03/02-api/
+- DAO Specifications: DD/MDE-03/04-dao/
+"""
+
+import io
+import json
+import time
+from types import SimpleNamespace
+from datetime import timedelta
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from resource_management import facets
+from resource_management.models import IdleResource, IdleResourceReadModel
+from tests.factories import DepartmentFactory, IdleResourceFactory, ResourceAvailabilityFactory
+
+
+class IdleResourceListAPITest(TestCase):
+    """
+    API Test Cases for GET /api/v1/idle-resources (API-MDE-03-01).
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.url = '/api/v1/idle-resources'
+        now = timezone.now()
+        self.resources = [
+            IdleResourceFactory(availability_start=now + timedelta(days=i))
+            for i in range(5)
+        ]
+    
+    def test_offset_mode_returns_real_records(self):
+        """Test default offset mode returns database rows with totals."""
+        response = self.client.get(self.url, {'pageSize': 2})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['totalCount'], 5)
+        self.assertEqual(len(response.data['records']), 2)
+        self.assertEqual(response.data['pageInfo']['totalPages'], 3)
+    
+    def test_urgent_only_and_idle_month_sort(self):
+        """Test urgentOnly filters on the stored flag and idleMM sorts on the stored column."""
+        now = timezone.now()
+        long_idle = IdleResourceFactory(
+            status='available', availability_start=now - timedelta(days=150), availability_end=now + timedelta(days=90)
+        )
+        
+        response = self.client.get(self.url, {'urgentOnly': 'true'})
+        self.assertEqual([r['id'] for r in response.data['records']], [str(long_idle.id)])
+        self.assertTrue(response.data['records'][0]['isUrgent'])
+        
+        response = self.client.get(self.url, {'sortBy': 'idleMM', 'sortOrder': 'desc', 'pageSize': 1})
+        self.assertEqual(response.data['records'][0]['id'], str(long_idle.id))
+    
+    def test_cursor_mode_returns_opaque_cursors(self):
+        """Test cursor mode pages forward with nextCursor and omits totals."""
+        response = self.client.get(self.url, {
+            'pageSize': 2, 'paginationMode': 'cursor', 'sortBy': 'idleFrom', 'sortOrder': 'asc'
+        })
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['totalCount'])
+        self.assertEqual(
+            [r['id'] for r in response.data['records']],
+            [str(r.id) for r in self.resources[:2]]
+        )
+        
+        next_page = self.client.get(self.url, {
+            'pageSize': 2, 'sortBy': 'idleFrom', 'sortOrder': 'asc',
+            'cursor': response.data['pageInfo']['nextCursor']
+        })
+        self.assertEqual(
+            [r['id'] for r in next_page.data['records']],
+            [str(r.id) for r in self.resources[2:4]]
+        )
+        self.assertTrue(next_page.data['pageInfo']['hasPreviousPage'])
+    
+    def test_invalid_cursor_returns_400(self):
+        """Test a tampered cursor is rejected as a bad request."""
+        response = self.client.get(self.url, {'cursor': 'garbage'})
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('cursor', response.data['details'])
+    
+    def test_include_columns_projects_requested_fields(self):
+        """Test includeColumns returns only those fields, with the same values as full records."""
+        columns = ['id', 'employeeName', 'departmentId', 'idleMM', 'salesPrice']
+        full = self.client.get(self.url, {'pageSize': 5})
+        projected = self.client.get(self.url, {'pageSize': 5, 'includeColumns': ','.join(columns)})
+        
+        self.assertEqual(projected.status_code, 200)
+        self.assertEqual(
+            projected.data['records'],
+            [{column: record[column] for column in columns} for record in full.data['records']]
+        )
+    
+    def test_include_columns_skips_unneeded_joins(self):
+        """Test a projection without employee columns does not join employees."""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {
+                'includeColumns': ['id', 'status'], 'includeAggregations': 'false'
+            })
+        
+        page_query = queries.captured_queries[-1]['sql']
+        self.assertNotIn('JOIN', page_query)
+        self.assertNotIn('"skills"', page_query)
+    
+    def test_include_columns_with_cursor_mode(self):
+        """Test projected rows still produce working cursors."""
+        params = {
+            'pageSize': 2, 'paginationMode': 'cursor', 'sortBy': 'idleFrom',
+            'sortOrder': 'asc', 'includeColumns': 'id'
+        }
+        first = self.client.get(self.url, params)
+        second = self.client.get(self.url, {**params, 'cursor': first.data['pageInfo']['nextCursor']})
+        
+        self.assertEqual(first.data['records'], [{'id': str(r.id)} for r in self.resources[:2]])
+        self.assertEqual(second.data['records'], [{'id': str(r.id)} for r in self.resources[2:4]])
+    
+    def test_unknown_include_column_returns_400(self):
+        """Test unknown column names are rejected."""
+        response = self.client.get(self.url, {'includeColumns': 'id,passwordHash'})
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('includeColumns', response.data['details'])
+    
+    def test_non_uuid_department_returns_400(self):
+        """Test a master-data style department code is a parameter error, not a 500."""
+        response = self.client.get(self.url, {'departmentId': 'HR'})
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('departmentId', response.data['details'])
+    
+    def test_count_mode_flags_exactness(self):
+        """Test pageInfo.totalCountExact follows countMode."""
+        exact = self.client.get(self.url, {'pageSize': 2})
+        skipped = self.client.get(self.url, {'pageSize': 2, 'countMode': 'none'})
+        
+        self.assertTrue(exact.data['pageInfo']['totalCountExact'])
+        self.assertFalse(skipped.data['pageInfo']['totalCountExact'])
+        self.assertIsNone(skipped.data['totalCount'])
+        self.assertIsNone(skipped.data['pageInfo']['totalPages'])
+        self.assertTrue(skipped.data['pageInfo']['hasNextPage'])
+
+
+class ConditionalGetAPITest(TestCase):
+    """
+    Test Cases for ETag / Last-Modified handling on detail, list and master data.
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.resource = IdleResourceFactory(status='available')
+        self.detail_url = f'/api/v1/idle-resources/{self.resource.id}'
+    
+    def test_detail_returns_record_with_validators(self):
+        """Test the detail endpoint serves the stored record with ETag and Last-Modified."""
+        response = self.client.get(self.detail_url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['version'], self.resource.version)
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        self.assertIn('Last-Modified', response)
+    
+    def test_detail_if_none_match_returns_304_in_one_query(self):
+        """Test a matching If-None-Match is answered from the version alone."""
+        etag = self.client.get(self.detail_url)['ETag']
+        
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+    
+    def test_detail_etag_changes_with_version(self):
+        """Test saving the record invalidates the previous ETag."""
+        etag = self.client.get(self.detail_url)['ETag']
+        self.resource.experience_years = 12
+        self.resource.save()
+        
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+    
+    def test_detail_unknown_id_returns_404(self):
+        """Test unknown resources are reported as not found."""
+        self.resource.delete()
+        
+        self.assertEqual(self.client.get(self.detail_url).status_code, 404)
+    
+    def test_list_if_none_match_returns_304_in_one_query(self):
+        """Test an unchanged list costs one aggregate query."""
+        etag = self.client.get('/api/v1/idle-resources', {'pageSize': 5})['ETag']
+        
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/v1/idle-resources', {'pageSize': 5}, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, 304)
+    
+    def test_list_etag_follows_data_and_parameters(self):
+        """Test list ETags change with writes under the filter and with query parameters."""
+        etag = self.client.get('/api/v1/idle-resources')['ETag']
+        
+        self.assertNotEqual(self.client.get('/api/v1/idle-resources', {'pageSize': 5})['ETag'], etag)
+        
+        IdleResourceFactory()
+        response = self.client.get('/api/v1/idle-resources', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+    
+    def test_list_has_no_last_modified(self):
+        """Test the list relies on its ETag: a hard delete does not move max(updated_at) forward."""
+        response = self.client.get('/api/v1/idle-resources')
+        self.assertNotIn('Last-Modified', response)
+        etag = response['ETag']
+        
+        IdleResourceFactory(status='available').delete()
+        self.resource.delete()
+        
+        self.assertEqual(self.client.get('/api/v1/idle-resources', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self.assertEqual(
+            self.client.get('/api/v1/idle-resources', HTTP_IF_MODIFIED_SINCE=http_date(time.time())).status_code, 200
+        )
+    
+    def test_employee_rename_invalidates_list_and_detail(self):
+        """Test a change that leaves the resource's version alone still changes both ETags."""
+        list_etag = self.client.get('/api/v1/idle-resources')['ETag']
+        detail_etag = self.client.get(self.detail_url)['ETag']
+        
+        employee = self.resource.employee
+        employee.first_name = 'Renamed'
+        employee.save()
+        
+        listed = self.client.get('/api/v1/idle-resources', HTTP_IF_NONE_MATCH=list_etag)
+        detail = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual((listed.status_code, detail.status_code), (200, 200))
+        self.assertTrue(detail.data['employee_name'].startswith('Renamed'))
+    
+    def test_idle_month_recompute_invalidates_list(self):
+        """Test the projection refresh of refresh_idle_metrics changes the list ETag."""
+        etag = self.client.get('/api/v1/idle-resources')['ETag']
+        
+        call_command('refresh_idle_metrics', '--recompute-idle-months', stdout=io.StringIO())
+        
+        self.assertEqual(self.client.get('/api/v1/idle-resources', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+    
+    def test_detail_includes_audit_and_related_data(self):
+        """Test include_audit (default) and include_related add their sections."""
+        self.resource.experience_years = 7
+        self.resource.save()
+        
+        response = self.client.get(self.detail_url, {'include_related': 'true'})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['audit_info']['audit_trail'][0]['changes']['experience_years']['new'], 7)
+        self.assertEqual(response.data['related_data']['employee']['id'], str(self.resource.employee_id))
+        self.assertNotIn('audit_info', self.client.get(self.detail_url, {'include_audit': 'false'}).data)
+    
+    def test_master_data_if_none_match(self):
+        """Test master data honors If-None-Match until departments change."""
+        etag = self.client.get('/api/v1/master-data')['ETag']
+        
+        self.assertEqual(self.client.get('/api/v1/master-data', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        
+        department = self.resource.employee.department
+        department.department_name = 'Renamed'
+        department.save()
+        self.assertEqual(self.client.get('/api/v1/master-data', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class IdleResourceStreamAPITest(TestCase):
+    """
+    API Test Cases for GET /api/v1/idle-resources/stream.
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.url = '/api/v1/idle-resources/stream'
+        now = timezone.now()
+        self.resources = [
+            IdleResourceFactory(availability_start=now + timedelta(days=i))
+            for i in range(5)
+        ]
+    
+    def _lines(self, response):
+        # split('\n') rather than splitlines(): the json-seq record separator counts as a line break there
+        return b''.join(response.streaming_content).decode('utf-8').split('\n')[:-1]
+    
+    def test_streams_every_record_as_ndjson(self):
+        """Test all matching rows are streamed one JSON object per line, in order."""
+        response = self.client.get(self.url, {'sortBy': 'idleFrom', 'sortOrder': 'asc', 'chunkSize': 100})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        records = [json.loads(line) for line in self._lines(response)]
+        self.assertEqual([r['id'] for r in records], [str(r.id) for r in self.resources])
+        self.assertIn('employeeName', records[0])
+    
+    def test_stream_with_projection_and_json_seq(self):
+        """Test json-seq framing and includeColumns projection."""
+        response = self.client.get(self.url, {'streamFormat': 'json-seq', 'includeColumns': 'id,status'})
+        
+        lines = self._lines(response)
+        self.assertEqual(response['Content-Type'], 'application/json-seq')
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(all(line.startswith('\x1e') for line in lines))
+        self.assertEqual(set(json.loads(lines[0][1:])), {'id', 'status'})
+    
+    def test_stream_applies_list_filters(self):
+        """Test list filters narrow the stream."""
+        target = self.resources[0]
+        response = self.client.get(self.url, {'idleType': target.resource_type, 'includeColumns': 'idleType'})
+        
+        values = {json.loads(line)['idleType'] for line in self._lines(response)}
+        self.assertEqual(values, {target.resource_type})
+    
+    def test_non_uuid_department_returns_400(self):
+        """Test a malformed departmentId is rejected before streaming starts."""
+        response = self.client.get(self.url, {'departmentId': 'HR'})
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('departmentId', response.data['details'])
+
+
+class IdleResourceSearchAPITest(TestCase):
+    """
+    API Test Cases for full-text search (API-MDE-03-01 searchQuery, API-MDE-03-09 query).
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.duc = IdleResourceFactory(
+            employee__first_name='Đức', employee__last_name='Nguyễn',
+            employee__position='Backend Engineer', skills=['Java', 'Spring Boot']
+        )
+        self.lan = IdleResourceFactory(
+            employee__first_name='Lan', employee__last_name='Trần',
+            employee__position='Tester', skills=['Selenium', 'JavaScript']
+        )
+    
+    def test_list_search_folds_vietnamese_diacritics(self):
+        """Test searchQuery matches names regardless of diacritics and đ."""
+        response = self.client.get('/api/v1/idle-resources', {'searchQuery': 'duc nguyen'})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r['id'] for r in response.data['records']], [str(self.duc.id)])
+    
+    def test_list_search_prefix_matching(self):
+        """Test partial words match as prefixes."""
+        response = self.client.get('/api/v1/idle-resources', {'searchQuery': 'sele'})
+        
+        self.assertEqual([r['id'] for r in response.data['records']], [str(self.lan.id)])
+    
+    def test_advanced_search_ranks_results(self):
+        """Test advanced search orders matches by relevance."""
+        response = self.client.post('/api/v1/idle-resources/search', {'query': 'java'}, format='json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['totalCount'], 2)
+        scores = [r['searchScore'] for r in response.data['results']]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+    
+    def test_advanced_search_without_count(self):
+        """Test includeCount=false (countMode none) omits the total."""
+        response = self.client.post(
+            '/api/v1/idle-resources/search', {'query': 'java', 'includeCount': False}, format='json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['totalCount'])
+        self.assertFalse(response.data['pageInfo']['totalCountExact'])
+        self.assertEqual(len(response.data['results']), 2)
+    
+    def test_search_index_follows_employee_changes(self):
+        """Test renaming an employee re-indexes their resources."""
+        employee = self.lan.employee
+        employee.first_name = 'Hương'
+        employee.save()
+        
+        response = self.client.get('/api/v1/idle-resources', {'searchQuery': 'huong'})
+        
+        self.assertEqual([r['id'] for r in response.data['records']], [str(self.lan.id)])
+
+
+class IdleResourceFacetTest(TestCase):
+    """
+    Test Cases for facet aggregation (API-MDE-03-01 aggregations, API-MDE-03-09 facets).
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.dev_a = IdleResourceFactory(resource_type='developer', status='available')
+        self.dev_b = IdleResourceFactory(
+            resource_type='developer', status='allocated',
+            employee__department=self.dev_a.employee.department
+        )
+        self.tester = IdleResourceFactory(resource_type='tester', status='available')
+        ResourceAvailabilityFactory(resource=self.dev_a, location_constraints='remote')
+        ResourceAvailabilityFactory(resource=self.dev_a, location_constraints='remote')
+        ResourceAvailabilityFactory(resource=self.tester, location_constraints='onsite')
+    
+    def test_compute_facets_single_query(self):
+        """Test all facets come back from one grouped round-trip."""
+        queryset = IdleResource.build_filtered_queryset({})
+        
+        with self.assertNumQueries(1):
+            result = facets.compute_facets(
+                queryset, ['departmentId', 'idleType', 'status', 'jobRank', 'location']
+            )
+        
+        self.assertEqual(result['idleType'], {'developer': 2, 'tester': 1})
+        self.assertEqual(result['status'], {'available': 2, 'allocated': 1})
+        self.assertEqual(
+            result['departmentId'][str(self.dev_a.employee.department_id)], 2
+        )
+        # Two periods for one resource still count the resource once
+        self.assertEqual(result['location'], {'onsite': 1, 'remote': 1})
+    
+    def test_compute_facets_on_read_model(self):
+        """Test the projection yields the same facets, location included, in one query."""
+        queryset = IdleResourceReadModel.build_filtered_queryset({})
+        
+        with self.assertNumQueries(1):
+            result = facets.compute_facets(
+                queryset, ['departmentId', 'idleType', 'status', 'jobRank', 'location']
+            )
+        
+        self.assertEqual(result, facets.compute_facets(
+            IdleResource.build_filtered_queryset({}),
+            ['departmentId', 'idleType', 'status', 'jobRank', 'location']
+        ))
+    
+    def test_list_aggregations_follow_filters(self):
+        """Test list aggregations reflect the current filter set."""
+        response = self.client.get('/api/v1/idle-resources', {'idleType': 'developer'})
+        
+        self.assertEqual(response.data['aggregations']['byIdleType'], {'developer': 2})
+        self.assertEqual(sum(response.data['aggregations']['byDepartment'].values()), 2)
+    
+    def test_advanced_search_returns_requested_facets(self):
+        """Test advanced search returns only the facets asked for."""
+        response = self.client.post(
+            '/api/v1/idle-resources/search', {'facets': ['status']}, format='json'
+        )
+        
+        self.assertEqual(response.data['facets'], {'status': {'available': 2, 'allocated': 1}})
+        self.assertEqual(response.data['aggregations']['byIdleType'], {'developer': 2, 'tester': 1})
+    
+    def test_facets_respect_search_query(self):
+        """Test facet counts are computed over full-text matches only."""
+        self.tester.skills = ['Selenium']
+        self.tester.save()
+        
+        response = self.client.post(
+            '/api/v1/idle-resources/search', {'query': 'selenium', 'facets': ['idleType']}, format='json'
+        )
+        
+        self.assertEqual(response.data['facets'], {'idleType': {'tester': 1}})
+
+
+class DepartmentScopedSearchAPITest(TestCase):
+    """
+    API Test Cases for department scoping of POST /api/v1/idle-resources/search.
+    """
+    
+    def _search_as(self, department):
+        client = APIClient()
+        client.force_authenticate(user=SimpleNamespace(
+            role='user', department_id=str(department.department_id), is_authenticated=True
+        ))
+        response = client.post('/api/v1/idle-resources/search', {'countMode': 'exact'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        return response.data
+    
+    def test_exact_count_is_not_shared_between_departments(self):
+        """Test each department gets the count of its own rows, not a cached one of another scope."""
+        first, second = DepartmentFactory(), DepartmentFactory()
+        for _ in range(5):
+            IdleResourceFactory(employee__department=first)
+        for _ in range(2):
+            IdleResourceFactory(employee__department=second)
+        
+        self.assertEqual(self._search_as(first)['totalCount'], 5)
+        data = self._search_as(second)
+        
+        self.assertEqual((data['totalCount'], len(data['results'])), (2, 2))
+
+
+class BulkUpdateAPITest(TestCase):
+    """
+    API Test Cases for PATCH /api/v1/idle-resources/bulk.
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.client = APIClient()
+        self.resources = [IdleResourceFactory(status='available') for _ in range(3)]
+    
+    def test_bulk_update_applies_versioned_items(self):
+        """Test every item is applied and returned with its new version."""
+        response = self.client.patch('/api/v1/idle-resources/bulk', {
+            'updates': [
+                {'id': str(resource.id), 'version': resource.version, 'data': {'idle_type': 'tester'}}
+                for resource in self.resources
+            ]
+        }, format='json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['summary']['successful'], 3)
+        first = response.data['results'][0]
+        self.assertEqual(first['changed_fields'], ['resource_type'])
+        self.assertEqual(first['updated_record']['idle_type'], 'tester')
+        self.assertEqual(first['updated_record']['version'], self.resources[0].version + 1)
+    
+    def test_conflict_rolls_back_whole_request(self):
+        """Test one stale version fails every item under rollback_on_error."""
+        response = self.client.patch('/api/v1/idle-resources/bulk', {
+            'updates': [
+                {'id': str(self.resources[0].id), 'version': self.resources[0].version, 'data': {'status': 'allocated'}},
+                {'id': str(self.resources[1].id), 'version': 99, 'data': {'status': 'allocated'}},
+            ]
+        }, format='json')
+        
+        self.assertEqual(response.data['summary']['failed'], 2)
+        self.assertIsNone(response.data['results'][0]['updated_record'])
+        self.assertEqual(IdleResource.objects.get(pk=self.resources[0].pk).status, 'available')
+    
+    def test_date_aliases_are_parsed_as_aware_datetimes(self):
+        """Test idle_from_date/idle_to_date strings are converted before the date range check."""
+        resource = self.resources[0]
+        response = self.client.patch('/api/v1/idle-resources/bulk', {
+            'updates': [{'id': str(resource.id), 'version': resource.version,
+                         'data': {'idle_from_date': '2026-01-01', 'idle_to_date': '2027-01-01'}}]
+        }, format='json')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['summary']['successful'], 1)
+        resource.refresh_from_db()
+        self.assertTrue(timezone.is_aware(resource.availability_start))
+        self.assertEqual(resource.availability_end.date().isoformat(), '2027-01-01')
+    
+    def test_non_numeric_rate_is_an_item_error(self):
+        """Test a bad value fails its item instead of the request."""
+        resource = self.resources[0]
+        response = self.client.patch('/api/v1/idle-resources/bulk', {
+            'updates': [{'id': str(resource.id), 'version': resource.version, 'data': {'hourly_rate': 'abc'}}]
+        }, format='json')
+        
+        self.assertEqual(response.status_code, 200)
+        result = response.data['results'][0]
+        self.assertFalse(result['success'])
+        self.assertIn('hourly_rate', result['error_message'])
@@ -12,7 +12,11 @@ Based on:
 
 import uuid
 from datetime import datetime, timedelta
+from unittest import mock
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.db import IntegrityError
@@ -20,8 +24,8 @@ from decimal import Decimal
 
 from authentication.models import Employee, Department
 from resource_management.models import (
-    IdleResource, ImportSession, ExportSession,
-    ResourceSkill, ResourceAvailability
+    IdleResource, IdleResourceReadModel, ImportSession, ExportSession,
+    ResourceSkill, ResourceAvailability, ResourceSkillToken
 )
 from tests.factories import (
     DepartmentFactory, EmployeeFactory, IdleResourceFactory,
@@ -415,6 +419,54 @@ class IdleResourceDAOMethodsTest(TestCase):
         python_resources = [r for r in result['records'] if 'Python' in r.get('skills', [])]
         self.assertEqual(len(python_resources), result['total_count'])
     
+    def test_list_with_filters_skills_exact_token_match(self):
+        """Test skills filter matches whole skills, not substrings."""
+        # Given: A Java resource and a JavaScript resource
+        java = IdleResourceFactory(skills=['Java', 'Spring'])
+        IdleResourceFactory(skills=['JavaScript', 'React'])
+        
+        # When: Filtering by Java (different case and spacing)
+        result = IdleResource.list_with_filters(filters={'skills': ' java '})
+        
+        # Then: Only the Java resource matches
+        self.assertEqual([r['id'] for r in result['records']], [str(java.id)])
+    
+    def test_list_with_filters_skills_all_and_any(self):
+        """Test AND (default) and OR skill matching semantics."""
+        both = IdleResourceFactory(skills=['Python', 'Django'])
+        python_only = IdleResourceFactory(skills=['Python'])
+        IdleResourceFactory(skills=['Go'])
+        
+        result = IdleResource.list_with_filters(filters={'skills': ['Python', 'Django']})
+        self.assertEqual({r['id'] for r in result['records']}, {str(both.id)})
+        
+        result = IdleResource.list_with_filters(
+            filters={'skills': ['Python', 'Django'], 'skills_match': 'any'}
+        )
+        self.assertEqual({r['id'] for r in result['records']}, {str(both.id), str(python_only.id)})
+    
+    def test_skill_index_tracks_resource_and_detailed_skills(self):
+        """Test index follows IdleResource.skills and ResourceSkill changes."""
+        # Given: Resource indexed with its JSON skills
+        resource = IdleResourceFactory(skills=['Python'])
+        self.assertEqual(set(resource.skill_tokens.values_list('token', flat=True)), {'python'})
+        
+        # When: JSON skills change and a detailed skill is added
+        resource.skills = ['Go']
+        resource.save()
+        detailed = ResourceSkillFactory(resource=resource, skill_name='Kubernetes')
+        
+        # Then: Index reflects both sources
+        self.assertEqual(
+            set(resource.skill_tokens.values_list('token', flat=True)), {'go', 'kubernetes'}
+        )
+        
+        # When: The detailed skill is removed
+        detailed.delete()
+        
+        # Then: Only JSON skills remain indexed
+        self.assertEqual(set(resource.skill_tokens.values_list('token', flat=True)), {'go'})
+    
     def test_list_with_filters_experience_filter(self):
         """Test list with filters for minimum experience."""
         # Given: Resources with different experience levels
@@ -459,6 +511,157 @@ class IdleResourceDAOMethodsTest(TestCase):
         first_record = result['records'][0]
         self.assertEqual(first_record['id'], str(old_resource.id))
     
+    def test_list_with_filters_cursor_mode_walks_all_pages(self):
+        """Test cursor pagination visits every row exactly once without counting."""
+        # Given: Resources sharing sort keys (forces the id tiebreaker)
+        start = timezone.now()
+        created = [
+            IdleResourceFactory(availability_start=start + timedelta(days=i // 3))
+            for i in range(7)
+        ]
+        created.append(IdleResourceFactory(availability_start=None))
+        
+        # When: Walking forward three rows at a time
+        seen = []
+        cursor = None
+        while True:
+            result = IdleResource.list_with_filters(
+                page_size=3, sort_by='availability_start', sort_order='asc',
+                cursor=cursor, pagination_mode='cursor'
+            )
+            seen.extend(record['id'] for record in result['records'])
+            cursor = result['page_info']['next_cursor']
+            if not cursor:
+                break
+        
+        # Then: Every resource appears once, NULL keys first, no total count
+        self.assertEqual(sorted(seen), sorted(str(r.id) for r in created))
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(seen[0], str(created[-1].id))
+        self.assertIsNone(result['total_count'])
+        self.assertFalse(result['page_info']['has_next_page'])
+    
+    def test_list_with_filters_cursor_mode_previous_page(self):
+        """Test previous cursor returns the page before the current one."""
+        # Given: Six resources
+        for i in range(6):
+            IdleResourceFactory(availability_start=timezone.now() + timedelta(days=i))
+        
+        first = IdleResource.list_with_filters(
+            page_size=2, sort_by='availability_start', sort_order='desc', pagination_mode='cursor'
+        )
+        second = IdleResource.list_with_filters(
+            page_size=2, sort_by='availability_start', sort_order='desc',
+            cursor=first['page_info']['next_cursor']
+        )
+        
+        # When: Going back from the second page
+        back = IdleResource.list_with_filters(
+            page_size=2, sort_by='availability_start', sort_order='desc',
+            cursor=second['page_info']['previous_cursor']
+        )
+        
+        # Then: Should return the first page again, in the same order
+        self.assertEqual(
+            [r['id'] for r in back['records']],
+            [r['id'] for r in first['records']]
+        )
+        self.assertFalse(back['page_info']['has_previous_page'])
+        self.assertTrue(back['page_info']['has_next_page'])
+    
+    def test_list_with_filters_cursor_rejects_mismatched_sort(self):
+        """Test cursor issued for one ordering is rejected for another."""
+        IdleResourceFactory()
+        IdleResourceFactory()
+        result = IdleResource.list_with_filters(page_size=1, pagination_mode='cursor')
+        
+        with self.assertRaises(ValidationError):
+            IdleResource.list_with_filters(
+                page_size=1, sort_by='created_at', sort_order='asc',
+                cursor=result['page_info']['next_cursor']
+            )
+        with self.assertRaises(ValidationError):
+            IdleResource.list_with_filters(cursor='not-a-cursor')
+    
+    def test_list_with_filters_count_mode_none(self):
+        """Test count_mode='none' skips COUNT(*) and still reports a next page."""
+        # Given: Five resources
+        for _ in range(5):
+            IdleResourceFactory()
+        
+        # When: Listing without a count (one query: the page itself)
+        with self.assertNumQueries(1):
+            result = IdleResource.list_with_filters(page=2, page_size=2, count_mode='none')
+        
+        # Then: No total, but paging flags are still right
+        self.assertIsNone(result['total_count'])
+        self.assertFalse(result['count_exact'])
+        self.assertEqual(len(result['records']), 2)
+        self.assertTrue(result['page_info']['has_next_page'])
+        self.assertTrue(result['page_info']['has_previous_page'])
+    
+    def test_list_with_filters_count_mode_estimate_is_bounded(self):
+        """Test estimate mode stops counting past the limit and flags the total as inexact."""
+        # Given: More resources than the estimate limit
+        for _ in range(5):
+            IdleResourceFactory()
+        
+        # When: Counting in estimate mode with a limit of 3
+        with mock.patch('resource_management.pagination.ESTIMATE_COUNT_LIMIT', 3):
+            result = IdleResource.list_with_filters(page_size=2, count_mode='estimate')
+        
+        # Then: The total is a lower bound above the limit
+        self.assertFalse(result['count_exact'])
+        self.assertEqual(result['total_count'], 4)
+        self.assertIsNone(result['page_info']['total_pages'])
+        
+        # And: Under the limit the estimate is exact
+        small = IdleResource.list_with_filters(page_size=2, count_mode='estimate')
+        self.assertTrue(small['count_exact'])
+        self.assertEqual(small['total_count'], 5)
+    
+    def test_list_with_filters_reuses_exact_count(self):
+        """Test an exact count is remembered per filter set until the next write."""
+        # Given: An exact count already taken for this filter set
+        for _ in range(3):
+            IdleResourceFactory(status='available')
+        IdleResource.list_with_filters(filters={'status': 'available'}, page_size=1)
+        
+        # When: Fetching another page with a different sort
+        with self.assertNumQueries(1):
+            result = IdleResource.list_with_filters(
+                filters={'status': 'available'}, page=2, page_size=1, sort_by='updated_at'
+            )
+        
+        # Then: The remembered count is exact
+        self.assertEqual(result['total_count'], 3)
+        self.assertTrue(result['count_exact'])
+        
+        # And: A write invalidates it
+        IdleResourceFactory(status='available')
+        result = IdleResource.list_with_filters(filters={'status': 'available'}, page_size=1)
+        self.assertEqual(result['total_count'], 4)
+    
+    def test_exact_count_is_keyed_on_the_queryset_filters(self):
+        """Test a remembered count is only reused by a queryset with the same filters."""
+        from resource_management.pagination import count_key, count_rows
+        
+        # Given: A count taken for the whole table
+        IdleResourceFactory(status='available', resource_type='developer')
+        IdleResourceFactory(status='allocated', resource_type='tester')
+        self.assertEqual(count_rows(IdleResource.objects.all()), (2, True))
+        
+        # When/Then: A narrower queryset is counted, not served the cached total
+        self.assertEqual(count_rows(IdleResource.objects.filter(status='available')), (1, True))
+        with self.assertNumQueries(0):
+            self.assertEqual(count_rows(IdleResource.objects.filter(status='available').order_by('-id')), (1, True))
+        
+        # And: The same values on swapped fields are a different filter
+        self.assertNotEqual(
+            count_key(IdleResource.objects.filter(status='developer', resource_type='tester')),
+            count_key(IdleResource.objects.filter(status='tester', resource_type='developer'))
+        )
+    
     def test_check_availability_dao_method(self):
         """Test DAO-MDE-03-01-04: Check Availability method."""
         # Given: Available resource
@@ -850,4 +1053,410 @@ class ResourceAvailabilityModelTest(TestCase):
         # Then: Pattern should be stored correctly
         self.assertTrue(availability.is_recurring)
         self.assertEqual(availability.recurrence_pattern['type'], 'weekly')
-        self.assertEqual(len(availability.recurrence_pattern['days']), 3)
\ No newline at end of file
+        self.assertEqual(len(availability.recurrence_pattern['days']), 3)
+
+
+class IdleResourceReadModelTest(TestCase):
+    """
+    Test Cases for the denormalized idle_resource_read_model projection.
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.department = DepartmentFactory(department_name='Delivery')
+        self.employee = EmployeeFactory(department=self.department, first_name='Lan', last_name='Tran')
+        self.resource = IdleResourceFactory(
+            employee=self.employee,
+            availability_start=timezone.make_aware(datetime(2026, 1, 15)),
+            availability_end=timezone.make_aware(datetime(2026, 4, 1))
+        )
+    
+    def test_resource_save_projects_flat_row(self):
+        """Test saving a resource writes its flattened projection row."""
+        # Given: A saved resource
+        # When: Reading its projection row
+        row = IdleResourceReadModel.objects.get(pk=self.resource.pk)
+        
+        # Then: Joined and computed values are stored on the row
+        self.assertEqual(row.employee_name, 'Lan Tran')
+        self.assertEqual(row.department_id, self.department.department_id)
+        self.assertEqual(row.department_name, 'Delivery')
+        self.assertEqual(row.idle_mm, 3)
+        self.assertEqual(row.version, self.resource.version)
+    
+    def test_projection_to_dict_matches_source(self):
+        """Test the projection renders the same record as the source model."""
+        source = IdleResource.objects.get(pk=self.resource.pk).to_dict()
+        projected = IdleResourceReadModel.objects.get(pk=self.resource.pk).to_dict()
+        
+        self.assertEqual({key: projected[key] for key in source}, source)
+    
+    def test_employee_and_department_changes_propagate(self):
+        """Test employee and department writes update the projection."""
+        # When: Renaming the employee and the department
+        self.employee.first_name = 'Mai'
+        self.employee.save()
+        self.department.department_name = 'Consulting'
+        self.department.save()
+        
+        # Then: The projection reflects both
+        row = IdleResourceReadModel.objects.get(pk=self.resource.pk)
+        self.assertEqual(row.employee_name, 'Mai Tran')
+        self.assertEqual(row.department_name, 'Consulting')
+        
+        # When: Deleting the department (employees are SET NULL)
+        self.department.delete()
+        
+        # Then: The projection is detached as well
+        row.refresh_from_db()
+        self.assertIsNone(row.department_id)
+        self.assertIsNone(row.department_name)
+    
+    def test_resource_delete_removes_row(self):
+        """Test deleting a resource drops its projection row."""
+        pk = self.resource.pk
+        self.resource.delete()
+        
+        self.assertFalse(IdleResourceReadModel.objects.filter(pk=pk).exists())
+    
+    def test_rebuild_command_restores_projection(self):
+        """Test rebuild_read_model recomputes missing and stale rows."""
+        # Given: A projection out of step with the sources
+        IdleResourceReadModel.objects.all().delete()
+        IdleResourceReadModel.objects.create(
+            id=uuid.uuid4(), employee_id=uuid.uuid4(), employee_name='Gone', resource_type='developer',
+            status='available', created_at=timezone.now(), updated_at=timezone.now()
+        )
+        
+        # When: Rebuilding
+        call_command('rebuild_read_model', batch_size=1, stdout=mock.MagicMock())
+        
+        # Then: Exactly the source resources are projected
+        self.assertEqual(
+            list(IdleResourceReadModel.objects.values_list('id', flat=True)), [self.resource.pk]
+        )
+    
+    def test_list_with_filters_reads_projection_without_joins(self):
+        """Test read_model listing matches the source listing in one table."""
+        IdleResourceFactory(employee=EmployeeFactory(department=DepartmentFactory()))
+        filters = {'department_id': self.department.department_id}
+        
+        source = IdleResource.list_with_filters(filters=filters)
+        with CaptureQueriesContext(connection) as queries:
+            projected = IdleResource.list_with_filters(filters=filters, read_model=True, count_mode='none')
+        
+        self.assertEqual([record['id'] for record in projected['records']], [str(self.resource.pk)])
+        self.assertEqual(projected['records'][0]['employee_name'], source['records'][0]['employee_name'])
+        self.assertTrue(all('JOIN' not in query['sql'] for query in queries.captured_queries))
+
+
+
+class IdleResourceComputedFieldsTest(TestCase):
+    """
+    Test Cases for the persisted idle_mm / is_urgent columns.
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.now = timezone.now()
+    
+    def _resource(self, start_days, end_days, status='available'):
+        return IdleResourceFactory(
+            status=status,
+            availability_start=self.now + timedelta(days=start_days) if start_days is not None else None,
+            availability_end=self.now + timedelta(days=end_days) if end_days is not None else None
+        )
+    
+    def test_save_computes_idle_months_and_urgency(self):
+        """Test save() stores idle_mm and flags long idle periods."""
+        # Given: A resource idle for about four months, ending in 60 days
+        resource = self._resource(-120, 60)
+        
+        # Then: Both columns are stored
+        resource.refresh_from_db()
+        self.assertEqual(
+            resource.idle_mm,
+            IdleResource.calculate_idle_months(resource.availability_start, resource.availability_end)
+        )
+        self.assertTrue(resource.is_urgent)
+        
+        # When: The resource is allocated through a partial save
+        resource.status = 'allocated'
+        resource.save(update_fields=['status'])
+        
+        # Then: The flag follows
+        resource.refresh_from_db()
+        self.assertFalse(resource.is_urgent)
+    
+    def test_urgent_condition_matches_python_rule(self):
+        """Test the SQL condition agrees with is_urgent_case() for every shape of window."""
+        cases = [
+            (-120, 60), (-120, -70), (-120, -100), (-10, 5), (-10, 60),
+            (-10, None), (-90, None), (None, 5), (None, None), (5, 100),
+        ]
+        resources = [self._resource(start, end) for start, end in cases]
+        resources.append(self._resource(-120, 60, status='allocated'))
+        
+        urgent_ids = set(
+            IdleResource.objects.filter(IdleResource.urgent_condition(self.now)).values_list('id', flat=True)
+        )
+        for resource in resources:
+            self.assertEqual(resource.id in urgent_ids, resource.is_urgent_case(self.now), resource.availability_start)
+    
+    def test_bulk_refresh_updates_drifted_flags(self):
+        """Test the nightly job flips flags with UPDATEs and keeps the projection in step."""
+        # Given: A resource not urgent today, but ending within the window in 30 days
+        resource = self._resource(-10, 40)
+        self.assertFalse(resource.is_urgent)
+        later = self.now + timedelta(days=30)
+        
+        # When: Running the job as of that date
+        result = IdleResource.bulk_refresh_computed_fields(batch_size=1, today=later)
+        
+        # Then: Source and projection are flagged
+        self.assertEqual(result['changed'], 1)
+        self.assertTrue(IdleResource.objects.get(pk=resource.pk).is_urgent)
+        self.assertTrue(IdleResourceReadModel.objects.get(pk=resource.pk).is_urgent)
+    
+    def test_bulk_refresh_recomputes_idle_months(self):
+        """Test --recompute-idle-months backfills rows written without save()."""
+        resource = self._resource(-10, 40)
+        IdleResource.objects.filter(pk=resource.pk).update(
+            availability_start=timezone.make_aware(datetime(2026, 1, 31)), idle_mm=None
+        )
+        
+        call_command('refresh_idle_metrics', recompute_idle_months=True, stdout=mock.MagicMock())
+        
+        resource.refresh_from_db()
+        self.assertEqual(
+            resource.idle_mm,
+            IdleResource.calculate_idle_months(resource.availability_start, resource.availability_end)
+        )
+        self.assertEqual(IdleResourceReadModel.objects.get(pk=resource.pk).idle_mm, resource.idle_mm)
+
+
+class IdleResourceBulkUpdateTest(TestCase):
+    """
+    Test Cases for IdleResource.bulk_update_with_version_check.
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.resources = [IdleResourceFactory(status='available', skills=['Java']) for _ in range(4)]
+    
+    def _item(self, resource, **data):
+        return {'id': resource.id, 'version': resource.version, 'data': data}
+    
+    def test_bulk_update_uses_constant_statements_per_chunk(self):
+        """Test a chunk costs one SELECT and one UPDATE plus derived-data refresh."""
+        updates = [self._item(resource, experience_years=9) for resource in self.resources]
+        
+        with CaptureQueriesContext(connection) as queries:
+            result = IdleResource.bulk_update_with_version_check(updates, updated_by='bulk', chunk_size=2)
+        
+        self.assertEqual(result['successful'], 4)
+        updates_sql = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE "idle_resources"')]
+        self.assertEqual(len(updates_sql), 2)
+        self.assertLess(len(queries), 12)
+        for resource in self.resources:
+            stored = IdleResource.objects.get(pk=resource.pk)
+            self.assertEqual((stored.experience_years, stored.version, stored.updated_by), (9, resource.version + 1, 'bulk'))
+    
+    def test_stale_versions_are_conflicts(self):
+        """Test items with an old version fail and, without rollback, the rest apply."""
+        stale = self._item(self.resources[0], status='allocated')
+        stale['version'] -= 1
+        updates = [stale, self._item(self.resources[1], status='allocated')]
+        
+        result = IdleResource.bulk_update_with_version_check(updates, rollback_on_error=False)
+        
+        self.assertEqual([r['success'] for r in result['results']], [False, True])
+        self.assertIn('modified by another user', result['results'][0]['error'])
+        self.assertEqual(result['results'][1]['new_version'], self.resources[1].version + 1)
+        self.assertEqual(IdleResource.objects.get(pk=self.resources[0].pk).status, 'available')
+        self.assertEqual(IdleResourceReadModel.objects.get(pk=self.resources[1].pk).status, 'allocated')
+    
+    def test_rollback_on_error_writes_nothing(self):
+        """Test one invalid item leaves every resource untouched."""
+        updates = [
+            self._item(self.resources[0], status='allocated'),
+            self._item(self.resources[1], experience_years=-1),
+        ]
+        
+        result = IdleResource.bulk_update_with_version_check(updates)
+        
+        self.assertEqual(result['successful'], 0)
+        self.assertIn('validation_errors', result['results'][1])
+        self.assertEqual(IdleResource.objects.get(pk=self.resources[0].pk).version, self.resources[0].version)
+    
+    def test_lost_race_is_detected_from_affected_rows(self):
+        """Test a write landing between the pre-check and the UPDATE is a conflict."""
+        updates = [self._item(resource, status='allocated') for resource in self.resources[:2]]
+        original_in_bulk = IdleResource.objects.in_bulk
+        
+        def in_bulk_then_concurrent_write(*args, **kwargs):
+            current = original_in_bulk(*args, **kwargs)
+            IdleResource.objects.filter(pk=self.resources[0].pk).update(version=self.resources[0].version + 5)
+            return current
+        
+        with mock.patch.object(IdleResource.objects, 'in_bulk', side_effect=in_bulk_then_concurrent_write):
+            result = IdleResource.bulk_update_with_version_check(updates, rollback_on_error=False)
+        
+        self.assertEqual([r['success'] for r in result['results']], [False, True])
+        self.assertEqual(IdleResource.objects.get(pk=self.resources[0].pk).status, 'available')
+    
+    def test_skill_changes_refresh_search_indexes(self):
+        """Test bulk skill edits reach the skill token index and the projection."""
+        updates = [self._item(self.resources[0], skills=['Rust'])]
+        
+        IdleResource.bulk_update_with_version_check(updates)
+        
+        self.assertIn(
+            {'resource_id': self.resources[0].id}, list(ResourceSkillToken.matching_resource_ids(['rust']))
+        )
+        self.assertEqual(IdleResourceReadModel.objects.get(pk=self.resources[0].pk).skills, ['Rust'])
+
+
+class CompareAndSwapTest(TestCase):
+    """
+    Test Cases for BaseModel.compare_and_swap and the methods built on it.
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.resource = IdleResourceFactory(status='available')
+    
+    def test_only_one_of_two_writers_with_the_same_version_wins(self):
+        """Test a second writer holding the same version gets a conflict."""
+        # Given: Two copies read at the same version
+        first = IdleResource.objects.get(pk=self.resource.pk)
+        second = IdleResource.objects.get(pk=self.resource.pk)
+        
+        # When: Both write
+        first.status = 'allocated'
+        second.status = 'unavailable'
+        
+        # Then: Only the first succeeds; the stored version moved by one
+        self.assertTrue(first.compare_and_swap(['status']))
+        self.assertFalse(second.compare_and_swap(['status']))
+        stored = IdleResource.objects.get(pk=self.resource.pk)
+        self.assertEqual((stored.status, stored.version), ('allocated', self.resource.version + 1))
+        self.assertEqual(first.version, stored.version)
+    
+    def test_update_is_one_statement_plus_derived_data(self):
+        """Test the write itself is a single conditional UPDATE with no prior read."""
+        with CaptureQueriesContext(connection) as queries:
+            self.resource.compare_and_swap(['experience_years'])
+        
+        self.assertTrue(queries.captured_queries[0]['sql'].startswith('UPDATE "idle_resources"'))
+        self.assertIn('"version" = ("idle_resources"."version" + 1)', queries.captured_queries[0]['sql'])
+    
+    def test_update_with_version_check_reports_concurrent_conflict(self):
+        """Test a write that lands after the in-memory check is still a conflict."""
+        IdleResource.objects.filter(pk=self.resource.pk).update(version=self.resource.version + 1)
+        
+        result = self.resource.update_with_version_check({'status': 'allocated', 'version': self.resource.version})
+        
+        self.assertFalse(result['success'])
+        self.assertEqual(result['current_version'], self.resource.version + 1)
+        self.assertEqual(IdleResource.objects.get(pk=self.resource.pk).status, 'available')
+    
+    def test_signals_keep_derived_data_in_step(self):
+        """Test post_save handlers see conditional updates."""
+        self.resource.status = 'allocated'
+        self.resource.compare_and_swap(['status'])
+        
+        self.assertEqual(IdleResourceReadModel.objects.get(pk=self.resource.pk).status, 'allocated')
+    
+    def test_soft_delete_and_restore_bump_the_version(self):
+        """Test soft delete and restore are versioned writes."""
+        version = self.resource.version
+        
+        self.assertTrue(self.resource.soft_delete(user_id='admin'))
+        stored = IdleResource.objects.get(pk=self.resource.pk)
+        self.assertTrue(stored.is_deleted)
+        self.assertEqual(stored.version, version + 1)
+        self.assertFalse(stored.is_urgent)
+        
+        self.assertTrue(self.resource.restore())
+        self.assertEqual(IdleResource.objects.get(pk=self.resource.pk).version, version + 2)
+    
+    def test_soft_delete_with_stale_version_is_rejected(self):
+        """Test a stale soft delete leaves the record and the instance untouched."""
+        self.assertFalse(self.resource.soft_delete(expected_version=self.resource.version - 1))
+        
+        self.assertFalse(self.resource.is_deleted)
+        self.assertFalse(IdleResource.objects.get(pk=self.resource.pk).is_deleted)
+
+
+class IdleResourceBulkCreateTest(TestCase):
+    """
+    Test Cases for IdleResource.bulk_create_with_validation.
+    """
+    
+    def setUp(self):
+        """Set up test data."""
+        self.employees = [EmployeeFactory() for _ in range(5)]
+        self.now = timezone.now()
+    
+    def _record(self, employee, **overrides):
+        record = {
+            'employee_id': employee.employee_id,
+            'resource_type': 'developer',
+            'availability_start': self.now,
+            'availability_end': self.now + timedelta(days=90),
+            'skills': ['Python'],
+        }
+        record.update(overrides)
+        return record
+    
+    def test_query_count_does_not_grow_with_records(self):
+        """Test lookups are set-wise and inserts are batched."""
+        records = [self._record(employee) for employee in self.employees]
+        
+        with CaptureQueriesContext(connection) as queries:
+            result = IdleResource.bulk_create_with_validation(records, created_by='importer', batch_size=2)
+        
+        self.assertEqual(result['created'], 5)
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "idle_resources"')]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(IdleResource.objects.filter(created_by='importer').count(), 5)
+        
+        # And: One record costs as many statements as four in a single batch
+        employees = [EmployeeFactory() for _ in range(5)]
+        with CaptureQueriesContext(connection) as one:
+            IdleResource.bulk_create_with_validation([self._record(employees[0])])
+        with CaptureQueriesContext(connection) as four:
+            IdleResource.bulk_create_with_validation([self._record(employee) for employee in employees[1:]])
+        self.assertEqual(len(one), len(four))
+    
+    def test_results_match_single_create(self):
+        """Test per-record errors and warnings follow create_with_validation."""
+        IdleResourceFactory(employee=self.employees[0], status='available')
+        records = [
+            self._record(self.employees[0]),
+            {'employee_id': uuid.uuid4()},
+            self._record(self.employees[1], skills='Python'),
+            self._record(self.employees[2]),
+            self._record(self.employees[2]),
+        ]
+        
+        results = IdleResource.bulk_create_with_validation(records)['results']
+        
+        self.assertEqual([r['success'] for r in results], [True, False, False, True, True])
+        self.assertIn('already has an active resource', results[0]['warnings'][0])
+        self.assertIn('not found', results[1]['errors'][0])
+        self.assertEqual(results[1]['warnings'], [])
+        self.assertEqual(results[2]['errors'], ['Skills must be a list'])
+        self.assertEqual(results[3]['warnings'], [])
+        self.assertIn('already has an active resource', results[4]['warnings'][0])
+    
+    def test_created_rows_reach_derived_data(self):
+        """Test computed columns, the projection and the skill index are filled."""
+        result = IdleResource.bulk_create_with_validation([self._record(self.employees[0])])
+        resource_id = result['results'][0]['resource'].id
+        
+        stored = IdleResource.objects.get(pk=resource_id)
+        self.assertEqual(stored.idle_mm, 3)
+        self.assertTrue(IdleResourceReadModel.objects.filter(pk=resource_id).exists())
+        self.assertIn({'resource_id': resource_id}, list(ResourceSkillToken.matching_resource_ids(['python'])))
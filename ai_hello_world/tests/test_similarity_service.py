@@ -0,0 +1,150 @@
+"""
+Test Suite for TF-IDF similar resource recommendations.
+
+Based on:
+- DAO Specifications: DD/MDE-03/04-dao/DAO-MDE-03-01_v0.1.md
+"""
+
+import uuid
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from resource_management.models import IdleResource
+from services.exceptions import DataNotFoundException
+from services.resource_management.similarity_service import (
+    SimilarityIndex,
+    SimilarityService,
+    resource_terms,
+    similarity_index,
+)
+from tests.factories import IdleResourceFactory, ResourceSkillFactory
+
+
+class ResourceTermsTest(TestCase):
+    """
+    Test Cases for building term weights.
+    """
+
+    def test_proficiency_weights_and_position_words(self):
+        """Test skills are weighted by proficiency and positions split into words."""
+        terms = resource_terms(
+            [{'name': 'Python', 'level': 'expert'}, 'SQL'],
+            [('python', 'beginner'), ('Docker', 'advanced')],
+            'Backend Engineer'
+        )
+
+        self.assertEqual(terms['skill:python'], 4.0)
+        self.assertEqual(terms['skill:sql'], 1.0)
+        self.assertEqual(terms['skill:docker'], 3.0)
+        self.assertEqual(terms['position:backend'], 0.5)
+
+
+class SimilarityServiceTest(TestCase):
+    """
+    Test Cases for SimilarityService.find_similar.
+    """
+
+    def setUp(self):
+        """Set up test data."""
+        # Resources of earlier tests were rolled back without a trace
+        similarity_index.clear()
+        self.service = SimilarityService({'role': 'admin'})
+        self.backend = IdleResourceFactory(skills=['Python', 'Django', 'PostgreSQL'], employee__position='Developer')
+        self.twin = IdleResourceFactory(skills=['Python', 'Django', 'Redis'], employee__position='Developer')
+        self.distant = IdleResourceFactory(skills=['PostgreSQL'], employee__position='DBA')
+        self.unrelated = IdleResourceFactory(skills=['Figma'], employee__position='Designer')
+
+    def test_most_similar_resource_ranks_first(self):
+        """Test resources sharing more distinctive skills score higher."""
+        results = self.service.find_similar(self.backend.id).data
+
+        ids = [r['resource_id'] for r in results]
+        self.assertEqual(ids[:2], [str(self.twin.id), str(self.distant.id)])
+        self.assertNotIn(str(self.unrelated.id), ids)
+        self.assertNotIn(str(self.backend.id), ids)
+        self.assertEqual(results[0]['shared_skills'], ['django', 'python'])
+        self.assertGreater(results[0]['score'], results[1]['score'])
+
+    def test_index_follows_skill_changes_incrementally(self):
+        """Test detailed skills added or removed later are picked up."""
+        self.service.find_similar(self.backend.id)
+        skill = ResourceSkillFactory(resource=self.unrelated, skill_name='Django', proficiency_level='expert')
+
+        ids = [r['resource_id'] for r in self.service.find_similar(self.backend.id).data]
+        self.assertIn(str(self.unrelated.id), ids)
+
+        skill.delete()
+        ids = [r['resource_id'] for r in self.service.find_similar(self.backend.id).data]
+        self.assertNotIn(str(self.unrelated.id), ids)
+
+    def test_deleted_resource_is_dropped(self):
+        """Test removed resources disappear from recommendations."""
+        self.service.find_similar(self.backend.id)
+        twin_id = str(self.twin.id)
+        self.twin.delete()
+
+        ids = [r['resource_id'] for r in self.service.find_similar(self.backend.id).data]
+        self.assertNotIn(twin_id, ids)
+
+    def test_incremental_refresh_matches_full_rebuild(self):
+        """Test incremental updates give the same scores as a rebuild."""
+        self.service.find_similar(self.backend.id)
+        ResourceSkillFactory(resource=self.distant, skill_name='Python', proficiency_level='advanced')
+        incremental = self.service.find_similar(self.backend.id).data
+
+        fresh = SimilarityIndex()
+        fresh.rebuild()
+        rebuilt = fresh.similar(self.backend.id)
+
+        self.assertEqual(
+            [(r['resource_id'], r['score']) for r in incremental],
+            [(r['resource_id'], r['score']) for r in rebuilt]
+        )
+
+    def test_signals_mark_changes_without_timestamps(self):
+        """Test changes made in this process are found through dirty ids, not by rescanning timestamps."""
+        self.service.find_similar(self.backend.id)
+        similarity_index.watermark = timezone.now() + timedelta(days=1)
+
+        ResourceSkillFactory(resource=self.unrelated, skill_name='Django', proficiency_level='expert')
+
+        ids = [r['resource_id'] for r in self.service.find_similar(self.backend.id).data]
+        self.assertIn(str(self.unrelated.id), ids)
+
+    def test_unsignalled_delete_is_not_recommended(self):
+        """Test a resource removed by a signal-less UPDATE is filtered out and dropped on refresh."""
+        self.service.find_similar(self.backend.id)
+        IdleResource.objects.filter(pk=self.twin.pk).update(is_deleted=True)
+
+        ids = [r['resource_id'] for r in self.service.find_similar(self.backend.id).data]
+        self.assertNotIn(str(self.twin.id), ids)
+        similarity_index.refresh()
+        self.assertIsNone(similarity_index.similar(self.twin.id))
+
+    def test_unknown_resource_raises(self):
+        """Test an unknown id is reported as not found."""
+        with self.assertRaises(DataNotFoundException):
+            self.service.find_similar(uuid.uuid4())
+
+
+class SimilarResourcesAPITest(TestCase):
+    """
+    API Test Cases for GET /api/v1/idle-resources/{id}/similar.
+    """
+
+    def test_api_returns_similar_resources(self):
+        """Test the endpoint returns camelCase recommendations and 404s unknown ids."""
+        resource = IdleResourceFactory(skills=['Kotlin', 'Android'])
+        other = IdleResourceFactory(skills=['Kotlin'])
+        client = APIClient()
+
+        response = client.get(f'/api/v1/idle-resources/{resource.id}/similar', {'limit': 5})
+        missing = client.get(f'/api/v1/idle-resources/{uuid.uuid4()}/similar')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['similar'][0]['resourceId'], str(other.id))
+        self.assertEqual(response.data['similar'][0]['sharedSkills'], ['kotlin'])
+        self.assertEqual(missing.status_code, 404)